@@ -25,11 +25,39 @@ class Settings(BaseSettings):
     
     # Database Configuration
     database_url: str = Field(..., description="Database connection URL")
+    database_replica_url: str | None = Field(None, description="Read replica URL for read-only queries")
     database_echo: bool = Field(False, description="Enable SQLAlchemy echo")
+    database_pool_size: int = Field(10, description="Persistent connections kept in the pool")
+    database_max_overflow: int = Field(20, description="Extra connections allowed above pool size")
+    database_pool_timeout: float = Field(10.0, description="Seconds to wait for a free pooled connection")
+    database_statement_timeout: int = Field(15000, description="Per-statement timeout in ms (0 disables)")
+    database_statement_cache_size: int = Field(100, description="asyncpg prepared statement cache size per connection")
     
     # Redis Configuration
     redis_url: str = Field("redis://localhost:6379/0", description="Redis connection URL")
     
+    # Menu Cache
+    menu_cache_enabled: bool = Field(True, description="Serve menu reads from in-process cache")
+    menu_cache_ttl: int = Field(300, description="Menu cache entry TTL in seconds")
+    menu_cache_max_entries: int = Field(1024, description="Maximum cached menu entries (LRU)")
+    menu_snapshot_enabled: bool = Field(False, description="Share menu snapshot between replicas via Redis")
+    
+    # Inline Mode
+    inline_query_cache_time: int = Field(300, description="Seconds Telegram may serve cached inline search answers")
+    
+    # Outbound Send Queue
+    send_queue_global_rate: float = Field(25.0, description="Queued messages per second across all chats")
+    send_queue_chat_rate: float = Field(1.0, description="Queued messages per second to one private chat")
+    send_queue_group_rate: float = Field(20 / 60, description="Queued messages per second to one group")
+    
+    # Redis Cart Store
+    cart_redis_enabled: bool = Field(False, description="Keep active carts in Redis and persist them write-behind")
+    cart_redis_ttl: int = Field(3 * 24 * 3600, description="Idle cart TTL in Redis in seconds")
+    cart_redis_flush_interval: float = Field(30.0, description="Seconds between flushes of changed carts to the database")
+    
+    # User Identity Cache
+    user_id_cache_max_entries: int = Field(10000, description="Maximum cached telegram_id -> user_id mappings (LRU)")
+    
     # Payment Systems
     yookassa_shop_id: str | None = Field(None, description="YooKassa shop ID")
     yookassa_secret_key: str | None = Field(None, description="YooKassa secret key")
@@ -6,23 +6,38 @@ from aiogram import Bot, Dispatcher
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
+from domain.repositories.analytics_repository import AnalyticsRepository
+from domain.repositories.broadcast_repository import BroadcastRepository
 from domain.repositories.cart_repository import CartRepository
 from domain.repositories.menu_repository import MenuRepository
 from domain.repositories.order_repository import OrderRepository
 from domain.repositories.payment_repository import PaymentRepository
+from domain.repositories.sales_rollup_repository import SalesRollupRepository
 from domain.repositories.user_repository import UserRepository
+from domain.services.broadcast_service import BroadcastService
 from domain.services.cart_service import CartService
 from domain.services.menu_service import MenuService
+from domain.services.notification_service import NotificationService
 from domain.services.order_service import OrderService
 from domain.services.payment_service import PaymentService
 from domain.services.statistics_service import StatisticsService
 from domain.services.user_service import UserService
+from infrastructure.cache.menu_cache import get_menu_cache
+from infrastructure.cache.cart_write_behind import get_cart_store
+from infrastructure.cache.menu_snapshot_sync import get_menu_snapshot
 from infrastructure.database.connection import get_session, get_current_session
+from infrastructure.database.repositories.analytics_repository_impl import AnalyticsRepositoryImpl
+from infrastructure.database.repositories.broadcast_repository_impl import BroadcastRepositoryImpl
+from infrastructure.database.repositories.cached_menu_repository import CachedMenuRepository
 from infrastructure.database.repositories.cart_repository_impl import CartRepositoryImpl
 from infrastructure.database.repositories.menu_repository_impl import MenuRepositoryImpl
 from infrastructure.database.repositories.order_repository_impl import OrderRepositoryImpl
 from infrastructure.database.repositories.payment_repository_impl import PaymentRepositoryImpl
+from infrastructure.database.repositories.redis_cart_repository import RedisCartRepository
+from infrastructure.database.repositories.sales_rollup_repository_impl import SalesRollupRepositoryImpl
 from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.telegram.send_queue import get_send_queue
+from infrastructure.telegram.utils.message_formatter import MessageFormatter
 
 
 class DIContainer:
@@ -60,11 +75,18 @@ class DIContainer:
     
     def get_menu_repository(self, session: AsyncSession) -> MenuRepository:
         """Get menu repository."""
-        return MenuRepositoryImpl(session)
+        repository = MenuRepositoryImpl(session)
+        if self._settings.menu_cache_enabled:
+            return CachedMenuRepository(repository, get_menu_cache())
+        return repository
     
     def get_cart_repository(self, session: AsyncSession) -> CartRepository:
         """Get cart repository."""
-        return CartRepositoryImpl(session)
+        repository = CartRepositoryImpl(session)
+        store = get_cart_store() if self._settings.cart_redis_enabled else None
+        if store is not None:
+            return RedisCartRepository(store, repository, self.get_menu_repository(session))
+        return repository
     
     def get_order_repository(self, session: AsyncSession) -> OrderRepository:
         """Get order repository."""
@@ -74,10 +96,22 @@ class DIContainer:
         """Get payment repository."""
         return PaymentRepositoryImpl(session)
     
+    def get_analytics_repository(self, session: AsyncSession) -> AnalyticsRepository:
+        """Get analytics repository."""
+        return AnalyticsRepositoryImpl(session)
+    
+    def get_sales_rollup_repository(self, session: AsyncSession) -> SalesRollupRepository:
+        """Get sales rollup repository."""
+        return SalesRollupRepositoryImpl(session)
+    
+    def get_broadcast_repository(self, session: AsyncSession) -> BroadcastRepository:
+        """Get broadcast repository."""
+        return BroadcastRepositoryImpl(session)
+    
     def get_menu_service(self, session: AsyncSession) -> MenuService:
         """Get menu service."""
         menu_repo = self.get_menu_repository(session)
-        return MenuService(menu_repo)
+        return MenuService(menu_repo, get_menu_snapshot())
     
     def get_cart_service(self, session: AsyncSession) -> CartService:
         """Get cart service."""
@@ -91,7 +125,9 @@ class DIContainer:
         order_repo = self.get_order_repository(session)
         cart_repo = self.get_cart_repository(session)
         user_repo = self.get_user_repository(session)
-        return OrderService(order_repo, cart_repo, user_repo)
+        rollup_repo = self.get_sales_rollup_repository(session)
+        menu_repo = self.get_menu_repository(session)
+        return OrderService(order_repo, cart_repo, user_repo, rollup_repo, menu_repo)
 
     def get_payment_service(self, session: AsyncSession) -> PaymentService:
         """Get payment service."""
@@ -111,12 +147,28 @@ class DIContainer:
         order_repo = self.get_order_repository(session)
         user_repo = self.get_user_repository(session)
         menu_repo = self.get_menu_repository(session)
-        return StatisticsService(order_repo, user_repo, menu_repo)
+        analytics_repo = self.get_analytics_repository(session)
+        rollup_repo = self.get_sales_rollup_repository(session)
+        return StatisticsService(order_repo, user_repo, menu_repo, analytics_repo, rollup_repo)
     
     def get_user_service(self, session: AsyncSession) -> UserService:
         """Get user service."""
         user_repo = self.get_user_repository(session)
         return UserService(user_repo)
+    
+    def get_broadcast_service(self, session: AsyncSession) -> BroadcastService:
+        """Get broadcast service."""
+        broadcast_repo = self.get_broadcast_repository(session)
+        user_repo = self.get_user_repository(session)
+        return BroadcastService(broadcast_repo, user_repo)
+    
+    def get_notification_service(self) -> NotificationService:
+        """Get notification service."""
+        return NotificationService(
+            send_queue=get_send_queue(),
+            formatter=MessageFormatter,
+            admin_chat_id=self._settings.admin_chat_id,
+        )
 
 
 # Global container instance
@@ -200,6 +252,18 @@ async def get_user_service(data: dict | None = None) -> UserService:
     return container.get_user_service(session)  # type: ignore[arg-type]
 
 
+async def get_broadcast_service(data: dict | None = None) -> BroadcastService:
+    session = None
+    if data and isinstance(data, dict):
+        session = data.get("session")
+    if session is None:
+        session = get_current_session()
+    if session is None:
+        from infrastructure.database.connection import get_sessionmaker
+        session = get_sessionmaker()()
+    return container.get_broadcast_service(session)  # type: ignore[arg-type]
+
+
 # Dependency annotations for FastAPI-style dependency injection
 def get_container() -> DIContainer:
     """Get DI container."""
@@ -11,13 +11,28 @@ from aiogram.enums import ParseMode
 from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
 from aiohttp import web
 from app.config import get_settings
+from infrastructure.cache.cart_write_behind import close_cart_store, init_cart_store
+from infrastructure.cache.menu_snapshot_sync import close_menu_snapshot_sync, init_menu_snapshot_sync
 from infrastructure.database.connection import init_database
+from infrastructure.database.pool_metrics import pool_metrics, replica_pool_metrics
 from infrastructure.logging.logger import setup_logging
+from infrastructure.telegram.api_metrics import api_call_metrics
 from infrastructure.telegram.bot import create_bot, create_dispatcher
+from infrastructure.telegram.broadcaster import close_broadcaster, init_broadcaster
+from infrastructure.telegram.send_queue import close_send_queue, get_send_queue, init_send_queue
 # Load environment variables from .env file
 load_dotenv()
 
 
+def send_queue_options(settings) -> dict:
+    """Send queue rates from settings."""
+    return {
+        "global_rate": settings.send_queue_global_rate,
+        "chat_rate": settings.send_queue_chat_rate,
+        "group_rate": settings.send_queue_group_rate,
+    }
+
+
 @asynccontextmanager
 async def lifespan(app: web.Application):
     """Application lifespan manager."""
@@ -28,12 +43,24 @@ async def lifespan(app: web.Application):
     logger = logging.getLogger(__name__)
 
     # Initialize database
-    await init_database(settings.database_url)
+    await init_database(settings.database_url, settings.database_replica_url)
     logger.info("Database initialized")
 
+    # Load shared menu snapshot
+    if settings.menu_snapshot_enabled:
+        await init_menu_snapshot_sync(settings.redis_url)
+        logger.info("Menu snapshot sync started")
+
+    # Start Redis cart store
+    if settings.cart_redis_enabled:
+        await init_cart_store(settings.redis_url, settings.cart_redis_ttl, settings.cart_redis_flush_interval)
+        logger.info("Redis cart store started")
+
     # Initialize bot
     bot = create_bot(settings.bot_token)
     dp = create_dispatcher()
+    send_queue = init_send_queue(bot, **send_queue_options(settings))
+    init_broadcaster(send_queue)
 
     # Setup webhook if in production
     if settings.is_production and settings.bot_webhook_url:
@@ -57,13 +84,25 @@ async def lifespan(app: web.Application):
         await bot.delete_webhook()
         logger.info("Webhook deleted")
 
+    await close_broadcaster()
+    await close_send_queue()
+    await close_cart_store()
+    await close_menu_snapshot_sync()
     await bot.session.close()
     logger.info("Application stopped")
 
 
 async def health_check(request: web.Request) -> web.Response:
     """Health check endpoint."""
-    return web.json_response({"status": "ok", "service": "cafe-bot"})
+    send_queue = get_send_queue()
+    return web.json_response({
+        "status": "ok",
+        "service": "cafe-bot",
+        "database_pool": pool_metrics.snapshot(),
+        "database_replica_pool": replica_pool_metrics.snapshot() if replica_pool_metrics.pool else None,
+        "bot_api": api_call_metrics.snapshot(),
+        "send_queue": send_queue.snapshot() if send_queue else None,
+    })
 
 
 def create_app() -> web.Application:
@@ -118,7 +157,16 @@ async def main():
         dp = create_dispatcher()
 
         # Initialize database
-        await init_database(settings.database_url)
+        await init_database(settings.database_url, settings.database_replica_url)
+
+        if settings.menu_snapshot_enabled:
+            await init_menu_snapshot_sync(settings.redis_url)
+
+        if settings.cart_redis_enabled:
+            await init_cart_store(settings.redis_url, settings.cart_redis_ttl, settings.cart_redis_flush_interval)
+
+        send_queue = init_send_queue(bot, **send_queue_options(settings))
+        init_broadcaster(send_queue)
 
         print("Bot started in development mode with polling")
 
@@ -127,6 +175,10 @@ async def main():
         except KeyboardInterrupt:
             pass
         finally:
+            await close_broadcaster()
+            await close_send_queue()
+            await close_cart_store()
+            await close_menu_snapshot_sync()
             await bot.session.close()
 
 
@@ -0,0 +1,58 @@
+"""Broadcast campaign entity."""
+
+from datetime import datetime
+from typing import Optional
+
+from shared.constants.broadcast_constants import ACTIVE_BROADCAST_STATUSES, BroadcastStatus
+
+
+class BroadcastCampaign:
+    """Promotional message sent to every user who accepts notifications.
+
+    Recipients are processed in user id order; `last_user_id` is the last
+    recipient whose send has finished, so a resumed campaign continues
+    right after it.
+    """
+
+    def __init__(
+        self,
+        campaign_id: str,
+        text: str,
+        created_by: Optional[int] = None,  # Telegram ID of the admin
+        status: BroadcastStatus = BroadcastStatus.PENDING,
+        total_recipients: int = 0,
+        delivered: int = 0,
+        blocked: int = 0,
+        failed: int = 0,
+        last_user_id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        started_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+    ):
+        self.campaign_id = campaign_id
+        self.text = text
+        self.created_by = created_by
+        self.status = status
+        self.total_recipients = total_recipients
+        self.delivered = delivered
+        self.blocked = blocked
+        self.failed = failed
+        self.last_user_id = last_user_id
+        self.created_at = created_at or datetime.utcnow()
+        self.started_at = started_at
+        self.finished_at = finished_at
+        self.updated_at = updated_at or self.created_at
+
+    @property
+    def processed(self) -> int:
+        """Recipients whose send has finished."""
+        return self.delivered + self.blocked + self.failed
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the campaign is still to be sent."""
+        return self.status in ACTIVE_BROADCAST_STATUSES
+
+    def __str__(self) -> str:
+        return f"BroadcastCampaign(id={self.campaign_id}, status={self.status}, processed={self.processed})"
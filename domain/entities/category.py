@@ -17,6 +17,7 @@ class Category:
         is_active: bool = True,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        image_file_id: Optional[str] = None,
     ):
         self.category_id = category_id
         self.name = name
@@ -26,6 +27,8 @@ class Category:
         self.is_active = is_active
         self.created_at = created_at or datetime.now()
         self.updated_at = updated_at or datetime.now()
+        # Telegram file_id of image_url once it has been uploaded
+        self.image_file_id = image_file_id
     
     def update_name(self, name: str) -> None:
         """Update category name."""
@@ -40,6 +43,7 @@ class Category:
     def update_image(self, image_url: Optional[str]) -> None:
         """Update category image."""
         self.image_url = image_url
+        self.image_file_id = None
         self.updated_at = datetime.now()
     
     def change_sort_order(self, sort_order: int) -> None:
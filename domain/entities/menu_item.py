@@ -24,6 +24,7 @@ class MenuItem:
         sort_order: int = 0,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        image_file_id: Optional[str] = None,
     ):
         self.item_id = item_id
         self.category_id = category_id
@@ -40,6 +41,8 @@ class MenuItem:
         self.sort_order = sort_order
         self.created_at = created_at or datetime.now()
         self.updated_at = updated_at or datetime.now()
+        # Telegram file_id of image_url once it has been uploaded
+        self.image_file_id = image_file_id
     
     def update_name(self, name: str) -> None:
         """Update menu item name."""
@@ -59,6 +62,7 @@ class MenuItem:
     def update_image(self, image_url: Optional[str]) -> None:
         """Update menu item image."""
         self.image_url = image_url
+        self.image_file_id = None
         self.updated_at = datetime.now()
     
     def update_ingredients(self, ingredients: Optional[str]) -> None:
@@ -50,4 +50,11 @@ class OrderDeliveryException(OrderException):
 
 class OrderTimeException(OrderException):
     """Exception raised when order time is invalid."""
-    pass
\ No newline at end of file
+    pass
+
+class CartChangedException(OrderException):
+    """Exception raised when cart prices or availability changed before checkout."""
+    
+    def __init__(self, validation):
+        super().__init__("Cart items changed since they were added", "cart_changed")
+        self.validation = validation
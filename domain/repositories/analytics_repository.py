@@ -0,0 +1,41 @@
+"""Analytics repository interface."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from shared.types.order_types import OrderPeriodStats
+
+
+class AnalyticsRepository(ABC):
+    """Aggregate queries for statistics; never loads individual rows."""
+    
+    @abstractmethod
+    async def get_order_period_stats(self, date_from: datetime, date_to: datetime) -> OrderPeriodStats:
+        """Get order count, revenue and active users for a period."""
+        pass
+    
+    @abstractmethod
+    async def count_orders_by_status(self, date_from: datetime, date_to: datetime) -> Dict[str, int]:
+        """Get order count per status for a period."""
+        pass
+    
+    @abstractmethod
+    async def count_orders_by_type(self, date_from: datetime, date_to: datetime) -> Dict[str, int]:
+        """Get order count per order type for a period."""
+        pass
+    
+    @abstractmethod
+    async def get_revenue_by_day(self, date_from: datetime, date_to: datetime) -> List[Tuple[str, int]]:
+        """Get (YYYY-MM-DD, revenue) pairs, highest revenue first."""
+        pass
+    
+    @abstractmethod
+    async def get_revenue_by_hour(self, date_from: datetime, date_to: datetime) -> List[Tuple[int, int]]:
+        """Get (hour, revenue) pairs, highest revenue first."""
+        pass
+    
+    @abstractmethod
+    async def count_users(self, created_from: Optional[datetime] = None) -> int:
+        """Count users, optionally only those registered since created_from."""
+        pass
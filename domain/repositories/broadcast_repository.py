@@ -0,0 +1,46 @@
+"""Broadcast campaign repository interface."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from domain.entities.broadcast_campaign import BroadcastCampaign
+
+
+class BroadcastRepository(ABC):
+    """Broadcast campaign repository interface.
+
+    `updated_at` doubles as the lease of the worker sending a campaign:
+    progress is saved only while it is unchanged, so a campaign cancelled
+    or taken over by another worker stops being written by the old one.
+    """
+
+    @abstractmethod
+    async def create(self, campaign: BroadcastCampaign) -> BroadcastCampaign:
+        """Create new campaign."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, campaign_id: str) -> Optional[BroadcastCampaign]:
+        """Get campaign by ID."""
+        pass
+
+    @abstractmethod
+    async def list_recent(self, limit: int = 10) -> List[BroadcastCampaign]:
+        """List latest campaigns, newest first."""
+        pass
+
+    @abstractmethod
+    async def claim_next(self, stale_before: datetime) -> Optional[BroadcastCampaign]:
+        """Mark oldest pending campaign (or running one not saved since stale_before) running and return it."""
+        pass
+
+    @abstractmethod
+    async def save_progress(self, campaign: BroadcastCampaign) -> bool:
+        """Save status, counts and position; False if the campaign changed since it was last saved."""
+        pass
+
+    @abstractmethod
+    async def cancel(self, campaign_id: str) -> bool:
+        """Cancel pending or running campaign."""
+        pass
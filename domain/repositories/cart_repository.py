@@ -1,7 +1,7 @@
 """Cart repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from domain.entities.cart import Cart
 
@@ -44,6 +44,21 @@ class CartRepository(ABC):
         """Add item to cart."""
         pass
     
+    @abstractmethod
+    async def add_item_returning(
+        self,
+        user_id: str,
+        item_id: str,
+        quantity: int,
+        comment: Optional[str] = None
+    ) -> Optional[Cart]:
+        """Add item to user's cart and return updated cart.
+
+        Returns None without changing anything if the user has no cart
+        or the menu item does not exist.
+        """
+        pass
+    
     @abstractmethod
     async def remove_item(self, cart_id: str, item_id: str) -> bool:
         """Remove item from cart."""
@@ -54,6 +69,11 @@ class CartRepository(ABC):
         """Update item quantity in cart."""
         pass
     
+    @abstractmethod
+    async def update_item_prices(self, cart_id: str, prices: Dict[str, int]) -> bool:
+        """Update prices of items in cart to current menu prices."""
+        pass
+    
     @abstractmethod
     async def get_cart_total(self, cart_id: str) -> int:
         """Get cart total amount in kopecks."""
@@ -52,6 +52,11 @@ class MenuRepository(ABC):
         """Get menu item by ID."""
         pass
     
+    @abstractmethod
+    async def get_menu_items_by_ids(self, item_ids: List[str]) -> List[MenuItem]:
+        """Get menu items by IDs; unknown IDs are skipped."""
+        pass
+    
     @abstractmethod
     async def get_menu_items_by_category(self, category_id: str, active_only: bool = True) -> List[MenuItem]:
         """Get menu items by category."""
@@ -63,8 +68,8 @@ class MenuRepository(ABC):
         pass
     
     @abstractmethod
-    async def search_menu_items(self, query: str, active_only: bool = True) -> List[MenuItem]:
-        """Search menu items by name or description."""
+    async def search_menu_items(self, query: str, active_only: bool = True, limit: int = 50) -> List[MenuItem]:
+        """Search menu items by name or description, best match first."""
         pass
     
     @abstractmethod
@@ -77,6 +82,16 @@ class MenuRepository(ABC):
         """Delete menu item."""
         pass
     
+    @abstractmethod
+    async def set_category_image_file_id(self, category_id: str, image_url: str, file_id: str) -> bool:
+        """Remember Telegram file_id of category image, unless the image has changed since."""
+        pass
+    
+    @abstractmethod
+    async def set_menu_item_image_file_id(self, item_id: str, image_url: str, file_id: str) -> bool:
+        """Remember Telegram file_id of menu item image, unless the image has changed since."""
+        pass
+    
     @abstractmethod
     async def count_menu_items(self, category_id: Optional[str] = None) -> int:
         """Count menu items."""
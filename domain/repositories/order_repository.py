@@ -2,11 +2,12 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from domain.entities.order import Order
 from shared.constants.order_constants import OrderStatus, OrderType, PaymentStatus
 from shared.types.order_types import OrderFilters
+from shared.types.pagination import Page
 
 
 class OrderRepository(ABC):
@@ -23,8 +24,8 @@ class OrderRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_user_id(self, user_id: str, limit: int = 50, offset: int = 0) -> List[Order]:
-        """Get orders by user ID."""
+    async def get_by_user_id(self, user_id: str, limit: int = 50) -> List[Order]:
+        """Get user's latest orders; older ones are paged with list_orders_page."""
         pass
     
     @abstractmethod
@@ -47,6 +48,17 @@ class OrderRepository(ABC):
         """List orders with filters."""
         pass
     
+    @abstractmethod
+    async def list_orders_page(
+        self,
+        filters: OrderFilters,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[Order]:
+        """List one page of filtered orders, newest first (keyset pagination)."""
+        pass
+    
     @abstractmethod
     async def get_orders_by_status(self, status: OrderStatus, limit: int = 100, offset: int = 0) -> List[Order]:
         """Get orders by status."""
@@ -100,4 +112,14 @@ class OrderRepository(ABC):
     @abstractmethod
     async def get_orders_by_filters(self, filters: OrderFilters) -> List[Order]:
         """Get orders by filters."""
+        pass
+    
+    @abstractmethod
+    async def get_top_items(
+        self,
+        limit: int = 10,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> List[Tuple[str, int, int]]:
+        """Get best-selling items as (name, quantity, revenue)."""
         pass
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Sales rollup repository interface."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from domain.entities.order import Order
+from shared.constants.order_constants import OrderStatus
+from shared.types.order_types import SalesRollupEntry
+
+
+class SalesRollupRepository(ABC):
+    """Pre-aggregated order counts and totals by creation hour, type and status.
+
+    Buckets are keyed by the hour the order was created in, so periods are
+    resolved with hourly precision.
+    """
+    
+    @abstractmethod
+    async def record_order(self, order: Order) -> None:
+        """Add new order to its bucket."""
+        pass
+    
+    @abstractmethod
+    async def move_order(self, order: Order, old_status: OrderStatus) -> None:
+        """Move order from its old-status bucket to the bucket of order.status."""
+        pass
+    
+    @abstractmethod
+    async def summarize(self, date_from: datetime, date_to: datetime) -> List[SalesRollupEntry]:
+        """Get totals per (status, order type) for a period."""
+        pass
+    
+    @abstractmethod
+    async def get_revenue_by_day(self, date_from: datetime, date_to: datetime) -> List[Tuple[str, int]]:
+        """Get (YYYY-MM-DD, revenue) pairs of completed orders, highest revenue first."""
+        pass
+    
+    @abstractmethod
+    async def get_revenue_by_hour(self, date_from: datetime, date_to: datetime) -> List[Tuple[int, int]]:
+        """Get (hour, revenue) pairs of completed orders, highest revenue first."""
+        pass
+    
+    @abstractmethod
+    async def rebuild(self, date_from: Optional[datetime] = None) -> int:
+        """Recompute rollup from orders (all history by default); return bucket count."""
+        pass
@@ -1,9 +1,12 @@
 """User repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
 from domain.entities.user import User
+from shared.types.pagination import Page
+from shared.types.user_types import UserRole, UserStatus
 
 
 class UserRepository(ABC):
@@ -24,6 +27,11 @@ class UserRepository(ABC):
         """Get user by Telegram ID."""
         pass
     
+    @abstractmethod
+    async def get_id_by_telegram_id(self, telegram_id: int) -> Optional[str]:
+        """Get internal user ID by Telegram ID."""
+        pass
+    
     @abstractmethod
     async def update(self, user: User) -> User:
         """Update user."""
@@ -39,6 +47,80 @@ class UserRepository(ABC):
         """List all users."""
         pass
     
+    @abstractmethod
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users, newest first (keyset pagination)."""
+        pass
+    
+    @abstractmethod
+    async def list_page_created_between(
+        self,
+        start: datetime,
+        end: datetime,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users created in [start, end), newest first."""
+        pass
+    
+    @abstractmethod
+    async def count_created_between(self, start: datetime, end: datetime) -> int:
+        """Count users created in [start, end)."""
+        pass
+    
+    @abstractmethod
+    async def list_page_by_role(
+        self,
+        role: UserRole,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users with role, newest first."""
+        pass
+    
+    @abstractmethod
+    async def list_page_by_status(
+        self,
+        status: UserStatus,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users with status, newest first."""
+        pass
+    
+    @abstractmethod
+    async def search_page(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users whose username or name contains query, newest first."""
+        pass
+    
+    @abstractmethod
+    def stream_notification_recipients(
+        self,
+        after_user_id: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Tuple[str, int]]:
+        """Stream (user_id, telegram_id) of users accepting notifications, in user id order."""
+        pass
+    
+    @abstractmethod
+    async def count_notification_recipients(self) -> int:
+        """Count users accepting notifications."""
+        pass
+    
     @abstractmethod
     async def get_admins(self) -> List[User]:
         """Get all admin users."""
@@ -0,0 +1,49 @@
+"""Broadcast service for promotional campaigns."""
+
+from typing import List, Optional
+from uuid import uuid4
+
+from domain.entities.broadcast_campaign import BroadcastCampaign
+from domain.repositories.broadcast_repository import BroadcastRepository
+from domain.repositories.user_repository import UserRepository
+
+
+class BroadcastService:
+    """Service for creating and tracking broadcast campaigns.
+
+    Campaigns are only recorded here; the broadcaster picks them up and
+    sends them in the background.
+    """
+
+    def __init__(self, broadcast_repository: BroadcastRepository, user_repository: UserRepository):
+        self.broadcast_repository = broadcast_repository
+        self.user_repository = user_repository
+
+    async def create_campaign(self, text: str, created_by: Optional[int] = None) -> BroadcastCampaign:
+        """Create campaign to all users accepting notifications."""
+        text = text.strip()
+        if not text:
+            raise ValueError("Broadcast text is empty")
+        campaign = BroadcastCampaign(
+            campaign_id=str(uuid4()),
+            text=text,
+            created_by=created_by,
+            total_recipients=await self.user_repository.count_notification_recipients(),
+        )
+        return await self.broadcast_repository.create(campaign)
+
+    async def get_campaign(self, campaign_id: str) -> Optional[BroadcastCampaign]:
+        """Get campaign by ID."""
+        return await self.broadcast_repository.get_by_id(campaign_id)
+
+    async def get_recent_campaigns(self, limit: int = 10) -> List[BroadcastCampaign]:
+        """Get latest campaigns, newest first."""
+        return await self.broadcast_repository.list_recent(limit)
+
+    async def cancel_campaign(self, campaign_id: str) -> bool:
+        """Stop campaign; recipients not reached yet are skipped."""
+        return await self.broadcast_repository.cancel(campaign_id)
+
+    async def count_recipients(self) -> int:
+        """Count users a new campaign would be sent to."""
+        return await self.user_repository.count_notification_recipients()
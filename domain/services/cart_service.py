@@ -9,10 +9,33 @@ from domain.entities.menu_item import MenuItem
 from domain.repositories.cart_repository import CartRepository
 from domain.repositories.menu_repository import MenuRepository
 from domain.repositories.user_repository import UserRepository
+from shared.types.cart_types import CartItemChange, CartValidationResult
 from shared.types.user_types import UserRole, UserStatus
 from shared.utils.helpers import generate_id
 
 
+async def check_cart(cart: Cart, menu_repository: MenuRepository) -> CartValidationResult:
+    """Compare cart with current menu, looking up all its items at once."""
+    items = cart.get_items_list()
+    menu_items = {
+        menu_item.item_id: menu_item
+        for menu_item in await menu_repository.get_menu_items_by_ids([item.item_id for item in items])
+    }
+    
+    result = CartValidationResult()
+    for item in items:
+        menu_item = menu_items.get(item.item_id)
+        if menu_item is None or not menu_item.is_available:
+            result.unavailable.append(CartItemChange(item.item_id, item.name, item.quantity, item.price))
+            continue
+        if menu_item.price != item.price:
+            result.price_changes.append(
+                CartItemChange(item.item_id, menu_item.name, item.quantity, item.price, menu_item.price)
+            )
+        result.total += menu_item.price * item.quantity
+    return result
+
+
 class CartService:
     """Cart service for business logic."""
     
@@ -26,11 +49,11 @@ class CartService:
         self.menu_repository = menu_repository
         self.user_repository = user_repository
     
-    async def _ensure_user(self, telegram_id: int) -> User:
-        """Get or create user by Telegram ID."""
-        user = await self.user_repository.get_by_telegram_id(telegram_id)
-        if user:
-            return user
+    async def _ensure_user(self, telegram_id: int) -> str:
+        """Get internal user ID by Telegram ID, creating user if needed."""
+        user_id = await self.user_repository.get_id_by_telegram_id(telegram_id)
+        if user_id:
+            return user_id
         user = User(
             user_id=generate_id(),
             telegram_id=telegram_id,
@@ -39,19 +62,24 @@ class CartService:
             created_at=datetime.now(),
             updated_at=datetime.now(),
         )
-        return await self.user_repository.create(user)
+        created = await self.user_repository.create(user)
+        return created.user_id
 
     async def get_or_create_cart(self, user_id: str | int) -> Cart:
         """Get existing cart or create new one for user."""
         telegram_id = int(user_id)
-        user = await self._ensure_user(telegram_id)
-        cart = await self.cart_repository.get_by_user_id(user.user_id)
+        internal_user_id = await self._ensure_user(telegram_id)
+        return await self._get_or_create_user_cart(internal_user_id)
+    
+    async def _get_or_create_user_cart(self, internal_user_id: str) -> Cart:
+        """Get existing cart or create new one for internal user ID."""
+        cart = await self.cart_repository.get_by_user_id(internal_user_id)
         
         if not cart:
             # Create new cart
             cart = Cart(
                 cart_id=generate_id(),
-                user_id=user.user_id,
+                user_id=internal_user_id,
                 items=[],
                 created_at=datetime.now(),
                 updated_at=datetime.now()
@@ -68,25 +96,26 @@ class CartService:
         comment: Optional[str] = None,
     ) -> Cart:
         """Add item to user's cart."""
-        # Get or create cart
-        cart = await self.get_or_create_cart(user_id)
+        internal_user_id = await self._ensure_user(int(user_id))
+        
+        # Fast path: single upsert returning the updated cart
+        cart = await self.cart_repository.add_item_returning(internal_user_id, item_id, quantity, comment)
+        if cart is not None:
+            return cart
         
-        # Get menu item
+        # Either the user has no cart yet or the menu item is unknown
         menu_item = await self.menu_repository.get_menu_item_by_id(item_id)
         if not menu_item:
             raise ValueError(f"Menu item with id {item_id} not found")
         
-        # Add item to cart
-        await self.cart_repository.add_item(cart.cart_id, item_id, quantity, comment)
-        
-        # Return updated cart
-        return await self.cart_repository.get_by_id(cart.cart_id)
+        await self._get_or_create_user_cart(internal_user_id)
+        return await self.cart_repository.add_item_returning(internal_user_id, item_id, quantity, comment)
     
     async def remove_item_from_cart(self, user_id: str | int, item_id: str) -> Cart:
         """Remove item from user's cart."""
         telegram_id = int(user_id)
-        user = await self._ensure_user(telegram_id)
-        cart = await self.cart_repository.get_by_user_id(user.user_id)
+        internal_user_id = await self._ensure_user(telegram_id)
+        cart = await self.cart_repository.get_by_user_id(internal_user_id)
         if not cart:
             raise ValueError("Cart not found")
         
@@ -97,8 +126,8 @@ class CartService:
     async def update_item_quantity(self, user_id: str | int, item_id: str, quantity: int) -> Cart:
         """Update item quantity in user's cart."""
         telegram_id = int(user_id)
-        user = await self._ensure_user(telegram_id)
-        cart = await self.cart_repository.get_by_user_id(user.user_id)
+        internal_user_id = await self._ensure_user(telegram_id)
+        cart = await self.cart_repository.get_by_user_id(internal_user_id)
         if not cart:
             raise ValueError("Cart not found")
         
@@ -109,29 +138,34 @@ class CartService:
     async def clear_cart(self, user_id: str | int) -> bool:
         """Clear user's cart."""
         telegram_id = int(user_id)
-        user = await self._ensure_user(telegram_id)
-        return await self.cart_repository.clear_user_cart(user.user_id)
+        internal_user_id = await self._ensure_user(telegram_id)
+        return await self.cart_repository.clear_user_cart(internal_user_id)
     
     async def get_cart_total(self, user_id: str | int) -> int:
         """Get cart total amount."""
         telegram_id = int(user_id)
-        user = await self._ensure_user(telegram_id)
-        cart = await self.cart_repository.get_by_user_id(user.user_id)
+        internal_user_id = await self._ensure_user(telegram_id)
+        cart = await self.cart_repository.get_by_user_id(internal_user_id)
         if not cart:
             return 0
         return await self.cart_repository.get_cart_total(cart.cart_id)
     
-    async def validate_cart(self, user_id: str | int) -> bool:
-        """Validate cart items availability and prices."""
+    async def validate_cart(self, user_id: str | int) -> CartValidationResult:
+        """Check availability and current prices of user's cart items."""
         telegram_id = int(user_id)
-        user = await self._ensure_user(telegram_id)
-        cart = await self.cart_repository.get_by_user_id(user.user_id)
-        if not cart or cart.is_empty():
-            return False
-        
-        # Check if all items are available
-        for item in cart.get_items_list():
-            if not item.menu_item.is_available:
-                return False
-        
-        return True
\ No newline at end of file
+        internal_user_id = await self._ensure_user(telegram_id)
+        cart = await self.cart_repository.get_by_user_id(internal_user_id)
+        if not cart:
+            return CartValidationResult()
+        return await check_cart(cart, self.menu_repository)
+    
+    async def apply_cart_changes(self, cart: Cart, validation: CartValidationResult) -> Cart:
+        """Drop unavailable items and move the rest to current prices."""
+        for change in validation.unavailable:
+            await self.cart_repository.remove_item(cart.cart_id, change.item_id)
+        if validation.price_changes:
+            await self.cart_repository.update_item_prices(
+                cart.cart_id,
+                {change.item_id: change.new_price for change in validation.price_changes}
+            )
+        return await self.cart_repository.get_by_id(cart.cart_id) or cart
\ No newline at end of file
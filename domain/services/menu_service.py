@@ -1,24 +1,35 @@
 """Menu service for business logic."""
 
+from datetime import datetime
 from typing import List, Optional
 
 from domain.entities.category import Category
 from domain.entities.menu_item import MenuItem
 from domain.repositories.menu_repository import MenuRepository
+from domain.value_objects.menu_snapshot import MenuSnapshot
 
 
 class MenuService:
-    """Menu service for business logic."""
+    """Menu service for business logic.
     
-    def __init__(self, menu_repository: MenuRepository):
+    When a menu snapshot is provided, reads are answered from it and the
+    repository is only used for writes.
+    """
+    
+    def __init__(self, menu_repository: MenuRepository, menu_snapshot: Optional[MenuSnapshot] = None):
         self.menu_repository = menu_repository
+        self.menu_snapshot = menu_snapshot
     
     async def get_categories(self, active_only: bool = True) -> List[Category]:
         """Get all categories."""
+        if self.menu_snapshot is not None:
+            return self.menu_snapshot.list_categories(active_only=active_only)
         return await self.menu_repository.list_categories(active_only=active_only)
     
     async def get_category(self, category_id: str) -> Optional[Category]:
         """Get category by ID."""
+        if self.menu_snapshot is not None:
+            return self.menu_snapshot.get_category(category_id)
         return await self.menu_repository.get_category_by_id(category_id)
     
     async def create_category(self, category: Category) -> Category:
@@ -48,6 +59,8 @@ class MenuService:
     
     async def get_menu_items(self, category_id: Optional[str] = None, active_only: bool = True) -> List[MenuItem]:
         """Get menu items."""
+        if self.menu_snapshot is not None:
+            return self.menu_snapshot.list_menu_items(category_id or None, active_only)
         if category_id:
             return await self.menu_repository.get_menu_items_by_category(category_id, active_only)
         else:
@@ -55,6 +68,8 @@ class MenuService:
     
     async def get_menu_item(self, item_id: str) -> Optional[MenuItem]:
         """Get menu item by ID."""
+        if self.menu_snapshot is not None:
+            return self.menu_snapshot.get_menu_item(item_id)
         return await self.menu_repository.get_menu_item_by_id(item_id)
     
     async def create_menu_item(self, menu_item: MenuItem) -> MenuItem:
@@ -81,23 +96,41 @@ class MenuService:
         if not category:
             raise ValueError(f"Category with id {menu_item.category_id} not found")
         
+        # Callers may set fields directly; rendered cards are keyed by updated_at
+        menu_item.updated_at = datetime.now()
         return await self.menu_repository.update_menu_item(menu_item)
     
+    async def set_category_image_file_id(self, category: Category, file_id: str) -> bool:
+        """Remember Telegram file_id of uploaded category image."""
+        if not category.image_url:
+            return False
+        category.image_file_id = file_id
+        return await self.menu_repository.set_category_image_file_id(category.category_id, category.image_url, file_id)
+    
+    async def set_menu_item_image_file_id(self, menu_item: MenuItem, file_id: str) -> bool:
+        """Remember Telegram file_id of uploaded menu item image."""
+        if not menu_item.image_url:
+            return False
+        menu_item.image_file_id = file_id
+        return await self.menu_repository.set_menu_item_image_file_id(menu_item.item_id, menu_item.image_url, file_id)
+    
     async def delete_menu_item(self, item_id: str) -> bool:
         """Delete menu item."""
         return await self.menu_repository.delete_menu_item(item_id)
     
-    async def search_menu_items(self, query: str, active_only: bool = True) -> List[MenuItem]:
-        """Search menu items."""
+    async def search_menu_items(self, query: str, active_only: bool = True, limit: int = 50) -> List[MenuItem]:
+        """Search menu items, best match first; tolerates typos, case and ё/е."""
         if not query or len(query.strip()) < 2:
             return []
         
-        return await self.menu_repository.search_menu_items(query.strip(), active_only)
+        if self.menu_snapshot is not None:
+            return self.menu_snapshot.search_menu_items(query.strip(), active_only, limit)
+        return await self.menu_repository.search_menu_items(query.strip(), active_only, limit)
     
     async def get_popular_items(self, limit: int = 10) -> List[MenuItem]:
         """Get popular menu items."""
         # Get all menu items and filter popular ones
-        all_items = await self.menu_repository.list_menu_items(active_only=True)
+        all_items = await self.get_menu_items(active_only=True)
         popular_items = [item for item in all_items if item.is_popular]
         
         # Sort by sort_order and limit
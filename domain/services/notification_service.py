@@ -1,105 +1,88 @@
 """Notification service for business logic."""
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, Optional, Type
 
 from domain.entities.order import Order
 from domain.entities.payment import Payment
 from domain.entities.user import User
+from infrastructure.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from infrastructure.telegram.send_queue import SendQueue
+    from infrastructure.telegram.utils.message_formatter import MessageFormatter
+
+logger = get_logger(__name__)
 
 
 class NotificationService:
-    """Notification service for business logic."""
-    
-    def __init__(self):
-        pass
-    
+    """Notification service for business logic.
+
+    Messages go through the rate-limited send queue as transactional
+    traffic, ahead of any broadcast, and are rendered by `formatter`.
+    Methods return once the message is queued; delivery failures are
+    logged by the queue. Promotions to all users are broadcast campaigns
+    (see BroadcastService).
+    """
+
+    def __init__(
+        self,
+        send_queue: Optional["SendQueue"] = None,
+        formatter: Optional[Type["MessageFormatter"]] = None,
+        admin_chat_id: Optional[int] = None,
+    ):
+        self.send_queue = send_queue
+        self.formatter = formatter
+        self.admin_chat_id = admin_chat_id
+
     async def send_order_created_notification(self, order: Order, user: User) -> bool:
         """Send order created notification."""
-        try:
-            # TODO: Implement actual notification sending via Telegram
-            # For now, just log the notification
-            print(f"📧 Order created notification sent to user {user.telegram_id}")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to send order created notification: {e}")
-            return False
-    
+        return await self._send(user.telegram_id, self.formatter.format_order_confirmation(order))
+
     async def send_order_status_changed_notification(self, order: Order, user: User) -> bool:
         """Send order status changed notification."""
-        try:
-            # TODO: Implement actual notification sending via Telegram
-            print(f"📧 Order status changed notification sent to user {user.telegram_id}")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to send order status changed notification: {e}")
-            return False
-    
+        return await self._send(user.telegram_id, self.formatter.format_order_status_update(order))
+
     async def send_payment_completed_notification(self, payment: Payment, user: User) -> bool:
         """Send payment completed notification."""
-        try:
-            # TODO: Implement actual notification sending via Telegram
-            print(f"📧 Payment completed notification sent to user {user.telegram_id}")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to send payment completed notification: {e}")
-            return False
-    
+        return await self._send(user.telegram_id, self.formatter.format_payment_success(payment.amount))
+
     async def send_payment_failed_notification(self, payment: Payment, user: User) -> bool:
         """Send payment failed notification."""
-        try:
-            # TODO: Implement actual notification sending via Telegram
-            print(f"📧 Payment failed notification sent to user {user.telegram_id}")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to send payment failed notification: {e}")
-            return False
-    
+        return await self._send(user.telegram_id, self.formatter.format_payment_failed())
+
     async def send_delivery_notification(self, order: Order, user: User) -> bool:
         """Send delivery notification."""
-        try:
-            # TODO: Implement actual notification sending via Telegram
-            print(f"📧 Delivery notification sent to user {user.telegram_id}")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to send delivery notification: {e}")
-            return False
-    
+        return await self._send(user.telegram_id, self.formatter.format_order_status_update(order))
+
     async def send_pickup_notification(self, order: Order, user: User) -> bool:
         """Send pickup notification."""
-        try:
-            # TODO: Implement actual notification sending via Telegram
-            print(f"📧 Pickup notification sent to user {user.telegram_id}")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to send pickup notification: {e}")
-            return False
-    
+        return await self._send(user.telegram_id, self.formatter.format_order_status_update(order))
+
     async def send_admin_notification(self, message: str, order: Optional[Order] = None) -> bool:
-        """Send notification to admin."""
-        try:
-            # TODO: Implement actual notification sending to admin chat
-            print(f"📧 Admin notification: {message}")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to send admin notification: {e}")
+        """Send notification to admin chat."""
+        if self.admin_chat_id is None:
+            logger.warning("Admin notification dropped: admin chat is not configured")
             return False
-    
+        if order is not None:
+            message = f"{message}\n\n{self.formatter.format_order_message(order)}"
+        return await self._send(self.admin_chat_id, message)
+
     async def send_courier_notification(self, message: str, order: Order) -> bool:
-        """Send notification to courier."""
-        try:
-            # TODO: Implement actual notification sending to courier
-            print(f"📧 Courier notification: {message}")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to send courier notification: {e}")
+        """Send notification to courier.
+
+        Couriers are not assigned to orders yet, so this goes to the admin chat.
+        """
+        return await self.send_admin_notification(f"🚚 {message}", order)
+
+    async def _send(self, chat_id: int, text: str) -> bool:
+        """Queue text message; False when it could not be queued."""
+        send_queue = self.send_queue
+        if send_queue is None:
+            logger.warning("Notification dropped: send queue is not running", chat_id=chat_id)
             return False
-    
-    async def send_promotion_notification(self, message: str, user_ids: List[str]) -> int:
-        """Send promotion notification to users."""
         try:
-            # TODO: Implement actual notification sending to multiple users
-            print(f"📧 Promotion notification sent to {len(user_ids)} users")
-            return len(user_ids)
+            await send_queue.submit_message(chat_id, text)
         except Exception as e:
-            print(f"❌ Failed to send promotion notification: {e}")
-            return 0
\ No newline at end of file
+            logger.error("Failed to queue notification", chat_id=chat_id, error=str(e))
+            return False
+        return True
@@ -5,11 +5,16 @@ from datetime import datetime
 
 from domain.entities.order import Order
 from domain.entities.cart import Cart
+from domain.exceptions.order_exception import CartChangedException
 from domain.repositories.cart_repository import CartRepository
+from domain.repositories.menu_repository import MenuRepository
 from domain.repositories.order_repository import OrderRepository
+from domain.repositories.sales_rollup_repository import SalesRollupRepository
 from domain.repositories.user_repository import UserRepository
+from domain.services.cart_service import check_cart
 from shared.constants.order_constants import OrderStatus, OrderType, PaymentMethod
 from shared.types.order_types import DeliveryInfo, OrderFilters, PickupInfo
+from shared.types.pagination import Page
 from shared.utils.helpers import generate_id
 
 
@@ -21,10 +26,14 @@ class OrderService:
         order_repository: OrderRepository,
         cart_repository: CartRepository,
         user_repository: UserRepository,
+        sales_rollup_repository: Optional[SalesRollupRepository] = None,
+        menu_repository: Optional[MenuRepository] = None,
     ):
         self.order_repository = order_repository
         self.cart_repository = cart_repository
         self.user_repository = user_repository
+        self.sales_rollup_repository = sales_rollup_repository
+        self.menu_repository = menu_repository
     
     async def _ensure_user(self, user_id_or_telegram: str | int) -> str:
         """Return internal user_id (UUID string) for given telegram id or internal id.
@@ -37,9 +46,9 @@ class OrderService:
         except (TypeError, ValueError):
             return str(user_id_or_telegram)
 
-        user = await self.user_repository.get_by_telegram_id(telegram_id)
-        if user:
-            return user.user_id
+        user_id = await self.user_repository.get_id_by_telegram_id(telegram_id)
+        if user_id:
+            return user_id
 
         # Create minimal user
         from domain.entities.user import User
@@ -71,6 +80,7 @@ class OrderService:
         cart = await self.cart_repository.get_by_user_id(internal_user_id)
         if not cart or cart.is_empty():
             raise ValueError("Cart is empty")
+        await self._check_cart(cart)
         
         # Create order
         
@@ -92,10 +102,7 @@ class OrderService:
         # Convert cart items to order items (lookup menu_item by id)
         for cart_item in cart.get_items_list():
             from domain.entities.order_item import OrderItem
-            # Lookup MenuItem via repository by id
-            from domain.repositories.menu_repository import MenuRepository  # type: ignore
-            # We don't have menu_repository on service; use repository from cart_repository if available
-            # Simpler: use cart_item fields (name/price) directly
+            # Prices were checked against the menu above
             order_item = OrderItem(
                 order_item_id=generate_id(),
                 order_id=order.order_id,
@@ -111,7 +118,7 @@ class OrderService:
             order.items.append(order_item)
         
         # Save order
-        return await self.order_repository.create(order)
+        return await self._save_new_order(order)
     
     async def create_order(
         self,
@@ -123,6 +130,7 @@ class OrderService:
     ) -> Order:
         """Create order from cart (simplified version)."""
         internal_user_id = await self._ensure_user(user_id)
+        await self._check_cart(cart)
 
         order = Order(
             order_id=generate_id(),
@@ -155,15 +163,53 @@ class OrderService:
             order.items.append(order_item)
         
         # Save order
-        return await self.order_repository.create(order)
+        return await self._save_new_order(order)
+    
+    async def _check_cart(self, cart: Cart) -> None:
+        """Refuse cart whose items changed price or became unavailable."""
+        if self.menu_repository is None:
+            return
+        validation = await check_cart(cart, self.menu_repository)
+        if not validation.is_valid:
+            raise CartChangedException(validation)
+    
+    async def _save_new_order(self, order: Order) -> Order:
+        """Persist new order and count it in the sales rollup."""
+        created = await self.order_repository.create(order)
+        if self.sales_rollup_repository is not None:
+            await self.sales_rollup_repository.record_order(created)
+        return created
+    
+    async def _save_status_change(self, order: Order, old_status: OrderStatus) -> Order:
+        """Persist order status change and move it between sales rollup buckets."""
+        updated = await self.order_repository.update(order)
+        if self.sales_rollup_repository is not None:
+            await self.sales_rollup_repository.move_order(updated, old_status)
+        return updated
     
     async def get_order(self, order_id: str) -> Optional[Order]:
         """Get order by ID."""
         return await self.order_repository.get_by_id(order_id)
     
-    async def get_user_orders(self, user_id: str, limit: int = 50, offset: int = 0) -> List[Order]:
-        """Get user's orders."""
-        return await self.order_repository.get_by_user_id(user_id, limit, offset)
+    async def get_user_orders(self, user_id: str, limit: int = 50) -> List[Order]:
+        """Get user's latest orders."""
+        return await self.order_repository.get_by_user_id(user_id, limit)
+    
+    async def get_user_orders_page(
+        self,
+        user_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[Order]:
+        """Get one page of user's orders."""
+        return await self.order_repository.list_orders_page(
+            OrderFilters(user_id=user_id), cursor, limit, backward
+        )
+    
+    async def count_user_orders(self, user_id: str) -> int:
+        """Count user's orders."""
+        return await self.order_repository.get_user_order_count(user_id)
     
     async def update_order_status(self, order_id: str, status: OrderStatus) -> Order:
         """Update order status."""
@@ -171,10 +217,11 @@ class OrderService:
         if not order:
             raise ValueError(f"Order with id {order_id} not found")
         
+        old_status = order.status
         order.status = status
         order.updated_at = datetime.now()
         
-        return await self.order_repository.update(order)
+        return await self._save_status_change(order, old_status)
     
     async def cancel_order(self, order_id: str, reason: Optional[str] = None) -> Order:
         """Cancel order."""
@@ -182,11 +229,12 @@ class OrderService:
         if not order:
             raise ValueError(f"Order with id {order_id} not found")
         
+        old_status = order.status
         order.status = OrderStatus.CANCELLED
         order.comment = reason if reason else order.comment
         order.updated_at = datetime.now()
         
-        return await self.order_repository.update(order)
+        return await self._save_status_change(order, old_status)
     
     async def list_orders(self, filters: OrderFilters) -> List[Order]:
         """List orders with filters."""
@@ -221,6 +269,30 @@ class OrderService:
             return []
         return await self.order_repository.get_orders_by_status(order_status)
     
+    async def get_orders_page_by_status(
+        self,
+        status: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[Order]:
+        """Get one page of orders by status."""
+        try:
+            order_status = OrderStatus(status)
+        except ValueError:
+            return Page()
+        return await self.order_repository.list_orders_page(
+            OrderFilters(status=order_status), cursor, limit, backward
+        )
+    
+    async def count_orders_by_status(self, status: str) -> int:
+        """Count orders by status."""
+        try:
+            order_status = OrderStatus(status)
+        except ValueError:
+            return 0
+        return await self.order_repository.count_orders(OrderFilters(status=order_status))
+    
     async def get_orders_by_user_id(self, user_id: str) -> List[Order]:
         """Get orders by user ID."""
         return await self.order_repository.get_orders_by_user_id(user_id)
\ No newline at end of file
@@ -1,13 +1,17 @@
 """Statistics service for calculating various statistics."""
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
+from domain.repositories.analytics_repository import AnalyticsRepository
 from domain.repositories.order_repository import OrderRepository
 from domain.repositories.user_repository import UserRepository
 from domain.repositories.menu_repository import MenuRepository
-from shared.types.order_types import OrderFilters
+from domain.repositories.sales_rollup_repository import SalesRollupRepository
 from shared.constants.order_constants import OrderStatus
+from shared.types.order_types import SalesRollupEntry
+
+COMPLETED_STATUSES = (OrderStatus.DELIVERED.value, OrderStatus.PICKED_UP.value)
 
 
 class StatisticsService:
@@ -17,43 +21,33 @@ class StatisticsService:
         self,
         order_repository: OrderRepository,
         user_repository: UserRepository,
-        menu_repository: MenuRepository
+        menu_repository: MenuRepository,
+        analytics_repository: AnalyticsRepository,
+        sales_rollup_repository: Optional[SalesRollupRepository] = None
     ):
         self.order_repository = order_repository
         self.user_repository = user_repository
         self.menu_repository = menu_repository
+        self.analytics_repository = analytics_repository
+        self.sales_rollup_repository = sales_rollup_repository
 
     async def get_dashboard_summary(self) -> Dict[str, Any]:
         """Get dashboard summary statistics."""
         today = datetime.now().date()
         yesterday = today - timedelta(days=1)
+        today_start = datetime.combine(today, datetime.min.time())
         
-        # Today's statistics
-        today_orders = await self.order_repository.get_orders_by_filters(
-            OrderFilters(date_from=datetime.combine(today, datetime.min.time()), 
-                        date_to=datetime.combine(today, datetime.max.time()))
+        today_stats = await self.analytics_repository.get_order_period_stats(
+            today_start, datetime.combine(today, datetime.max.time())
         )
-        
-        # Yesterday's statistics
-        yesterday_orders = await self.order_repository.get_orders_by_filters(
-            OrderFilters(date_from=datetime.combine(yesterday, datetime.min.time()), 
-                        date_to=datetime.combine(yesterday, datetime.max.time()))
+        yesterday_stats = await self.analytics_repository.get_order_period_stats(
+            datetime.combine(yesterday, datetime.min.time()),
+            datetime.combine(yesterday, datetime.max.time())
         )
         
-        # Calculate today's metrics
-        today_revenue = sum(order.total for order in today_orders 
-                          if order.status in [OrderStatus.DELIVERED, OrderStatus.PICKED_UP])
-        today_avg_order = today_revenue // len(today_orders) if today_orders else 0
-        
-        # Calculate yesterday's metrics
-        yesterday_revenue = sum(order.total for order in yesterday_orders 
-                              if order.status in [OrderStatus.DELIVERED, OrderStatus.PICKED_UP])
-        yesterday_avg_order = yesterday_revenue // len(yesterday_orders) if yesterday_orders else 0
-        
         # User statistics
-        all_users = await self.user_repository.list_all()
-        new_users_today = len([u for u in all_users if u.created_at.date() == today])
-        active_users_today = len(set(order.user_id for order in today_orders))
+        total_users = await self.analytics_repository.count_users()
+        new_users_today = await self.analytics_repository.count_users(created_from=today_start)
         
         # Menu statistics
         categories = await self.menu_repository.list_categories()
@@ -61,19 +55,19 @@ class StatisticsService:
         
         return {
             'today': {
-                'orders': len(today_orders),
-                'revenue': today_revenue,
-                'avg_order': today_avg_order
+                'orders': today_stats.total_orders,
+                'revenue': today_stats.revenue,
+                'avg_order': today_stats.average_order_value
             },
             'yesterday': {
-                'orders': len(yesterday_orders),
-                'revenue': yesterday_revenue,
-                'avg_order': yesterday_avg_order
+                'orders': yesterday_stats.total_orders,
+                'revenue': yesterday_stats.revenue,
+                'avg_order': yesterday_stats.average_order_value
             },
             'users': {
-                'total_users': len(all_users),
+                'total_users': total_users,
                 'new_users_today': new_users_today,
-                'active_users_today': active_users_today
+                'active_users_today': today_stats.active_users
             },
             'menu': {
                 'total_categories': len(categories),
@@ -83,67 +77,40 @@ class StatisticsService:
 
     async def get_sales_statistics(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """Get sales statistics for a period."""
-        orders = await self.order_repository.get_orders_by_filters(
-            OrderFilters(date_from=start_date, date_to=end_date)
-        )
-        
-        # Filter completed orders for revenue calculation
-        completed_orders = [order for order in orders 
-                          if order.status in [OrderStatus.DELIVERED, OrderStatus.PICKED_UP]]
-        
-        total_sales = sum(order.total for order in completed_orders)
-        
-        # Sales by day
-        sales_by_day = {}
-        for order in completed_orders:
-            day = order.created_at.date().strftime('%Y-%m-%d')
-            sales_by_day[day] = sales_by_day.get(day, 0) + order.total
+        if self.sales_rollup_repository is not None:
+            entries = await self.sales_rollup_repository.summarize(start_date, end_date)
+            return {
+                'total_sales': sum(e.revenue for e in entries if e.status in COMPLETED_STATUSES),
+                'sales_by_day': await self.sales_rollup_repository.get_revenue_by_day(start_date, end_date),
+                'sales_by_hour': await self.sales_rollup_repository.get_revenue_by_hour(start_date, end_date)
+            }
         
-        # Sales by hour
-        sales_by_hour = {}
-        for order in completed_orders:
-            hour = order.created_at.hour
-            sales_by_hour[hour] = sales_by_hour.get(hour, 0) + order.total
+        period_stats = await self.analytics_repository.get_order_period_stats(start_date, end_date)
         
         return {
-            'total_sales': total_sales,
-            'sales_by_day': sorted(sales_by_day.items(), key=lambda x: x[1], reverse=True),
-            'sales_by_hour': sorted(sales_by_hour.items(), key=lambda x: x[1], reverse=True)
+            'total_sales': period_stats.revenue,
+            'sales_by_day': await self.analytics_repository.get_revenue_by_day(start_date, end_date),
+            'sales_by_hour': await self.analytics_repository.get_revenue_by_hour(start_date, end_date)
         }
 
     async def get_user_statistics(self) -> Dict[str, Any]:
         """Get user statistics."""
-        all_users = await self.user_repository.list_all()
-        
-        today = datetime.now().date()
-        week_ago = today - timedelta(days=7)
-        month_ago = today - timedelta(days=30)
-        
-        # Count new users
-        new_users_today = len([u for u in all_users if u.created_at.date() == today])
-        new_users_this_week = len([u for u in all_users if u.created_at.date() >= week_ago])
-        new_users_this_month = len([u for u in all_users if u.created_at.date() >= month_ago])
+        now = datetime.now()
+        today_start = datetime.combine(now.date(), datetime.min.time())
+        week_start = today_start - timedelta(days=7)
+        month_start = today_start - timedelta(days=30)
         
         # Active users (users who made orders)
-        today_orders = await self.order_repository.get_orders_by_filters(
-            OrderFilters(date_from=datetime.combine(today, datetime.min.time()), 
-                        date_to=datetime.combine(today, datetime.max.time()))
-        )
-        week_orders = await self.order_repository.get_orders_by_filters(
-            OrderFilters(date_from=datetime.combine(week_ago, datetime.min.time()), 
-                        date_to=datetime.now())
-        )
-        
-        active_users_today = len(set(order.user_id for order in today_orders))
-        active_users_this_week = len(set(order.user_id for order in week_orders))
+        today_stats = await self.analytics_repository.get_order_period_stats(today_start, now)
+        week_stats = await self.analytics_repository.get_order_period_stats(week_start, now)
         
         return {
-            'total_users': len(all_users),
-            'new_users_today': new_users_today,
-            'new_users_this_week': new_users_this_week,
-            'new_users_this_month': new_users_this_month,
-            'active_users_today': active_users_today,
-            'active_users_this_week': active_users_this_week
+            'total_users': await self.analytics_repository.count_users(),
+            'new_users_today': await self.analytics_repository.count_users(created_from=today_start),
+            'new_users_this_week': await self.analytics_repository.count_users(created_from=week_start),
+            'new_users_this_month': await self.analytics_repository.count_users(created_from=month_start),
+            'active_users_today': today_stats.active_users,
+            'active_users_this_week': week_stats.active_users
         }
 
     async def get_menu_statistics(self) -> Dict[str, Any]:
@@ -162,8 +129,11 @@ class StatisticsService:
         
         top_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
         
-        # Top items (placeholder - would need order item data)
-        top_items = []  # This would require order item statistics
+        # Top items by quantity sold, aggregated in the database
+        top_items = [
+            (name, quantity)
+            for name, quantity, _revenue in await self.order_repository.get_top_items(limit=10)
+        ]
         
         return {
             'total_categories': len(categories),
@@ -176,32 +146,38 @@ class StatisticsService:
 
     async def get_order_statistics(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """Get order statistics for a period."""
-        orders = await self.order_repository.get_orders_by_filters(
-            OrderFilters(date_from=start_date, date_to=end_date)
-        )
+        if self.sales_rollup_repository is not None:
+            return self._order_statistics_from_rollup(
+                await self.sales_rollup_repository.summarize(start_date, end_date)
+            )
         
         # Revenue only from completed orders (delivered/picked up)
-        completed_orders = [order for order in orders 
-                          if order.status in [OrderStatus.DELIVERED, OrderStatus.PICKED_UP]]
-        total_revenue = sum(order.total for order in completed_orders)
-        average_order_value = total_revenue // len(completed_orders) if completed_orders else 0
-        
-        # Orders by status
-        orders_by_status = {}
-        for order in orders:
-            status = order.status.value
-            orders_by_status[status] = orders_by_status.get(status, 0) + 1
-        
-        # Orders by type
-        orders_by_type = {}
-        for order in orders:
-            order_type = order.order_type.value
-            orders_by_type[order_type] = orders_by_type.get(order_type, 0) + 1
+        period_stats = await self.analytics_repository.get_order_period_stats(start_date, end_date)
+        
+        return {
+            'total_orders': period_stats.total_orders,
+            'total_revenue': period_stats.revenue,
+            'average_order_value': period_stats.average_order_value,
+            'orders_by_status': await self.analytics_repository.count_orders_by_status(start_date, end_date),
+            'orders_by_type': await self.analytics_repository.count_orders_by_type(start_date, end_date)
+        }
+
+    def _order_statistics_from_rollup(self, entries: List[SalesRollupEntry]) -> Dict[str, Any]:
+        """Build order statistics from (status, order type) rollup totals."""
+        completed = [e for e in entries if e.status in COMPLETED_STATUSES]
+        total_revenue = sum(e.revenue for e in completed)
+        completed_orders = sum(e.order_count for e in completed)
+        
+        orders_by_status: Dict[str, int] = {}
+        orders_by_type: Dict[str, int] = {}
+        for entry in entries:
+            orders_by_status[entry.status] = orders_by_status.get(entry.status, 0) + entry.order_count
+            orders_by_type[entry.order_type] = orders_by_type.get(entry.order_type, 0) + entry.order_count
         
         return {
-            'total_orders': len(orders),
+            'total_orders': sum(e.order_count for e in entries),
             'total_revenue': total_revenue,
-            'average_order_value': average_order_value,
+            'average_order_value': total_revenue // completed_orders if completed_orders else 0,
             'orders_by_status': orders_by_status,
             'orders_by_type': orders_by_type
         }
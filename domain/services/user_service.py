@@ -1,11 +1,13 @@
 """User service for user-related business logic."""
 
-from datetime import datetime, date
-from typing import List, Optional
+from datetime import datetime, date, time, timedelta
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from domain.entities.user import User
 from domain.repositories.user_repository import UserRepository
+from shared.types.pagination import Page
+from shared.types.user_types import UserRole, UserStatus
 
 
 class UserService:
@@ -59,20 +61,48 @@ class UserService:
         """Get all users."""
         return await self.user_repository.list_all()
 
-    async def get_users_by_date(self, target_date: date) -> List[User]:
-        """Get users created on a specific date."""
-        all_users = await self.user_repository.list_all()
-        return [user for user in all_users if user.created_at.date() == target_date]
-
-    async def get_active_users(self) -> List[User]:
-        """Get active users."""
-        all_users = await self.user_repository.list_all()
-        return [user for user in all_users if user.is_active and not user.is_blocked]
-
-    async def get_admin_users(self) -> List[User]:
-        """Get admin users."""
-        all_users = await self.user_repository.list_all()
-        return [user for user in all_users if user.is_admin]
+    async def get_users_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """Get one page of users, newest first."""
+        return await self.user_repository.list_page(cursor, limit, backward)
+
+    async def get_users_by_date(
+        self,
+        target_date: date,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """Get one page of users created on a specific date."""
+        start, end = self._day_bounds(target_date)
+        return await self.user_repository.list_page_created_between(start, end, cursor, limit, backward)
+
+    async def count_users_by_date(self, target_date: date) -> int:
+        """Get count of users created on a specific date."""
+        start, end = self._day_bounds(target_date)
+        return await self.user_repository.count_created_between(start, end)
+
+    async def get_active_users(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """Get one page of active users."""
+        return await self.user_repository.list_page_by_status(UserStatus.ACTIVE, cursor, limit, backward)
+
+    async def get_admin_users(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """Get one page of admin users."""
+        return await self.user_repository.list_page_by_role(UserRole.ADMIN, cursor, limit, backward)
 
     async def block_user(self, user_id: str) -> bool:
         """Block a user."""
@@ -96,17 +126,20 @@ class UserService:
 
     async def get_user_count(self) -> int:
         """Get total user count."""
-        users = await self.user_repository.list_all()
-        return len(users)
+        return await self.user_repository.count()
 
-    async def search_users(self, query: str) -> List[User]:
-        """Search users by username, first name, or last name."""
-        all_users = await self.user_repository.list_all()
-        query_lower = query.lower()
-        
-        return [
-            user for user in all_users
-            if (user.username and query_lower in user.username.lower()) or
-               (user.first_name and query_lower in user.first_name.lower()) or
-               (user.last_name and query_lower in user.last_name.lower())
-        ]
+    async def search_users(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """Search users by username, first name, or last name (case-insensitive substring)."""
+        return await self.user_repository.search_page(query, cursor, limit, backward)
+
+    @staticmethod
+    def _day_bounds(target_date: date) -> Tuple[datetime, datetime]:
+        """Get [start, end) datetimes of a day."""
+        start = datetime.combine(target_date, time.min)
+        return start, start + timedelta(days=1)
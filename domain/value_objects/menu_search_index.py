@@ -0,0 +1,43 @@
+"""In-process menu search index."""
+
+import copy
+from typing import Iterable, List
+
+from domain.entities.menu_item import MenuItem
+from shared.utils.text_search import TrigramIndex
+
+# Same ranking as the PostgreSQL search: a description match counts half a name match.
+# MIN_SCORE is the share of query trigrams an item must contain (pg_trgm uses 0.6).
+NAME_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.5
+MIN_SCORE = 0.5
+
+
+class MenuSearchIndex:
+    """Ranked, typo-tolerant menu item search over a fixed set of items.
+
+    Built once per menu version (snapshot or cached menu) and answers
+    searches without touching the database. Case and ё/е are ignored.
+    """
+
+    def __init__(self, menu_items: Iterable[MenuItem]):
+        self._items = {}
+        self._index: TrigramIndex[str] = TrigramIndex()
+        for item in sorted(menu_items, key=lambda i: (i.sort_order, i.name)):
+            self._items[item.item_id] = item
+            self._index.add(item.item_id, ((item.name, NAME_WEIGHT), (item.description, DESCRIPTION_WEIGHT)))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def search(self, query: str, active_only: bool = True, limit: int = 50) -> List[MenuItem]:
+        """Get items matching query, best match first."""
+        results = []
+        for item_id, _score in self._index.search(query, MIN_SCORE):
+            item = self._items[item_id]
+            if active_only and not item.is_available:
+                continue
+            results.append(copy.copy(item))
+            if len(results) >= limit:
+                break
+        return results
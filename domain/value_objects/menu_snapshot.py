@@ -0,0 +1,70 @@
+"""Menu snapshot value object."""
+
+import copy
+from typing import Dict, List, Optional
+
+from domain.entities.category import Category
+from domain.entities.menu_item import MenuItem
+from domain.value_objects.menu_search_index import MenuSearchIndex
+
+
+class MenuSnapshot:
+    """Immutable, versioned copy of the whole menu (categories and items).
+
+    Lookups return copies so callers may mutate results freely.
+    """
+
+    def __init__(self, version: int, categories: List[Category], menu_items: List[MenuItem]):
+        self.version = version
+        self._categories = sorted(categories, key=lambda c: (c.sort_order, c.name))
+        self._menu_items = sorted(menu_items, key=lambda i: (i.sort_order, i.name))
+        self._categories_by_id: Dict[str, Category] = {c.category_id: c for c in self._categories}
+        self._items_by_id: Dict[str, MenuItem] = {i.item_id: i for i in self._menu_items}
+        self._items_by_category: Dict[str, List[MenuItem]] = {}
+        for item in self._menu_items:
+            self._items_by_category.setdefault(item.category_id, []).append(item)
+        self._search_index: Optional[MenuSearchIndex] = None
+
+    @property
+    def categories(self) -> List[Category]:
+        """All categories ordered by sort order and name."""
+        return [copy.copy(category) for category in self._categories]
+
+    @property
+    def menu_items(self) -> List[MenuItem]:
+        """All menu items ordered by sort order and name."""
+        return [copy.copy(item) for item in self._menu_items]
+
+    def list_categories(self, active_only: bool = True) -> List[Category]:
+        """List categories."""
+        return [
+            copy.copy(category) for category in self._categories
+            if category.is_active or not active_only
+        ]
+
+    def get_category(self, category_id: str) -> Optional[Category]:
+        """Get category by ID."""
+        category = self._categories_by_id.get(category_id)
+        return copy.copy(category) if category else None
+
+    def list_menu_items(self, category_id: Optional[str] = None, active_only: bool = True) -> List[MenuItem]:
+        """List menu items, optionally for a single category."""
+        items = self._menu_items if category_id is None else self._items_by_category.get(category_id, [])
+        return [copy.copy(item) for item in items if item.is_available or not active_only]
+
+    def get_menu_item(self, item_id: str) -> Optional[MenuItem]:
+        """Get menu item by ID."""
+        item = self._items_by_id.get(item_id)
+        return copy.copy(item) if item else None
+
+    def search_menu_items(self, query: str, active_only: bool = True, limit: int = 50) -> List[MenuItem]:
+        """Search menu items, best match first; the index is built on first search."""
+        if self._search_index is None:
+            self._search_index = MenuSearchIndex(self._menu_items)
+        return self._search_index.search(query, active_only, limit)
+
+    def __str__(self) -> str:
+        return f"MenuSnapshot(version={self.version}, categories={len(self._categories)}, items={len(self._menu_items)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1 @@
+# Caching infrastructure
\ No newline at end of file
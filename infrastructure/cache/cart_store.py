@@ -0,0 +1,288 @@
+"""Redis storage for active carts."""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from domain.entities.cart import Cart, CartItem
+from infrastructure.logging.logger import get_logger
+from shared.constants.bot_constants import MAX_CART_ITEM_QUANTITY
+
+logger = get_logger(__name__)
+
+_META = "meta"
+_UPDATED_AT = "updated_at"
+_QUANTITY = "q:"
+_DETAILS = "d:"
+_COMMENT = "c:"
+
+# HINCRBY capped at a maximum; runs atomically, so concurrent adds cannot
+# overwrite each other or leave the quantity above the cap
+_INCREMENT_CAPPED = """
+local quantity = redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+local cap = tonumber(ARGV[3])
+if quantity > cap then
+    redis.call('HSET', KEYS[1], ARGV[1], cap)
+    quantity = cap
+end
+return quantity
+"""
+
+
+class RedisCartStore:
+    """Keeps active carts in Redis hashes.
+
+    `<prefix>:<cart_id>` holds one cart: `meta` and `updated_at` fields plus,
+    per item, `q:<item>` (quantity), `d:<item>` (name, price and time the item
+    was first added) and `c:<item>` (comment). `<prefix>:user:<user_id>`
+    points to the user's cart, `<prefix>:dirty` is the set of carts changed
+    since they were last persisted and `<prefix>:deleted:<cart_id>` marks
+    deleted carts.
+
+    Every write is a single MULTI/EXEC that also refreshes the TTL, so one
+    HGETALL always returns a consistent cart.
+    """
+
+    def __init__(self, redis, prefix: str = "cart", ttl: int = 3 * 24 * 3600):
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl = ttl
+        self._pending_deletes: Set[asyncio.Task] = set()
+
+    @property
+    def dirty_key(self) -> str:
+        return f"{self.prefix}:dirty"
+
+    def cart_key(self, cart_id: str) -> str:
+        return f"{self.prefix}:{cart_id}"
+
+    def user_key(self, user_id: str) -> str:
+        return f"{self.prefix}:user:{user_id}"
+
+    def tombstone_key(self, cart_id: str) -> str:
+        return f"{self.prefix}:deleted:{cart_id}"
+
+    async def get_cart_id(self, user_id: str) -> Optional[str]:
+        """Get ID of user's active cart."""
+        return _to_str(await self.redis.get(self.user_key(user_id)))
+
+    async def load(self, cart_id: str) -> Optional[Cart]:
+        """Load cart, None when it is not in Redis."""
+        return self.parse(await self.redis.hgetall(self.cart_key(cart_id)))
+
+    async def save(self, cart: Cart, dirty: bool = True) -> None:
+        """Store whole cart, replacing what Redis has for it."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self.cart_key(cart.cart_id))
+            pipe.hset(self.cart_key(cart.cart_id), mapping=self.dumps(cart))
+            self._touch(pipe, cart.cart_id, cart.user_id, dirty)
+            await pipe.execute()
+
+    async def hydrate(self, cart: Cart) -> Optional[Cart]:
+        """Put cart loaded from the database into Redis and return what Redis holds.
+
+        Fields written concurrently by another update win over the loaded copy.
+        Returns None for a deleted cart.
+        """
+        if await self.is_deleted(cart.cart_id):
+            return None
+        key = self.cart_key(cart.cart_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for field, value in self.dumps(cart).items():
+                pipe.hsetnx(key, field, value)
+            self._touch(pipe, cart.cart_id, cart.user_id, dirty=False)
+            pipe.hgetall(key)
+            results = await pipe.execute()
+        return self.parse(results[-1]) or cart
+
+    async def add_item(
+        self,
+        cart: Cart,
+        item_id: str,
+        name: str,
+        price: int,
+        quantity: int,
+        comment: Optional[str] = None,
+    ) -> Cart:
+        """Add quantity of item and return updated cart."""
+        key = self.cart_key(cart.cart_id)
+        details = json.dumps({"name": name, "price": price, "added_at": time.time()})
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hsetnx(key, _DETAILS + item_id, details)
+            pipe.eval(_INCREMENT_CAPPED, 1, key, _QUANTITY + item_id, quantity, MAX_CART_ITEM_QUANTITY)
+            if comment:
+                pipe.hset(key, _COMMENT + item_id, comment)
+            self._touch(pipe, cart.cart_id, cart.user_id)
+            pipe.hgetall(key)
+            results = await pipe.execute()
+        return self.parse(results[-1])
+
+    async def set_quantity(self, cart: Cart, item_id: str, quantity: int) -> bool:
+        """Set quantity of item already in cart; non-positive quantity removes it."""
+        if quantity <= 0:
+            return await self.remove_item(cart, item_id)
+        if item_id not in cart.items:
+            return False
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self.cart_key(cart.cart_id), _QUANTITY + item_id, min(quantity, MAX_CART_ITEM_QUANTITY))
+            self._touch(pipe, cart.cart_id, cart.user_id)
+            await pipe.execute()
+        return True
+
+    async def set_prices(self, cart: Cart, prices: Dict[str, int]) -> bool:
+        """Replace stored price of items already in cart."""
+        item_ids = [item_id for item_id in prices if item_id in cart.items]
+        if not item_ids:
+            return False
+        key = self.cart_key(cart.cart_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for item_id in item_ids:
+                pipe.hget(key, _DETAILS + item_id)
+            stored = await pipe.execute()
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for item_id, details in zip(item_ids, stored):
+                if details is None:
+                    continue
+                details = json.loads(details)
+                details["price"] = prices[item_id]
+                pipe.hset(key, _DETAILS + item_id, json.dumps(details))
+            self._touch(pipe, cart.cart_id, cart.user_id)
+            await pipe.execute()
+        return True
+
+    async def remove_item(self, cart: Cart, item_id: str) -> bool:
+        """Remove item from cart."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hdel(self.cart_key(cart.cart_id), _QUANTITY + item_id, _DETAILS + item_id, _COMMENT + item_id)
+            self._touch(pipe, cart.cart_id, cart.user_id)
+            results = await pipe.execute()
+        return results[0] > 0
+
+    async def touch(self, cart: Cart) -> None:
+        """Mark cart as changed."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            self._touch(pipe, cart.cart_id, cart.user_id)
+            await pipe.execute()
+
+    async def delete(self, cart_id: str, user_id: Optional[str] = None) -> bool:
+        """Drop cart from Redis for good.
+
+        Leaves a tombstone so the cart is never hydrated again from a database
+        copy that a concurrent flush may still write, and marks it dirty so the
+        next flush removes that copy.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self.cart_key(cart_id))
+            if user_id is not None:
+                pipe.delete(self.user_key(user_id))
+            pipe.set(self.tombstone_key(cart_id), 1, ex=self.ttl)
+            pipe.sadd(self.dirty_key, cart_id)
+            results = await pipe.execute()
+        return results[0] > 0
+
+    async def exists(self, cart_id: str) -> bool:
+        """Whether cart is in Redis."""
+        return bool(await self.redis.exists(self.cart_key(cart_id)))
+
+    async def is_deleted(self, cart_id: str) -> bool:
+        """Whether cart was dropped with `delete` (not just expired or evicted)."""
+        return bool(await self.redis.exists(self.tombstone_key(cart_id)))
+
+    def delete_later(self, cart_id: str, user_id: Optional[str] = None) -> None:
+        """Start deleting cart in the background; `join` waits for it."""
+        task = asyncio.get_running_loop().create_task(self.delete(cart_id, user_id))
+        self._pending_deletes.add(task)
+        task.add_done_callback(self._delete_done)
+
+    async def join(self) -> None:
+        """Wait for deletions started with `delete_later`."""
+        if self._pending_deletes:
+            await asyncio.gather(*self._pending_deletes, return_exceptions=True)
+
+    def _delete_done(self, task: asyncio.Task) -> None:
+        self._pending_deletes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Failed to delete cart from Redis", error=str(task.exception()))
+
+    async def pop_dirty(self, count: int) -> List[str]:
+        """Take up to count changed carts for persisting."""
+        cart_ids = await self.redis.spop(self.dirty_key, count)
+        return [_to_str(cart_id) for cart_id in cart_ids or []]
+
+    async def mark_dirty(self, cart_ids: List[str]) -> None:
+        """Return carts to the set of changed carts."""
+        if cart_ids:
+            await self.redis.sadd(self.dirty_key, *cart_ids)
+
+    def _touch(self, pipe, cart_id: str, user_id: str, dirty: bool = True) -> None:
+        key = self.cart_key(cart_id)
+        if dirty:
+            # Recreates meta if the hash expired between reading and writing
+            pipe.hsetnx(key, _META, self._meta(cart_id, user_id, datetime.now()))
+            pipe.hset(key, _UPDATED_AT, datetime.now().isoformat())
+            pipe.sadd(self.dirty_key, cart_id)
+        pipe.expire(key, self.ttl)
+        pipe.set(self.user_key(user_id), cart_id, ex=self.ttl)
+
+    # Serialization
+    @staticmethod
+    def _meta(cart_id: str, user_id: str, created_at: datetime) -> str:
+        return json.dumps({"cart_id": cart_id, "user_id": user_id, "created_at": created_at.isoformat()})
+
+    @classmethod
+    def dumps(cls, cart: Cart) -> Dict[str, Any]:
+        """Serialize cart to hash fields."""
+        fields: Dict[str, Any] = {
+            _META: cls._meta(cart.cart_id, cart.user_id, cart.created_at),
+            _UPDATED_AT: cart.updated_at.isoformat(),
+        }
+        for position, item in enumerate(cart.get_items_list()):
+            fields[_QUANTITY + item.item_id] = item.quantity
+            fields[_DETAILS + item.item_id] = json.dumps(
+                {"name": item.name, "price": item.price, "added_at": position}
+            )
+            if item.comment:
+                fields[_COMMENT + item.item_id] = item.comment
+        return fields
+
+    @classmethod
+    def parse(cls, fields: Dict[Any, Any]) -> Optional[Cart]:
+        """Build cart from HGETALL result."""
+        fields = {_to_str(key): _to_str(value) for key, value in (fields or {}).items()}
+        if _META not in fields:
+            return None
+        meta = json.loads(fields[_META])
+
+        items = []
+        for field, value in fields.items():
+            if not field.startswith(_QUANTITY):
+                continue
+            item_id = field[len(_QUANTITY):]
+            quantity = int(value)
+            details = fields.get(_DETAILS + item_id)
+            if quantity <= 0 or details is None:
+                continue
+            details = json.loads(details)
+            items.append((details["added_at"], CartItem(
+                item_id=item_id,
+                name=details["name"],
+                price=details["price"],
+                quantity=quantity,
+                comment=fields.get(_COMMENT + item_id),
+            )))
+        items.sort(key=lambda entry: entry[0])
+
+        return Cart(
+            cart_id=meta["cart_id"],
+            user_id=meta["user_id"],
+            items={item.item_id: item for _, item in items},
+            created_at=datetime.fromisoformat(meta["created_at"]),
+            updated_at=datetime.fromisoformat(fields.get(_UPDATED_AT) or meta["created_at"]),
+        )
+
+
+def _to_str(value: Any) -> Any:
+    return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,131 @@
+"""Persists carts kept in Redis to the database in the background."""
+
+import asyncio
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.cache.cart_store import RedisCartStore
+from infrastructure.database.connection import get_sessionmaker
+from infrastructure.database.repositories.cart_repository_impl import CartRepositoryImpl
+from infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CartWriteBehind:
+    """Flushes carts changed in Redis to the `carts`/`cart_items` tables.
+
+    Carts are taken off the dirty set before they are read, so an edit made
+    while a flush is running marks the cart dirty again and is picked up by
+    the next flush. Carts that fail to persist because of a transient error
+    are returned to the dirty set. A dirty cart missing from Redis is deleted
+    from the database only when it was deleted on purpose; one that expired
+    or was evicted keeps its last persisted copy.
+    """
+
+    def __init__(
+        self,
+        store: RedisCartStore,
+        session_maker: Callable[[], async_sessionmaker[AsyncSession]] = get_sessionmaker,
+        interval: float = 30.0,
+        batch_size: int = 100,
+    ):
+        self.store = store
+        self._session_maker = session_maker
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start periodic flushing."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic flushing and persist what is left."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        await self.store.join()
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Persist all dirty carts; return how many were written."""
+        written = 0
+        while True:
+            cart_ids = await self.store.pop_dirty(self.batch_size)
+            if not cart_ids:
+                return written
+            try:
+                written += await self._persist(cart_ids)
+            except Exception:
+                await self.store.mark_dirty(cart_ids)
+                raise
+
+    async def _persist(self, cart_ids: list) -> int:
+        written = 0
+        async with self._session_maker()() as session:
+            repository = CartRepositoryImpl(session)
+            for cart_id in cart_ids:
+                cart = await self.store.load(cart_id)
+                if cart is None and not await self.store.is_deleted(cart_id):
+                    logger.warning("Dirty cart expired before it was persisted", cart_id=cart_id)
+                    continue
+                try:
+                    async with session.begin_nested():
+                        if cart is None:
+                            await repository.delete(cart_id)
+                        else:
+                            await repository.replace(cart)
+                    written += 1
+                except Exception as e:
+                    # E.g. a menu item deleted meanwhile; retrying would fail the same way
+                    logger.error("Failed to persist cart", cart_id=cart_id, error=str(e))
+            await session.commit()
+        return written
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                written = await self.flush()
+                if written:
+                    logger.debug("Carts persisted", count=written)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Cart write-behind flush failed", error=str(e))
+
+
+_cart_write_behind: Optional[CartWriteBehind] = None
+
+
+async def init_cart_store(redis_url: str, ttl: int, flush_interval: float) -> CartWriteBehind:
+    """Connect to Redis and start persisting carts in the background."""
+    global _cart_write_behind
+    from redis import asyncio as redis_asyncio
+
+    redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+    _cart_write_behind = CartWriteBehind(RedisCartStore(redis, ttl=ttl), interval=flush_interval)
+    _cart_write_behind.start()
+    return _cart_write_behind
+
+
+async def close_cart_store() -> None:
+    """Persist remaining carts and disconnect."""
+    global _cart_write_behind
+    if _cart_write_behind is not None:
+        await _cart_write_behind.stop()
+        await _cart_write_behind.store.redis.aclose()
+        _cart_write_behind = None
+
+
+def get_cart_store() -> Optional[RedisCartStore]:
+    """Get Redis cart store (None when carts live in the database only)."""
+    if _cart_write_behind is None:
+        return None
+    return _cart_write_behind.store
@@ -0,0 +1,24 @@
+"""Process-wide cache of inline query results for the menu."""
+
+from typing import Dict
+
+from aiogram.types import InlineQueryResult
+
+from infrastructure.cache.menu_cache import MenuCache, MenuMemo, process_wide_memo
+
+InlineResults = Dict[str, InlineQueryResult]
+
+
+class InlineResultCache(MenuMemo):
+    """Keeps one inline result per menu item until the menu changes.
+
+    Holds item_id -> result under the key "menu", so an inline query only
+    searches and picks prebuilt results.
+    """
+
+    def __init__(self, menu_cache: MenuCache, enabled: bool = True):
+        super().__init__(menu_cache, "inline_results", enabled)
+
+
+# Getter of the process-wide inline result cache, configured from settings
+get_inline_result_cache = process_wide_memo(InlineResultCache)
@@ -0,0 +1,20 @@
+"""Process-wide cache of menu keyboards."""
+
+from infrastructure.cache.menu_cache import MenuCache, MenuMemo, process_wide_memo
+from infrastructure.telegram.keyboards.cached_markup import CachedInlineKeyboardMarkup
+
+
+class KeyboardCache(MenuMemo):
+    """Keeps built menu keyboards until the menu changes.
+
+    Keyboards are stored pre-serialized as `CachedInlineKeyboardMarkup`;
+    a builder returning None (e.g. nothing to show) is called again next
+    time.
+    """
+
+    def __init__(self, menu_cache: MenuCache, enabled: bool = True):
+        super().__init__(menu_cache, "keyboard", enabled, freeze=CachedInlineKeyboardMarkup.from_markup)
+
+
+# Getter of the process-wide keyboard cache, configured from settings
+get_keyboard_cache = process_wide_memo(KeyboardCache)
@@ -0,0 +1,139 @@
+"""Process-wide menu cache with version-based invalidation."""
+
+from typing import Any, Awaitable, Callable, Hashable, List, Optional
+
+from app.config import get_settings
+from infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+
+class MenuCache:
+    """Holds cached categories and menu items for the current process.
+    
+    Every entry is keyed by the menu version it was read under. Any menu
+    write bumps the version, so entries read before the write can never be
+    served again, even if they are stored after the bump.
+    """
+    
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0):
+        self._entries = TTLLRUCache(max_entries=max_entries, ttl=ttl)
+        self._version = 0
+        self._listeners: List[Callable[[int], Any]] = []
+        self._commit_listeners: List[Callable[[int], Any]] = []
+    
+    @property
+    def version(self) -> int:
+        """Current menu version."""
+        return self._version
+    
+    def get(self, key: Hashable, version: Optional[int] = None) -> Any:
+        """Get cached value for key under given (or current) version."""
+        return self._entries.get((self._version if version is None else version, key))
+    
+    def set(self, key: Hashable, value: Any, version: Optional[int] = None) -> None:
+        """Cache value for key under given (or current) version."""
+        if version is None:
+            version = self._version
+        if version != self._version:
+            # Menu changed while the value was being loaded
+            return
+        self._entries.set((version, key), value)
+    
+    def bump_version(self) -> int:
+        """Invalidate everything cached so far and return the new version."""
+        self._version += 1
+        self._entries.clear()
+        for listener in list(self._listeners):
+            listener(self._version)
+        return self._version
+    
+    def notify_committed(self) -> int:
+        """Bump version after a menu write was committed by this process."""
+        version = self.bump_version()
+        for listener in list(self._commit_listeners):
+            listener(version)
+        return version
+    
+    def add_listener(self, listener: Callable[[int], Any]) -> None:
+        """Subscribe to every version change."""
+        self._listeners.append(listener)
+    
+    def add_commit_listener(self, listener: Callable[[int], Any]) -> None:
+        """Subscribe to menu writes committed by this process."""
+        self._commit_listeners.append(listener)
+    
+    @property
+    def stats(self) -> dict:
+        """Cache hit/miss counters."""
+        return {
+            "version": self._version,
+            "entries": len(self._entries),
+            "hits": self._entries.hits,
+            "misses": self._entries.misses,
+        }
+
+
+_menu_cache: Optional[MenuCache] = None
+
+
+def get_menu_cache() -> MenuCache:
+    """Get process-wide menu cache configured from settings."""
+    global _menu_cache
+    if _menu_cache is None:
+        settings = get_settings()
+        _menu_cache = MenuCache(
+            max_entries=settings.menu_cache_max_entries,
+            ttl=settings.menu_cache_ttl,
+        )
+    return _menu_cache
+
+
+class MenuMemo:
+    """Keeps values built from the menu until the menu changes.
+    
+    Values are stored in `MenuCache` under `namespace` and the menu version
+    they were built for, so every menu write drops them. `freeze` converts a
+    built value before it is stored. A build returning None is not cached.
+    With caching disabled nothing bumps the version, so values are built on
+    every call.
+    """
+    
+    def __init__(
+        self,
+        menu_cache: MenuCache,
+        namespace: str,
+        enabled: bool = True,
+        freeze: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.menu_cache = menu_cache
+        self.namespace = namespace
+        self.enabled = enabled
+        self.freeze = freeze
+    
+    async def get_or_build(self, key: Hashable, build: Callable[[], Awaitable[Any]]) -> Any:
+        """Get value built for current menu version, building it on miss."""
+        if not self.enabled:
+            return await build()
+        
+        version = self.menu_cache.version
+        cache_key = (self.namespace, key)
+        cached = self.menu_cache.get(cache_key, version)
+        if cached is None:
+            value = await build()
+            if value is None:
+                return None
+            cached = self.freeze(value) if self.freeze else value
+            self.menu_cache.set(cache_key, cached, version)
+        return cached
+
+
+def process_wide_memo(factory: Callable[[MenuCache, bool], MenuMemo]) -> Callable[[], MenuMemo]:
+    """Make getter of a memo created on first use on the process-wide menu cache."""
+    memo: Optional[MenuMemo] = None
+    
+    def get() -> MenuMemo:
+        nonlocal memo
+        if memo is None:
+            memo = factory(get_menu_cache(), get_settings().menu_cache_enabled)
+        return memo
+    
+    return get
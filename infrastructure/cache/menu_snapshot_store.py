@@ -0,0 +1,145 @@
+"""Redis storage for versioned menu snapshots."""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from domain.entities.category import Category
+from domain.entities.menu_item import MenuItem
+from domain.value_objects.menu_snapshot import MenuSnapshot
+
+
+class RedisMenuSnapshotStore:
+    """Publishes and loads immutable menu snapshots in Redis.
+
+    Every snapshot is written once under its own key (`<prefix>:snapshot:<version>`);
+    `<prefix>:version` is a monotonically increasing counter and new versions
+    are announced on the `<prefix>:updates` channel.
+    """
+
+    def __init__(self, redis, prefix: str = "menu", ttl: int = 7 * 24 * 3600, search_depth: int = 5):
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl = ttl
+        self.search_depth = search_depth
+
+    @property
+    def version_key(self) -> str:
+        return f"{self.prefix}:version"
+
+    @property
+    def channel(self) -> str:
+        return f"{self.prefix}:updates"
+
+    def snapshot_key(self, version: int) -> str:
+        return f"{self.prefix}:snapshot:{version}"
+
+    async def next_version(self) -> int:
+        """Reserve version number for a snapshot about to be built."""
+        return int(await self.redis.incr(self.version_key))
+
+    async def get_version(self) -> int:
+        """Get latest reserved version (0 if nothing was published)."""
+        value = await self.redis.get(self.version_key)
+        return int(value) if value is not None else 0
+
+    async def publish(self, snapshot: MenuSnapshot) -> None:
+        """Store snapshot and announce it to other replicas."""
+        await self.redis.set(self.snapshot_key(snapshot.version), self.dumps(snapshot), ex=self.ttl)
+        if snapshot.version > 1:
+            # Older snapshot is only needed by replicas that are loading it right now
+            await self.redis.expire(self.snapshot_key(snapshot.version - 1), 60)
+        await self.redis.publish(self.channel, str(snapshot.version))
+
+    async def load(self, version: int) -> Optional[MenuSnapshot]:
+        """Load snapshot of exact version."""
+        payload = await self.redis.get(self.snapshot_key(version))
+        if payload is None:
+            return None
+        return self.loads(payload)
+
+    async def load_latest(self) -> Optional[MenuSnapshot]:
+        """Load newest available snapshot.
+
+        The newest reserved version may still be in flight (or its publisher
+        may have died), so a few previous versions are tried as well.
+        """
+        version = await self.get_version()
+        for candidate in range(version, max(version - self.search_depth, 0), -1):
+            snapshot = await self.load(candidate)
+            if snapshot is not None:
+                return snapshot
+        return None
+
+    # Serialization
+    @classmethod
+    def dumps(cls, snapshot: MenuSnapshot) -> str:
+        """Serialize snapshot to JSON."""
+        return json.dumps(
+            {
+                "version": snapshot.version,
+                "categories": [cls._category_to_dict(c) for c in snapshot.categories],
+                "menu_items": [cls._menu_item_to_dict(i) for i in snapshot.menu_items],
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def loads(cls, payload: str | bytes) -> MenuSnapshot:
+        """Deserialize snapshot from JSON."""
+        data = json.loads(payload)
+        return MenuSnapshot(
+            version=data["version"],
+            categories=[cls._category_from_dict(c) for c in data["categories"]],
+            menu_items=[cls._menu_item_from_dict(i) for i in data["menu_items"]],
+        )
+
+    @staticmethod
+    def _category_to_dict(category: Category) -> Dict[str, Any]:
+        return {
+            "category_id": category.category_id,
+            "name": category.name,
+            "description": category.description,
+            "image_url": category.image_url,
+            "image_file_id": category.image_file_id,
+            "sort_order": category.sort_order,
+            "is_active": category.is_active,
+            "created_at": category.created_at.isoformat(),
+            "updated_at": category.updated_at.isoformat(),
+        }
+
+    @staticmethod
+    def _category_from_dict(data: Dict[str, Any]) -> Category:
+        data = dict(data)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        return Category(**data)
+
+    @staticmethod
+    def _menu_item_to_dict(item: MenuItem) -> Dict[str, Any]:
+        return {
+            "item_id": item.item_id,
+            "category_id": item.category_id,
+            "name": item.name,
+            "price": item.price,
+            "description": item.description,
+            "image_url": item.image_url,
+            "image_file_id": item.image_file_id,
+            "ingredients": item.ingredients,
+            "allergens": item.allergens,
+            "weight": item.weight,
+            "calories": item.calories,
+            "is_available": item.is_available,
+            "is_popular": item.is_popular,
+            "sort_order": item.sort_order,
+            "created_at": item.created_at.isoformat(),
+            "updated_at": item.updated_at.isoformat(),
+        }
+
+    @staticmethod
+    def _menu_item_from_dict(data: Dict[str, Any]) -> MenuItem:
+        data = dict(data)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        return MenuItem(**data)
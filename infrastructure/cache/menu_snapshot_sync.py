@@ -0,0 +1,180 @@
+"""Keeps local menu snapshot in sync with Redis across bot replicas."""
+
+import asyncio
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.value_objects.menu_snapshot import MenuSnapshot
+from infrastructure.cache.menu_cache import MenuCache, get_menu_cache
+from infrastructure.cache.menu_snapshot_store import RedisMenuSnapshotStore
+from infrastructure.database.connection import get_sessionmaker
+from infrastructure.database.repositories.menu_repository_impl import MenuRepositoryImpl
+from infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MenuSnapshotSync:
+    """Loads the shared snapshot on startup and whenever a new version is announced.
+
+    Menu writes committed by this process trigger a rebuild from the
+    database, which is then published for the other replicas. Until that
+    rebuild is applied the local snapshot is dropped, so reads fall back to
+    the repository and the writer always sees its own changes.
+    """
+
+    def __init__(
+        self,
+        store: RedisMenuSnapshotStore,
+        cache: MenuCache,
+        session_maker: Callable[[], async_sessionmaker[AsyncSession]] = get_sessionmaker,
+        reconnect_delay: float = 1.0,
+    ):
+        self.store = store
+        self.cache = cache
+        self._session_maker = session_maker
+        self._reconnect_delay = reconnect_delay
+        self._snapshot: Optional[MenuSnapshot] = None
+        self._version = 0
+        self._listener_task: Optional[asyncio.Task] = None
+        self._publish_task: Optional[asyncio.Task] = None
+        self._publish_pending = False
+        cache.add_listener(self._on_version_changed)
+        cache.add_commit_listener(self._on_local_commit)
+
+    @property
+    def snapshot(self) -> Optional[MenuSnapshot]:
+        """Current local snapshot, if it is up to date."""
+        return self._snapshot
+
+    async def start(self) -> None:
+        """Load latest snapshot (building it if there is none) and start listening."""
+        snapshot = await self.store.load_latest()
+        if snapshot is None:
+            await self.publish_from_database()
+        else:
+            self.apply(snapshot)
+        self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop background tasks."""
+        for task in (self._listener_task, self._publish_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._listener_task = None
+        self._publish_task = None
+
+    def apply(self, snapshot: MenuSnapshot) -> bool:
+        """Make snapshot current unless a newer one is already applied."""
+        if snapshot.version <= self._version:
+            return False
+        self._version = snapshot.version
+        # Drop local cache entries; this also resets the current snapshot
+        self.cache.bump_version()
+        self._snapshot = snapshot
+        logger.info("Menu snapshot applied", version=snapshot.version)
+        return True
+
+    async def publish_from_database(self) -> MenuSnapshot:
+        """Build snapshot from the database, publish it and apply locally."""
+        # Reserve version before reading so a later build always wins
+        version = await self.store.next_version()
+        async with self._session_maker()() as session:
+            repository = MenuRepositoryImpl(session)
+            categories = await repository.list_categories(active_only=False)
+            items_count = await repository.count_menu_items()
+            menu_items = await repository.list_menu_items(active_only=False, limit=items_count, offset=0)
+
+        snapshot = MenuSnapshot(version, categories, menu_items)
+        await self.store.publish(snapshot)
+        self.apply(snapshot)
+        return snapshot
+
+    async def refresh(self) -> None:
+        """Apply newest snapshot from Redis if it is newer than the local one."""
+        snapshot = await self.store.load_latest()
+        if snapshot is not None:
+            self.apply(snapshot)
+
+    def _on_version_changed(self, _version: int) -> None:
+        self._snapshot = None
+
+    def _on_local_commit(self, _version: int) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._publish_pending = True
+        if self._publish_task is None or self._publish_task.done():
+            self._publish_task = loop.create_task(self._publish_loop())
+
+    async def _publish_loop(self) -> None:
+        # Coalesce bursts of admin edits into as few rebuilds as possible
+        while self._publish_pending:
+            self._publish_pending = False
+            try:
+                await self.publish_from_database()
+            except Exception as e:
+                logger.error("Failed to publish menu snapshot", error=str(e))
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.store.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.store.channel)
+                # Catch up on anything published while we were not subscribed
+                await self.refresh()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    version = int(message["data"])
+                    if version <= self._version:
+                        continue
+                    snapshot = await self.store.load(version)
+                    if snapshot is not None:
+                        self.apply(snapshot)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Menu snapshot subscription failed", error=str(e))
+                await asyncio.sleep(self._reconnect_delay)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+_menu_snapshot_sync: Optional[MenuSnapshotSync] = None
+
+
+async def init_menu_snapshot_sync(redis_url: str) -> MenuSnapshotSync:
+    """Connect to Redis and start menu snapshot synchronization."""
+    global _menu_snapshot_sync
+    from redis import asyncio as redis_asyncio
+
+    redis = redis_asyncio.from_url(redis_url)
+    _menu_snapshot_sync = MenuSnapshotSync(RedisMenuSnapshotStore(redis), get_menu_cache())
+    await _menu_snapshot_sync.start()
+    return _menu_snapshot_sync
+
+
+async def close_menu_snapshot_sync() -> None:
+    """Stop menu snapshot synchronization."""
+    global _menu_snapshot_sync
+    if _menu_snapshot_sync is not None:
+        await _menu_snapshot_sync.stop()
+        await _menu_snapshot_sync.store.redis.aclose()
+        _menu_snapshot_sync = None
+
+
+def get_menu_snapshot() -> Optional[MenuSnapshot]:
+    """Get current local menu snapshot (None when sync is disabled or stale)."""
+    if _menu_snapshot_sync is None:
+        return None
+    return _menu_snapshot_sync.snapshot
@@ -0,0 +1,51 @@
+"""Telegram file_id cache for menu images."""
+
+from typing import Optional
+
+from infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+
+class PhotoCache:
+    """Image URL -> file_id Telegram assigned when the URL was first sent.
+
+    Sending a file_id spares Telegram from downloading the image again.
+    File IDs are also stored on menu rows; this process-wide map serves
+    them until cached menu entities are reloaded with the stored value.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._file_ids = TTLLRUCache(max_entries=max_entries, ttl=float("inf"))
+
+    @staticmethod
+    def is_url(image: str) -> bool:
+        """Check whether image is a URL rather than a Telegram file_id."""
+        return image.startswith(("http://", "https://"))
+
+    def get_photo(self, image_url: str, image_file_id: Optional[str] = None) -> str:
+        """Get what to send for image: a known file_id or the image itself."""
+        if not self.is_url(image_url):
+            return image_url
+        return self._file_ids.get(image_url) or image_file_id or image_url
+
+    def remember(self, image_url: str, file_id: str) -> None:
+        """Record file_id of uploaded image."""
+        self._file_ids.set(image_url, file_id)
+
+    def forget(self, image_url: str) -> None:
+        """Drop file_id Telegram no longer accepts."""
+        self._file_ids.delete(image_url)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._file_ids.clear()
+
+
+_photo_cache: Optional[PhotoCache] = None
+
+
+def get_photo_cache() -> PhotoCache:
+    """Get process-wide photo cache."""
+    global _photo_cache
+    if _photo_cache is None:
+        _photo_cache = PhotoCache()
+    return _photo_cache
@@ -0,0 +1,67 @@
+"""In-process cache with TTL expiration and LRU eviction."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class TTLLRUCache:
+    """Bounded mapping whose entries expire after `ttl` seconds.
+
+    When `max_entries` is reached the least recently used entry is evicted.
+    Not thread-safe; intended for use from a single asyncio event loop.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get value by key or `default` when missing or expired."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self.misses += 1
+            return default
+        
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key."""
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+    
+    def delete(self, key: Hashable) -> None:
+        """Remove key if present."""
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,115 @@
+"""Telegram ID to internal user resolution caches."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from app.config import get_settings
+from domain.entities.user import User
+from infrastructure.cache.ttl_lru_cache import TTLLRUCache
+
+
+class UserIdentityMap:
+    """Users and user IDs resolved while handling one update, keyed by Telegram ID.
+
+    Lives for a single update only, so handlers and services see one
+    consistent User without reloading it, and nothing stale outlives
+    the update.
+    """
+    
+    def __init__(self):
+        self._users: Dict[int, User] = {}
+        self._user_ids: Dict[int, str] = {}
+    
+    def get(self, telegram_id: int) -> Optional[User]:
+        """Get user loaded earlier in this update."""
+        return self._users.get(telegram_id)
+    
+    def get_id(self, telegram_id: int) -> Optional[str]:
+        """Get user ID resolved earlier in this update."""
+        return self._user_ids.get(telegram_id)
+    
+    def add(self, user: User) -> None:
+        """Remember loaded or saved user."""
+        self._users[user.telegram_id] = user
+        self._user_ids[user.telegram_id] = user.user_id
+    
+    def add_id(self, telegram_id: int, user_id: str) -> None:
+        """Remember resolved user ID."""
+        self._user_ids[telegram_id] = user_id
+    
+    def discard(self, telegram_id: int) -> None:
+        """Forget user."""
+        self._users.pop(telegram_id, None)
+        self._user_ids.pop(telegram_id, None)
+
+
+_identity_map_ctx: ContextVar[Optional[UserIdentityMap]] = ContextVar("user_identity_map", default=None)
+
+_user_ids: Optional[TTLLRUCache] = None
+
+
+def get_user_id_cache() -> TTLLRUCache:
+    """Get process-wide telegram_id -> user_id LRU.
+
+    The mapping never changes for an existing user, so entries do not expire;
+    deleting a user removes its entry.
+    """
+    global _user_ids
+    if _user_ids is None:
+        _user_ids = TTLLRUCache(max_entries=get_settings().user_id_cache_max_entries, ttl=float("inf"))
+    return _user_ids
+
+
+@contextmanager
+def user_identity_scope() -> Iterator[UserIdentityMap]:
+    """Open identity map for the current update."""
+    identity_map = UserIdentityMap()
+    token = _identity_map_ctx.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _identity_map_ctx.reset(token)
+
+
+def get_cached_user(telegram_id: int) -> Optional[User]:
+    """Get user already loaded in the current update."""
+    identity_map = _identity_map_ctx.get()
+    return identity_map.get(telegram_id) if identity_map is not None else None
+
+
+def get_cached_user_id(telegram_id: int) -> Optional[str]:
+    """Get internal user ID without touching the database, if known."""
+    identity_map = _identity_map_ctx.get()
+    if identity_map is not None:
+        user_id = identity_map.get_id(telegram_id)
+        if user_id is not None:
+            return user_id
+    return get_user_id_cache().get(telegram_id)
+
+
+def remember_user(user: User) -> None:
+    """Cache user for the current update."""
+    identity_map = _identity_map_ctx.get()
+    if identity_map is not None:
+        identity_map.add(user)
+
+
+def remember_user_id(telegram_id: int, user_id: str) -> None:
+    """Cache user ID for the current update."""
+    identity_map = _identity_map_ctx.get()
+    if identity_map is not None:
+        identity_map.add_id(telegram_id, user_id)
+
+
+def cache_user_id(telegram_id: int, user_id: str) -> None:
+    """Cache telegram_id -> user_id mapping for the process; only for committed users."""
+    get_user_id_cache().set(telegram_id, user_id)
+
+
+def forget_user(telegram_id: int) -> None:
+    """Drop user from both caches."""
+    identity_map = _identity_map_ctx.get()
+    if identity_map is not None:
+        identity_map.discard(telegram_id)
+    get_user_id_cache().delete(telegram_id)
@@ -1,12 +1,20 @@
 """Database connection and session management."""
 
-from typing import AsyncGenerator, Optional
+import asyncio
+from typing import Any, AsyncGenerator, Awaitable, Callable, Hashable, Optional, Set
 from contextvars import ContextVar, Token
 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import get_settings
+from infrastructure.database.pool_metrics import InstrumentedAsyncQueuePool, pool_metrics, replica_pool_metrics
+from infrastructure.database.routing import RoutingSession
+from infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class Base(DeclarativeBase):
@@ -16,26 +24,75 @@ class Base(DeclarativeBase):
 
 # Global engine and session maker
 _engine = None
+_replica_engine = None
 _session_maker = None
 _session_ctx: ContextVar[Optional[AsyncSession]] = ContextVar("db_async_session", default=None)
+_PENDING_AFTER_COMMIT_KEY = "pending_after_commit"
+_after_commit_tasks: Set[asyncio.Task] = set()
 
 
-async def init_database(database_url: str) -> None:
-    """Initialize database connection."""
-    global _engine, _session_maker
+def _engine_options(database_url: str) -> dict:
+    """Build pool and driver options for database URL from settings."""
+    settings = get_settings()
+    backend = make_url(database_url).get_backend_name()
+    
+    if backend == "sqlite":
+        # SQLite uses its own single-file pools; pool sizing does not apply
+        return {}
     
-    _engine = create_async_engine(
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+    }
+    if backend == "postgresql":
+        connect_args = {
+            "prepared_statement_cache_size": settings.database_statement_cache_size,
+        }
+        if settings.database_statement_timeout:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(settings.database_statement_timeout),
+            }
+        options["connect_args"] = connect_args
+    return options
+
+
+def _create_engine(database_url: str):
+    return create_async_engine(
         database_url,
         echo=get_settings().database_echo,
         future=True,
         pool_pre_ping=True,
         pool_recycle=3600,
+        **_engine_options(database_url),
     )
+
+
+async def init_database(database_url: str, replica_url: Optional[str] = None) -> None:
+    """Initialize database connection.
+    
+    With `replica_url`, sessions route SELECTs issued from `read_only`
+    repository methods to the replica and everything else to the primary.
+    """
+    global _engine, _replica_engine, _session_maker
+    
+    _engine = _create_engine(database_url)
+    pool_metrics.reset()
+    pool_metrics.bind(_engine.sync_engine.pool)
+    
+    _replica_engine = _create_engine(replica_url) if replica_url else None
+    replica_pool_metrics.reset()
+    replica_pool_metrics.pool = None
+    if _replica_engine is not None:
+        replica_pool_metrics.bind(_replica_engine.sync_engine.pool)
     
     _session_maker = async_sessionmaker(
         _engine,
         class_=AsyncSession,
         expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        replica=_replica_engine.sync_engine if _replica_engine else None,
     )
 
 
@@ -59,9 +116,12 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 
 async def close_database() -> None:
     """Close database connection."""
-    global _engine
+    global _engine, _replica_engine
     if _engine:
         await _engine.dispose()
+    if _replica_engine:
+        await _replica_engine.dispose()
+        _replica_engine = None
 
 
 def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
@@ -78,6 +138,114 @@ def set_current_session(session: AsyncSession) -> Token[Optional[AsyncSession]]:
     return _session_ctx.set(session)
 
 
+def reset_current_session(token: Token[Optional[AsyncSession]]) -> None:
+    """Restore session context using token from `set_current_session`."""
+    _session_ctx.reset(token)
+
+
 def get_current_session() -> Optional[AsyncSession]:
     """Get session from context set by middleware."""
-    return _session_ctx.get()
\ No newline at end of file
+    return _session_ctx.get()
+
+
+def on_commit(session: Any, callback: Callable[[], Any], key: Optional[Hashable] = None) -> None:
+    """Call callback once session's transaction commits.
+    
+    Callbacks of a transaction that rolls back are dropped, so caches and
+    side effects never reflect changes that were not saved. A callback
+    registered under a key already pending replaces that one, so work keyed
+    by it is done once per transaction. None means the session of the
+    current update; without a real session the callback runs right away.
+    Failing callbacks are logged and never fail the commit.
+    """
+    if session is None:
+        session = get_current_session()
+    sync_session = getattr(session, "sync_session", None)
+    if sync_session is None:
+        _call_committed(callback)
+        return
+    
+    pending = session.info.get(_PENDING_AFTER_COMMIT_KEY)
+    if pending is None:
+        pending = session.info[_PENDING_AFTER_COMMIT_KEY] = {}
+        
+        def _after_commit(_session) -> None:
+            callbacks = list(pending.values())
+            pending.clear()
+            for committed in callbacks:
+                _call_committed(committed)
+        
+        def _after_rollback(_session) -> None:
+            pending.clear()
+        
+        event.listen(sync_session, "after_commit", _after_commit)
+        event.listen(sync_session, "after_rollback", _after_rollback)
+    pending[object() if key is None else key] = callback
+
+
+def run_after_commit(session: Any, step: Callable[[], Awaitable[Any]]) -> None:
+    """Start async step in the background once session's transaction commits.
+    
+    Same rules as `on_commit`; used for side effects such as messages that
+    must never announce changes that were not saved.
+    """
+    on_commit(session, lambda: _start_after_commit(step))
+
+
+def _call_committed(callback: Callable[[], Any]) -> None:
+    try:
+        callback()
+    except Exception as e:
+        logger.error("After-commit callback failed", error=str(e))
+
+
+def _start_after_commit(step: Callable[[], Awaitable[Any]]) -> None:
+    task = asyncio.ensure_future(step())
+    _after_commit_tasks.add(task)
+    task.add_done_callback(_after_commit_done)
+
+
+def _after_commit_done(task: asyncio.Task) -> None:
+    _after_commit_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("After-commit step failed", error=str(task.exception()))
+
+
+class LazySession:
+    """Stand-in for AsyncSession that is only created when first used.
+    
+    Attribute access is forwarded to a real session opened on demand, so
+    updates that never touch the database neither check out a pooled
+    connection nor emit BEGIN/COMMIT.
+    """
+    
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
+        self._session_maker = session_maker
+        self._session: Optional[AsyncSession] = None
+    
+    @property
+    def acquired(self) -> bool:
+        """Whether the underlying session was created."""
+        return self._session is not None
+    
+    def __getattr__(self, name: str):
+        # Only called for attributes not defined on the proxy itself
+        if self._session is None:
+            self._session = self._session_maker()
+        return getattr(self._session, name)
+    
+    async def commit_if_used(self) -> None:
+        """Commit pending transaction, if one was started."""
+        if self._session is not None and self._session.in_transaction():
+            await self._session.commit()
+    
+    async def rollback_if_used(self) -> None:
+        """Roll back pending transaction, if one was started."""
+        if self._session is not None and self._session.in_transaction():
+            await self._session.rollback()
+    
+    async def close_if_used(self) -> None:
+        """Close underlying session, if it was created."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
\ No newline at end of file
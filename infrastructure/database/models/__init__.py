@@ -4,10 +4,12 @@ from .user_model import UserModel
 from .category_model import CategoryModel
 from .menu_item_model import MenuItemModel
 from .cart_model import CartModel, CartItemModel
-from .order_model import OrderModel
+from .order_model import OrderModel, OrderItemModel
 from .payment_model import PaymentModel
 from .cafe_settings_model import CafeSettingsModel
 from .promotion_model import PromotionModel, PromotionUsageModel
+from .sales_rollup_model import SalesRollupModel
+from .broadcast_model import BroadcastCampaignModel
 
 __all__ = [
     "UserModel",
@@ -16,8 +18,11 @@ __all__ = [
     "CartModel",
     "CartItemModel",
     "OrderModel",
+    "OrderItemModel",
     "PaymentModel",
     "CafeSettingsModel",
     "PromotionModel",
     "PromotionUsageModel",
+    "SalesRollupModel",
+    "BroadcastCampaignModel",
 ]
\ No newline at end of file
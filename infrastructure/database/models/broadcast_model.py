@@ -0,0 +1,37 @@
+"""Broadcast campaign SQLAlchemy model."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, Integer, BigInteger, DateTime, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column
+import uuid
+
+from infrastructure.database.connection import Base
+
+
+class BroadcastCampaignModel(Base):
+    """Broadcast campaign database model."""
+
+    __tablename__ = "broadcast_campaigns"
+    __table_args__ = (
+        Index("ix_broadcast_campaigns_status_created_at", "status", "created_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    created_by: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)  # Telegram ID администратора
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    total_recipients: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    delivered: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    blocked: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Последний получатель, отправка которому завершена; продолжение идёт после него
+    last_user_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<BroadcastCampaignModel(id={self.id}, status={self.status}, delivered={self.delivered})>"
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Text
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -33,6 +33,10 @@ class CartItemModel(Base):
     """Cart item database model."""
     
     __tablename__ = "cart_items"
+    __table_args__ = (
+        # One row per menu item in a cart; arbiter for ON CONFLICT upserts
+        UniqueConstraint("cart_id", "menu_item_id", name="uq_cart_items_cart_id_menu_item_id"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     cart_id: Mapped[str] = mapped_column(String(36), ForeignKey("carts.id"), nullable=False)
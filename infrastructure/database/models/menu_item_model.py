@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import String, Integer, DateTime, Boolean, Text, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -15,6 +15,17 @@ class MenuItemModel(Base):
     """Menu item database model."""
     
     __tablename__ = "menu_items"
+    __table_args__ = (
+        # Ranked search (word_similarity) with ё folded into е; pg_trgm is enabled in docker/init.sql
+        *(
+            Index(
+                f"ix_menu_items_{name}_trgm",
+                text(f"translate({name}, 'Ёё', 'Ее') gin_trgm_ops"),
+                postgresql_using="gin",
+            ).ddl_if(dialect="postgresql")
+            for name in ("name", "description")
+        ),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     category_id: Mapped[str] = mapped_column(String(36), ForeignKey("categories.id"), nullable=False)
@@ -22,6 +33,7 @@ class MenuItemModel(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     price: Mapped[int] = mapped_column(Integer, nullable=False)  # в копейках
     image_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    image_file_id: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)  # Telegram file_id of image_url
     ingredients: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     allergens: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     weight: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
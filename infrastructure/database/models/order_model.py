@@ -3,18 +3,40 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, DateTime, Boolean, Text, ForeignKey, JSON
+from sqlalchemy import String, Integer, DateTime, Boolean, Text, ForeignKey, Index, column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 
 from infrastructure.database.connection import Base
+from shared.constants.order_constants import OrderStatus
+
+# Orders staff still has to act on (covered by the partial index below)
+ACTIVE_ORDER_STATUSES = tuple(
+    status.value
+    for status in (OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.PREPARING, OrderStatus.READY)
+)
+# Orders that count towards revenue
+COMPLETED_ORDER_STATUSES = (OrderStatus.DELIVERED.value, OrderStatus.PICKED_UP.value)
 
 
 class OrderModel(Base):
     """Order database model."""
     
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        Index("ix_orders_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_orders_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_orders_order_type_created_at", "order_type", "created_at"),
+        Index("ix_orders_payment_status_created_at", "payment_status", "created_at"),
+        Index(
+            "ix_orders_active_created_at",
+            "created_at",
+            postgresql_where=column("status").in_(ACTIVE_ORDER_STATUSES),
+            sqlite_where=column("status").in_(ACTIVE_ORDER_STATUSES),
+        ),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
@@ -24,7 +46,6 @@ class OrderModel(Base):
     payment_status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
     
     # Order details
-    items: Mapped[dict] = mapped_column(JSON, nullable=False)  # Список товаров с количеством и ценой
     subtotal: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # в копейках
     delivery_fee: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # в копейках
     discount: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # в копейках
@@ -51,6 +72,40 @@ class OrderModel(Base):
     # Relationships
     user: Mapped["UserModel"] = relationship("UserModel", back_populates="orders")
     payment: Mapped[Optional["PaymentModel"]] = relationship("PaymentModel", back_populates="order", uselist=False)
+    items: Mapped[list["OrderItemModel"]] = relationship(
+        "OrderItemModel",
+        back_populates="order",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="OrderItemModel.position"
+    )
+    
+    def __repr__(self) -> str:
+        return f"<OrderModel(id={self.id}, user_id={self.user_id}, status={self.status}, total={self.total})>"
+
+
+class OrderItemModel(Base):
+    """Order line item database model."""
+    
+    __tablename__ = "order_items"
+    __table_args__ = (
+        Index("ix_order_items_order_id", "order_id"),
+        Index("ix_order_items_item_id_order_id", "item_id", "order_id"),
+    )
+    
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    order_id: Mapped[str] = mapped_column(String(36), ForeignKey("orders.id", ondelete="CASCADE"), nullable=False)
+    # No FK to menu_items: the line item is a snapshot and outlives deleted dishes
+    item_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    price: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # в копейках
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    comment: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    # Relationships
+    order: Mapped["OrderModel"] = relationship("OrderModel", back_populates="items")
     
     def __repr__(self) -> str:
-        return f"<OrderModel(id={self.id}, user_id={self.user_id}, status={self.status}, total={self.total})>"
\ No newline at end of file
+        return f"<OrderItemModel(id={self.id}, order_id={self.order_id}, item_id={self.item_id}, quantity={self.quantity})>"
\ No newline at end of file
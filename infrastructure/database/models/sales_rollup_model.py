@@ -0,0 +1,27 @@
+"""Sales rollup SQLAlchemy model."""
+
+from datetime import date
+
+from sqlalchemy import String, Integer, BigInteger, Date, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.database.connection import Base
+
+
+class SalesRollupModel(Base):
+    """Order count and total per (day, hour, order type, status) of order creation."""
+    
+    __tablename__ = "sales_rollup"
+    
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    hour: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    order_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    order_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)  # сумма заказов в копейках
+    
+    def __repr__(self) -> str:
+        return (
+            f"<SalesRollupModel(day={self.day}, hour={self.hour}, order_type={self.order_type}, "
+            f"status={self.status}, order_count={self.order_count})>"
+        )
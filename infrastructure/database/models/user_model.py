@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, DateTime, Boolean, Text
+from sqlalchemy import String, Integer, DateTime, Boolean, Text, Index
 from sqlalchemy import BigInteger
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -16,6 +16,21 @@ class UserModel(Base):
     """User database model."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_role_created_at_id", "role", "created_at", "id"),
+        Index("ix_users_status_created_at_id", "status", "created_at", "id"),
+        # Substring search by name; pg_trgm is enabled in docker/init.sql
+        *(
+            Index(
+                f"ix_users_{name}_trgm",
+                name,
+                postgresql_using="gin",
+                postgresql_ops={name: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for name in ("username", "first_name", "last_name")
+        ),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     telegram_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=False, index=True)
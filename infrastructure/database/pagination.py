@@ -0,0 +1,66 @@
+"""Keyset pagination over (created_at, id)."""
+
+from typing import Any, Optional
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.types.pagination import Page, PageCursor
+
+
+def cursor_for(row: Any) -> str:
+    """Encode cursor pointing at row."""
+    return PageCursor(row.created_at, row.id).encode()
+
+
+async def fetch_page(
+    session: AsyncSession,
+    query: Select,
+    model: Any,
+    cursor: Optional[str] = None,
+    limit: int = 10,
+    backward: bool = False,
+) -> Page:
+    """Run query as one page of model rows, newest first.
+
+    Rows are compared as (created_at, id) row values, which an index on
+    those columns (optionally prefixed by equality-filtered columns) answers
+    without scanning skipped rows the way OFFSET does. `backward` returns
+    the page of newer rows preceding cursor.
+    """
+    key = tuple_(model.created_at, model.id)
+    position = PageCursor.decode(cursor) if cursor else None
+    page_query = query
+
+    if position is not None:
+        bound = tuple_(position.created_at, position.id)
+        page_query = page_query.where(key > bound if backward else key < bound)
+
+    if backward:
+        page_query = page_query.order_by(model.created_at.asc(), model.id.asc())
+    else:
+        page_query = page_query.order_by(model.created_at.desc(), model.id.desc())
+
+    result = await session.execute(page_query.limit(limit + 1))
+    rows = list(result.scalars().all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if backward and not has_more:
+        # Reached the newest rows: show a full first page instead of a partial one
+        return await fetch_page(session, query, model, None, limit)
+
+    if backward:
+        rows.reverse()
+
+    if not rows:
+        return Page()
+
+    if backward:
+        next_cursor = cursor_for(rows[-1])
+        prev_cursor = cursor_for(rows[0]) if has_more else None
+    else:
+        next_cursor = cursor_for(rows[-1]) if has_more else None
+        prev_cursor = cursor_for(rows[0]) if position is not None else None
+
+    return Page(rows, next_cursor, prev_cursor)
@@ -0,0 +1,124 @@
+"""Connection pool instrumentation."""
+
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PoolMetrics:
+    """Counters for pool checkouts, checkout wait time and connections in use."""
+
+    def __init__(self, slow_checkout_threshold: float = 0.1):
+        self.slow_checkout_threshold = slow_checkout_threshold
+        self.pool: Optional[Pool] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def bind(self, pool: Pool) -> None:
+        """Track checkouts and checkins of pool."""
+        self.pool = pool
+        if isinstance(pool, InstrumentedAsyncQueuePool):
+            pool.metrics = self
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+
+    def observe_wait(self, seconds: float) -> None:
+        """Record time spent waiting for a pooled connection."""
+        self.checkouts += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        if seconds >= self.slow_checkout_threshold:
+            self.slow_checkouts += 1
+            logger.warning(
+                "Slow database pool checkout",
+                wait_seconds=round(seconds, 4),
+                **self._pool_status()
+            )
+
+    def observe_timeout(self, seconds: float) -> None:
+        """Record checkout that gave up waiting."""
+        self.timeouts += 1
+        logger.error(
+            "Database pool exhausted",
+            wait_seconds=round(seconds, 4),
+            **self._pool_status()
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics as a plain dict."""
+        return {
+            "in_use": self.in_use,
+            "peak_in_use": self.peak_in_use,
+            "checkouts": self.checkouts,
+            "slow_checkouts": self.slow_checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+            **self._pool_status(),
+        }
+
+    def _pool_status(self) -> Dict[str, Any]:
+        pool = self.pool
+        if not isinstance(pool, AsyncAdaptedQueuePool):
+            return {}
+        return {
+            "pool_size": pool.size(),
+            "pool_checked_in": pool.checkedin(),
+            "pool_overflow": pool.overflow(),
+        }
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        self.in_use = max(self.in_use - 1, 0)
+
+
+# Primary and replica engines are measured separately
+pool_metrics = PoolMetrics()
+replica_pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that reports how long callers wait for a connection.
+
+    Waits go to the PoolMetrics the pool was bound to; an unbound pool
+    is not measured.
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        metrics = self.metrics
+        if metrics is None:
+            return super()._do_get()
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            metrics.observe_timeout(time.perf_counter() - started)
+            raise
+        metrics.observe_wait(time.perf_counter() - started)
+        return connection
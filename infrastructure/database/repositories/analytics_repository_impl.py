@@ -0,0 +1,111 @@
+"""Analytics repository implementation."""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from domain.repositories.analytics_repository import AnalyticsRepository
+from infrastructure.database.models.order_model import COMPLETED_ORDER_STATUSES, OrderModel
+from infrastructure.database.models.user_model import UserModel
+from infrastructure.database.routing import read_only
+from shared.types.order_types import OrderPeriodStats
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Integer, and_, case, cast, extract, func, literal_column, select
+
+
+class AnalyticsRepositoryImpl(AnalyticsRepository):
+    """Analytics repository implementation."""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    @read_only
+    async def get_order_period_stats(self, date_from: datetime, date_to: datetime) -> OrderPeriodStats:
+        """Get order count, revenue and active users for a period."""
+        completed = OrderModel.status.in_(COMPLETED_ORDER_STATUSES)
+        result = await self.session.execute(
+            select(
+                func.count(OrderModel.id),
+                func.sum(case((completed, 1), else_=0)),
+                func.sum(case((completed, OrderModel.total), else_=0)),
+                func.count(func.distinct(OrderModel.user_id)),
+            )
+            .where(self._period(date_from, date_to))
+        )
+        total_orders, completed_orders, revenue, active_users = result.one()
+        return OrderPeriodStats(
+            total_orders=total_orders or 0,
+            completed_orders=int(completed_orders or 0),
+            revenue=int(revenue or 0),
+            active_users=active_users or 0,
+        )
+    
+    @read_only
+    async def count_orders_by_status(self, date_from: datetime, date_to: datetime) -> Dict[str, int]:
+        """Get order count per status for a period."""
+        return await self._count_by(OrderModel.status, date_from, date_to)
+    
+    @read_only
+    async def count_orders_by_type(self, date_from: datetime, date_to: datetime) -> Dict[str, int]:
+        """Get order count per order type for a period."""
+        return await self._count_by(OrderModel.order_type, date_from, date_to)
+    
+    @read_only
+    async def get_revenue_by_day(self, date_from: datetime, date_to: datetime) -> List[Tuple[str, int]]:
+        """Get (YYYY-MM-DD, revenue) pairs, highest revenue first."""
+        if self._dialect() == "postgresql":
+            # Literal format so SELECT and GROUP BY render the identical expression
+            day = func.to_char(OrderModel.created_at, literal_column("'YYYY-MM-DD'"))
+        else:
+            day = func.strftime("%Y-%m-%d", OrderModel.created_at)
+        return await self._revenue_by(day, date_from, date_to)
+    
+    @read_only
+    async def get_revenue_by_hour(self, date_from: datetime, date_to: datetime) -> List[Tuple[int, int]]:
+        """Get (hour, revenue) pairs, highest revenue first."""
+        if self._dialect() == "postgresql":
+            hour = cast(extract("hour", OrderModel.created_at), Integer)
+        else:
+            hour = cast(func.strftime("%H", OrderModel.created_at), Integer)
+        return [(int(h), revenue) for h, revenue in await self._revenue_by(hour, date_from, date_to)]
+    
+    @read_only
+    async def count_users(self, created_from: Optional[datetime] = None) -> int:
+        """Count users, optionally only those registered since created_from."""
+        query = select(func.count(UserModel.id))
+        if created_from is not None:
+            query = query.where(UserModel.created_at >= created_from)
+        result = await self.session.execute(query)
+        return result.scalar() or 0
+    
+    async def _count_by(self, column, date_from: datetime, date_to: datetime) -> Dict[str, int]:
+        """Count orders grouped by column."""
+        result = await self.session.execute(
+            select(column, func.count(OrderModel.id))
+            .where(self._period(date_from, date_to))
+            .group_by(column)
+        )
+        return {key: count for key, count in result.all()}
+    
+    async def _revenue_by(self, bucket, date_from: datetime, date_to: datetime) -> list:
+        """Sum completed order totals grouped by bucket expression."""
+        revenue = func.sum(OrderModel.total)
+        result = await self.session.execute(
+            select(bucket, revenue)
+            .where(
+                and_(
+                    self._period(date_from, date_to),
+                    OrderModel.status.in_(COMPLETED_ORDER_STATUSES)
+                )
+            )
+            .group_by(bucket)
+            .order_by(revenue.desc())
+        )
+        return [(key, int(total or 0)) for key, total in result.all()]
+    
+    def _period(self, date_from: datetime, date_to: datetime):
+        """Condition for orders created within period."""
+        return and_(OrderModel.created_at >= date_from, OrderModel.created_at <= date_to)
+    
+    def _dialect(self) -> str:
+        """Name of the dialect queries are sent to."""
+        return self.session.get_bind().dialect.name
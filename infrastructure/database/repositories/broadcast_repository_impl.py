@@ -0,0 +1,160 @@
+"""Broadcast campaign repository implementation."""
+
+from datetime import datetime
+from typing import List, Optional
+
+from domain.entities.broadcast_campaign import BroadcastCampaign
+from domain.repositories.broadcast_repository import BroadcastRepository
+from infrastructure.database.models.broadcast_model import BroadcastCampaignModel
+from infrastructure.database.routing import read_only
+from shared.constants.broadcast_constants import ACTIVE_BROADCAST_STATUSES, BroadcastStatus
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, select, update
+
+
+class BroadcastRepositoryImpl(BroadcastRepository):
+    """Broadcast campaign repository implementation."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, campaign: BroadcastCampaign) -> BroadcastCampaign:
+        """Create new campaign."""
+        db_campaign = BroadcastCampaignModel(
+            id=campaign.campaign_id,
+            text=campaign.text,
+            created_by=campaign.created_by,
+            status=BroadcastStatus(campaign.status).value,
+            total_recipients=campaign.total_recipients,
+            created_at=campaign.created_at,
+            updated_at=campaign.updated_at,
+        )
+        self.session.add(db_campaign)
+        await self.session.flush()
+        return self._model_to_entity(db_campaign)
+
+    async def get_by_id(self, campaign_id: str) -> Optional[BroadcastCampaign]:
+        """Get campaign by ID."""
+        db_campaign = await self.session.get(BroadcastCampaignModel, campaign_id)
+        return self._model_to_entity(db_campaign) if db_campaign else None
+
+    @read_only
+    async def list_recent(self, limit: int = 10) -> List[BroadcastCampaign]:
+        """List latest campaigns, newest first."""
+        result = await self.session.execute(
+            select(BroadcastCampaignModel)
+            .order_by(BroadcastCampaignModel.created_at.desc(), BroadcastCampaignModel.id.desc())
+            .limit(limit)
+        )
+        return [self._model_to_entity(db_campaign) for db_campaign in result.scalars().all()]
+
+    async def claim_next(self, stale_before: datetime) -> Optional[BroadcastCampaign]:
+        """Mark oldest pending campaign (or running one not saved since stale_before) running and return it.
+
+        The claim only succeeds if the row is unchanged since it was read,
+        so two workers never take the same campaign.
+        """
+        result = await self.session.execute(
+            select(
+                BroadcastCampaignModel.id,
+                BroadcastCampaignModel.status,
+                BroadcastCampaignModel.updated_at,
+                BroadcastCampaignModel.started_at,
+            )
+            .where(or_(
+                BroadcastCampaignModel.status == BroadcastStatus.PENDING.value,
+                and_(
+                    BroadcastCampaignModel.status == BroadcastStatus.RUNNING.value,
+                    BroadcastCampaignModel.updated_at < stale_before,
+                ),
+            ))
+            .order_by(BroadcastCampaignModel.created_at, BroadcastCampaignModel.id)
+            .limit(1)
+        )
+        row = result.first()
+        if row is None:
+            return None
+
+        campaign_id, status, updated_at, started_at = row
+        now = datetime.utcnow()
+        claimed = await self.session.execute(
+            update(BroadcastCampaignModel)
+            .where(
+                BroadcastCampaignModel.id == campaign_id,
+                BroadcastCampaignModel.status == status,
+                BroadcastCampaignModel.updated_at == updated_at,
+            )
+            .values(status=BroadcastStatus.RUNNING.value, started_at=started_at or now, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if claimed.rowcount != 1:
+            return None
+        return await self._get_fresh(campaign_id)
+
+    async def save_progress(self, campaign: BroadcastCampaign) -> bool:
+        """Save status, counts and position; False if the campaign changed since it was last saved."""
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            update(BroadcastCampaignModel)
+            .where(
+                BroadcastCampaignModel.id == campaign.campaign_id,
+                BroadcastCampaignModel.status == BroadcastStatus.RUNNING.value,
+                BroadcastCampaignModel.updated_at == campaign.updated_at,
+            )
+            .values(
+                status=BroadcastStatus(campaign.status).value,
+                delivered=campaign.delivered,
+                blocked=campaign.blocked,
+                failed=campaign.failed,
+                last_user_id=campaign.last_user_id,
+                finished_at=campaign.finished_at,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return False
+        campaign.updated_at = now
+        return True
+
+    async def cancel(self, campaign_id: str) -> bool:
+        """Cancel pending or running campaign."""
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            update(BroadcastCampaignModel)
+            .where(
+                BroadcastCampaignModel.id == campaign_id,
+                BroadcastCampaignModel.status.in_([status.value for status in ACTIVE_BROADCAST_STATUSES]),
+            )
+            .values(status=BroadcastStatus.CANCELLED.value, finished_at=now, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def _get_fresh(self, campaign_id: str) -> Optional[BroadcastCampaign]:
+        """Get campaign bypassing objects already loaded in the session."""
+        result = await self.session.execute(
+            select(BroadcastCampaignModel)
+            .where(BroadcastCampaignModel.id == campaign_id)
+            .execution_options(populate_existing=True)
+        )
+        db_campaign = result.scalar_one_or_none()
+        return self._model_to_entity(db_campaign) if db_campaign else None
+
+    def _model_to_entity(self, db_campaign: BroadcastCampaignModel) -> BroadcastCampaign:
+        """Convert BroadcastCampaignModel to BroadcastCampaign entity."""
+        return BroadcastCampaign(
+            campaign_id=db_campaign.id,
+            text=db_campaign.text,
+            created_by=db_campaign.created_by,
+            status=BroadcastStatus(db_campaign.status),
+            total_recipients=db_campaign.total_recipients,
+            delivered=db_campaign.delivered,
+            blocked=db_campaign.blocked,
+            failed=db_campaign.failed,
+            last_user_id=db_campaign.last_user_id,
+            created_at=db_campaign.created_at,
+            started_at=db_campaign.started_at,
+            finished_at=db_campaign.finished_at,
+            updated_at=db_campaign.updated_at,
+        )
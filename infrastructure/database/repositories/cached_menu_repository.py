@@ -0,0 +1,205 @@
+"""Read-through caching decorator for menu repository."""
+
+import copy
+from typing import List, Optional
+
+from domain.entities.category import Category
+from domain.entities.menu_item import MenuItem
+from domain.repositories.menu_repository import MenuRepository
+from domain.value_objects.menu_search_index import MenuSearchIndex
+from infrastructure.cache.menu_cache import MenuCache
+from infrastructure.database.connection import on_commit
+
+_INVALIDATION_KEY = "menu_cache_invalidate_on_commit"
+_SEARCH_INDEX_MAX_ITEMS = 100000
+
+
+class CachedMenuRepository(MenuRepository):
+    """Menu repository that serves reads from `MenuCache`.
+
+    Writes are delegated to the wrapped repository and bump the menu
+    version twice: immediately (so this request sees its own changes) and
+    after the surrounding transaction commits (so concurrent requests that
+    re-read the old rows before the commit are not cached for long).
+    """
+
+    def __init__(self, repository: MenuRepository, cache: MenuCache):
+        self.repository = repository
+        self.cache = cache
+
+    @property
+    def session(self):
+        """Session of the wrapped repository."""
+        return getattr(self.repository, "session", None)
+
+    # Category methods
+    async def create_category(self, category: Category) -> Category:
+        """Create new category."""
+        result = await self.repository.create_category(category)
+        self._invalidate()
+        return result
+
+    async def get_category_by_id(self, category_id: str) -> Optional[Category]:
+        """Get category by ID."""
+        version = self.cache.version
+        key = ("category", category_id)
+        cached = self.cache.get(key, version)
+        if cached is None:
+            cached = await self.repository.get_category_by_id(category_id)
+            if cached is None:
+                return None
+            self.cache.set(key, cached, version)
+        return copy.copy(cached)
+
+    async def get_category_by_name(self, name: str) -> Optional[Category]:
+        """Get category by name."""
+        return await self.repository.get_category_by_name(name)
+
+    async def list_categories(self, active_only: bool = True) -> List[Category]:
+        """List all categories."""
+        version = self.cache.version
+        key = ("categories", active_only)
+        cached = self.cache.get(key, version)
+        if cached is None:
+            cached = await self.repository.list_categories(active_only=active_only)
+            self.cache.set(key, cached, version)
+        return [copy.copy(category) for category in cached]
+
+    async def update_category(self, category: Category) -> Category:
+        """Update category."""
+        result = await self.repository.update_category(category)
+        self._invalidate()
+        return result
+
+    async def delete_category(self, category_id: str) -> bool:
+        """Delete category."""
+        result = await self.repository.delete_category(category_id)
+        self._invalidate()
+        return result
+
+    # Menu item methods
+    async def create_menu_item(self, menu_item: MenuItem) -> MenuItem:
+        """Create new menu item."""
+        result = await self.repository.create_menu_item(menu_item)
+        self._invalidate()
+        return result
+
+    async def get_menu_item_by_id(self, item_id: str) -> Optional[MenuItem]:
+        """Get menu item by ID."""
+        version = self.cache.version
+        key = ("item", item_id)
+        cached = self.cache.get(key, version)
+        if cached is None:
+            cached = await self.repository.get_menu_item_by_id(item_id)
+            if cached is None:
+                return None
+            self.cache.set(key, cached, version)
+        return copy.copy(cached)
+
+    async def get_menu_items_by_ids(self, item_ids: List[str]) -> List[MenuItem]:
+        """Get menu items by IDs; cache misses are loaded with one query."""
+        version = self.cache.version
+        found = {}
+        missing = []
+        for item_id in dict.fromkeys(item_ids):
+            cached = self.cache.get(("item", item_id), version)
+            if cached is None:
+                missing.append(item_id)
+            else:
+                found[item_id] = cached
+        if missing:
+            for item in await self.repository.get_menu_items_by_ids(missing):
+                self.cache.set(("item", item.item_id), item, version)
+                found[item.item_id] = item
+        return [copy.copy(found[item_id]) for item_id in dict.fromkeys(item_ids) if item_id in found]
+
+    async def get_menu_items_by_category(self, category_id: str, active_only: bool = True) -> List[MenuItem]:
+        """Get menu items by category."""
+        version = self.cache.version
+        key = ("category_items", category_id, active_only)
+        cached = self.cache.get(key, version)
+        if cached is None:
+            cached = await self.repository.get_menu_items_by_category(category_id, active_only)
+            self.cache.set(key, cached, version)
+            for item in cached:
+                self.cache.set(("item", item.item_id), item, version)
+        return [copy.copy(item) for item in cached]
+
+    async def list_menu_items(self, active_only: bool = True, limit: int = 100, offset: int = 0) -> List[MenuItem]:
+        """List all menu items."""
+        version = self.cache.version
+        key = ("items", active_only, limit, offset)
+        cached = self.cache.get(key, version)
+        if cached is None:
+            cached = await self.repository.list_menu_items(active_only=active_only, limit=limit, offset=offset)
+            self.cache.set(key, cached, version)
+        return [copy.copy(item) for item in cached]
+
+    async def search_menu_items(self, query: str, active_only: bool = True, limit: int = 50) -> List[MenuItem]:
+        """Search menu items by name or description, best match first.
+
+        PostgreSQL searches its trigram indexes. Otherwise the whole menu
+        is indexed in process once per menu version and searched there.
+        """
+        if self._dialect() == "postgresql":
+            return await self.repository.search_menu_items(query, active_only, limit)
+
+        version = self.cache.version
+        key = ("search_index",)
+        index = self.cache.get(key, version)
+        if index is None:
+            items = await self.repository.list_menu_items(active_only=False, limit=_SEARCH_INDEX_MAX_ITEMS)
+            index = MenuSearchIndex(items)
+            self.cache.set(key, index, version)
+        return index.search(query, active_only, limit)
+
+    async def update_menu_item(self, menu_item: MenuItem) -> MenuItem:
+        """Update menu item."""
+        result = await self.repository.update_menu_item(menu_item)
+        self._invalidate()
+        return result
+
+    async def delete_menu_item(self, item_id: str) -> bool:
+        """Delete menu item."""
+        result = await self.repository.delete_menu_item(item_id)
+        self._invalidate()
+        return result
+
+    async def set_category_image_file_id(self, category_id: str, image_url: str, file_id: str) -> bool:
+        """Remember Telegram file_id of category image.
+
+        The menu is not invalidated: until cached entries expire, the
+        process-wide photo cache supplies the file_id.
+        """
+        return await self.repository.set_category_image_file_id(category_id, image_url, file_id)
+
+    async def set_menu_item_image_file_id(self, item_id: str, image_url: str, file_id: str) -> bool:
+        """Remember Telegram file_id of menu item image.
+
+        The menu is not invalidated: until cached entries expire, the
+        process-wide photo cache supplies the file_id.
+        """
+        return await self.repository.set_menu_item_image_file_id(item_id, image_url, file_id)
+
+    async def count_menu_items(self, category_id: Optional[str] = None) -> int:
+        """Count menu items."""
+        version = self.cache.version
+        key = ("count", category_id)
+        cached = self.cache.get(key, version)
+        if cached is None:
+            cached = await self.repository.count_menu_items(category_id)
+            self.cache.set(key, cached, version)
+        return cached
+
+    # Helper methods
+    def _dialect(self) -> Optional[str]:
+        """Name of the dialect of the wrapped repository, if it is SQL."""
+        session = self.session
+        if session is None:
+            return None
+        return session.get_bind().dialect.name
+
+    def _invalidate(self) -> None:
+        """Bump menu version now and once more after commit."""
+        self.cache.bump_version()
+        on_commit(self.session, self.cache.notify_committed, key=_INVALIDATION_KEY)
@@ -1,15 +1,18 @@
 """Cart repository implementation."""
 
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+import uuid
 
 from domain.entities.cart import Cart, CartItem
 from domain.entities.menu_item import MenuItem
 from domain.repositories.cart_repository import CartRepository
 from infrastructure.database.models.cart_model import CartModel, CartItemModel
 from infrastructure.database.models.menu_item_model import MenuItemModel
+from infrastructure.database.upsert import upsert_insert
+from shared.constants.bot_constants import MAX_CART_ITEM_QUANTITY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, func, case, insert, literal, union_all
 from sqlalchemy.orm import selectinload
 
 
@@ -91,6 +94,39 @@ class CartRepositoryImpl(CartRepository):
         await self.session.flush()
         return True
     
+    async def replace(self, cart: Cart) -> None:
+        """Store cart and exactly its items, creating the cart row if needed."""
+        query = upsert_insert(self.session, CartModel).values(
+            id=cart.cart_id,
+            user_id=cart.user_id,
+            created_at=cart.created_at,
+            updated_at=cart.updated_at,
+        )
+        await self.session.execute(
+            query.on_conflict_do_update(index_elements=["id"], set_={"updated_at": query.excluded.updated_at})
+        )
+        await self.session.execute(delete(CartItemModel).where(CartItemModel.cart_id == cart.cart_id))
+        
+        items = cart.get_items_list()
+        if items:
+            now = datetime.now()
+            await self.session.execute(
+                insert(CartItemModel),
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "cart_id": cart.cart_id,
+                        "menu_item_id": item.item_id,
+                        "quantity": item.quantity,
+                        "comment": item.comment,
+                        # Distinct timestamps keep the order items were added in
+                        "created_at": now + timedelta(microseconds=position),
+                        "updated_at": now,
+                    }
+                    for position, item in enumerate(items)
+                ],
+            )
+    
     async def clear_user_cart(self, user_id: str) -> bool:
         """Clear user's cart."""
         # Delete all cart items for user
@@ -145,6 +181,95 @@ class CartRepositoryImpl(CartRepository):
         await self.session.flush()
         return True
     
+    async def add_item_returning(
+        self,
+        user_id: str,
+        item_id: str,
+        quantity: int,
+        comment: Optional[str] = None
+    ) -> Optional[Cart]:
+        """Add item to user's cart and return updated cart.
+
+        The cart row and the menu item are looked up inside the INSERT ... SELECT
+        and the (cart_id, menu_item_id) unique constraint turns a repeated add
+        into a quantity increment. On PostgreSQL the upsert runs in a CTE next
+        to the cart read, so the whole mutation is one statement; SQLite cannot
+        put DML in a CTE and reads the cart with a second statement.
+        """
+        now = datetime.now()
+        source = (
+            select(
+                literal(str(uuid.uuid4())),
+                CartModel.id,
+                MenuItemModel.id,
+                literal(min(quantity, MAX_CART_ITEM_QUANTITY)),
+                literal(comment, CartItemModel.comment.type),
+                literal(now),
+                literal(now),
+            )
+            .select_from(CartModel)
+            .join(MenuItemModel, MenuItemModel.id == item_id)
+            .where(CartModel.user_id == user_id)
+        )
+        query = upsert_insert(self.session, CartItemModel).from_select(
+            ["id", "cart_id", "menu_item_id", "quantity", "comment", "created_at", "updated_at"],
+            source,
+        )
+        new_quantity = CartItemModel.quantity + query.excluded.quantity
+        query = query.on_conflict_do_update(
+            index_elements=["cart_id", "menu_item_id"],
+            set_={
+                "quantity": case(
+                    (new_quantity > MAX_CART_ITEM_QUANTITY, MAX_CART_ITEM_QUANTITY),
+                    else_=new_quantity,
+                ),
+                "comment": func.coalesce(query.excluded.comment, CartItemModel.comment),
+                "updated_at": query.excluded.updated_at,
+            },
+        )
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            # Outer query sees the snapshot from before the upsert, so the
+            # upserted row comes from RETURNING and the rest from the table
+            upserted = query.returning(
+                CartItemModel.cart_id,
+                CartItemModel.menu_item_id,
+                CartItemModel.quantity,
+                CartItemModel.comment,
+                CartItemModel.created_at,
+            ).cte("upserted")
+            others = select(
+                CartItemModel.cart_id,
+                CartItemModel.menu_item_id,
+                CartItemModel.quantity,
+                CartItemModel.comment,
+                CartItemModel.created_at,
+            ).where(
+                CartItemModel.cart_id == select(upserted.c.cart_id).scalar_subquery(),
+                CartItemModel.menu_item_id != item_id,
+            )
+            rows = await self.session.execute(
+                self._cart_rows_query(union_all(select(upserted), others).subquery())
+            )
+        else:
+            result = await self.session.execute(query)
+            if not result.rowcount:
+                return None
+            items = (
+                select(
+                    CartItemModel.cart_id,
+                    CartItemModel.menu_item_id,
+                    CartItemModel.quantity,
+                    CartItemModel.comment,
+                    CartItemModel.created_at,
+                )
+                .join(CartModel, CartModel.id == CartItemModel.cart_id)
+                .where(CartModel.user_id == user_id)
+            )
+            rows = await self.session.execute(self._cart_rows_query(items.subquery()))
+
+        return self._rows_to_entity(rows.all())
+    
     async def remove_item(self, cart_id: str, item_id: str) -> bool:
         """Remove item from cart."""
         result = await self.session.execute(
@@ -185,6 +310,14 @@ class CartRepositoryImpl(CartRepository):
         await self.session.flush()
         return True
     
+    async def update_item_prices(self, cart_id: str, prices: Dict[str, int]) -> bool:
+        """Update prices of items in cart to current menu prices.
+        
+        Prices are not stored with cart items - they are read from menu items
+        whenever the cart is loaded - so there is nothing to update.
+        """
+        return True
+    
     async def get_cart_total(self, cart_id: str) -> int:
         """Get cart total amount."""
         result = await self.session.execute(
@@ -225,6 +358,47 @@ class CartRepositoryImpl(CartRepository):
             updated_at=db_cart.updated_at
         )
     
+    def _cart_rows_query(self, items):
+        """Select cart and menu item columns for cart item rows."""
+        return (
+            select(
+                items.c.cart_id,
+                CartModel.user_id,
+                CartModel.created_at.label("cart_created_at"),
+                CartModel.updated_at.label("cart_updated_at"),
+                MenuItemModel.id.label("item_id"),
+                MenuItemModel.name,
+                MenuItemModel.price,
+                items.c.quantity,
+                items.c.comment,
+            )
+            .join(CartModel, CartModel.id == items.c.cart_id)
+            .join(MenuItemModel, MenuItemModel.id == items.c.menu_item_id)
+            .order_by(items.c.created_at)
+        )
+    
+    def _rows_to_entity(self, rows) -> Optional[Cart]:
+        """Convert rows of _cart_rows_query to domain Cart."""
+        if not rows:
+            return None
+        first = rows[0]
+        return Cart(
+            cart_id=first.cart_id,
+            user_id=first.user_id,
+            items={
+                row.item_id: CartItem(
+                    item_id=row.item_id,
+                    name=row.name,
+                    price=row.price,
+                    quantity=row.quantity,
+                    comment=row.comment,
+                )
+                for row in rows
+            },
+            created_at=first.cart_created_at,
+            updated_at=first.cart_updated_at
+        )
+    
     def _menu_item_model_to_entity(self, db_item: MenuItemModel) -> MenuItem:
         """Convert MenuItemModel to MenuItem entity."""
         from domain.entities.menu_item import MenuItem
@@ -5,13 +5,25 @@ from typing import List, Optional
 from domain.entities.category import Category
 from domain.entities.menu_item import MenuItem
 from domain.repositories.menu_repository import MenuRepository
+from domain.value_objects.menu_search_index import DESCRIPTION_WEIGHT, MenuSearchIndex
 from infrastructure.database.models.category_model import CategoryModel
 from infrastructure.database.models.menu_item_model import MenuItemModel
 from infrastructure.database.models.cart_model import CartItemModel
+from infrastructure.database.routing import read_only
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, delete
+from sqlalchemy import select, and_, or_, func, delete, update, literal_column
 from sqlalchemy.orm import selectinload
 
+from shared.utils.text_search import normalize_search_text
+
+
+def _fold_yo(column):
+    """translate(column, 'Ёё', 'Ее') exactly as the trigram indexes are built.
+
+    The arguments are inlined literals so the planner can match the indexed expression.
+    """
+    return func.translate(column, literal_column("'Ёё'"), literal_column("'Ее'"))
+
 
 class MenuRepositoryImpl(MenuRepository):
     """Menu repository implementation."""
@@ -27,6 +39,7 @@ class MenuRepositoryImpl(MenuRepository):
             name=category.name,
             description=category.description,
             image_url=category.image_url,
+            image_file_id=category.image_file_id,
             sort_order=category.sort_order,
             is_active=category.is_active,
             created_at=category.created_at,
@@ -61,6 +74,7 @@ class MenuRepositoryImpl(MenuRepository):
             return self._category_model_to_entity(db_category)
         return None
     
+    @read_only
     async def list_categories(self, active_only: bool = True) -> List[Category]:
         """List all categories."""
         query = select(CategoryModel).order_by(CategoryModel.sort_order, CategoryModel.name)
@@ -85,6 +99,9 @@ class MenuRepositoryImpl(MenuRepository):
         
         db_category.name = category.name
         db_category.description = category.description
+        if db_category.image_url != category.image_url:
+            # file_id belongs to the previous image
+            db_category.image_file_id = None
         db_category.image_url = category.image_url
         db_category.sort_order = category.sort_order
         db_category.is_active = category.is_active
@@ -119,6 +136,7 @@ class MenuRepositoryImpl(MenuRepository):
             description=menu_item.description,
             price=menu_item.price,
             image_url=menu_item.image_url,
+            image_file_id=menu_item.image_file_id,
             ingredients=menu_item.ingredients,
             allergens=menu_item.allergens,
             weight=menu_item.weight,
@@ -147,6 +165,15 @@ class MenuRepositoryImpl(MenuRepository):
             return self._menu_item_model_to_entity(db_item)
         return None
     
+    async def get_menu_items_by_ids(self, item_ids: List[str]) -> List[MenuItem]:
+        """Get menu items by IDs in a single query; unknown IDs are skipped."""
+        if not item_ids:
+            return []
+        result = await self.session.execute(
+            select(MenuItemModel).where(MenuItemModel.id.in_(set(item_ids)))
+        )
+        return [self._menu_item_model_to_entity(db_item) for db_item in result.scalars().all()]
+    
     async def get_menu_items_by_category(self, category_id: str, active_only: bool = True) -> List[MenuItem]:
         """Get menu items by category."""
         query = select(MenuItemModel).where(MenuItemModel.category_id == category_id)
@@ -161,6 +188,7 @@ class MenuRepositoryImpl(MenuRepository):
         
         return [self._menu_item_model_to_entity(item) for item in db_items]
     
+    @read_only
     async def list_menu_items(self, active_only: bool = True, limit: int = 100, offset: int = 0) -> List[MenuItem]:
         """List all menu items."""
         query = select(MenuItemModel).offset(offset).limit(limit)
@@ -175,19 +203,46 @@ class MenuRepositoryImpl(MenuRepository):
         
         return [self._menu_item_model_to_entity(item) for item in db_items]
     
-    async def search_menu_items(self, query: str, active_only: bool = True) -> List[MenuItem]:
-        """Search menu items by name or description."""
+    @read_only
+    async def search_menu_items(self, query: str, active_only: bool = True, limit: int = 50) -> List[MenuItem]:
+        """Search menu items by name or description, best match first.
+
+        PostgreSQL ranks by pg_trgm word similarity served by the GIN
+        trigram indexes. Other databases have no trigram support, so the
+        menu is loaded and searched through an in-process index; wrap the
+        repository in CachedMenuRepository to keep that index between calls.
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            return await self._search_menu_items_trgm(query, active_only, limit)
+        
+        items_query = select(MenuItemModel)
+        if active_only:
+            items_query = items_query.where(MenuItemModel.is_available == True)
+        result = await self.session.execute(items_query)
+        index = MenuSearchIndex(self._menu_item_model_to_entity(item) for item in result.scalars().all())
+        return index.search(query, active_only, limit)
+    
+    async def _search_menu_items_trgm(self, query: str, active_only: bool, limit: int) -> List[MenuItem]:
+        """Search menu items with pg_trgm; `%>` matches word_similarity above pg_trgm.word_similarity_threshold."""
+        normalized = normalize_search_text(query)
+        if not normalized:
+            return []
+        name = _fold_yo(MenuItemModel.name)
+        description = _fold_yo(MenuItemModel.description)
+        rank = func.greatest(
+            func.word_similarity(normalized, name),
+            func.word_similarity(normalized, description) * DESCRIPTION_WEIGHT,
+        )
         search_query = select(MenuItemModel).where(
-            or_(
-                MenuItemModel.name.ilike(f"%{query}%"),
-                MenuItemModel.description.ilike(f"%{query}%")
-            )
+            or_(name.op("%>")(normalized), description.op("%>")(normalized))
         )
         
         if active_only:
             search_query = search_query.where(MenuItemModel.is_available == True)
         
-        search_query = search_query.order_by(MenuItemModel.sort_order, MenuItemModel.name)
+        search_query = search_query.order_by(
+            rank.desc(), MenuItemModel.sort_order, MenuItemModel.name
+        ).limit(limit)
         
         result = await self.session.execute(search_query)
         db_items = result.scalars().all()
@@ -208,6 +263,9 @@ class MenuRepositoryImpl(MenuRepository):
         db_item.name = menu_item.name
         db_item.description = menu_item.description
         db_item.price = menu_item.price
+        if db_item.image_url != menu_item.image_url:
+            # file_id belongs to the previous image
+            db_item.image_file_id = None
         db_item.image_url = menu_item.image_url
         db_item.ingredients = menu_item.ingredients
         db_item.allergens = menu_item.allergens
@@ -243,6 +301,25 @@ class MenuRepositoryImpl(MenuRepository):
         await self.session.flush()
         return True
     
+    async def set_category_image_file_id(self, category_id: str, image_url: str, file_id: str) -> bool:
+        """Remember Telegram file_id of category image."""
+        result = await self.session.execute(
+            update(CategoryModel)
+            .where(CategoryModel.id == category_id, CategoryModel.image_url == image_url)
+            # Keep updated_at: caching a file_id does not change the category
+            .values(image_file_id=file_id, updated_at=CategoryModel.updated_at)
+        )
+        return result.rowcount > 0
+    
+    async def set_menu_item_image_file_id(self, item_id: str, image_url: str, file_id: str) -> bool:
+        """Remember Telegram file_id of menu item image."""
+        result = await self.session.execute(
+            update(MenuItemModel)
+            .where(MenuItemModel.id == item_id, MenuItemModel.image_url == image_url)
+            .values(image_file_id=file_id, updated_at=MenuItemModel.updated_at)
+        )
+        return result.rowcount > 0
+    
     async def count_menu_items(self, category_id: Optional[str] = None) -> int:
         """Count menu items."""
         query = select(func.count(MenuItemModel.id))
@@ -261,6 +338,7 @@ class MenuRepositoryImpl(MenuRepository):
             name=db_category.name,
             description=db_category.description,
             image_url=db_category.image_url,
+            image_file_id=db_category.image_file_id,
             sort_order=db_category.sort_order,
             is_active=db_category.is_active,
             created_at=db_category.created_at,
@@ -276,6 +354,7 @@ class MenuRepositoryImpl(MenuRepository):
             description=db_item.description,
             price=db_item.price,
             image_url=db_item.image_url,
+            image_file_id=db_item.image_file_id,
             ingredients=db_item.ingredients,
             allergens=db_item.allergens,
             weight=db_item.weight,
@@ -287,6 +366,7 @@ class MenuRepositoryImpl(MenuRepository):
             updated_at=db_item.updated_at
         )
     
+    @read_only
     async def list_categories(self, active_only: bool = True) -> List[Category]:
         """List all categories; optionally only active."""
         query = select(CategoryModel).order_by(CategoryModel.sort_order, CategoryModel.name)
@@ -296,6 +376,7 @@ class MenuRepositoryImpl(MenuRepository):
         db_categories = result.scalars().all()
         return [self._category_model_to_entity(db_category) for db_category in db_categories]
     
+    @read_only
     async def list_menu_items(self, active_only: bool = True, limit: int = 100, offset: int = 0) -> List[MenuItem]:
         """List all menu items; supports active_only and pagination."""
         query = select(MenuItemModel).offset(offset).limit(limit)
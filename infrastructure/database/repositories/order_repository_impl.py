@@ -1,17 +1,21 @@
 """Order repository implementation."""
 
+import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from domain.entities.order import Order, OrderItem
 from domain.entities.menu_item import MenuItem
 from domain.repositories.order_repository import OrderRepository
-from infrastructure.database.models.order_model import OrderModel
+from infrastructure.database.models.order_model import ACTIVE_ORDER_STATUSES, OrderModel, OrderItemModel
 from infrastructure.database.models.menu_item_model import MenuItemModel
+from infrastructure.database.pagination import fetch_page
+from infrastructure.database.routing import read_only
 from shared.constants.order_constants import OrderStatus, OrderType, PaymentStatus, PaymentMethod
 from shared.types.order_types import OrderFilters
+from shared.types.pagination import Page
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, insert, func, and_, or_, bindparam
 from sqlalchemy.orm import selectinload
 
 
@@ -23,17 +27,6 @@ class OrderRepositoryImpl(OrderRepository):
     
     async def create(self, order: Order) -> Order:
         """Create new order."""
-        # Prepare JSON items snapshot
-        items_json = []
-        for it in order.items:
-            items_json.append({
-                "item_id": it.item_id or getattr(it.menu_item, "item_id", None),
-                "name": it.name or getattr(it.menu_item, "name", None),
-                "price": it.price,
-                "quantity": it.quantity,
-                "comment": it.comment,
-            })
-
         db_order = OrderModel(
             id=order.order_id,
             user_id=order.user_id,
@@ -44,7 +37,6 @@ class OrderRepositoryImpl(OrderRepository):
             payment_status=order.payment_status.value if order.payment_status else None,
             delivery_address=order.delivery_info.address if order.delivery_info else None,
             delivery_phone=order.delivery_info.phone if order.delivery_info else None,
-            items=items_json,
             comment=order.comment,
             created_at=order.created_at or datetime.now(),
             updated_at=order.updated_at or datetime.now()
@@ -53,9 +45,24 @@ class OrderRepositoryImpl(OrderRepository):
         self.session.add(db_order)
         await self.session.flush()  # Get the ID
         
-        # Items are already stored as JSON in OrderModel
+        # Insert all line items in a single executemany round trip
+        rows = [
+            {
+                "id": getattr(it, "order_item_id", None) or str(uuid.uuid4()),
+                "order_id": db_order.id,
+                "item_id": it.item_id or getattr(it.menu_item, "item_id", None),
+                "name": it.name or getattr(it.menu_item, "name", None) or "",
+                "price": it.price,
+                "quantity": it.quantity,
+                "comment": it.comment,
+                "position": position,
+                "created_at": db_order.created_at,
+            }
+            for position, it in enumerate(order.items)
+        ]
+        if rows:
+            await self.session.execute(insert(OrderItemModel), rows)
         
-        await self.session.flush()
         await self.session.refresh(db_order)
         
         return await self.get_by_id(db_order.id)
@@ -72,18 +79,11 @@ class OrderRepositoryImpl(OrderRepository):
             return self._model_to_entity(db_order)
         return None
     
-    async def get_by_user_id(self, user_id: str, limit: int = 50, offset: int = 0) -> List[Order]:
-        """Get orders by user ID."""
-        result = await self.session.execute(
-            select(OrderModel)
-            .where(OrderModel.user_id == user_id)
-            .order_by(OrderModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
-        db_orders = result.scalars().all()
-        
-        return [self._model_to_entity(order) for order in db_orders]
+    async def get_by_user_id(self, user_id: str, limit: int = 50) -> List[Order]:
+        """Get user's latest orders, newest first."""
+        query = select(OrderModel).where(OrderModel.user_id == user_id)
+        page = await fetch_page(self.session, query, OrderModel, limit=limit)
+        return [self._model_to_entity(order) for order in page.items]
     
     async def update(self, order: Order) -> Order:
         """Update order."""
@@ -123,31 +123,12 @@ class OrderRepositoryImpl(OrderRepository):
         await self.session.flush()
         return True
     
+    @read_only
     async def list_orders(self, filters: OrderFilters) -> List[Order]:
         """List orders with filters."""
-        query = select(OrderModel).options(
-        )
-        
-        conditions = []
-        
-        if filters.status:
-            conditions.append(OrderModel.status == filters.status.value)
-        
-        if filters.order_type:
-            conditions.append(OrderModel.order_type == filters.order_type.value)
-        
-        if filters.payment_status:
-            conditions.append(OrderModel.payment_status == filters.payment_status.value)
-        
-        if filters.user_id:
-            conditions.append(OrderModel.user_id == filters.user_id)
-        
-        if filters.date_from:
-            conditions.append(OrderModel.created_at >= filters.date_from)
-        
-        if filters.date_to:
-            conditions.append(OrderModel.created_at <= filters.date_to)
+        query = select(OrderModel)
         
+        conditions = self._filter_conditions(filters)
         if conditions:
             query = query.where(and_(*conditions))
         
@@ -164,6 +145,24 @@ class OrderRepositoryImpl(OrderRepository):
         
         return [self._model_to_entity(order) for order in db_orders]
     
+    @read_only
+    async def list_orders_page(
+        self,
+        filters: OrderFilters,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[Order]:
+        """List one page of filtered orders, newest first."""
+        query = select(OrderModel)
+        
+        conditions = self._filter_conditions(filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+        
+        page = await fetch_page(self.session, query, OrderModel, cursor, limit, backward)
+        return page.map(self._model_to_entity)
+    
     async def get_orders_by_status(self, status: OrderStatus, limit: int = 100, offset: int = 0) -> List[Order]:
         """Get orders by status."""
         result = await self.session.execute(
@@ -190,6 +189,7 @@ class OrderRepositoryImpl(OrderRepository):
         
         return [self._model_to_entity(order) for order in db_orders]
     
+    @read_only
     async def get_orders_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Order]:
         """Get orders by date range."""
         result = await self.session.execute(
@@ -217,31 +217,13 @@ class OrderRepositoryImpl(OrderRepository):
         
         return [self._model_to_entity(order) for order in db_orders]
     
+    @read_only
     async def count_orders(self, filters: Optional[OrderFilters] = None) -> int:
         """Count orders with optional filters."""
         query = select(func.count(OrderModel.id))
         
         if filters:
-            conditions = []
-            
-            if filters.status:
-                conditions.append(OrderModel.status == filters.status.value)
-            
-            if filters.order_type:
-                conditions.append(OrderModel.order_type == filters.order_type.value)
-            
-            if filters.payment_status:
-                conditions.append(OrderModel.payment_status == filters.payment_status.value)
-            
-            if filters.user_id:
-                conditions.append(OrderModel.user_id == filters.user_id)
-            
-            if filters.date_from:
-                conditions.append(OrderModel.created_at >= filters.date_from)
-            
-            if filters.date_to:
-                conditions.append(OrderModel.created_at <= filters.date_to)
-            
+            conditions = self._filter_conditions(filters)
             if conditions:
                 query = query.where(and_(*conditions))
         
@@ -267,12 +249,10 @@ class OrderRepositoryImpl(OrderRepository):
         result = await self.session.execute(
             select(OrderModel)
             .where(
-                OrderModel.status.in_([
-                    OrderStatus.PENDING.value,
-                    OrderStatus.CONFIRMED.value,
-                    OrderStatus.PREPARING.value,
-                    OrderStatus.READY.value
-                ])
+                # Statuses are inlined so the planner can match ix_orders_active_created_at
+                OrderModel.status.in_(
+                    bindparam("active_statuses", list(ACTIVE_ORDER_STATUSES), expanding=True, literal_execute=True)
+                )
             )
             .order_by(OrderModel.created_at.asc())
         )
@@ -302,23 +282,79 @@ class OrderRepositoryImpl(OrderRepository):
         
         return [self._model_to_entity(order) for order in db_orders]
     
+    @read_only
+    async def get_top_items(
+        self,
+        limit: int = 10,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> List[Tuple[str, int, int]]:
+        """Get best-selling items as (name, quantity, revenue), cancelled orders excluded."""
+        quantity = func.sum(OrderItemModel.quantity)
+        revenue = func.sum(OrderItemModel.price * OrderItemModel.quantity)
+        query = (
+            select(func.max(OrderItemModel.name), quantity, revenue)
+            .join(OrderModel, OrderModel.id == OrderItemModel.order_id)
+            .where(OrderModel.status.notin_([OrderStatus.CANCELLED.value, OrderStatus.REFUNDED.value]))
+        )
+        
+        if date_from:
+            query = query.where(OrderModel.created_at >= date_from)
+        
+        if date_to:
+            query = query.where(OrderModel.created_at <= date_to)
+        
+        # Items without a menu reference are grouped by their name
+        query = (
+            query.group_by(func.coalesce(OrderItemModel.item_id, OrderItemModel.name))
+            .order_by(quantity.desc())
+            .limit(limit)
+        )
+        
+        result = await self.session.execute(query)
+        return [(name, int(qty or 0), int(total or 0)) for name, qty, total in result.all()]
+    
+    def _filter_conditions(self, filters: OrderFilters) -> list:
+        """Build WHERE conditions for order filters."""
+        conditions = []
+        
+        if filters.status:
+            conditions.append(OrderModel.status == filters.status.value)
+        
+        if filters.order_type:
+            conditions.append(OrderModel.order_type == filters.order_type.value)
+        
+        if filters.payment_status:
+            conditions.append(OrderModel.payment_status == filters.payment_status.value)
+        
+        if filters.user_id:
+            conditions.append(OrderModel.user_id == filters.user_id)
+        
+        if filters.date_from:
+            conditions.append(OrderModel.created_at >= filters.date_from)
+        
+        if filters.date_to:
+            conditions.append(OrderModel.created_at <= filters.date_to)
+        
+        return conditions
+    
     def _model_to_entity(self, db_order: OrderModel) -> Order:
         """Convert OrderModel to Order entity."""
-        order_items = []
-        for obj in (db_order.items or []):
-            # obj is dict serialized above
-            from domain.entities.order_item import OrderItem
-            order_item = OrderItem(
-                order_item_id="",  # not persisted separately in JSON
+        from domain.entities.order_item import OrderItem
+        order_items = [
+            OrderItem(
+                order_item_id=row.id,
                 order_id=db_order.id,
                 menu_item=None,
-                item_id=obj.get("item_id"),
-                name=obj.get("name"),
-                quantity=int(obj.get("quantity", 0)),
-                price=int(obj.get("price", 0)),
-                comment=obj.get("comment")
+                item_id=row.item_id,
+                name=row.name,
+                quantity=row.quantity,
+                price=row.price,
+                comment=row.comment,
+                created_at=row.created_at
             )
-            order_items.append(order_item)
+            for row in db_order.items
+        ]
         
         # Create delivery/pickup info
         delivery_info = None
@@ -375,7 +411,7 @@ class OrderRepositoryImpl(OrderRepository):
     
     async def get_orders_by_user_id(self, user_id: str) -> List[Order]:
         """Get orders by user ID."""
-        return await self.get_by_user_id(user_id, limit=100, offset=0)
+        return await self.get_by_user_id(user_id, limit=100)
     
     async def get_orders_by_filters(self, filters: OrderFilters) -> List[Order]:
         """Get orders by filters."""
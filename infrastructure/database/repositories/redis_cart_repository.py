@@ -0,0 +1,162 @@
+"""Cart repository serving active carts from Redis."""
+
+from typing import Dict, List, Optional
+
+from domain.entities.cart import Cart
+from domain.repositories.cart_repository import CartRepository
+from domain.repositories.menu_repository import MenuRepository
+from infrastructure.cache.cart_store import RedisCartStore
+from infrastructure.database.connection import on_commit
+from infrastructure.database.repositories.cart_repository_impl import CartRepositoryImpl
+
+
+class RedisCartRepository(CartRepository):
+    """Keeps cart edits in Redis and persists them write-behind.
+
+    Item edits touch Redis only; `CartWriteBehind` copies changed carts to
+    the database. A cart missing in Redis (new process, expired TTL) is
+    loaded from the database on first access. Deleting or clearing a cart
+    - which happens at checkout - deletes the database copy in the caller's
+    transaction and the Redis copy once that transaction commits, so no
+    stale cart survives an order and a failed checkout keeps the cart.
+    """
+
+    def __init__(
+        self,
+        store: RedisCartStore,
+        repository: CartRepositoryImpl,
+        menu_repository: MenuRepository,
+    ):
+        self.store = store
+        self.repository = repository
+        self.menu_repository = menu_repository
+
+    async def create(self, cart: Cart) -> Cart:
+        """Create new cart."""
+        await self.store.save(cart)
+        return cart
+
+    async def get_by_id(self, cart_id: str) -> Optional[Cart]:
+        """Get cart by ID."""
+        cart = await self.store.load(cart_id)
+        if cart is not None:
+            return cart
+        cart = await self.repository.get_by_id(cart_id)
+        if cart is not None:
+            cart = await self.store.hydrate(cart)
+        return cart
+
+    async def get_by_user_id(self, user_id: str) -> Optional[Cart]:
+        """Get cart by user ID.
+
+        Comes from a single HGETALL, so it is a consistent snapshot even
+        while other updates edit the cart.
+        """
+        cart_id = await self.store.get_cart_id(user_id)
+        if cart_id is not None:
+            cart = await self.store.load(cart_id)
+            if cart is not None:
+                return cart
+        cart = await self.repository.get_by_user_id(user_id)
+        if cart is not None:
+            cart = await self.store.hydrate(cart)
+        return cart
+
+    async def update(self, cart: Cart) -> Cart:
+        """Update cart."""
+        current = await self.get_by_id(cart.cart_id)
+        if current is None:
+            raise ValueError(f"Cart with id {cart.cart_id} not found")
+        await self.store.touch(current)
+        return await self.store.load(cart.cart_id) or current
+
+    async def delete(self, cart_id: str) -> bool:
+        """Delete cart."""
+        cart = await self.store.load(cart_id)
+        deleted = await self.repository.delete(cart_id)
+        self._delete_after_commit(cart_id, cart.user_id if cart else None)
+        return cart is not None or deleted
+
+    async def clear_user_cart(self, user_id: str) -> bool:
+        """Clear user's cart."""
+        cart_id = await self.store.get_cart_id(user_id)
+        in_redis = cart_id is not None and await self.store.exists(cart_id)
+        in_database = await self.repository.clear_user_cart(user_id)
+        if cart_id is not None:
+            self._delete_after_commit(cart_id, user_id)
+        return in_redis or in_database
+
+    async def add_item(self, cart_id: str, item_id: str, quantity: int, comment: Optional[str] = None) -> bool:
+        """Add item to cart."""
+        cart = await self.get_by_id(cart_id)
+        if cart is None:
+            return False
+        return await self._add(cart, item_id, quantity, comment) is not None
+
+    async def add_item_returning(
+        self,
+        user_id: str,
+        item_id: str,
+        quantity: int,
+        comment: Optional[str] = None
+    ) -> Optional[Cart]:
+        """Add item to user's cart and return updated cart."""
+        cart = await self.get_by_user_id(user_id)
+        if cart is None:
+            return None
+        return await self._add(cart, item_id, quantity, comment)
+
+    async def remove_item(self, cart_id: str, item_id: str) -> bool:
+        """Remove item from cart."""
+        cart = await self.get_by_id(cart_id)
+        if cart is None:
+            return False
+        return await self.store.remove_item(cart, item_id)
+
+    async def update_item_quantity(self, cart_id: str, item_id: str, quantity: int) -> bool:
+        """Update item quantity in cart."""
+        cart = await self.get_by_id(cart_id)
+        if cart is None:
+            return False
+        return await self.store.set_quantity(cart, item_id, quantity)
+
+    async def update_item_prices(self, cart_id: str, prices: Dict[str, int]) -> bool:
+        """Update prices of items in cart to current menu prices."""
+        cart = await self.get_by_id(cart_id)
+        if cart is None:
+            return False
+        return await self.store.set_prices(cart, prices)
+
+    async def get_cart_total(self, cart_id: str) -> int:
+        """Get cart total amount."""
+        cart = await self.get_by_id(cart_id)
+        return cart.total_price if cart else 0
+
+    async def count_items(self, cart_id: str) -> int:
+        """Count items in cart."""
+        cart = await self.get_by_id(cart_id)
+        return cart.item_count if cart else 0
+
+    async def list_user_carts(self, user_id: str) -> List[Cart]:
+        """List all carts for user."""
+        cart = await self.get_by_user_id(user_id)
+        return [cart] if cart else []
+
+    async def _add(self, cart: Cart, item_id: str, quantity: int, comment: Optional[str]) -> Optional[Cart]:
+        """Add item to loaded cart, None if menu item does not exist."""
+        menu_item = await self.menu_repository.get_menu_item_by_id(item_id)
+        if menu_item is None:
+            return None
+        return await self.store.add_item(cart, item_id, menu_item.name, menu_item.price, quantity, comment)
+
+    def _delete_after_commit(self, cart_id: str, user_id: Optional[str]) -> None:
+        """Drop cart from Redis once the transaction deleting its database copy commits.
+
+        Until then the cart stays in Redis, so a rolled back checkout leaves
+        it untouched instead of tombstoned.
+        """
+        on_commit(
+            self.repository.session,
+            lambda: self.store.delete_later(cart_id, user_id),
+            key=("delete_redis_cart", cart_id),
+        )
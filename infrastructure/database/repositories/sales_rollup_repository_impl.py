@@ -0,0 +1,144 @@
+"""Sales rollup repository implementation."""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from domain.entities.order import Order
+from domain.repositories.sales_rollup_repository import SalesRollupRepository
+from infrastructure.database.models.order_model import COMPLETED_ORDER_STATUSES, OrderModel
+from infrastructure.database.models.sales_rollup_model import SalesRollupModel
+from infrastructure.database.routing import read_only
+from infrastructure.database.upsert import upsert_insert
+from shared.constants.order_constants import OrderStatus
+from shared.types.order_types import SalesRollupEntry
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Date, Integer, and_, cast, delete, extract, func, insert, select, tuple_
+
+
+class SalesRollupRepositoryImpl(SalesRollupRepository):
+    """Sales rollup repository implementation."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def record_order(self, order: Order) -> None:
+        """Add new order to its bucket."""
+        await self._add(order, order.status.value, 1)
+
+    async def move_order(self, order: Order, old_status: OrderStatus) -> None:
+        """Move order from its old-status bucket to the bucket of order.status."""
+        if old_status == order.status:
+            return
+        await self._add(order, old_status.value, -1)
+        await self._add(order, order.status.value, 1)
+
+    @read_only
+    async def summarize(self, date_from: datetime, date_to: datetime) -> List[SalesRollupEntry]:
+        """Get totals per (status, order type) for a period."""
+        result = await self.session.execute(
+            select(
+                SalesRollupModel.status,
+                SalesRollupModel.order_type,
+                func.sum(SalesRollupModel.order_count),
+                func.sum(SalesRollupModel.revenue),
+            )
+            .where(self._period(date_from, date_to))
+            .group_by(SalesRollupModel.status, SalesRollupModel.order_type)
+        )
+        return [
+            SalesRollupEntry(status, order_type, int(count or 0), int(revenue or 0))
+            for status, order_type, count, revenue in result.all()
+            if count
+        ]
+
+    @read_only
+    async def get_revenue_by_day(self, date_from: datetime, date_to: datetime) -> List[Tuple[str, int]]:
+        """Get (YYYY-MM-DD, revenue) pairs of completed orders, highest revenue first."""
+        rows = await self._completed_revenue_by(SalesRollupModel.day, date_from, date_to)
+        return [(day.isoformat(), revenue) for day, revenue in rows]
+
+    @read_only
+    async def get_revenue_by_hour(self, date_from: datetime, date_to: datetime) -> List[Tuple[int, int]]:
+        """Get (hour, revenue) pairs of completed orders, highest revenue first."""
+        return await self._completed_revenue_by(SalesRollupModel.hour, date_from, date_to)
+
+    async def rebuild(self, date_from: Optional[datetime] = None) -> int:
+        """Recompute rollup from orders (all history by default); return bucket count."""
+        delete_query = delete(SalesRollupModel)
+        if date_from is not None:
+            # Whole days only, so no bucket is left half-counted
+            day_start = datetime.combine(date_from.date(), datetime.min.time())
+            delete_query = delete_query.where(SalesRollupModel.day >= day_start.date())
+        await self.session.execute(delete_query)
+
+        if self.session.get_bind().dialect.name == "postgresql":
+            day = cast(OrderModel.created_at, Date)
+            hour = cast(extract("hour", OrderModel.created_at), Integer)
+        else:
+            day = func.date(OrderModel.created_at)
+            hour = cast(func.strftime("%H", OrderModel.created_at), Integer)
+
+        source = select(
+            day, hour, OrderModel.order_type, OrderModel.status,
+            func.count(OrderModel.id), func.coalesce(func.sum(OrderModel.total), 0)
+        )
+        if date_from is not None:
+            source = source.where(OrderModel.created_at >= day_start)
+        source = source.group_by(day, hour, OrderModel.order_type, OrderModel.status)
+
+        await self.session.execute(
+            insert(SalesRollupModel).from_select(
+                ["day", "hour", "order_type", "status", "order_count", "revenue"], source
+            )
+        )
+
+        count_query = select(func.count()).select_from(SalesRollupModel)
+        if date_from is not None:
+            count_query = count_query.where(SalesRollupModel.day >= day_start.date())
+        result = await self.session.execute(count_query)
+        return result.scalar() or 0
+
+    async def _add(self, order: Order, status: str, delta: int) -> None:
+        """Atomically add delta orders (and their total) to a bucket."""
+        created_at = order.created_at
+        query = upsert_insert(self.session, SalesRollupModel).values(
+            day=created_at.date(),
+            hour=created_at.hour,
+            order_type=order.order_type.value,
+            status=status,
+            order_count=delta,
+            revenue=delta * order.total,
+        )
+        query = query.on_conflict_do_update(
+            index_elements=["day", "hour", "order_type", "status"],
+            set_={
+                "order_count": SalesRollupModel.order_count + query.excluded.order_count,
+                "revenue": SalesRollupModel.revenue + query.excluded.revenue,
+            },
+        )
+        await self.session.execute(query)
+
+    async def _completed_revenue_by(self, column, date_from: datetime, date_to: datetime) -> list:
+        """Sum completed revenue grouped by rollup column."""
+        revenue = func.sum(SalesRollupModel.revenue)
+        result = await self.session.execute(
+            select(column, revenue)
+            .where(
+                and_(
+                    self._period(date_from, date_to),
+                    SalesRollupModel.status.in_(COMPLETED_ORDER_STATUSES)
+                )
+            )
+            .group_by(column)
+            .having(revenue != 0)
+            .order_by(revenue.desc())
+        )
+        return [(key, int(total or 0)) for key, total in result.all()]
+
+    def _period(self, date_from: datetime, date_to: datetime):
+        """Condition for buckets whose hour overlaps period."""
+        key = tuple_(SalesRollupModel.day, SalesRollupModel.hour)
+        return and_(
+            key >= tuple_(date_from.date(), date_from.hour),
+            key <= tuple_(date_to.date(), date_to.hour),
+        )
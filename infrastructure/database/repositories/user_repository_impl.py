@@ -1,14 +1,34 @@
 """User repository implementation."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from datetime import datetime
 
 from domain.entities.user import User
+from shared.types.pagination import Page
 from shared.types.user_types import UserRole, UserStatus
 from domain.repositories.user_repository import UserRepository
+from infrastructure.cache.user_identity_cache import (
+    cache_user_id,
+    forget_user,
+    get_cached_user,
+    get_cached_user_id,
+    remember_user,
+    remember_user_id,
+)
+from infrastructure.database.connection import on_commit
 from infrastructure.database.models.user_model import UserModel
+from infrastructure.database.pagination import fetch_page
+from infrastructure.database.routing import read_only
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import Select, select, func, or_
+
+_SEARCH_COLUMNS = (UserModel.username, UserModel.first_name, UserModel.last_name)
+
+
+def _contains_pattern(query: str) -> str:
+    """Build ILIKE pattern matching query anywhere, with wildcards escaped."""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
 
 
 class UserRepositoryImpl(UserRepository):
@@ -36,7 +56,10 @@ class UserRepositoryImpl(UserRepository):
         await self.session.flush()
         await self.session.refresh(db_user)
         
-        return self._model_to_entity(db_user)
+        created = self._model_to_entity(db_user)
+        remember_user(created)
+        self._cache_user_id_after_commit(created.telegram_id, created.user_id)
+        return created
     
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID."""
@@ -51,15 +74,38 @@ class UserRepositoryImpl(UserRepository):
     
     async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
         """Get user by Telegram ID."""
+        cached = get_cached_user(telegram_id)
+        if cached is not None:
+            return cached
+        
         result = await self.session.execute(
             select(UserModel).where(UserModel.telegram_id == telegram_id)
         )
         db_user = result.scalar_one_or_none()
         
         if db_user:
-            return self._model_to_entity(db_user)
+            user = self._model_to_entity(db_user)
+            remember_user(user)
+            self._cache_user_id_after_commit(user.telegram_id, user.user_id)
+            return user
         return None
     
+    async def get_id_by_telegram_id(self, telegram_id: int) -> Optional[str]:
+        """Get internal user ID by Telegram ID."""
+        user_id = get_cached_user_id(telegram_id)
+        if user_id is not None:
+            return user_id
+        
+        result = await self.session.execute(
+            select(UserModel.id).where(UserModel.telegram_id == telegram_id)
+        )
+        user_id = result.scalar_one_or_none()
+        
+        if user_id is not None:
+            remember_user_id(telegram_id, user_id)
+            self._cache_user_id_after_commit(telegram_id, user_id)
+        return user_id
+    
     async def update(self, user: User) -> User:
         """Update user."""
         result = await self.session.execute(
@@ -81,7 +127,9 @@ class UserRepositoryImpl(UserRepository):
         await self.session.flush()
         await self.session.refresh(db_user)
         
-        return self._model_to_entity(db_user)
+        updated = self._model_to_entity(db_user)
+        remember_user(updated)
+        return updated
     
     async def delete(self, user_id: str) -> bool:
         """Delete user."""
@@ -93,10 +141,13 @@ class UserRepositoryImpl(UserRepository):
         if not db_user:
             return False
         
+        forget_user(db_user.telegram_id)
+        self.session.info.get(_PENDING_USER_IDS_KEY, {}).pop(db_user.telegram_id, None)
         await self.session.delete(db_user)
         await self.session.flush()
         return True
     
+    @read_only
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[User]:
         """List all users."""
         result = await self.session.execute(
@@ -109,10 +160,126 @@ class UserRepositoryImpl(UserRepository):
         
         return [self._model_to_entity(user) for user in db_users]
     
+    @read_only
+    async def list_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users, newest first."""
+        return await self._fetch_page(select(UserModel), cursor, limit, backward)
+    
+    @read_only
+    async def list_page_created_between(
+        self,
+        start: datetime,
+        end: datetime,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users created in [start, end), newest first."""
+        query = select(UserModel).where(UserModel.created_at >= start, UserModel.created_at < end)
+        return await self._fetch_page(query, cursor, limit, backward)
+    
+    @read_only
+    async def count_created_between(self, start: datetime, end: datetime) -> int:
+        """Count users created in [start, end)."""
+        result = await self.session.execute(
+            select(func.count(UserModel.id))
+            .where(UserModel.created_at >= start, UserModel.created_at < end)
+        )
+        return result.scalar() or 0
+    
+    @read_only
+    async def list_page_by_role(
+        self,
+        role: UserRole,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users with role, newest first."""
+        query = select(UserModel).where(UserModel.role == UserRole(role).value)
+        return await self._fetch_page(query, cursor, limit, backward)
+    
+    @read_only
+    async def list_page_by_status(
+        self,
+        status: UserStatus,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users with status, newest first."""
+        query = select(UserModel).where(UserModel.status == UserStatus(status).value)
+        return await self._fetch_page(query, cursor, limit, backward)
+    
+    @read_only
+    async def search_page(
+        self,
+        query: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        backward: bool = False
+    ) -> Page[User]:
+        """List one page of users whose username or name contains query, newest first.
+
+        Substring ILIKE on PostgreSQL is answered by the pg_trgm GIN index
+        on each searched column instead of scanning the table.
+        """
+        query = query.strip().lstrip("@")
+        if not query:
+            return Page()
+        pattern = _contains_pattern(query)
+        select_query = select(UserModel).where(
+            or_(*(column.ilike(pattern, escape="\\") for column in _SEARCH_COLUMNS))
+        )
+        return await self._fetch_page(select_query, cursor, limit, backward)
+    
+    async def stream_notification_recipients(
+        self,
+        after_user_id: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Tuple[str, int]]:
+        """Stream (user_id, telegram_id) of users accepting notifications, in user id order.
+
+        Rows come from a server-side cursor `batch_size` at a time, so memory
+        does not grow with the user count. The cursor keeps the session's
+        transaction open until the stream is closed, so slow consumers
+        should read a batch, close the stream and reopen it after the last
+        user id. Reads the primary: a cursor on a hot standby can be
+        cancelled by replication conflicts.
+        """
+        query = (
+            select(UserModel.id, UserModel.telegram_id)
+            .where(UserModel.is_notifications_enabled.is_(True))
+            .order_by(UserModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if after_user_id is not None:
+            query = query.where(UserModel.id > after_user_id)
+        result = await self.session.stream(query)
+        try:
+            async for user_id, telegram_id in result:
+                yield user_id, telegram_id
+        finally:
+            await result.close()
+    
+    @read_only
+    async def count_notification_recipients(self) -> int:
+        """Count users accepting notifications."""
+        result = await self.session.execute(
+            select(func.count(UserModel.id)).where(UserModel.is_notifications_enabled.is_(True))
+        )
+        return result.scalar() or 0
+    
+    @read_only
     async def get_admins(self) -> List[User]:
         """Get all admin users."""
         result = await self.session.execute(
-            select(UserModel).where(UserModel.is_admin == True)
+            select(UserModel).where(UserModel.role == UserRole.ADMIN.value)
         )
         db_users = result.scalars().all()
         
@@ -125,6 +292,28 @@ class UserRepositoryImpl(UserRepository):
         )
         return result.scalar() or 0
     
+    async def _fetch_page(
+        self,
+        query: Select,
+        cursor: Optional[str],
+        limit: int,
+        backward: bool
+    ) -> Page[User]:
+        """Run user query as one keyset page of entities."""
+        page = await fetch_page(self.session, query, UserModel, cursor, limit, backward)
+        return page.map(self._model_to_entity)
+    
+    def _cache_user_id_after_commit(self, telegram_id: int, user_id: str) -> None:
+        """Put mapping into the process-wide LRU once the transaction commits.
+
+        A user created by a transaction that rolls back must never be cached.
+        """
+        on_commit(
+            self.session,
+            lambda: cache_user_id(telegram_id, user_id),
+            key=("cache_user_id", telegram_id),
+        )
+    
     def _model_to_entity(self, db_user: UserModel) -> User:
         """Convert UserModel to User entity."""
         role = UserRole(db_user.role) if isinstance(db_user.role, str) else db_user.role
@@ -142,19 +331,9 @@ class UserRepositoryImpl(UserRepository):
             updated_at=db_user.updated_at
         )
     
+    @read_only
     async def list_all(self) -> List[User]:
         """List all users without pagination."""
         result = await self.session.execute(select(UserModel))
         db_users = result.scalars().all()
         return [self._model_to_entity(db_user) for db_user in db_users]
-    
-    async def get_by_telegram_id(self, telegram_id: int) -> Optional[User]:
-        """Get user by Telegram ID."""
-        result = await self.session.execute(
-            select(UserModel).where(UserModel.telegram_id == telegram_id)
-        )
-        db_user = result.scalar_one_or_none()
-        
-        if db_user:
-            return self._model_to_entity(db_user)
-        return None
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""Primary/replica routing for database sessions."""
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+USE_PRIMARY_KEY = "use_primary"
+
+_read_only_ctx: ContextVar[bool] = ContextVar("db_read_only", default=False)
+_primary_only_ctx: ContextVar[bool] = ContextVar("db_primary_only", default=False)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def read_only(method: F) -> F:
+    """Mark repository method as safe to serve from a read replica."""
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = _read_only_ctx.set(True)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _read_only_ctx.reset(token)
+    return wrapper  # type: ignore[return-value]
+
+
+@contextmanager
+def primary_only() -> Iterator[None]:
+    """Send every statement in this block to the primary, even from read-only methods."""
+    token = _primary_only_ctx.set(True)
+    try:
+        yield
+    finally:
+        _primary_only_ctx.reset(token)
+
+
+def use_primary(session: Any) -> None:
+    """Pin session to the primary for the rest of its life (read-your-writes).
+
+    Happens automatically once the session writes anything.
+    """
+    session.info[USE_PRIMARY_KEY] = True
+
+
+class RoutingSession(Session):
+    """Session that sends SELECTs from `read_only` methods to the replica.
+
+    Everything else - writes, flushes, raw SQL and any read issued after
+    the session has written - goes to the primary.
+    """
+
+    def __init__(self, *args, replica: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        primary = super().get_bind(mapper=mapper, clause=clause, **kw)
+        if self.replica is None or self._flushing:
+            return primary
+        if clause is not None and getattr(clause, "is_dml", False):
+            self.info[USE_PRIMARY_KEY] = True
+            return primary
+        if (
+            _read_only_ctx.get()
+            and not _primary_only_ctx.get()
+            and not self.info.get(USE_PRIMARY_KEY)
+            and getattr(clause, "is_select", False)
+        ):
+            return self.replica
+        return primary
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_to_primary_after_flush(session: Session, flush_context) -> None:
+    session.info[USE_PRIMARY_KEY] = True
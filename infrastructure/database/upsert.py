@@ -0,0 +1,19 @@
+"""Dialect-specific INSERT ... ON CONFLICT support."""
+
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def upsert_insert(session: Any, model: Any):
+    """Get INSERT construct for model that supports on_conflict_do_update/do_nothing.
+
+    PostgreSQL and SQLite (3.24+) share the ON CONFLICT syntax, so callers
+    can build the statement the same way for both.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"Upsert is not supported for dialect {dialect!r}")
@@ -0,0 +1,83 @@
+"""Bot API call accounting."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+
+class ApiCallMetrics:
+    """Counters of Bot API calls, in total and per handled update."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        self.calls = 0
+        self.updates = 0
+        self.update_calls = 0
+        self.max_update_calls = 0
+        self.by_method: Dict[str, int] = {}
+        # calls per update -> number of updates
+        self.histogram: Dict[int, int] = {}
+
+    def observe_call(self, method: str) -> None:
+        """Record one Bot API request."""
+        self.calls += 1
+        self.by_method[method] = self.by_method.get(method, 0) + 1
+
+    def observe_update(self, calls: int) -> None:
+        """Record number of requests made while handling one update."""
+        self.updates += 1
+        self.update_calls += calls
+        self.max_update_calls = max(self.max_update_calls, calls)
+        self.histogram[calls] = self.histogram.get(calls, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics as a plain dict."""
+        return {
+            "calls": self.calls,
+            "updates": self.updates,
+            "calls_per_update_avg": round(self.update_calls / self.updates, 3) if self.updates else 0.0,
+            "calls_per_update_max": self.max_update_calls,
+            "calls_per_update": {str(calls): count for calls, count in sorted(self.histogram.items())},
+            "by_method": dict(sorted(self.by_method.items())),
+        }
+
+
+api_call_metrics = ApiCallMetrics()
+
+_update_calls: ContextVar[Optional[List[str]]] = ContextVar("bot_api_update_calls", default=None)
+
+
+@contextmanager
+def api_call_scope() -> Iterator[List[str]]:
+    """Collect names of Bot API methods called while handling the current update."""
+    calls: List[str] = []
+    token = _update_calls.set(calls)
+    try:
+        yield calls
+    finally:
+        _update_calls.reset(token)
+
+
+class ApiCallCounter(BaseRequestMiddleware):
+    """Request middleware feeding `api_call_metrics`."""
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        name = getattr(method, "__api_method__", type(method).__name__)
+        api_call_metrics.observe_call(name)
+        calls = _update_calls.get()
+        if calls is not None:
+            calls.append(name)
+        return await make_request(bot, method)
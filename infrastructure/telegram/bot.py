@@ -5,15 +5,21 @@ from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 
 from app.config import get_settings
+from infrastructure.telegram.api_metrics import ApiCallCounter
 from infrastructure.telegram.middlewares.auth_middleware import AuthMiddleware
 from infrastructure.telegram.middlewares.error_middleware import ErrorMiddleware
 from infrastructure.telegram.middlewares.logging_middleware import LoggingMiddleware
+from infrastructure.telegram.session import CachedMarkupSession
+from infrastructure.telegram.utils.callback_router import CallbackRouter
 
 
 def create_bot(token: str) -> Bot:
     """Create and configure bot instance."""
+    session = CachedMarkupSession()
+    session.middleware(ApiCallCounter())
     return Bot(
         token=token,
+        session=session,
         default=DefaultBotProperties(
             parse_mode=ParseMode.HTML,
             link_preview_is_disabled=True,
@@ -25,20 +31,33 @@ def create_dispatcher() -> Dispatcher:
     """Create and configure dispatcher."""
     dp = Dispatcher()
     
-    # Register middlewares (order matters: logging -> db -> auth -> error)
+    # Register middlewares (order matters: logging -> api calls -> db -> auth -> identity -> error)
+    from infrastructure.telegram.middlewares.api_call_middleware import ApiCallMiddleware
     from infrastructure.telegram.middlewares.db_session_middleware import DbSessionMiddleware
+    from infrastructure.telegram.middlewares.user_identity_middleware import UserIdentityMiddleware
 
     dp.message.middleware(LoggingMiddleware())
     dp.callback_query.middleware(LoggingMiddleware())
+    dp.inline_query.middleware(LoggingMiddleware())
+
+    dp.message.middleware(ApiCallMiddleware())
+    dp.callback_query.middleware(ApiCallMiddleware())
+    dp.inline_query.middleware(ApiCallMiddleware())
 
     dp.message.middleware(DbSessionMiddleware())
     dp.callback_query.middleware(DbSessionMiddleware())
+    dp.inline_query.middleware(DbSessionMiddleware())
 
     dp.message.middleware(AuthMiddleware())
     dp.callback_query.middleware(AuthMiddleware())
 
+    dp.message.middleware(UserIdentityMiddleware())
+    dp.callback_query.middleware(UserIdentityMiddleware())
+
     dp.message.middleware(ErrorMiddleware())
     dp.callback_query.middleware(ErrorMiddleware())
+    # Inline queries need no registered user, so auth and identity are skipped
+    dp.inline_query.middleware(ErrorMiddleware())
     
     # Register handlers
     from infrastructure.telegram.handlers.start_handler import StartHandler
@@ -48,6 +67,7 @@ def create_dispatcher() -> Dispatcher:
     from infrastructure.telegram.handlers.payment_handler import PaymentHandler
     from infrastructure.telegram.handlers.admin_handler import AdminHandler
     from infrastructure.telegram.handlers.help_handler import HelpHandler
+    from infrastructure.telegram.handlers.inline_search_handler import InlineSearchHandler
     
     # Create handler instances
     start_handler = StartHandler()
@@ -57,14 +77,27 @@ def create_dispatcher() -> Dispatcher:
     payment_handler = PaymentHandler()
     admin_handler = AdminHandler()
     help_handler = HelpHandler()
+    inline_search_handler = InlineSearchHandler()
     
+    handlers = [
+        start_handler,
+        menu_handler,
+        cart_handler,
+        order_handler,
+        payment_handler,
+        admin_handler,
+        help_handler,
+        inline_search_handler,
+    ]
+
     # Include routers
-    dp.include_router(start_handler.get_router())
-    dp.include_router(menu_handler.get_router())
-    dp.include_router(cart_handler.get_router())
-    dp.include_router(order_handler.get_router())
-    dp.include_router(payment_handler.get_router())
-    dp.include_router(admin_handler.get_router())
-    dp.include_router(help_handler.get_router())
+    for handler in handlers:
+        dp.include_router(handler.get_router())
+
+    # All callback queries go through one routing table
+    callback_router = CallbackRouter()
+    for handler in handlers:
+        callback_router.include(handler.get_callback_routes())
+    dp.callback_query.register(callback_router.dispatch, callback_router.as_filter())
     
     return dp
\ No newline at end of file
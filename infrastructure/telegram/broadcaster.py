@@ -0,0 +1,255 @@
+"""Sends broadcast campaigns in the background."""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Tuple
+
+from aiogram.exceptions import TelegramForbiddenError
+from aiogram.methods import SendMessage
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.entities.broadcast_campaign import BroadcastCampaign
+from infrastructure.database.connection import get_sessionmaker, on_commit
+from infrastructure.database.repositories.broadcast_repository_impl import BroadcastRepositoryImpl
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.logging.logger import get_logger
+from infrastructure.telegram.send_queue import Priority, SendQueue
+from shared.constants.broadcast_constants import BroadcastStatus
+
+logger = get_logger(__name__)
+
+
+class Broadcaster:
+    """Sends broadcast campaigns one at a time as bulk traffic of the send queue.
+
+    Recipients are read in user id order from a server-side cursor,
+    `batch_size` at a time, each batch in its own short transaction, so
+    no cursor stays open for the hour a large campaign takes and
+    checkpoints can commit meanwhile. They are submitted as fast as the
+    queue takes them; the queue's bulk backlog limit holds the reader
+    back, so memory stays bounded however many users there are, and
+    sending runs at the queue's global rate while transactional messages
+    still go first.
+
+    Every `checkpoint_interval` seconds the counts and the last recipient
+    whose send has finished are saved. A restarted worker continues after
+    that recipient, so delivery is at least once: messages finished after
+    the last checkpoint may be sent again. A campaign of a worker that
+    died is taken over once it has not been saved for `lease_timeout`
+    seconds. A cancelled campaign stops at its next checkpoint.
+    """
+
+    def __init__(
+        self,
+        send_queue: SendQueue,
+        session_maker: Callable[[], async_sessionmaker[AsyncSession]] = get_sessionmaker,
+        batch_size: int = 500,
+        max_unconfirmed: int = 5000,
+        checkpoint_interval: float = 5.0,
+        lease_timeout: float = 300.0,
+        poll_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.send_queue = send_queue
+        self._session_maker = session_maker
+        self.batch_size = batch_size
+        self.max_unconfirmed = max_unconfirmed
+        self.checkpoint_interval = checkpoint_interval
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._db_step: Optional[asyncio.Future] = None
+
+    def start(self) -> None:
+        """Start sending campaigns."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sending; the current campaign is saved and left for the next start."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def wake(self) -> None:
+        """Look for new campaigns now instead of at the next poll."""
+        self._wakeup.set()
+
+    async def run_pending(self) -> int:
+        """Send every campaign waiting to be sent; return how many were finished."""
+        finished = 0
+        while True:
+            campaign = await self._db(self._claim())
+            if campaign is None:
+                return finished
+            if await self._send_campaign(campaign):
+                finished += 1
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.run_pending()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Broadcast failed", error=str(e))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _claim(self) -> Optional[BroadcastCampaign]:
+        stale_before = datetime.utcnow() - timedelta(seconds=self.lease_timeout)
+        async with self._session_maker()() as session:
+            campaign = await BroadcastRepositoryImpl(session).claim_next(stale_before)
+            await session.commit()
+        return campaign
+
+    async def _send_campaign(self, campaign: BroadcastCampaign) -> bool:
+        """Send campaign from where it stopped; False if it was cancelled or taken over."""
+        logger.info("Broadcast started", campaign_id=campaign.campaign_id, resume_after=campaign.last_user_id)
+        # Submitted sends in recipient order; the finished prefix is counted and popped
+        sent: Deque[Tuple[str, asyncio.Future]] = deque()
+        after_user_id = campaign.last_user_id
+        last_checkpoint = self._clock()
+        try:
+            while True:
+                batch = await self._db(self._read_recipients(after_user_id))
+                for user_id, telegram_id in batch:
+                    if len(sent) >= self.max_unconfirmed:
+                        await asyncio.wait([sent[0][1]])
+                    future = await self.send_queue.submit(
+                        SendMessage(chat_id=telegram_id, text=campaign.text), Priority.BULK
+                    )
+                    sent.append((user_id, future))
+                    self._confirm(campaign, sent)
+                    if self._clock() - last_checkpoint >= self.checkpoint_interval:
+                        last_checkpoint = self._clock()
+                        if not await self._db(self._save(campaign)):
+                            return self._abandon(campaign, sent)
+                if len(batch) < self.batch_size:
+                    break
+                after_user_id = batch[-1][0]
+
+            while sent:
+                await asyncio.wait([future for _, future in sent], timeout=self.checkpoint_interval)
+                self._confirm(campaign, sent)
+                if sent and not await self._db(self._save(campaign)):
+                    return self._abandon(campaign, sent)
+            campaign.status = BroadcastStatus.COMPLETED
+            campaign.finished_at = datetime.utcnow()
+            if not await self._db(self._save(campaign)):
+                return self._abandon(campaign, sent)
+        except asyncio.CancelledError:
+            await self._release(campaign, sent)
+            raise
+
+        logger.info(
+            "Broadcast completed",
+            campaign_id=campaign.campaign_id,
+            delivered=campaign.delivered,
+            blocked=campaign.blocked,
+            failed=campaign.failed,
+        )
+        return True
+
+    async def _db(self, step: Awaitable[Any]) -> Any:
+        """Run database step to the end even if the broadcaster is stopped meanwhile."""
+        self._db_step = asyncio.ensure_future(step)
+        return await asyncio.shield(self._db_step)
+
+    async def _read_recipients(self, after_user_id: Optional[str]) -> List[Tuple[str, int]]:
+        """Read next batch of recipients and close the cursor."""
+        batch: List[Tuple[str, int]] = []
+        async with self._session_maker()() as session:
+            recipients = UserRepositoryImpl(session).stream_notification_recipients(after_user_id, self.batch_size)
+            try:
+                async for recipient in recipients:
+                    batch.append(recipient)
+                    if len(batch) >= self.batch_size:
+                        break
+            finally:
+                await recipients.aclose()
+        return batch
+
+    @staticmethod
+    def _confirm(campaign: BroadcastCampaign, sent: Deque[Tuple[str, asyncio.Future]]) -> None:
+        """Count finished sends at the head and move the resume position past them."""
+        while sent and sent[0][1].done() and not sent[0][1].cancelled():
+            user_id, future = sent.popleft()
+            error = future.exception()
+            if error is None:
+                campaign.delivered += 1
+            elif isinstance(error, TelegramForbiddenError):
+                campaign.blocked += 1
+            else:
+                campaign.failed += 1
+            campaign.last_user_id = user_id
+
+    async def _save(self, campaign: BroadcastCampaign) -> bool:
+        async with self._session_maker()() as session:
+            saved = await BroadcastRepositoryImpl(session).save_progress(campaign)
+            await session.commit()
+        return saved
+
+    @staticmethod
+    def _abandon(campaign: BroadcastCampaign, sent: Deque[Tuple[str, asyncio.Future]]) -> bool:
+        """Drop unsent messages of a campaign that was cancelled or taken over."""
+        for _, future in sent:
+            future.cancel()
+        logger.info("Broadcast stopped: cancelled or taken over", campaign_id=campaign.campaign_id)
+        return False
+
+    async def _release(self, campaign: BroadcastCampaign, sent: Deque[Tuple[str, asyncio.Future]]) -> None:
+        """Save progress on shutdown and hand the campaign back for the next start."""
+        # Queued sends are dropped; ones already in flight may be sent again on resume
+        for _, future in sent:
+            future.cancel()
+        if self._db_step is not None:
+            await asyncio.wait([self._db_step])
+        self._confirm(campaign, sent)
+        campaign.status = BroadcastStatus.PENDING
+        try:
+            await self._save(campaign)
+        except Exception as e:
+            logger.error("Failed to save broadcast progress", campaign_id=campaign.campaign_id, error=str(e))
+        logger.info("Broadcast paused", campaign_id=campaign.campaign_id, resume_after=campaign.last_user_id)
+
+
+_broadcaster: Optional[Broadcaster] = None
+
+
+def init_broadcaster(send_queue: SendQueue, **options: Any) -> Broadcaster:
+    """Create and start the process-wide broadcaster."""
+    global _broadcaster
+    _broadcaster = Broadcaster(send_queue, **options)
+    _broadcaster.start()
+    return _broadcaster
+
+
+async def close_broadcaster() -> None:
+    """Save the current campaign and stop."""
+    global _broadcaster
+    if _broadcaster is not None:
+        await _broadcaster.stop()
+        _broadcaster = None
+
+
+def get_broadcaster() -> Optional[Broadcaster]:
+    """Get process-wide broadcaster (None before startup)."""
+    return _broadcaster
+
+
+def wake_broadcaster_after_commit(session: Any) -> None:
+    """Start looking for campaigns once session commits the one just created."""
+    if _broadcaster is not None:
+        on_commit(session, _broadcaster.wake, key="wake_broadcaster")
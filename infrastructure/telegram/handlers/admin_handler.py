@@ -60,120 +60,51 @@ class AdminHandler(BaseHandler):
         
         # Callback handlers
         # Explicit admin entry from main menu
-        self.router.callback_query.register(
-            self.handle_admin_open_callback,
-            F.data == "admin"
-        )
-        self.router.callback_query.register(
-            self.handle_admin_callback,
-            F.data.startswith("admin")
-        )
+        self.callback_routes.exact("admin", self.handle_admin_open_callback)
+        self.callback_routes.prefix("admin", self.handle_admin_callback)
         
-        self.router.callback_query.register(
-            self.handle_menu_edit_callback,
-            (F.data.startswith("menu_edit:"))
-        )
+        self.callback_routes.prefix("menu_edit:", self.handle_menu_edit_callback)
         
-        self.router.callback_query.register(
-            self.handle_category_edit_callback,
-            F.data.startswith("category_edit")
-        )
+        self.callback_routes.prefix("category_edit", self.handle_category_edit_callback)
         
-        self.router.callback_query.register(
-            self.handle_item_edit_callback,
-            F.data.startswith("item_edit")
-        )
+        self.callback_routes.prefix("item_edit", self.handle_item_edit_callback)
         
         # Additional callback handlers for editing
-        self.router.callback_query.register(
-            self.callbacks.handle_edit_category_callback,
-            F.data.startswith("edit_category")
-        )
+        self.callback_routes.prefix("edit_category", self.callbacks.handle_edit_category_callback)
         
-        self.router.callback_query.register(
-            self.callbacks.handle_edit_item_callback,
-            F.data.startswith("edit_item")
-        )
+        self.callback_routes.prefix("edit_item", self.callbacks.handle_edit_item_callback)
         
-        self.router.callback_query.register(
-            self.callbacks.handle_add_category_callback,
-            F.data.startswith("add_category")
-        )
+        self.callback_routes.prefix("add_category", self.callbacks.handle_add_category_callback)
         
-        self.router.callback_query.register(
-            self.callbacks.handle_add_item_callback,
-            F.data.startswith("add_item")
-        )
+        self.callback_routes.prefix("add_item", self.callbacks.handle_add_item_callback)
         
         # Orders management callbacks
-        self.router.callback_query.register(
-            self.handle_orders_callback,
-            F.data.startswith("orders:")
-        )
+        self.callback_routes.prefix("orders:", self.handle_orders_callback)
         
         # Order detail and management callbacks
-        self.router.callback_query.register(
-            self.handle_order_detail_callback,
-            F.data.startswith("order_detail:")
-        )
-        self.router.callback_query.register(
-            self.handle_order_management_callback,
-            F.data.startswith("order_")
-        )
+        self.callback_routes.prefix("order_detail:", self.handle_order_detail_callback)
+        self.callback_routes.prefix("order_", self.handle_order_management_callback)
         
         # Statistics callbacks
-        self.router.callback_query.register(
-            self.handle_statistics_callback,
-            F.data.startswith("stats:")
-        )
+        self.callback_routes.prefix("stats:", self.handle_statistics_callback)
         
         # Users management callbacks
-        self.router.callback_query.register(
-            self.management.handle_users_callback,
-            F.data.startswith("users:")
-        )
-        self.router.callback_query.register(
-            self.management.handle_user_detail_callback,
-            F.data.startswith("user_detail:")
-        )
-        self.router.callback_query.register(
-            self.management.handle_user_management_callback,
-            F.data.startswith("user_")
-        )
+        self.callback_routes.prefix("users:", self.management.handle_users_callback)
+        self.callback_routes.prefix("user_detail:", self.management.handle_user_detail_callback)
+        self.callback_routes.prefix("user_", self.management.handle_user_management_callback)
         
         # Payments management callbacks
-        self.router.callback_query.register(
-            self.management.handle_payments_callback,
-            F.data.startswith("payments:")
-        )
-        self.router.callback_query.register(
-            self.management.handle_payment_detail_callback,
-            F.data.startswith("payment_detail:")
-        )
-        self.router.callback_query.register(
-            self.management.handle_payment_management_callback,
-            F.data.startswith("payment_")
-        )
+        self.callback_routes.prefix("payments:", self.management.handle_payments_callback)
+        self.callback_routes.prefix("payment_detail:", self.management.handle_payment_detail_callback)
+        self.callback_routes.prefix("payment_", self.management.handle_payment_management_callback)
         
         # Notifications management callbacks
-        self.router.callback_query.register(
-            self.management.handle_notifications_callback,
-            F.data.startswith("notify:")
-        )
-        self.router.callback_query.register(
-            self.management.handle_notification_template_callback,
-            F.data.startswith("notify_template:")
-        )
+        self.callback_routes.prefix("notify:", self.management.handle_notifications_callback)
+        self.callback_routes.prefix("notify_template:", self.management.handle_notification_template_callback)
         
-        self.router.callback_query.register(
-            self.callbacks.handle_select_category_callback,
-            F.data.startswith("select_category")
-        )
+        self.callback_routes.prefix("select_category", self.callbacks.handle_select_category_callback)
         
-        self.router.callback_query.register(
-            self.callbacks.handle_cancel_editing_callback,
-            F.data.startswith("cancel_editing")
-        )
+        self.callback_routes.prefix("cancel_editing", self.callbacks.handle_cancel_editing_callback)
 
     
     async def handle_admin_command(self, message: Message, data: Dict[str, Any] = None) -> None:
@@ -632,6 +563,9 @@ class AdminHandler(BaseHandler):
             return
 
         action = parts[1]  # pending, preparing, ready, delivery
+        # orders:<action>:n|p:<cursor> pages forward/backward from cursor
+        cursor = parts[3] if len(parts) > 3 else None
+        backward = len(parts) > 3 and parts[2] == "p"
 
         # Get order service
         session = data.get("session")
@@ -641,29 +575,34 @@ class AdminHandler(BaseHandler):
             from app.dependencies import container
             order_service = container.get_order_service(session)
 
+        status_titles = {
+            "pending": "⏳ Ожидающие заказы",
+            "preparing": "👨‍🍳 Заказы в приготовлении",
+            "ready": "✅ Готовые заказы",
+            "delivery": "🚚 Заказы в доставке",
+        }
+
         try:
-            if action == "pending":
-                orders = await order_service.get_orders_by_status("pending")
-                status_text = "⏳ Ожидающие заказы"
-            elif action == "preparing":
-                orders = await order_service.get_orders_by_status("preparing")
-                status_text = "👨‍🍳 Заказы в приготовлении"
-            elif action == "ready":
-                orders = await order_service.get_orders_by_status("ready")
-                status_text = "✅ Готовые заказы"
-            elif action == "delivery":
-                orders = await order_service.get_orders_by_status("delivery")
-                status_text = "🚚 Заказы в доставке"
-            else:
+            if action not in status_titles:
                 await callback.answer("❌ Неизвестное действие")
                 return
+            status_text = status_titles[action]
 
-            if not orders:
+            try:
+                page = await order_service.get_orders_page_by_status(action, cursor, backward=backward)
+            except ValueError:
+                await callback.answer("❌ Ошибка: неверные данные")
+                return
+
+            if not page.items:
                 text = f"{status_text}\n\nЗаказы не найдены"
                 keyboard = AdminKeyboard.get_back_to_admin_keyboard()
             else:
-                text = f"{status_text}\n\nНайдено заказов: {len(orders)}\n\nВыберите заказ для управления:"
-                keyboard = AdminKeyboard.get_orders_list_keyboard(orders[:10])  # Show first 10 orders
+                total = await order_service.count_orders_by_status(action)
+                text = f"{status_text}\n\nНайдено заказов: {total}\n\nВыберите заказ для управления:"
+                keyboard = AdminKeyboard.get_orders_list_keyboard(
+                    page.items, action, page.next_cursor, page.prev_cursor
+                )
 
             await self.safe_edit_message(
                 callback.message,
@@ -829,6 +768,8 @@ class AdminHandler(BaseHandler):
                 await callback.answer("❌ Неизвестное действие")
                 return
 
+            await self._notify_customer(order, data, kwargs.get("session"))
+
             # Update the message with new order details
             from infrastructure.telegram.utils.message_formatter import MessageFormatter
             text = MessageFormatter.format_order_message(order)
@@ -847,6 +788,21 @@ class AdminHandler(BaseHandler):
 
         await callback.answer()
 
+    async def _notify_customer(self, order, data: Dict[str, Any], session: Any = None) -> None:
+        """Queue order status update to the customer once the status change commits."""
+        from app.dependencies import container, get_user_service
+        from infrastructure.database.connection import run_after_commit
+        user_service = await get_user_service(data)
+        user = await user_service.get_user_by_id(order.user_id)
+        if user is None:
+            self.logger.warning("Order customer not found", order_id=order.order_id, user_id=order.user_id)
+            return
+        notification_service = container.get_notification_service()
+        run_after_commit(
+            session,
+            lambda: notification_service.send_order_status_changed_notification(order, user),
+        )
+
     # Statistics handlers
     async def handle_statistics_callback(self, callback: CallbackQuery, **kwargs) -> None:
         """Handle statistics callbacks."""
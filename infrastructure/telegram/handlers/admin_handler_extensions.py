@@ -13,7 +13,8 @@ from shared.types.admin_states import AdminState
 from shared.utils.helpers import generate_id
 from domain.entities.category import Category
 from domain.entities.menu_item import MenuItem
-from app.dependencies import get_menu_service
+from app.dependencies import get_broadcast_service, get_menu_service
+from infrastructure.telegram.utils.message_formatter import MessageFormatter
 
 
 class AdminHandlerExtensions:
@@ -77,6 +78,8 @@ class AdminHandlerExtensions:
             await self._handle_editing_item_weight(message, text)
         elif state == AdminState.EDITING_ITEM_CALORIES:
             await self._handle_editing_item_calories(message, text)
+        elif state == AdminState.SENDING_BROADCAST_TEXT:
+            await self._handle_broadcast_text(message, data)
         else:
             await message.answer("❌ Неизвестное состояние")
             admin_state_service.reset_admin_context(user_id)
@@ -95,6 +98,19 @@ class AdminHandlerExtensions:
         else:
             await message.answer("❌ Фото не ожидается в текущем состоянии")
 
+    async def _handle_broadcast_text(self, message: Message, data: Dict[str, Any]) -> None:
+        """Handle broadcast text: keep it and show preview before sending."""
+        # Keep admin's formatting; messages are sent with HTML parse mode
+        text = message.html_text
+        admin_state_service.set_temp_data(message.from_user.id, "broadcast_text", text)
+
+        broadcast_service = await get_broadcast_service(data)
+        recipients = await broadcast_service.count_recipients()
+        await message.answer(
+            MessageFormatter.format_broadcast_preview(text, recipients),
+            reply_markup=AdminKeyboard.get_broadcast_confirm_keyboard()
+        )
+
     # Category creation handlers
     async def _handle_adding_category_name(self, message: Message, text: str) -> None:
         """Handle adding category name."""
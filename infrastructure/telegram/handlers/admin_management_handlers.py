@@ -6,10 +6,15 @@ from datetime import datetime
 from aiogram.types import CallbackQuery
 from aiogram import F
 
+from infrastructure.telegram.broadcaster import wake_broadcaster_after_commit
 from infrastructure.telegram.handlers.base_handler import BaseHandler
 from infrastructure.telegram.keyboards.admin_keyboard import AdminKeyboard
+from infrastructure.telegram.utils.message_formatter import MessageFormatter
+from domain.services.admin_state_service import admin_state_service
+from shared.types.admin_states import AdminState
 from app.dependencies import container
 from app.dependencies import (
+    get_broadcast_service,
     get_user_service,
     get_statistics_service,
     get_order_service,
@@ -32,6 +37,9 @@ class AdminManagementHandlers(BaseHandler):
         callback_data = callback.data
         parts = callback_data.split(":")
         action = parts[1]
+        # users:<action>:n|p:<cursor> pages forward/backward from cursor
+        cursor = parts[3] if len(parts) > 3 else None
+        backward = len(parts) > 3 and parts[2] == "p"
 
         session = data.get("session")
         if session is None:
@@ -43,14 +51,28 @@ class AdminManagementHandlers(BaseHandler):
 
         try:
             if action == "all":
-                users = await user_service.get_all_users()
-                text = f"👥 <b>Все пользователи</b>\n\nНайдено: {len(users)}"
-                keyboard = AdminKeyboard.get_users_list_keyboard(users)
+                try:
+                    page = await user_service.get_users_page(cursor, backward=backward)
+                except ValueError:
+                    await callback.answer("❌ Ошибка: неверные данные")
+                    return
+                total = await user_service.get_user_count()
+                text = f"👥 <b>Все пользователи</b>\n\nНайдено: {total}"
+                keyboard = AdminKeyboard.get_users_list_keyboard(
+                    page.items, action, page.next_cursor, page.prev_cursor
+                )
             elif action == "new_today":
                 today = datetime.now().date()
-                users = await user_service.get_users_by_date(today)
-                text = f"🆕 <b>Новые пользователи сегодня</b>\n\nНайдено: {len(users)}"
-                keyboard = AdminKeyboard.get_users_list_keyboard(users)
+                try:
+                    page = await user_service.get_users_by_date(today, cursor, backward=backward)
+                except ValueError:
+                    await callback.answer("❌ Ошибка: неверные данные")
+                    return
+                total = await user_service.count_users_by_date(today)
+                text = f"🆕 <b>Новые пользователи сегодня</b>\n\nНайдено: {total}"
+                keyboard = AdminKeyboard.get_users_list_keyboard(
+                    page.items, action, page.next_cursor, page.prev_cursor
+                )
             elif action == "stats":
                 user_stats = await statistics_service.get_user_statistics()
                 text = f"👥 <b>Статистика пользователей</b>\n\n"
@@ -178,15 +200,16 @@ class AdminManagementHandlers(BaseHandler):
                     order_service = await get_order_service(data)
                 else:
                     order_service = container.get_order_service(session)
-                orders = await order_service.get_orders_by_user_id(target_user_id)
+                page = await order_service.get_user_orders_page(target_user_id, limit=5)
                 
                 text = f"📋 <b>Заказы пользователя</b>\n\n"
-                if orders:
-                    text += f"Найдено заказов: {len(orders)}\n\n"
-                    for order in orders[:5]:  # Show first 5 orders
+                if page.items:
+                    total_orders = await order_service.count_user_orders(target_user_id)
+                    text += f"Найдено заказов: {total_orders}\n\n"
+                    for order in page.items:  # Show latest 5 orders
                         text += f"• #{order.order_id[:8]} - {order.status.value} - {order.total // 100}₽\n"
-                    if len(orders) > 5:
-                        text += f"\n... и еще {len(orders) - 5} заказов"
+                    if total_orders > len(page.items):
+                        text += f"\n... и еще {total_orders - len(page.items)} заказов"
                 else:
                     text += "Заказы не найдены"
                 
@@ -375,17 +398,45 @@ class AdminManagementHandlers(BaseHandler):
         callback_data = callback.data
         parts = callback_data.split(":")
         action = parts[1]
+        user_id = data.get("user_id", callback.from_user.id)
+        notice = None
+
+        session = data.get("session")
+        if session is None:
+            broadcast_service = await get_broadcast_service(data)
+        else:
+            broadcast_service = container.get_broadcast_service(session)
 
         try:
             if action == "send":
-                text = "📢 <b>Отправка уведомлений</b>\n\nВыберите тип уведомления:"
-                keyboard = AdminKeyboard.get_notification_templates_keyboard()
+                admin_state_service.reset_admin_context(user_id)
+                admin_state_service.set_admin_state(user_id, AdminState.SENDING_BROADCAST_TEXT)
+                recipients = await broadcast_service.count_recipients()
+                text = "📢 <b>Отправка уведомлений</b>\n\n"
+                text += f"Сообщение получат все пользователи с включенными уведомлениями ({recipients}).\n\n"
+                text += "Отправьте текст рассылки:"
+                keyboard = AdminKeyboard.get_cancel_keyboard()
+            elif action == "start":
+                broadcast_text = admin_state_service.get_temp_data(user_id, "broadcast_text")
+                if not broadcast_text:
+                    await callback.answer("❌ Текст рассылки не найден")
+                    return
+                campaign = await broadcast_service.create_campaign(broadcast_text, created_by=user_id)
+                admin_state_service.reset_admin_context(user_id)
+                wake_broadcaster_after_commit(session or broadcast_service.broadcast_repository.session)
+                self.logger.info("Broadcast created", campaign_id=campaign.campaign_id, admin_id=user_id)
+                text = f"✅ <b>Рассылка запущена</b>\n\n👥 Получателей: {campaign.total_recipients}"
+                keyboard = AdminKeyboard.get_broadcast_history_keyboard([campaign])
             elif action == "templates":
                 text = "📝 <b>Шаблоны уведомлений</b>\n\nВыберите шаблон для редактирования:"
                 keyboard = AdminKeyboard.get_notification_templates_keyboard()
-            elif action == "history":
-                text = "📋 <b>История уведомлений</b>\n\nИстория отправленных уведомлений будет здесь"
-                keyboard = AdminKeyboard.get_back_to_admin_keyboard()
+            elif action in ("history", "cancel"):
+                if action == "cancel" and len(parts) > 2:
+                    cancelled = await broadcast_service.cancel_campaign(parts[2])
+                    notice = "⛔ Рассылка остановлена" if cancelled else "❌ Рассылка уже завершена"
+                campaigns = await broadcast_service.get_recent_campaigns()
+                text = MessageFormatter.format_broadcast_history(campaigns)
+                keyboard = AdminKeyboard.get_broadcast_history_keyboard(campaigns)
             else:
                 await callback.answer("❌ Неизвестное действие")
                 return
@@ -401,7 +452,7 @@ class AdminManagementHandlers(BaseHandler):
             await callback.answer("❌ Произошла ошибка при загрузке уведомлений")
             return
 
-        await callback.answer()
+        await callback.answer(notice)
 
     async def handle_notification_template_callback(self, callback: CallbackQuery, **kwargs) -> None:
         """Handle notification template callback."""
@@ -1,12 +1,17 @@
 """Base handler class for Telegram."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
 from aiogram import Router
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import CallbackQuery, Message
+from domain.entities.category import Category
+from domain.entities.menu_item import MenuItem
+from infrastructure.cache.photo_cache import get_photo_cache
 from infrastructure.logging.logger import get_logger
+from infrastructure.telegram.utils.message_transition import MessageTransition
+from infrastructure.telegram.utils.callback_router import CallbackRouter
 
 
 class BaseHandler(ABC):
@@ -15,6 +20,8 @@ class BaseHandler(ABC):
     def __init__(self):
         self.logger = get_logger(self.__class__.__name__)
         self.router = Router()
+        # Callback queries are routed by the dispatcher-wide CallbackRouter
+        self.callback_routes = CallbackRouter()
         self._register_handlers()
     
     @abstractmethod
@@ -44,29 +51,50 @@ class BaseHandler(ABC):
         """Get router for this handler."""
         return self.router
 
+    def get_callback_routes(self) -> CallbackRouter:
+        """Get callback routes of this handler."""
+        return self.callback_routes
+
     async def safe_edit_message(self, message: Message, text: str, reply_markup=None) -> None:
-        """Safely edit a message text or caption; fallback to delete+send if needed."""
+        """Show text in place of message; a photo stays and gets text as caption."""
+        await MessageTransition.show_text(message, text, reply_markup=reply_markup)
+
+    async def show_menu_photo(
+        self,
+        message: Message,
+        entity: Union[MenuItem, Category],
+        menu_service,
+        caption: str,
+        reply_markup=None,
+    ) -> None:
+        """Show image of menu item or category, reusing file_id of an earlier upload."""
+        photo_cache = get_photo_cache()
+        image_url = entity.image_url
+        photo = photo_cache.get_photo(image_url, entity.image_file_id)
         try:
-            await message.edit_text(text=text, reply_markup=reply_markup)
+            shown = await MessageTransition.show_photo(message, photo, caption, reply_markup=reply_markup)
+        except TelegramBadRequest:
+            if photo == image_url:
+                raise
+            # Stored file_id is not valid for this bot; the old message is gone, upload again
+            photo_cache.forget(image_url)
+            photo = image_url
+            shown = await message.answer_photo(photo=photo, caption=caption, reply_markup=reply_markup)
+
+        sizes = getattr(shown, "photo", None)
+        if photo != image_url or not photo_cache.is_url(image_url) or not sizes:
             return
-        except TelegramBadRequest as e:
-            # When original message has no text (e.g., photo with caption), try editing caption
-            try:
-                await message.edit_caption(caption=text, reply_markup=reply_markup)
-                return
-            except Exception:
-                pass
-            # Fallback: delete and send a new text message
-            try:
-                await message.delete()
-            except Exception:
-                pass
-            await message.answer(text=text, reply_markup=reply_markup)
 
-    async def replace_with_text_message(self, message: Message, text: str, reply_markup=None) -> None:
-        """Always replace current message with a fresh text message (no media kept)."""
+        file_id = sizes[-1].file_id
+        photo_cache.remember(image_url, file_id)
         try:
-            await message.delete()
-        except Exception:
-            pass
-        await message.answer(text=text, reply_markup=reply_markup)
\ No newline at end of file
+            if isinstance(entity, Category):
+                await menu_service.set_category_image_file_id(entity, file_id)
+            else:
+                await menu_service.set_menu_item_image_file_id(entity, file_id)
+        except Exception as e:
+            self.logger.warning("Failed to store photo file_id", image_url=image_url, error=str(e))
+
+    async def replace_with_text_message(self, message: Message, text: str, reply_markup=None) -> None:
+        """Show text in place of message without keeping media."""
+        await MessageTransition.show_text(message, text, reply_markup=reply_markup, keep_media=False)
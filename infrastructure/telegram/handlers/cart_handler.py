@@ -7,7 +7,7 @@ from aiogram import F
 from infrastructure.telegram.handlers.base_handler import BaseHandler
 from infrastructure.telegram.keyboards.cart_keyboard import CartKeyboard
 from infrastructure.telegram.utils.message_formatter import MessageFormatter
-from infrastructure.telegram.utils.callback_parser import CallbackParser
+from infrastructure.telegram.utils.callbacks import CartAction, CartCallback, OpenCartCallback, QuantityCallback
 from app.dependencies import get_cart_service
 
 
@@ -23,15 +23,9 @@ class CartHandler(BaseHandler):
         )
         
         # Callback handlers
-        self.router.callback_query.register(
-            self.handle_cart_callback,
-            F.data.startswith("cart")
-        )
+        self.callback_routes.payload(self.handle_cart_callback, OpenCartCallback, CartCallback)
         
-        self.router.callback_query.register(
-            self.handle_quantity_callback,
-            F.data.startswith("quantity")
-        )
+        self.callback_routes.payload(self.handle_quantity_callback, QuantityCallback)
     
     async def handle_cart_command(self, message: Message, data: Dict[str, Any] = None) -> None:
         """Handle cart command."""
@@ -79,47 +73,44 @@ class CartHandler(BaseHandler):
         """Handle cart callback."""
         data = kwargs.get("data", {})
         user_id = data.get("user_id", callback.from_user.id)
-        callback_data = callback.data
+        payload = kwargs["payload"]
         
-        # Parse callback data
-        action = CallbackParser.get_cart_action(callback_data)
-        
-        if not action:
-            # Treat bare "cart" as open cart
-            if callback_data == "cart":
-                session = data.get("session")
-                if session is None:
-                    cart_service = await get_cart_service(data)
-                else:
-                    from app.dependencies import container
-                    cart_service = container.get_cart_service(session)
-
-                cart = await cart_service.get_or_create_cart(user_id)
+        if isinstance(payload, OpenCartCallback):
+            session = data.get("session")
+            if session is None:
+                cart_service = await get_cart_service(data)
+            else:
+                from app.dependencies import container
+                cart_service = container.get_cart_service(session)
 
-                if cart.is_empty():
-                    await self.safe_edit_message(
-                        callback.message,
-                        text="🛒 <b>Корзина пуста</b>\n\nДобавьте товары из меню!",
-                        reply_markup=CartKeyboard.get_empty_cart_keyboard()
-                    )
-                else:
-                    cart_text = MessageFormatter.format_cart_message(cart)
-                    keyboard = CartKeyboard.get_cart_keyboard(cart)
-                    await self.safe_edit_message(
-                        callback.message,
-                        text=cart_text,
-                        reply_markup=keyboard
-                    )
+            cart = await cart_service.get_or_create_cart(user_id)
 
-                await callback.answer()
-                self.logger.info(
-                    "Cart view opened",
-                    user_id=user_id
+            if cart.is_empty():
+                await self.safe_edit_message(
+                    callback.message,
+                    text="🛒 <b>Корзина пуста</b>\n\nДобавьте товары из меню!",
+                    reply_markup=CartKeyboard.get_empty_cart_keyboard()
                 )
-                return
-            await callback.answer("❌ Ошибка: неверные данные")
+            else:
+                cart_text = MessageFormatter.format_cart_message(cart)
+                keyboard = CartKeyboard.get_cart_keyboard(cart)
+                await self.safe_edit_message(
+                    callback.message,
+                    text=cart_text,
+                    reply_markup=keyboard
+                )
+
+            await callback.answer()
+            self.logger.info(
+                "Cart view opened",
+                user_id=user_id
+            )
             return
         
+        action = payload.action
+        item_id = payload.item_id
+        quantity = payload.quantity
+        
         # Get cart service
         session = data.get("session")
         if session is None:
@@ -128,10 +119,8 @@ class CartHandler(BaseHandler):
             from app.dependencies import container
             cart_service = container.get_cart_service(session)
         
-        if action == "add":
+        if action == CartAction.ADD:
             # Add item to cart
-            parsed = CallbackParser.parse_cart_callback(callback_data)
-            item_id = parsed.get("item_id")
             if not item_id:
                 await callback.answer("❌ Ошибка: неверные данные")
                 return
@@ -145,13 +134,8 @@ class CartHandler(BaseHandler):
                 reply_markup=keyboard
             )
             
-        elif action == "add_confirm":
+        elif action == CartAction.ADD_CONFIRM:
             # Confirm adding to cart
-            parsed = CallbackParser.parse_cart_callback(callback_data)
-            item_id = parsed.get("item_id")
-            quantity_str = parsed.get("quantity")
-            quantity = int(quantity_str) if quantity_str and quantity_str.isdigit() else None
-            
             if not item_id or not quantity:
                 await callback.answer("❌ Ошибка: неверные данные")
                 return
@@ -164,13 +148,8 @@ class CartHandler(BaseHandler):
                 reply_markup=CartKeyboard.get_back_to_item_keyboard(item_id)
             )
             
-        elif action == "add_final":
+        elif action == CartAction.ADD_FINAL:
             # Add to cart without comment
-            parsed = CallbackParser.parse_cart_callback(callback_data)
-            item_id = parsed.get("item_id")
-            quantity_str = parsed.get("quantity")
-            quantity = int(quantity_str) if quantity_str and quantity_str.isdigit() else None
-            
             if not item_id or not quantity:
                 await callback.answer("❌ Ошибка: неверные данные")
                 return
@@ -184,12 +163,8 @@ class CartHandler(BaseHandler):
                 reply_markup=CartKeyboard.get_back_to_item_keyboard(item_id)
             )
             
-        elif action == "add_comment":
+        elif action == CartAction.ADD_COMMENT:
             # Request comment (temporarily disabled in MVP, keep for future)
-            parsed = CallbackParser.parse_cart_callback(callback_data)
-            item_id = parsed.get("item_id")
-            quantity_str = parsed.get("quantity")
-            quantity = int(quantity_str) if quantity_str and quantity_str.isdigit() else None
             if not item_id or not quantity:
                 await callback.answer("❌ Ошибка: неверные данные")
                 return
@@ -199,7 +174,7 @@ class CartHandler(BaseHandler):
                 reply_markup=CartKeyboard.get_cancel_keyboard()
             )
 
-        elif action == "edit":
+        elif action == CartAction.EDIT:
             # Enter item-by-item edit mode: show first item details
             session = data.get("session")
             if session is None:
@@ -227,20 +202,16 @@ class CartHandler(BaseHandler):
             keyboard = CartKeyboard.get_item_edit_keyboard(current.item_id, prev_id, next_id)
             if menu_item.image_url:
                 try:
-                    await callback.message.delete()
-                    await callback.message.answer_photo(photo=menu_item.image_url, caption=text, reply_markup=keyboard)
+                    await self.show_menu_photo(callback.message, menu_item, menu_service, caption=text, reply_markup=keyboard)
                 except Exception:
                     await self.safe_edit_message(callback.message, text=text, reply_markup=keyboard)
             else:
                 await self.safe_edit_message(callback.message, text=text, reply_markup=keyboard)
             await callback.answer()
             return
-        elif action == "update":
+        elif action in (CartAction.INC, CartAction.DEC):
             # Increment/decrement item quantity
-            parsed = CallbackParser.parse_cart_callback(callback_data)
-            item_id = parsed.get("item_id")
-            op = parsed.get("op")
-            if not item_id or op not in {"inc", "dec"}:
+            if not item_id:
                 await callback.answer("❌ Ошибка: неверные данные")
                 return
             session = data.get("session")
@@ -249,23 +220,24 @@ class CartHandler(BaseHandler):
             else:
                 from app.dependencies import container
                 cart_service = container.get_cart_service(session)
-            cart = await cart_service.get_or_create_cart(user_id)
-            # Find current quantity
-            current_item = next((i for i in cart.get_items_list() if i.item_id == item_id), None)
-            if not current_item:
-                await callback.answer("❌ Позиция не найдена")
-                return
-            new_qty = current_item.quantity + (1 if op == "inc" else -1)
-            new_qty = max(0, min(99, new_qty))
-            if new_qty == 0:
-                await cart_service.remove_item_from_cart(user_id, item_id)
+            if action == CartAction.INC:
+                # Upsert returns the updated cart, quantity is capped in SQL
+                cart = await cart_service.add_item_to_cart(user_id, item_id, 1)
             else:
-                await cart_service.update_item_quantity(user_id, item_id, new_qty)
-            # Reload for display
+                cart = await cart_service.get_or_create_cart(user_id)
+                # Find current quantity
+                current_item = next((i for i in cart.get_items_list() if i.item_id == item_id), None)
+                if not current_item:
+                    await callback.answer("❌ Позиция не найдена")
+                    return
+                new_qty = max(0, current_item.quantity - 1)
+                if new_qty == 0:
+                    cart = await cart_service.remove_item_from_cart(user_id, item_id)
+                else:
+                    cart = await cart_service.update_item_quantity(user_id, item_id, new_qty)
             from app.dependencies import get_menu_service
             menu_service = await get_menu_service(data) if session is None else container.get_menu_service(session)
             menu_item = await menu_service.get_menu_item(item_id)
-            cart = await cart_service.get_or_create_cart(user_id)
             updated_item = next((i for i in cart.get_items_list() if i.item_id == item_id), None)
             # If removed, go back to cart
             if updated_item is None:
@@ -284,21 +256,16 @@ class CartHandler(BaseHandler):
                 prev_id = None
                 next_id = None
             keyboard = CartKeyboard.get_item_edit_keyboard(item_id, prev_id, next_id)
-            # Always refresh media as a new message when item has photo
+            # Photo screens are swapped in place with edit_media
             if menu_item.image_url:
-                try:
-                    await callback.message.delete()
-                except Exception:
-                    pass
-                await callback.message.answer_photo(photo=menu_item.image_url, caption=text, reply_markup=keyboard)
+                await self.show_menu_photo(callback.message, menu_item, menu_service, caption=text, reply_markup=keyboard)
             else:
                 await self.safe_edit_message(callback.message, text=text, reply_markup=keyboard)
             await callback.answer()
             return
-        elif action == "navigate":
+        elif action == CartAction.NAVIGATE:
             # Navigate to previous/next item edit screen
-            parsed = CallbackParser.parse_cart_callback(callback_data)
-            target_item_id = parsed.get("item_id")
+            target_item_id = item_id
             if not target_item_id:
                 await callback.answer("❌ Ошибка: неверные данные")
                 return
@@ -331,21 +298,12 @@ class CartHandler(BaseHandler):
                 next_id = None
             keyboard = CartKeyboard.get_item_edit_keyboard(target_item_id, prev_id, next_id)
             if menu_item.image_url:
-                try:
-                    await callback.message.delete()
-                except Exception:
-                    pass
-                await callback.message.answer_photo(photo=menu_item.image_url, caption=text, reply_markup=keyboard)
+                await self.show_menu_photo(callback.message, menu_item, menu_service, caption=text, reply_markup=keyboard)
             else:
                 await self.safe_edit_message(callback.message, text=text, reply_markup=keyboard)
             await callback.answer()
             return
             # Request comment
-            parsed = CallbackParser.parse_cart_callback(callback_data)
-            item_id = parsed.get("item_id")
-            quantity_str = parsed.get("quantity")
-            quantity = int(quantity_str) if quantity_str and quantity_str.isdigit() else None
-            
             if not item_id or not quantity:
                 await callback.answer("❌ Ошибка: неверные данные")
                 return
@@ -359,10 +317,8 @@ class CartHandler(BaseHandler):
                 reply_markup=CartKeyboard.get_cancel_keyboard()
             )
             
-        elif action == "remove":
+        elif action == CartAction.REMOVE:
             # Remove item from cart
-            parsed = CallbackParser.parse_cart_callback(callback_data)
-            item_id = parsed.get("item_id")
             if not item_id:
                 await callback.answer("❌ Ошибка: неверные данные")
                 return
@@ -385,7 +341,7 @@ class CartHandler(BaseHandler):
                     reply_markup=keyboard
                 )
             
-        elif action == "clear":
+        elif action == CartAction.CLEAR:
             # Clear cart
             await cart_service.clear_cart(user_id)
             
@@ -395,7 +351,7 @@ class CartHandler(BaseHandler):
                 reply_markup=CartKeyboard.get_empty_cart_keyboard()
             )
             
-        elif action == "order":
+        elif action == CartAction.ORDER:
             # Proceed to order
             cart = await cart_service.get_or_create_cart(user_id)
             
@@ -415,27 +371,16 @@ class CartHandler(BaseHandler):
         self.logger.info(
             "Cart callback handled",
             user_id=user_id,
-            action=action
+            action=action.value
         )
     
     async def handle_quantity_callback(self, callback: CallbackQuery, **kwargs) -> None:
         """Handle quantity selection callback."""
         data = kwargs.get("data", {})
         user_id = data.get("user_id", callback.from_user.id)
-        callback_data = callback.data
-        
-        # Parse quantity data
-        parts = callback_data.split(":")
-        if len(parts) != 3:
-            await callback.answer("❌ Ошибка: неверные данные")
-            return
-        
-        item_id = parts[1]
-        try:
-            quantity = int(parts[2])
-        except ValueError:
-            await callback.answer("❌ Неверное количество")
-            return
+        payload: QuantityCallback = kwargs["payload"]
+        item_id = payload.item_id
+        quantity = payload.quantity
         
         if quantity < 1 or quantity > 99:
             await callback.answer("❌ Неверное количество")
@@ -29,6 +29,9 @@ class HelpHandler(BaseHandler):
 /cart - Показать корзину
 /order - Оформить заказ
 
+<b>🔍 Поиск блюд:</b>
+В любом чате наберите имя бота через @ и название блюда, например «борщ»
+
 <b>👨‍💼 Админские команды:</b>
 /admin - Открыть админ-панель
 
@@ -0,0 +1,103 @@
+"""Inline mode menu search handler."""
+
+from typing import List, Optional
+
+from aiogram.types import (
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InlineQuery,
+    InlineQueryResultArticle,
+    InputTextMessageContent,
+)
+
+from app.config import get_settings
+from app.dependencies import get_menu_service
+from domain.entities.menu_item import MenuItem
+from domain.services.menu_service import MenuService
+from infrastructure.cache.inline_result_cache import InlineResults, get_inline_result_cache
+from infrastructure.cache.photo_cache import PhotoCache
+from infrastructure.telegram.handlers.base_handler import BaseHandler
+from infrastructure.telegram.utils.message_formatter import MessageFormatter
+from shared.utils.formatters import format_price
+
+# Telegram accepts at most 50 results per answer
+RESULTS_PER_PAGE = 50
+
+
+class InlineSearchHandler(BaseHandler):
+    """Answers `@bot борщ` in any chat with matching menu items.
+
+    One result per menu item is built once per menu version; a query only
+    runs the menu search and picks prebuilt results. Answers are shared by
+    all users (not personal), so Telegram serves repeats of a query from
+    its own cache for `inline_query_cache_time` seconds without asking
+    the bot.
+    """
+
+    def _register_handlers(self) -> None:
+        """Register inline query handlers."""
+        self.router.inline_query.register(self.handle_inline_query)
+
+    async def handle_inline_query(self, inline_query: InlineQuery, **kwargs) -> None:
+        """Handle inline query."""
+        data = kwargs.get("data", {})
+        menu_service = await get_menu_service(data)
+        query = inline_query.query.strip()
+        offset = int(inline_query.offset) if inline_query.offset.isdigit() else 0
+
+        results = await get_inline_result_cache().get_or_build("menu", lambda: self._build_results(menu_service))
+        items = await self._find_items(menu_service, query, offset + RESULTS_PER_PAGE + 1)
+        page = [results[item.item_id] for item in items[offset:] if item.item_id in results]
+        has_more = len(page) > RESULTS_PER_PAGE
+
+        await inline_query.answer(
+            page[:RESULTS_PER_PAGE],
+            cache_time=get_settings().inline_query_cache_time,
+            is_personal=False,
+            next_offset=str(offset + RESULTS_PER_PAGE) if has_more else "",
+        )
+
+        self.logger.info(
+            "Inline query handled",
+            user_id=inline_query.from_user.id,
+            query=query,
+            offset=offset,
+            results_count=min(len(page), RESULTS_PER_PAGE),
+        )
+
+    @staticmethod
+    async def _find_items(menu_service: MenuService, query: str, limit: int) -> List[MenuItem]:
+        """Get matching items, best first; an empty query lists the menu."""
+        if not query:
+            return (await menu_service.get_menu_items(active_only=True))[:limit]
+        return await menu_service.search_menu_items(query, active_only=True, limit=limit)
+
+    @staticmethod
+    async def _build_results(menu_service: MenuService) -> InlineResults:
+        """Build result for every available menu item."""
+        items = await menu_service.get_menu_items(active_only=True)
+        return {item.item_id: InlineSearchHandler.build_menu_item_result(item) for item in items}
+
+    @staticmethod
+    def build_menu_item_result(item: MenuItem) -> InlineQueryResultArticle:
+        """Build inline result sending the menu item card."""
+        thumbnail_url: Optional[str] = None
+        if item.image_url and PhotoCache.is_url(item.image_url):
+            thumbnail_url = item.image_url
+
+        description = format_price(item.price)
+        if item.description:
+            description += f" · {item.description}"
+
+        return InlineQueryResultArticle(
+            id=item.item_id,
+            title=item.name,
+            description=description,
+            thumbnail_url=thumbnail_url,
+            input_message_content=InputTextMessageContent(
+                message_text=MessageFormatter.format_menu_item(item),
+            ),
+            reply_markup=InlineKeyboardMarkup(inline_keyboard=[[
+                InlineKeyboardButton(text="🔍 Найти в меню", switch_inline_query_current_chat=""),
+            ]]),
+        )
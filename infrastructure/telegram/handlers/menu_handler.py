@@ -1,14 +1,15 @@
 """Menu handler for Telegram bot."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from aiogram import Router
-from aiogram.types import CallbackQuery, Message
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
 from aiogram import F
+from infrastructure.cache.keyboard_cache import get_keyboard_cache
 from infrastructure.telegram.handlers.base_handler import BaseHandler
 from infrastructure.telegram.keyboards.menu_keyboard import MenuKeyboard
 from infrastructure.telegram.utils.message_formatter import MessageFormatter
-from infrastructure.telegram.utils.callback_parser import CallbackParser
+from infrastructure.telegram.utils.callbacks import CategoryCallback, ItemCallback, MenuCallback
 from domain.services.menu_service import MenuService
 from app.dependencies import get_menu_service
 
@@ -25,20 +26,11 @@ class MenuHandler(BaseHandler):
         )
         
         # Callback handlers
-        self.router.callback_query.register(
-            self.handle_menu_callback,
-            F.data == "menu"
-        )
+        self.callback_routes.payload(self.handle_menu_callback, MenuCallback)
         
-        self.router.callback_query.register(
-            self.handle_category_callback,
-            F.data.startswith("category")
-        )
+        self.callback_routes.payload(self.handle_category_callback, CategoryCallback)
         
-        self.router.callback_query.register(
-            self.handle_item_callback,
-            F.data.startswith("item")
-        )
+        self.callback_routes.payload(self.handle_item_callback, ItemCallback)
     
     async def handle_menu_command(self, message: Message, data: Dict[str, Any] = None) -> None:
         """Handle menu command."""
@@ -49,16 +41,13 @@ class MenuHandler(BaseHandler):
         # Get menu service
         menu_service = await get_menu_service(data)
         
-        # Get categories
-        categories = await menu_service.get_categories(active_only=True)
+        # Get categories keyboard
+        keyboard = await self._get_categories_keyboard(menu_service)
         
-        if not categories:
+        if keyboard is None:
             await message.answer("📖 Меню временно недоступно")
             return
         
-        # Create categories keyboard
-        keyboard = MenuKeyboard.get_categories_keyboard(categories)
-        
         await message.answer(
             text="📖 <b>Наше меню</b>\n\nВыберите категорию:",
             reply_markup=keyboard
@@ -66,8 +55,7 @@ class MenuHandler(BaseHandler):
         
         self.logger.info(
             "Menu command handled",
-            user_id=user_id,
-            categories_count=len(categories)
+            user_id=user_id
         )
     
     async def handle_menu_callback(self, callback: CallbackQuery, **kwargs) -> None:
@@ -75,28 +63,24 @@ class MenuHandler(BaseHandler):
         data = kwargs.get("data", {})
         session = data.get("session")
         user_id = data.get("user_id", callback.from_user.id)
-        callback_data = callback.data
-        
-        if callback_data == "menu":
-            # Show categories
-            if session is None:
-                menu_service = await get_menu_service(data)
-            else:
-                from app.dependencies import container
-                menu_service = container.get_menu_service(session)
-            categories = await menu_service.get_categories(active_only=True)
-            
-            if not categories:
-                await self.replace_with_text_message(callback.message, "📖 Меню временно недоступно")
-                return
-            
-            keyboard = MenuKeyboard.get_categories_keyboard(categories)
-            
-            await self.replace_with_text_message(
-                callback.message,
-                text="📖 <b>Наше меню</b>\n\nВыберите категорию:",
-                reply_markup=keyboard
-            )
+        
+        # Show categories
+        if session is None:
+            menu_service = await get_menu_service(data)
+        else:
+            from app.dependencies import container
+            menu_service = container.get_menu_service(session)
+        keyboard = await self._get_categories_keyboard(menu_service)
+        
+        if keyboard is None:
+            await self.replace_with_text_message(callback.message, "📖 Меню временно недоступно")
+            return
+        
+        await self.replace_with_text_message(
+            callback.message,
+            text="📖 <b>Наше меню</b>\n\nВыберите категорию:",
+            reply_markup=keyboard
+        )
         
         await callback.answer()
     
@@ -105,14 +89,8 @@ class MenuHandler(BaseHandler):
         data = kwargs.get("data", {})
         session = data.get("session")
         user_id = data.get("user_id", callback.from_user.id)
-        callback_data = callback.data
-        
-        # Parse category ID from callback data
-        category_id = CallbackParser.get_category_id(callback_data)
-        
-        if not category_id:
-            await callback.answer("❌ Ошибка: неверные данные")
-            return
+        payload: CategoryCallback = kwargs["payload"]
+        category_id = payload.category_id
         
         # Get menu service
         if session is None:
@@ -127,10 +105,16 @@ class MenuHandler(BaseHandler):
             await callback.answer("❌ Категория не найдена")
             return
         
-        # Get menu items for category
-        menu_items = await menu_service.get_menu_items(category_id, active_only=True)
+        # Get menu items keyboard; items are only loaded when it is not cached
+        async def build_keyboard() -> Optional[InlineKeyboardMarkup]:
+            menu_items = await menu_service.get_menu_items(category_id, active_only=True)
+            if not menu_items:
+                return None
+            return MenuKeyboard.get_menu_items_keyboard(menu_items, category_id)
+        
+        keyboard = await get_keyboard_cache().get_or_build(("category_items", category_id), build_keyboard)
         
-        if not menu_items:
+        if keyboard is None:
             await self.replace_with_text_message(
                 callback.message,
                 text=f"📖 <b>{category.name}</b>\n\nВ этой категории пока нет блюд",
@@ -138,9 +122,6 @@ class MenuHandler(BaseHandler):
             )
             return
         
-        # Create menu items keyboard
-        keyboard = MenuKeyboard.get_menu_items_keyboard(menu_items, category_id)
-        
         await self.replace_with_text_message(
             callback.message,
             text=f"📖 <b>{category.name}</b>\n\nВыберите блюдо:",
@@ -153,22 +134,27 @@ class MenuHandler(BaseHandler):
             "Category callback handled",
             user_id=user_id,
             category_id=category_id,
-            items_count=len(menu_items)
+            # One row per item plus navigation row
+            items_count=len(keyboard.inline_keyboard) - 1
         )
     
+    async def _get_categories_keyboard(self, menu_service: MenuService) -> Optional[InlineKeyboardMarkup]:
+        """Get categories keyboard, None when there are no categories."""
+        async def build_keyboard() -> Optional[InlineKeyboardMarkup]:
+            categories = await menu_service.get_categories(active_only=True)
+            if not categories:
+                return None
+            return MenuKeyboard.get_categories_keyboard(categories)
+        
+        return await get_keyboard_cache().get_or_build(("categories",), build_keyboard)
+    
     async def handle_item_callback(self, callback: CallbackQuery, **kwargs) -> None:
         """Handle menu item callback."""
         data = kwargs.get("data", {})
         session = data.get("session")
         user_id = data.get("user_id", callback.from_user.id)
-        callback_data = callback.data
-        
-        # Parse item ID from callback data
-        item_id = CallbackParser.get_item_id(callback_data)
-        
-        if not item_id:
-            await callback.answer("❌ Ошибка: неверные данные")
-            return
+        payload: ItemCallback = kwargs["payload"]
+        item_id = payload.item_id
         
         # Get menu service
         if session is None:
@@ -192,9 +178,10 @@ class MenuHandler(BaseHandler):
         # Send photo if available
         if menu_item.image_url:
             try:
-                await callback.message.delete()
-                await callback.message.answer_photo(
-                    photo=menu_item.image_url,
+                await self.show_menu_photo(
+                    callback.message,
+                    menu_item,
+                    menu_service,
                     caption=item_text,
                     reply_markup=keyboard
                 )
@@ -8,7 +8,15 @@ from aiogram import F
 from infrastructure.telegram.handlers.base_handler import BaseHandler
 from infrastructure.telegram.keyboards.cart_keyboard import CartKeyboard
 from infrastructure.telegram.utils.message_formatter import MessageFormatter
-from infrastructure.telegram.utils.callback_parser import CallbackParser
+from infrastructure.telegram.utils.callbacks import (
+    OrderBackCallback,
+    OrderCallback,
+    OrderCancelCallback,
+    OrderConfirmCallback,
+    OrderPaymentCallback,
+    OrderTypeCallback,
+)
+from domain.exceptions.order_exception import CartChangedException
 from domain.services.order_service import OrderService
 from domain.services.cart_service import CartService
 from app.dependencies import get_order_service, get_cart_service
@@ -26,33 +34,14 @@ class OrderHandler(BaseHandler):
         )
         
         # Callback handlers
-        # More specific callbacks must be registered before generic ones
-        self.router.callback_query.register(
-            self.handle_order_type_callback,
-            F.data.startswith("order:type")
-        )
-        self.router.callback_query.register(
-            self.handle_payment_method_callback,
-            F.data.startswith("order:payment")
-        )
-        self.router.callback_query.register(
-            self.handle_order_confirm_callback,
-            F.data.startswith("order:confirm")
-        )
+        self.callback_routes.payload(self.handle_order_type_callback, OrderTypeCallback)
+        self.callback_routes.payload(self.handle_payment_method_callback, OrderPaymentCallback)
+        self.callback_routes.payload(self.handle_order_confirm_callback, OrderConfirmCallback)
         # Generic 'order' entry point from main menu
-        self.router.callback_query.register(
-            self.handle_order_callback,
-            F.data == "order"
-        )
+        self.callback_routes.payload(self.handle_order_callback, OrderCallback)
         # Back and cancel actions on payment selection
-        self.router.callback_query.register(
-            self.handle_order_back_callback,
-            F.data == "order:back"
-        )
-        self.router.callback_query.register(
-            self.handle_order_cancel_callback,
-            F.data == "order:cancel"
-        )
+        self.callback_routes.payload(self.handle_order_back_callback, OrderBackCallback)
+        self.callback_routes.payload(self.handle_order_cancel_callback, OrderCancelCallback)
     
     async def handle_order_command(self, message: Message, data: Dict[str, Any] = None) -> None:
         """Handle order command."""
@@ -96,50 +85,26 @@ class OrderHandler(BaseHandler):
         data = kwargs.get("data", {})
         session = data.get("session")
         user_id = data.get("user_id", callback.from_user.id)
-        callback_data = callback.data
         
         # Entry point from main menu ("order")
-        if callback_data == "order":
-            # Ensure cart exists
-            if session is None:
-                cart_service = await get_cart_service(data)
-            else:
-                from app.dependencies import container
-                cart_service = container.get_cart_service(session)
-            cart = await cart_service.get_or_create_cart(user_id)
-            if cart.is_empty():
-                await self.safe_edit_message(
-                    callback.message,
-                    text="🛒 <b>Корзина пуста</b>\n\nДобавьте товары из меню!",
-                    reply_markup=CartKeyboard.get_empty_cart_keyboard()
-                )
-            else:
-                await self.safe_edit_message(
-                    callback.message,
-                    text="🚚 <b>Оформление заказа</b>\n\nВыберите способ получения:",
-                    reply_markup=CartKeyboard.get_order_type_keyboard()
-                )
-            await callback.answer()
-            return
-        
-        # Fallback actions (e.g., order:back)
-        action = CallbackParser.get_action(callback_data)
-        if action == "back":
-            # Go back to cart
-            if session is None:
-                cart_service = await get_cart_service(data)
-            else:
-                from app.dependencies import container
-                cart_service = container.get_cart_service(session)
-            cart = await cart_service.get_or_create_cart(user_id)
-            from infrastructure.telegram.utils.message_formatter import MessageFormatter
-            cart_text = MessageFormatter.format_cart_message(cart)
+        if session is None:
+            cart_service = await get_cart_service(data)
+        else:
+            from app.dependencies import container
+            cart_service = container.get_cart_service(session)
+        cart = await cart_service.get_or_create_cart(user_id)
+        if cart.is_empty():
             await self.safe_edit_message(
                 callback.message,
-                text=cart_text,
-                reply_markup=CartKeyboard.get_cart_keyboard(cart)
+                text="🛒 <b>Корзина пуста</b>\n\nДобавьте товары из меню!",
+                reply_markup=CartKeyboard.get_empty_cart_keyboard()
+            )
+        else:
+            await self.safe_edit_message(
+                callback.message,
+                text="🚚 <b>Оформление заказа</b>\n\nВыберите способ получения:",
+                reply_markup=CartKeyboard.get_order_type_keyboard()
             )
-        
         await callback.answer()
     
     async def handle_order_type_callback(self, callback: CallbackQuery, **kwargs) -> None:
@@ -147,14 +112,8 @@ class OrderHandler(BaseHandler):
         data = kwargs.get("data", {})
         session = data.get("session")
         user_id = data.get("user_id", callback.from_user.id)
-        callback_data = callback.data
-        
-        # Parse order type
-        order_type = callback_data.split(":")[-1]  # delivery or pickup
-        
-        if order_type not in ["delivery", "pickup"]:
-            await callback.answer("❌ Ошибка: неверный тип заказа")
-            return
+        payload: OrderTypeCallback = kwargs["payload"]
+        order_type = payload.order_type.value  # delivery or pickup
         
         # Store order type in user data (in real app, use Redis or database)
         # For now, we'll pass it through the callback data
@@ -178,14 +137,8 @@ class OrderHandler(BaseHandler):
         """Handle payment method selection."""
         data = kwargs.get("data", {})
         user_id = data.get("user_id", callback.from_user.id)
-        callback_data = callback.data
-        
-        # Parse payment method
-        payment_method = callback_data.split(":")[-1]  # online, cash, card
-        
-        if payment_method not in ["online", "cash", "card"]:
-            await callback.answer("❌ Ошибка: неверный способ оплаты")
-            return
+        payload: OrderPaymentCallback = kwargs["payload"]
+        payment_method = payload.payment_method.value  # online, cash, card
         
         # Get cart service
         session = data.get("session")
@@ -316,6 +269,23 @@ class OrderHandler(BaseHandler):
                 total=order.total
             )
             
+        except CartChangedException as e:
+            # Show what changed and let the user confirm the updated cart
+            cart = await cart_service.apply_cart_changes(cart, e.validation)
+            text = MessageFormatter.format_cart_changes(e.validation)
+            if cart.is_empty():
+                await self.safe_edit_message(
+                    callback.message,
+                    text=text,
+                    reply_markup=CartKeyboard.get_empty_cart_keyboard()
+                )
+            else:
+                await self.safe_edit_message(
+                    callback.message,
+                    text=text + "\n" + MessageFormatter.format_cart_message(cart),
+                    reply_markup=CartKeyboard.get_cart_keyboard(cart)
+                )
+            
         except Exception as e:
             self.logger.error(f"Order creation error: {e}")
             from infrastructure.telegram.keyboards.main_keyboard import MainKeyboard
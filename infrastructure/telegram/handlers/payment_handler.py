@@ -4,7 +4,6 @@ from typing import Any, Dict
 
 from aiogram import Router
 from aiogram.types import CallbackQuery, Message
-from aiogram import F
 from infrastructure.telegram.handlers.base_handler import BaseHandler
 from infrastructure.telegram.keyboards.cart_keyboard import CartKeyboard
 from infrastructure.telegram.utils.message_formatter import MessageFormatter
@@ -20,20 +19,11 @@ class PaymentHandler(BaseHandler):
     def _register_handlers(self) -> None:
         """Register payment handlers."""
         # Callback handlers
-        self.router.callback_query.register(
-            self.handle_payment_callback,
-            F.data.startswith("payment")
-        )
+        self.callback_routes.prefix("payment", self.handle_payment_callback)
         
-        self.router.callback_query.register(
-            self.handle_payment_success_callback,
-            F.data.startswith("payment_success")
-        )
+        self.callback_routes.prefix("payment_success", self.handle_payment_success_callback)
         
-        self.router.callback_query.register(
-            self.handle_payment_failed_callback,
-            F.data.startswith("payment_failed")
-        )
+        self.callback_routes.prefix("payment_failed", self.handle_payment_failed_callback)
     
     async def handle_payment_callback(self, callback: CallbackQuery, **kwargs) -> None:
         """Handle payment callback."""
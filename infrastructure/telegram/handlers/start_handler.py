@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from aiogram import Router, F
+from aiogram import Router
 from aiogram.filters import CommandStart
 from aiogram.types import Message
 from infrastructure.telegram.handlers.base_handler import BaseHandler
@@ -20,23 +20,11 @@ class StartHandler(BaseHandler):
             CommandStart()
         )
         # Navigation callbacks
-        self.router.callback_query.register(
-            self.handle_main_menu_callback,
-            F.data == "main_menu"
-        )
-        self.router.callback_query.register(
-            self.handle_back_callback,
-            F.data == "back"
-        )
+        self.callback_routes.exact("main_menu", self.handle_main_menu_callback)
+        self.callback_routes.exact("back", self.handle_back_callback)
         # Misc callbacks from main menu
-        self.router.callback_query.register(
-            self.handle_contacts_callback,
-            F.data == "contacts"
-        )
-        self.router.callback_query.register(
-            self.handle_support_callback,
-            F.data == "support"
-        )
+        self.callback_routes.exact("contacts", self.handle_contacts_callback)
+        self.callback_routes.exact("support", self.handle_support_callback)
     
     async def handle_start_command(self, message: Message, data: Dict[str, Any] = None) -> None:
         """Handle /start command."""
@@ -1,13 +1,15 @@
 """Admin keyboard for Telegram bot."""
 
-from typing import List
+from typing import List, Optional
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from infrastructure.telegram.keyboards.base_keyboard import BaseKeyboard
+from domain.entities.broadcast_campaign import BroadcastCampaign
 from domain.entities.category import Category
 from domain.entities.menu_item import MenuItem
 from shared.constants.bot_constants import CALLBACK_PREFIX_ADMIN
 from shared.types.user_types import UserStatus
+from shared.utils.formatters import format_datetime
 
 
 class AdminKeyboard(BaseKeyboard):
@@ -409,16 +411,16 @@ class AdminKeyboard(BaseKeyboard):
         return BaseKeyboard.create_inline_keyboard(buttons)
     
     @staticmethod
-    def get_orders_list_keyboard(orders: List['Order'], page: int = 0, per_page: int = 10) -> InlineKeyboardMarkup:
-        """Get orders list keyboard with pagination."""
+    def get_orders_list_keyboard(
+        orders: List['Order'],
+        list_key: str = "pending",
+        next_cursor: Optional[str] = None,
+        prev_cursor: Optional[str] = None
+    ) -> InlineKeyboardMarkup:
+        """Get orders list keyboard with cursor pagination."""
         buttons = []
         
-        # Show orders for current page
-        start_idx = page * per_page
-        end_idx = start_idx + per_page
-        page_orders = orders[start_idx:end_idx]
-        
-        for order in page_orders:
+        for order in orders:
             # Format order info: ID, status, total
             order_info = f"#{order.order_id[:8]} - {order.status.value} - {order.total // 100}₽"
             buttons.append([
@@ -429,18 +431,9 @@ class AdminKeyboard(BaseKeyboard):
             ])
         
         # Pagination buttons
-        if len(orders) > per_page:
-            nav_buttons = []
-            if page > 0:
-                nav_buttons.append(
-                    InlineKeyboardButton(text="⬅️", callback_data=f"orders:page:{page-1}")
-                )
-            if end_idx < len(orders):
-                nav_buttons.append(
-                    InlineKeyboardButton(text="➡️", callback_data=f"orders:page:{page+1}")
-                )
-            if nav_buttons:
-                buttons.append(nav_buttons)
+        nav_buttons = AdminKeyboard._get_cursor_nav_buttons(f"orders:{list_key}", next_cursor, prev_cursor)
+        if nav_buttons:
+            buttons.append(nav_buttons)
         
         # Back button
         buttons.append([
@@ -449,6 +442,24 @@ class AdminKeyboard(BaseKeyboard):
         
         return BaseKeyboard.create_inline_keyboard(buttons)
     
+    @staticmethod
+    def _get_cursor_nav_buttons(
+        prefix: str,
+        next_cursor: Optional[str],
+        prev_cursor: Optional[str]
+    ) -> List[InlineKeyboardButton]:
+        """Get ⬅️/➡️ buttons; callback_data is '<prefix>:p|n:<cursor>'."""
+        nav_buttons = []
+        if prev_cursor:
+            nav_buttons.append(
+                InlineKeyboardButton(text="⬅️", callback_data=f"{prefix}:p:{prev_cursor}")
+            )
+        if next_cursor:
+            nav_buttons.append(
+                InlineKeyboardButton(text="➡️", callback_data=f"{prefix}:n:{next_cursor}")
+            )
+        return nav_buttons
+    
     @staticmethod
     def get_order_management_keyboard(order: 'Order') -> InlineKeyboardMarkup:
         """Get order management keyboard based on order status."""
@@ -531,16 +542,16 @@ class AdminKeyboard(BaseKeyboard):
         return BaseKeyboard.create_inline_keyboard(buttons)
     
     @staticmethod
-    def get_users_list_keyboard(users: List['User'], page: int = 0, per_page: int = 10) -> InlineKeyboardMarkup:
-        """Get users list keyboard with pagination."""
+    def get_users_list_keyboard(
+        users: List['User'],
+        list_key: str = "all",
+        next_cursor: Optional[str] = None,
+        prev_cursor: Optional[str] = None
+    ) -> InlineKeyboardMarkup:
+        """Get users list keyboard with cursor pagination."""
         buttons = []
         
-        # Show users for current page
-        start_idx = page * per_page
-        end_idx = start_idx + per_page
-        page_users = users[start_idx:end_idx]
-        
-        for user in page_users:
+        for user in users:
             # Format user info: name, username, status
             user_info = f"{user.first_name or 'Без имени'}"
             if user.username:
@@ -556,18 +567,9 @@ class AdminKeyboard(BaseKeyboard):
             ])
         
         # Pagination buttons
-        if len(users) > per_page:
-            nav_buttons = []
-            if page > 0:
-                nav_buttons.append(
-                    InlineKeyboardButton(text="⬅️", callback_data=f"users:page:{page-1}")
-                )
-            if end_idx < len(users):
-                nav_buttons.append(
-                    InlineKeyboardButton(text="➡️", callback_data=f"users:page:{page+1}")
-                )
-            if nav_buttons:
-                buttons.append(nav_buttons)
+        nav_buttons = AdminKeyboard._get_cursor_nav_buttons(f"users:{list_key}", next_cursor, prev_cursor)
+        if nav_buttons:
+            buttons.append(nav_buttons)
         
         # Back button
         buttons.append([
@@ -726,4 +728,32 @@ class AdminKeyboard(BaseKeyboard):
                 InlineKeyboardButton(text="🔙 Назад", callback_data="admin:notifications")
             ]
         ]
+        return BaseKeyboard.create_inline_keyboard(buttons)
+    
+    @staticmethod
+    def get_broadcast_confirm_keyboard() -> InlineKeyboardMarkup:
+        """Get broadcast confirmation keyboard."""
+        buttons = [
+            [
+                InlineKeyboardButton(text="✅ Отправить", callback_data="notify:start"),
+                InlineKeyboardButton(text="❌ Отменить", callback_data="cancel_editing"),
+            ]
+        ]
+        return BaseKeyboard.create_inline_keyboard(buttons)
+    
+    @staticmethod
+    def get_broadcast_history_keyboard(campaigns: List[BroadcastCampaign]) -> InlineKeyboardMarkup:
+        """Get broadcast history keyboard with stop buttons for active broadcasts."""
+        buttons = [
+            [InlineKeyboardButton(
+                text=f"⛔ Остановить рассылку от {format_datetime(campaign.created_at)}",
+                callback_data=f"notify:cancel:{campaign.campaign_id}",
+            )]
+            for campaign in campaigns
+            if campaign.is_active
+        ]
+        buttons.append([
+            InlineKeyboardButton(text="🔄 Обновить", callback_data="notify:history"),
+            InlineKeyboardButton(text="🔙 Назад", callback_data="admin:notifications"),
+        ])
         return BaseKeyboard.create_inline_keyboard(buttons)
\ No newline at end of file
@@ -3,6 +3,7 @@
 from typing import List, Optional
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, KeyboardButton, ReplyKeyboardMarkup
+from infrastructure.telegram.utils.callback_codec import pack_callback
 from shared.constants.bot_constants import CALLBACK_SEPARATOR
 from shared.utils.helpers import build_callback_data
 
@@ -59,6 +60,11 @@ class BaseKeyboard:
         callback_data = build_callback_data(prefix, **kwargs)
         return InlineKeyboardButton(text=text, callback_data=callback_data)
     
+    @staticmethod
+    def create_payload_button(text: str, payload: object) -> InlineKeyboardButton:
+        """Create button with typed callback payload."""
+        return InlineKeyboardButton(text=text, callback_data=pack_callback(payload))
+    
     @staticmethod
     def create_pagination_buttons(
         current_page: int,
@@ -0,0 +1,28 @@
+"""Inline keyboard that keeps its serialized form."""
+
+from typing import Optional
+
+from aiogram.types import InlineKeyboardMarkup
+from pydantic import PrivateAttr
+
+
+class CachedInlineKeyboardMarkup(InlineKeyboardMarkup):
+    """Inline keyboard built once and sent many times.
+
+    Instances are shared between requests, so they must not be modified.
+    The JSON sent to Telegram is computed on first use and reused by
+    `CachedMarkupSession`.
+    """
+
+    _serialized: Optional[str] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_markup(cls, markup: InlineKeyboardMarkup) -> "CachedInlineKeyboardMarkup":
+        """Wrap built keyboard."""
+        return cls(inline_keyboard=markup.inline_keyboard, **(markup.model_extra or {}))
+
+    def serialized(self, session, bot) -> str:
+        """Get JSON exactly as the session would send it."""
+        if self._serialized is None:
+            self._serialized = session.prepare_value(self, bot=bot, files={})
+        return self._serialized
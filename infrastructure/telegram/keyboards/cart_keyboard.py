@@ -5,6 +5,20 @@ from typing import List
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from infrastructure.telegram.keyboards.base_keyboard import BaseKeyboard
 from domain.entities.cart import Cart, CartItem
+from infrastructure.telegram.utils.callbacks import (
+    CartAction,
+    CartCallback,
+    ItemCallback,
+    MenuCallback,
+    OpenCartCallback,
+    OrderBackCallback,
+    OrderCancelCallback,
+    OrderConfirmCallback,
+    OrderPaymentCallback,
+    OrderTypeCallback,
+    QuantityCallback,
+)
+from shared.constants.order_constants import OrderType, PaymentMethod
 
 
 class CartKeyboard(BaseKeyboard):
@@ -17,32 +31,29 @@ class CartKeyboard(BaseKeyboard):
         
         # Action buttons
         buttons.append([
-            BaseKeyboard.create_callback_button(
+            BaseKeyboard.create_payload_button(
                 text="✏️ Редактировать",
-                prefix="cart",
-                action="edit"
+                payload=CartCallback(CartAction.EDIT)
             )
         ])
 
         buttons.append([
-            BaseKeyboard.create_callback_button(
+            BaseKeyboard.create_payload_button(
                 text="🗑️ Очистить корзину",
-                prefix="cart",
-                action="clear"
+                payload=CartCallback(CartAction.CLEAR)
             )
         ])
         
         buttons.append([
-            BaseKeyboard.create_callback_button(
+            BaseKeyboard.create_payload_button(
                 text="🚚 Оформить заказ",
-                prefix="cart",
-                action="order"
+                payload=CartCallback(CartAction.ORDER)
             )
         ])
         
         # Navigation buttons
         buttons.append([
-            InlineKeyboardButton(text="📖 Меню", callback_data="menu"),
+            BaseKeyboard.create_payload_button(text="📖 Меню", payload=MenuCallback()),
             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")
         ])
         
@@ -53,21 +64,13 @@ class CartKeyboard(BaseKeyboard):
         """Keyboard for editing a specific cart item quantity with optional navigation."""
         buttons = [
             [
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="➖",
-                    prefix="cart",
-                    action="update",
-                    item_id=item_id,
-                    op="dec",
-                    ctx="cart"
+                    payload=CartCallback(CartAction.DEC, item_id)
                 ),
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="➕",
-                    prefix="cart",
-                    action="update",
-                    item_id=item_id,
-                    op="inc",
-                    ctx="cart"
+                    payload=CartCallback(CartAction.INC, item_id)
                 )
             ],
         ]
@@ -76,35 +79,29 @@ class CartKeyboard(BaseKeyboard):
         nav_row = []
         if prev_item_id:
             nav_row.append(
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="⬅️ Пред.",
-                    prefix="cart",
-                    action="navigate",
-                    item_id=prev_item_id
+                    payload=CartCallback(CartAction.NAVIGATE, prev_item_id)
                 )
             )
         if next_item_id:
             nav_row.append(
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="След. ➡️",
-                    prefix="cart",
-                    action="navigate",
-                    item_id=next_item_id
+                    payload=CartCallback(CartAction.NAVIGATE, next_item_id)
                 )
             )
         if nav_row:
             buttons.append(nav_row)
         buttons.extend([
             [
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="🗑️ Удалить",
-                    prefix="cart",
-                    action="remove",
-                    item_id=item_id
+                    payload=CartCallback(CartAction.REMOVE, item_id)
                 )
             ],
             [
-                InlineKeyboardButton(text="🔙 Корзина", callback_data="cart"),
+                BaseKeyboard.create_payload_button(text="🔙 Корзина", payload=OpenCartCallback()),
                 InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")
             ]
         ])
@@ -115,7 +112,7 @@ class CartKeyboard(BaseKeyboard):
         """Get empty cart keyboard."""
         buttons = [
             [
-                InlineKeyboardButton(text="📖 Меню", callback_data="menu"),
+                BaseKeyboard.create_payload_button(text="📖 Меню", payload=MenuCallback()),
                 InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")
             ]
         ]
@@ -131,33 +128,30 @@ class CartKeyboard(BaseKeyboard):
         control_row = []
         if current_quantity > 1:
             control_row.append(
-                InlineKeyboardButton(
+                BaseKeyboard.create_payload_button(
                     text="➖",
-                    callback_data=f"quantity:{item_id}:{current_quantity - 1}"
+                    payload=QuantityCallback(item_id, current_quantity - 1)
                 )
             )
         
         control_row.append(
-            InlineKeyboardButton(
+            BaseKeyboard.create_payload_button(
                 text="➕",
-                callback_data=f"quantity:{item_id}:{current_quantity + 1}"
+                payload=QuantityCallback(item_id, current_quantity + 1)
             )
         )
         buttons.append(control_row)
         
         # Action buttons
         buttons.append([
-            BaseKeyboard.create_callback_button(
+            BaseKeyboard.create_payload_button(
                 text="✅ Добавить в корзину",
-                prefix="cart",
-                action="add_confirm",
-                item_id=item_id,
-                quantity=current_quantity
+                payload=CartCallback(CartAction.ADD_CONFIRM, item_id, current_quantity)
             )
         ])
         
         buttons.append([
-            InlineKeyboardButton(text="❌ Отменить", callback_data=f"item:id:{item_id}")
+            BaseKeyboard.create_payload_button(text="❌ Отменить", payload=ItemCallback(item_id))
         ])
         
         return BaseKeyboard.create_inline_keyboard(buttons)
@@ -167,25 +161,19 @@ class CartKeyboard(BaseKeyboard):
         """Get comment keyboard."""
         buttons = [
             [
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="✅ Без комментария",
-                    prefix="cart",
-                    action="add_final",
-                    item_id=item_id,
-                    quantity=quantity
+                    payload=CartCallback(CartAction.ADD_FINAL, item_id, quantity)
                 )
             ],
             [
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="✏️ Добавить комментарий",
-                    prefix="cart",
-                    action="add_comment",
-                    item_id=item_id,
-                    quantity=quantity
+                    payload=CartCallback(CartAction.ADD_COMMENT, item_id, quantity)
                 )
             ],
             [
-                InlineKeyboardButton(text="❌ Отменить", callback_data=f"item:id:{item_id}")
+                BaseKeyboard.create_payload_button(text="❌ Отменить", payload=ItemCallback(item_id))
             ]
         ]
         
@@ -196,11 +184,11 @@ class CartKeyboard(BaseKeyboard):
         """Get back to item keyboard."""
         buttons = [
             [
-                InlineKeyboardButton(text="🔙 К блюду", callback_data=f"item:id:{item_id}"),
-                InlineKeyboardButton(text="🛒 Корзина", callback_data="cart")
+                BaseKeyboard.create_payload_button(text="🔙 К блюду", payload=ItemCallback(item_id)),
+                BaseKeyboard.create_payload_button(text="🛒 Корзина", payload=OpenCartCallback())
             ],
             [
-                InlineKeyboardButton(text="📖 Меню", callback_data="menu"),
+                BaseKeyboard.create_payload_button(text="📖 Меню", payload=MenuCallback()),
                 InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")
             ]
         ]
@@ -223,11 +211,11 @@ class CartKeyboard(BaseKeyboard):
         """Get order type selection keyboard."""
         buttons = [
             [
-                InlineKeyboardButton(text="🚚 Доставка", callback_data="order:type:delivery"),
-                InlineKeyboardButton(text="🚶 Самовывоз", callback_data="order:type:pickup")
+                BaseKeyboard.create_payload_button(text="🚚 Доставка", payload=OrderTypeCallback(OrderType.DELIVERY)),
+                BaseKeyboard.create_payload_button(text="🚶 Самовывоз", payload=OrderTypeCallback(OrderType.PICKUP))
             ],
             [
-                InlineKeyboardButton(text="🔙 Корзина", callback_data="cart")
+                BaseKeyboard.create_payload_button(text="🔙 Корзина", payload=OpenCartCallback())
             ]
         ]
         
@@ -238,15 +226,15 @@ class CartKeyboard(BaseKeyboard):
         """Get payment method selection keyboard."""
         buttons = [
             [
-                InlineKeyboardButton(text="💳 Онлайн оплата", callback_data="order:payment:online"),
-                InlineKeyboardButton(text="💵 Наличные", callback_data="order:payment:cash")
+                BaseKeyboard.create_payload_button(text="💳 Онлайн оплата", payload=OrderPaymentCallback(PaymentMethod.ONLINE)),
+                BaseKeyboard.create_payload_button(text="💵 Наличные", payload=OrderPaymentCallback(PaymentMethod.CASH))
             ],
             [
-                InlineKeyboardButton(text="💳 Карта при получении", callback_data="order:payment:card")
+                BaseKeyboard.create_payload_button(text="💳 Карта при получении", payload=OrderPaymentCallback(PaymentMethod.CARD))
             ],
             [
-                InlineKeyboardButton(text="🔙 Назад", callback_data="order:back"),
-                InlineKeyboardButton(text="❌ Отменить", callback_data="order:cancel")
+                BaseKeyboard.create_payload_button(text="🔙 Назад", payload=OrderBackCallback()),
+                BaseKeyboard.create_payload_button(text="❌ Отменить", payload=OrderCancelCallback())
             ]
         ]
         
@@ -257,8 +245,8 @@ class CartKeyboard(BaseKeyboard):
         """Get order confirmation keyboard."""
         buttons = [
             [
-                InlineKeyboardButton(text="✅ Подтвердить заказ", callback_data="order:confirm"),
-                InlineKeyboardButton(text="❌ Отменить", callback_data="order:cancel")
+                BaseKeyboard.create_payload_button(text="✅ Подтвердить заказ", payload=OrderConfirmCallback()),
+                BaseKeyboard.create_payload_button(text="❌ Отменить", payload=OrderCancelCallback())
             ]
         ]
         
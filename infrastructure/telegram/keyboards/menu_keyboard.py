@@ -6,7 +6,14 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from infrastructure.telegram.keyboards.base_keyboard import BaseKeyboard
 from domain.entities.category import Category
 from domain.entities.menu_item import MenuItem
-from shared.constants.bot_constants import CALLBACK_PREFIX_CATEGORY, CALLBACK_PREFIX_ITEM
+from infrastructure.telegram.utils.callbacks import (
+    CartAction,
+    CartCallback,
+    CategoryCallback,
+    ItemCallback,
+    MenuCallback,
+    QuantityCallback,
+)
 
 
 class MenuKeyboard(BaseKeyboard):
@@ -24,10 +31,9 @@ class MenuKeyboard(BaseKeyboard):
             # First category in row
             category = categories[i]
             row.append(
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text=f"📁 {category.name}",
-                    prefix=CALLBACK_PREFIX_CATEGORY,
-                    id=category.category_id
+                    payload=CategoryCallback(category.category_id)
                 )
             )
             
@@ -35,10 +41,9 @@ class MenuKeyboard(BaseKeyboard):
             if i + 1 < len(categories):
                 category = categories[i + 1]
                 row.append(
-                    BaseKeyboard.create_callback_button(
+                    BaseKeyboard.create_payload_button(
                         text=f"📁 {category.name}",
-                        prefix=CALLBACK_PREFIX_CATEGORY,
-                        id=category.category_id
+                        payload=CategoryCallback(category.category_id)
                     )
                 )
             
@@ -63,16 +68,15 @@ class MenuKeyboard(BaseKeyboard):
             button_text = f"🍽️ {item.name} - {item.price // 100}₽"
             
             buttons.append([
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text=button_text,
-                    prefix=CALLBACK_PREFIX_ITEM,
-                    id=item.item_id
+                    payload=ItemCallback(item.item_id)
                 )
             ])
         
         # Add navigation buttons
         buttons.append([
-            InlineKeyboardButton(text="🔙 К категориям", callback_data="menu"),
+            BaseKeyboard.create_payload_button(text="🔙 К категориям", payload=MenuCallback()),
             InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")
         ])
         
@@ -87,11 +91,9 @@ class MenuKeyboard(BaseKeyboard):
         # We cannot know cart quantity here without service; so show generic + button
         if menu_item.is_available:
             buttons.append([
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="➕",
-                    prefix="cart",
-                    action="add",
-                    item_id=menu_item.item_id
+                    payload=CartCallback(CartAction.ADD, menu_item.item_id)
                 )
             ])
         else:
@@ -104,8 +106,11 @@ class MenuKeyboard(BaseKeyboard):
         
         # Navigation buttons
         buttons.append([
-            InlineKeyboardButton(text="🔙 К категории", callback_data=f"category:id:{menu_item.category_id}"),
-            InlineKeyboardButton(text="📖 Меню", callback_data="menu")
+            BaseKeyboard.create_payload_button(
+                text="🔙 К категории",
+                payload=CategoryCallback(menu_item.category_id)
+            ),
+            BaseKeyboard.create_payload_button(text="📖 Меню", payload=MenuCallback())
         ])
         
         buttons.append([
@@ -119,7 +124,7 @@ class MenuKeyboard(BaseKeyboard):
         """Get back to categories keyboard."""
         buttons = [
             [
-                InlineKeyboardButton(text="🔙 К категориям", callback_data="menu"),
+                BaseKeyboard.create_payload_button(text="🔙 К категориям", payload=MenuCallback()),
                 InlineKeyboardButton(text="🏠 Главное меню", callback_data="main_menu")
             ]
         ]
@@ -136,16 +141,16 @@ class MenuKeyboard(BaseKeyboard):
         for i in range(1, 6):
             if i == current_quantity:
                 quantity_row.append(
-                    InlineKeyboardButton(
+                    BaseKeyboard.create_payload_button(
                         text=f"[{i}]",
-                        callback_data=f"quantity:{item_id}:{i}"
+                        payload=QuantityCallback(item_id, i)
                     )
                 )
             else:
                 quantity_row.append(
-                    InlineKeyboardButton(
+                    BaseKeyboard.create_payload_button(
                         text=str(i),
-                        callback_data=f"quantity:{item_id}:{i}"
+                        payload=QuantityCallback(item_id, i)
                     )
                 )
         buttons.append(quantity_row)
@@ -154,33 +159,30 @@ class MenuKeyboard(BaseKeyboard):
         control_row = []
         if current_quantity > 1:
             control_row.append(
-                InlineKeyboardButton(
+                BaseKeyboard.create_payload_button(
                     text="➖",
-                    callback_data=f"quantity:{item_id}:{current_quantity - 1}"
+                    payload=QuantityCallback(item_id, current_quantity - 1)
                 )
             )
         
         control_row.append(
-            InlineKeyboardButton(
+            BaseKeyboard.create_payload_button(
                 text="➕",
-                callback_data=f"quantity:{item_id}:{current_quantity + 1}"
+                payload=QuantityCallback(item_id, current_quantity + 1)
             )
         )
         buttons.append(control_row)
         
         # Action buttons
         buttons.append([
-            BaseKeyboard.create_callback_button(
+            BaseKeyboard.create_payload_button(
                 text="✅ Добавить в корзину",
-                prefix="cart",
-                action="add_confirm",
-                item_id=item_id,
-                quantity=current_quantity
+                payload=CartCallback(CartAction.ADD_CONFIRM, item_id, current_quantity)
             )
         ])
         
         buttons.append([
-            InlineKeyboardButton(text="❌ Отменить", callback_data=f"item:{item_id}")
+            BaseKeyboard.create_payload_button(text="❌ Отменить", payload=ItemCallback(item_id))
         ])
         
         return BaseKeyboard.create_inline_keyboard(buttons)
@@ -190,25 +192,19 @@ class MenuKeyboard(BaseKeyboard):
         """Get comment keyboard."""
         buttons = [
             [
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="✅ Без комментария",
-                    prefix="cart",
-                    action="add_final",
-                    item_id=item_id,
-                    quantity=quantity
+                    payload=CartCallback(CartAction.ADD_FINAL, item_id, quantity)
                 )
             ],
             [
-                BaseKeyboard.create_callback_button(
+                BaseKeyboard.create_payload_button(
                     text="✏️ Добавить комментарий",
-                    prefix="cart",
-                    action="add_comment",
-                    item_id=item_id,
-                    quantity=quantity
+                    payload=CartCallback(CartAction.ADD_COMMENT, item_id, quantity)
                 )
             ],
             [
-                InlineKeyboardButton(text="❌ Отменить", callback_data=f"item:{item_id}")
+                BaseKeyboard.create_payload_button(text="❌ Отменить", payload=ItemCallback(item_id))
             ]
         ]
         
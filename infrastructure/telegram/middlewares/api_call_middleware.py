@@ -0,0 +1,45 @@
+"""Middleware that counts Bot API calls per update."""
+
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery, InlineQuery, Message
+
+from infrastructure.logging.logger import get_logger
+from infrastructure.telegram.api_metrics import api_call_metrics, api_call_scope
+
+logger = get_logger(__name__)
+
+
+def _event_type(event: Any) -> str:
+    if isinstance(event, CallbackQuery):
+        return "callback_query"
+    if isinstance(event, InlineQuery):
+        return "inline_query"
+    return "message"
+
+
+class ApiCallMiddleware(BaseMiddleware):
+    """Report how many Bot API requests handling an update took.
+
+    Requests are counted by `ApiCallCounter` on the bot session; this
+    middleware scopes them to the update and feeds `api_call_metrics`.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[Message, Dict[str, Any]], Awaitable[Any]],
+        event: Message | CallbackQuery | InlineQuery,
+        data: Dict[str, Any]
+    ) -> Any:
+        with api_call_scope() as calls:
+            try:
+                return await handler(event, data)
+            finally:
+                api_call_metrics.observe_update(len(calls))
+                logger.debug(
+                    "Bot API calls for update",
+                    event_type=_event_type(event),
+                    calls=len(calls),
+                    methods=calls,
+                )
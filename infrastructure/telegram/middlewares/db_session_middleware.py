@@ -1,15 +1,25 @@
-"""Middleware that opens AsyncSession per update and commits on success."""
+"""Middleware that provides a lazily opened AsyncSession per update and commits on success."""
 
 from typing import Any, Awaitable, Callable, Dict
 
 from aiogram import BaseMiddleware
 from aiogram.types import Message, CallbackQuery
 
-from infrastructure.database.connection import get_sessionmaker, set_current_session
+from infrastructure.database.connection import (
+    LazySession,
+    get_sessionmaker,
+    reset_current_session,
+    set_current_session,
+)
 
 
 class DbSessionMiddleware(BaseMiddleware):
-    """Provide `session` in data and manage transaction lifecycle."""
+    """Provide `session` in data and manage transaction lifecycle.
+
+    The session is a `LazySession`: a pooled connection is checked out only
+    when a handler actually runs a query, and handlers that never touch the
+    database cost no BEGIN/COMMIT at all.
+    """
 
     async def __call__(
         self,
@@ -17,18 +27,17 @@ class DbSessionMiddleware(BaseMiddleware):
         event: Message | CallbackQuery,
         data: Dict[str, Any]
     ) -> Any:
-        session_maker = get_sessionmaker()
-        async with session_maker() as session:
-            data["session"] = session
-            token = set_current_session(session)
-            try:
-                async with session.begin():
-                    return await handler(event, data)
-            finally:
-                # always reset contextvar (session closed by context manager)
-                try:
-                    from contextvars import Token as _Token  # just for typing safety
-                except Exception:
-                    pass
-                token = token  # silence linter unused var
+        session = LazySession(get_sessionmaker())
+        data["session"] = session
+        token = set_current_session(session)  # type: ignore[arg-type]
+        try:
+            result = await handler(event, data)
+            await session.commit_if_used()
+            return result
+        except Exception:
+            await session.rollback_if_used()
+            raise
+        finally:
+            await session.close_if_used()
+            reset_current_session(token)
 
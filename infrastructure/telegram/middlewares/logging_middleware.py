@@ -4,7 +4,7 @@ import time
 from typing import Any, Awaitable, Callable, Dict
 
 from aiogram import BaseMiddleware
-from aiogram.types import CallbackQuery, Message
+from aiogram.types import CallbackQuery, InlineQuery, Message
 
 from infrastructure.logging.logger import get_logger
 
@@ -17,7 +17,7 @@ class LoggingMiddleware(BaseMiddleware):
     async def __call__(
         self,
         handler: Callable[[Message, Dict[str, Any]], Awaitable[Any]],
-        event: Message | CallbackQuery,
+        event: Message | CallbackQuery | InlineQuery,
         data: Dict[str, Any]
     ) -> Any:
         """Log incoming events."""
@@ -39,6 +39,12 @@ class LoggingMiddleware(BaseMiddleware):
                 "chat_id": event.message.chat.id if event.message else None,
                 "message_id": event.message.message_id if event.message else None,
             }
+        elif isinstance(event, InlineQuery):
+            event_type = "inline_query"
+            event_data = {
+                "query": event.query,
+                "offset": event.offset,
+            }
         else:
             event_type = "unknown"
             event_data = {}
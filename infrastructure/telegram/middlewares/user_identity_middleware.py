@@ -0,0 +1,29 @@
+"""Middleware that scopes user identity resolution to one update."""
+
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery, Message
+
+from infrastructure.cache.user_identity_cache import get_cached_user_id, user_identity_scope
+
+
+class UserIdentityMiddleware(BaseMiddleware):
+    """Open a per-update user identity map and expose `internal_user_id`.
+
+    Runs after `AuthMiddleware`. The internal ID comes from the process-wide
+    LRU when the user was seen before; otherwise it stays None and the first
+    repository lookup in the update fills both caches, so handlers that
+    never need the user cost no query.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[Message, Dict[str, Any]], Awaitable[Any]],
+        event: Message | CallbackQuery,
+        data: Dict[str, Any]
+    ) -> Any:
+        with user_identity_scope():
+            telegram_id = data.get("user_id")
+            data["internal_user_id"] = get_cached_user_id(telegram_id) if telegram_id is not None else None
+            return await handler(event, data)
@@ -0,0 +1,411 @@
+"""Rate-limited outbound Bot API queue."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramForbiddenError, TelegramNetworkError, TelegramRetryAfter, TelegramServerError
+from aiogram.methods import SendMessage, TelegramMethod
+
+from infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Priority(IntEnum):
+    """Send priority; lower values go first."""
+
+    TRANSACTIONAL = 0  # order status, payment results, admin alerts
+    BULK = 1  # promotions and broadcasts
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` sends per second with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def delay(self) -> float:
+        """Seconds until a token is available (0 when one is available now)."""
+        now = self._clock()
+        self._refill(now)
+        wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+        return max(wait, self._paused_until - now)
+
+    def consume(self) -> None:
+        """Take one token; call only when `delay()` is 0."""
+        self._refill(self._clock())
+        self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Give no tokens for `seconds` (Telegram asked to retry later)."""
+        now = self._clock()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+
+
+@dataclass
+class _Outbound:
+    method: TelegramMethod
+    priority: Priority
+    future: asyncio.Future
+    attempts: int = 0
+
+
+@dataclass
+class _Chat:
+    bucket: TokenBucket
+    queues: Dict[Priority, Deque[_Outbound]] = field(default_factory=lambda: {p: deque() for p in Priority})
+    # Set whenever the chat is (re)scheduled; older schedule entries are ignored
+    generation: int = 0
+    scheduled: Optional[Priority] = None
+    in_flight: bool = False
+
+    def head_priority(self) -> Optional[Priority]:
+        for priority in Priority:
+            if self.queues[priority]:
+                return priority
+        return None
+
+
+class SendQueueMetrics:
+    """Counters of outbound sends for /health."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset counters."""
+        self.sent: Dict[str, int] = {p.name.lower(): 0 for p in Priority}
+        self.failed = 0
+        self.blocked = 0
+        self.retried = 0
+        self.rate_limited = 0
+
+    def snapshot(self, pending: Dict[str, int]) -> Dict[str, Any]:
+        """Counters plus queue depth."""
+        return {
+            "sent": dict(self.sent),
+            "pending": pending,
+            "failed": self.failed,
+            "blocked": self.blocked,
+            "retried": self.retried,
+            "rate_limited": self.rate_limited,
+        }
+
+
+class SendQueue:
+    """Central queue for messages the bot sends on its own initiative.
+
+    Telegram allows about 30 messages per second per bot, one per second
+    per private chat and 20 per minute per group. Every queued Bot API
+    method waits for a token from the global bucket and from its chat's
+    bucket (private or group rate), so bursts are spread out instead of
+    answered with 429s. Chats are scheduled independently: a chat waiting
+    for its own bucket never holds up others, and messages to one chat
+    keep their order. Among chats ready to send, transactional messages
+    always go before bulk ones. A chat whose queue drained is forgotten
+    only once its bucket has refilled, so messages sent one after another
+    keep to the chat's rate too.
+
+    `TelegramRetryAfter` pauses the global bucket for the requested time
+    and the message is retried; network and server errors are retried with
+    exponential backoff. A chat that blocked the bot fails immediately.
+    Cancelling the future of a queued message drops it unsent.
+    Replies to a user's own update are still sent directly by handlers,
+    so the global rate should leave headroom for them.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        global_rate: float = 25.0,
+        chat_rate: float = 1.0,
+        group_rate: float = 20 / 60,
+        max_in_flight: int = 20,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+        max_pending_bulk: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.bot = bot
+        self.chat_rate = chat_rate
+        self.group_rate = group_rate
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_pending_bulk = max_pending_bulk
+        self.metrics = SendQueueMetrics()
+        self._clock = clock
+        self._global = TokenBucket(global_rate, capacity=1.0, clock=clock)
+        self._chats: Dict[int, _Chat] = {}
+        self._waiting: List[Tuple[float, int, int, int]] = []  # (ready_at, seq, chat_id, generation)
+        self._ready: Dict[Priority, Deque[Tuple[int, int]]] = {p: deque() for p in Priority}
+        self._seq = itertools.count()
+        self._pending = {p: 0 for p in Priority}
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._wakeup = asyncio.Event()
+        self._bulk_room = asyncio.Condition()
+        self._tasks: set = set()
+        self._task: Optional[asyncio.Task] = None
+
+    # Public API
+    def start(self) -> None:
+        """Start sending."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Send what is queued (up to timeout), then stop."""
+        deadline = self._clock() + timeout
+        while self.pending and self._clock() < deadline:
+            await asyncio.sleep(0.05)
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for chat in self._chats.values():
+            for queue in chat.queues.values():
+                while queue:
+                    outbound = queue.popleft()
+                    if not outbound.future.done():
+                        outbound.future.cancel()
+        self._chats.clear()
+
+    @property
+    def pending(self) -> int:
+        """Messages queued or being sent."""
+        return sum(self._pending.values())
+
+    async def submit(self, method: TelegramMethod, priority: Priority = Priority.TRANSACTIONAL) -> asyncio.Future:
+        """Queue Bot API method with a `chat_id`; the future resolves to its result.
+
+        Bulk producers wait here while `max_pending_bulk` bulk messages are
+        queued, so a large broadcast never sits in memory all at once.
+        """
+        if priority == Priority.BULK and self._pending[Priority.BULK] >= self.max_pending_bulk:
+            async with self._bulk_room:
+                await self._bulk_room.wait_for(lambda: self._pending[Priority.BULK] < self.max_pending_bulk)
+        future = asyncio.get_running_loop().create_future()
+        chat_id = int(method.chat_id)
+        chat = self._chats.get(chat_id)
+        if chat is None:
+            chat = self._chats[chat_id] = _Chat(TokenBucket(self._chat_rate(chat_id), clock=self._clock))
+        chat.queues[priority].append(_Outbound(method, priority, future))
+        self._pending[priority] += 1
+        if not chat.in_flight and (chat.scheduled is None or priority < chat.scheduled):
+            # Idle chat, or a transactional message overtaking queued bulk ones
+            self._schedule(chat_id, chat)
+        return future
+
+    async def submit_message(
+        self, chat_id: int, text: str, priority: Priority = Priority.TRANSACTIONAL
+    ) -> asyncio.Future:
+        """Queue text message to chat."""
+        return await self.submit(SendMessage(chat_id=chat_id, text=text), priority)
+
+    async def send(self, method: TelegramMethod, priority: Priority = Priority.TRANSACTIONAL) -> Any:
+        """Queue Bot API method and wait for its result."""
+        return await (await self.submit(method, priority))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Metrics for /health."""
+        return self.metrics.snapshot({p.name.lower(): n for p, n in self._pending.items()})
+
+    # Scheduling
+    def _chat_rate(self, chat_id: int) -> float:
+        # Group and channel ids are negative
+        return self.group_rate if chat_id < 0 else self.chat_rate
+
+    def _schedule(self, chat_id: int, chat: _Chat, extra_delay: float = 0.0) -> None:
+        chat.generation = next(self._seq)
+        chat.scheduled = chat.head_priority()
+        ready_at = self._clock() + max(chat.bucket.delay(), extra_delay)
+        heapq.heappush(self._waiting, (ready_at, next(self._seq), chat_id, chat.generation))
+        self._wakeup.set()
+
+    def _forget_when_refilled(self, chat_id: int, chat: _Chat) -> None:
+        """Drop idle chat once its bucket refills; a new bucket would start full."""
+        chat.generation = next(self._seq)
+        chat.scheduled = None
+        ready_at = self._clock() + chat.bucket.delay()
+        # Not urgent, so the send loop is not woken for it
+        heapq.heappush(self._waiting, (ready_at, next(self._seq), chat_id, chat.generation))
+
+    def _promote_ready(self) -> float:
+        """Move chats whose bucket has a token to the ready lanes; get seconds until the next one."""
+        now = self._clock()
+        while self._waiting and self._waiting[0][0] <= now:
+            _ready_at, _seq, chat_id, generation = heapq.heappop(self._waiting)
+            chat = self._chats.get(chat_id)
+            if chat is None or chat.generation != generation:
+                continue
+            priority = chat.head_priority()
+            if priority is not None:
+                self._ready[priority].append((chat_id, generation))
+            elif not chat.in_flight:
+                # Idle and its bucket refilled: a new chat starts the same
+                del self._chats[chat_id]
+        return self._waiting[0][0] - now if self._waiting else float("inf")
+
+    def _take_ready(self) -> Optional[Tuple[int, _Chat, _Outbound]]:
+        for priority in Priority:
+            lane = self._ready[priority]
+            while lane:
+                chat_id, generation = lane.popleft()
+                chat = self._chats.get(chat_id)
+                if chat is None or chat.generation != generation or chat.in_flight:
+                    continue
+                self._drop_cancelled(chat)
+                head = chat.head_priority()
+                if head is None:
+                    self._forget_when_refilled(chat_id, chat)
+                    continue
+                chat.scheduled = None
+                chat.in_flight = True
+                chat.bucket.consume()
+                return chat_id, chat, chat.queues[head].popleft()
+        return None
+
+    def _drop_cancelled(self, chat: _Chat) -> None:
+        """Forget queued messages whose caller cancelled them."""
+        for priority, queue in chat.queues.items():
+            while queue and queue[0].future.cancelled():
+                queue.popleft()
+                self._pending[priority] -= 1
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            next_ready = self._promote_ready()
+            if not any(self._ready.values()):
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=min(next_ready, 60.0))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            delay = self._global.delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            await self._in_flight.acquire()
+            self._promote_ready()
+            taken = self._take_ready()
+            if taken is None:
+                self._in_flight.release()
+                await self._notify_bulk_room()
+                continue
+            self._global.consume()
+            task = asyncio.create_task(self._deliver(*taken))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    # Delivery
+    async def _deliver(self, chat_id: int, chat: _Chat, outbound: _Outbound) -> None:
+        retry_in: Optional[float] = None
+        try:
+            outbound.attempts += 1
+            result = await self.bot(outbound.method)
+        except TelegramRetryAfter as e:
+            self.metrics.rate_limited += 1
+            self._global.pause(e.retry_after)
+            chat.bucket.pause(e.retry_after)
+            retry_in = e.retry_after
+            logger.warning("Telegram rate limit hit", chat_id=chat_id, retry_after=e.retry_after)
+            if outbound.attempts > self.max_retries:
+                retry_in = None
+                self.metrics.failed += 1
+                self._finish(outbound, exception=e)
+        except TelegramForbiddenError as e:
+            # Bot blocked or kicked: retrying cannot help
+            self.metrics.blocked += 1
+            self._finish(outbound, exception=e)
+        except (TelegramNetworkError, TelegramServerError) as e:
+            retry_in = self.backoff * 2 ** (outbound.attempts - 1)
+            logger.warning("Send failed, retrying", chat_id=chat_id, attempt=outbound.attempts, error=str(e))
+            if outbound.attempts > self.max_retries:
+                retry_in = None
+                self.metrics.failed += 1
+                self._finish(outbound, exception=e)
+        except Exception as e:
+            self.metrics.failed += 1
+            logger.error("Send failed", chat_id=chat_id, error=str(e))
+            self._finish(outbound, exception=e)
+        else:
+            self.metrics.sent[outbound.priority.name.lower()] += 1
+            self._finish(outbound, result=result)
+        finally:
+            self._in_flight.release()
+
+        if retry_in is not None:
+            self.metrics.retried += 1
+            chat.queues[outbound.priority].appendleft(outbound)
+        chat.in_flight = False
+        if chat.head_priority() is None:
+            self._forget_when_refilled(chat_id, chat)
+        else:
+            self._schedule(chat_id, chat, retry_in or 0.0)
+        await self._notify_bulk_room()
+
+    def _finish(self, outbound: _Outbound, result: Any = None, exception: Optional[BaseException] = None) -> None:
+        self._pending[outbound.priority] -= 1
+        if outbound.future.done():
+            return
+        if exception is not None:
+            outbound.future.set_exception(exception)
+            # Fire-and-forget callers never retrieve it; do not log "never retrieved"
+            outbound.future.exception()
+        else:
+            outbound.future.set_result(result)
+
+    async def _notify_bulk_room(self) -> None:
+        if self._pending[Priority.BULK] < self.max_pending_bulk:
+            async with self._bulk_room:
+                self._bulk_room.notify_all()
+
+
+_send_queue: Optional[SendQueue] = None
+
+
+def init_send_queue(bot: Bot, **options: Any) -> SendQueue:
+    """Create and start the process-wide send queue."""
+    global _send_queue
+    _send_queue = SendQueue(bot, **options)
+    _send_queue.start()
+    return _send_queue
+
+
+async def close_send_queue() -> None:
+    """Send what is left and stop the queue."""
+    global _send_queue
+    if _send_queue is not None:
+        await _send_queue.stop()
+        _send_queue = None
+
+
+def get_send_queue() -> Optional[SendQueue]:
+    """Get process-wide send queue (None before startup)."""
+    return _send_queue
@@ -0,0 +1,22 @@
+"""HTTP session for Telegram Bot API requests."""
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.methods import TelegramMethod
+from aiohttp import FormData
+
+from infrastructure.telegram.keyboards.cached_markup import CachedInlineKeyboardMarkup
+
+
+class CachedMarkupSession(AiohttpSession):
+    """Aiohttp session that sends cached keyboards as their stored JSON."""
+
+    def build_form_data(self, bot: Bot, method: TelegramMethod) -> FormData:
+        """Build request form, reusing serialized cached keyboard."""
+        markup = getattr(method, "reply_markup", None)
+        if not isinstance(markup, CachedInlineKeyboardMarkup):
+            return super().build_form_data(bot, method)
+
+        form = super().build_form_data(bot, method.model_copy(update={"reply_markup": None}))
+        form.add_field("reply_markup", markup.serialized(self, bot))
+        return form
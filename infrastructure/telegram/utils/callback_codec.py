@@ -0,0 +1,224 @@
+"""Compact, typed encoding of inline button callback data."""
+
+import dataclasses
+import enum
+import string
+import typing
+import uuid
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from aiogram.filters import Filter
+from aiogram.types import CallbackQuery
+
+from shared.constants.bot_constants import CALLBACK_DATA_SEPARATOR
+
+T = TypeVar("T")
+
+MAX_CALLBACK_DATA_BYTES = 64
+
+_ALPHABET = string.digits + string.ascii_letters
+_DIGITS = {char: value for value, char in enumerate(_ALPHABET)}
+_UUID_TOKEN_LENGTH = 22
+_RAW_ID_MARKER = "~"
+
+
+def encode_int(value: int) -> str:
+    """Encode non-negative integer as base-62 token."""
+    if value < 0:
+        raise ValueError(f"Cannot encode negative integer {value}")
+    token = ""
+    while True:
+        value, digit = divmod(value, len(_ALPHABET))
+        token = _ALPHABET[digit] + token
+        if not value:
+            return token
+
+
+def decode_int(token: str) -> int:
+    """Decode base-62 token."""
+    if not token:
+        raise ValueError("Empty integer token")
+    value = 0
+    for char in token:
+        value = value * len(_ALPHABET) + _DIGITS[char]
+    return value
+
+
+def encode_id(value: str) -> str:
+    """Encode entity ID; canonical UUIDs shrink from 36 to 22 characters.
+
+    Other IDs are kept as they are, marked with `~` only when they could be
+    mistaken for a packed UUID.
+    """
+    try:
+        packed = uuid.UUID(value)
+    except ValueError:
+        packed = None
+    if packed is not None and str(packed) == value:
+        return encode_int(packed.int).rjust(_UUID_TOKEN_LENGTH, _ALPHABET[0])
+    if len(value) == _UUID_TOKEN_LENGTH or value.startswith(_RAW_ID_MARKER):
+        return _RAW_ID_MARKER + value
+    return value
+
+
+def decode_id(token: str) -> str:
+    """Decode entity ID token."""
+    if token.startswith(_RAW_ID_MARKER):
+        return token[len(_RAW_ID_MARKER):]
+    if len(token) == _UUID_TOKEN_LENGTH:
+        return str(uuid.UUID(int=decode_int(token)))
+    return token
+
+
+_FieldCodec = Tuple[Callable[[Any], str], Callable[[str], Any]]
+
+
+def _field_codec(annotation: Any) -> _FieldCodec:
+    """Get (encode, decode) pair for a payload field type."""
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            raise TypeError(f"Unsupported callback field type {annotation}")
+        encode, decode = _field_codec(args[0])
+        return (
+            lambda value: "" if value is None else encode(value),
+            lambda token: None if token == "" else decode(token),
+        )
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return (lambda value: str(value.value), annotation)
+    if annotation is int:
+        return (encode_int, decode_int)
+    if annotation is str:
+        return (encode_id, decode_id)
+    raise TypeError(f"Unsupported callback field type {annotation}")
+
+
+@dataclasses.dataclass(frozen=True)
+class _CallbackSpec:
+    """How one payload type maps to callback data."""
+
+    payload_type: type
+    tag: str
+    field_names: Tuple[str, ...]
+    encoders: Tuple[Callable[[Any], str], ...]
+    decoders: Tuple[Callable[[str], Any], ...]
+
+
+class CallbackRegistry:
+    """Maps payload dataclasses to `<tag>|<token>|...` callback data.
+
+    Decoding looks the tag up in a dict and splits the rest once, so it
+    costs the same for any number of registered payloads. Decoded payloads
+    are immutable and memoized per callback data string. Parsers added with
+    `add_fallback` handle strings with an unknown tag, e.g. buttons sent
+    before their format changed.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self._specs_by_tag: Dict[str, _CallbackSpec] = {}
+        self._specs_by_type: Dict[type, _CallbackSpec] = {}
+        self._fallbacks: List[Callable[[str], Optional[Any]]] = []
+        self.unpack = lru_cache(maxsize=cache_size)(self._unpack)
+
+    def register(self, tag: str) -> Callable[[Type[T]], Type[T]]:
+        """Class decorator registering frozen dataclass under tag."""
+        if CALLBACK_DATA_SEPARATOR in tag:
+            raise ValueError(f"Callback tag {tag!r} contains separator")
+
+        def decorator(payload_type: Type[T]) -> Type[T]:
+            if tag in self._specs_by_tag:
+                raise ValueError(f"Callback tag {tag!r} is already registered")
+            hints = typing.get_type_hints(payload_type)
+            fields = dataclasses.fields(payload_type)
+            codecs = [_field_codec(hints[field.name]) for field in fields]
+            spec = _CallbackSpec(
+                payload_type=payload_type,
+                tag=tag,
+                field_names=tuple(field.name for field in fields),
+                encoders=tuple(encode for encode, _ in codecs),
+                decoders=tuple(decode for _, decode in codecs),
+            )
+            self._specs_by_tag[tag] = spec
+            self._specs_by_type[payload_type] = spec
+            self.unpack.cache_clear()
+            return payload_type
+
+        return decorator
+
+    def add_fallback(self, parser: Callable[[str], Optional[Any]]) -> None:
+        """Add parser for callback data with an unregistered tag."""
+        self._fallbacks.append(parser)
+        self.unpack.cache_clear()
+
+    def pack(self, payload: Any) -> str:
+        """Encode payload as callback data."""
+        spec = self._specs_by_type[type(payload)]
+        tokens = [
+            encode(getattr(payload, name))
+            for name, encode in zip(spec.field_names, spec.encoders)
+        ]
+        for token in tokens:
+            if CALLBACK_DATA_SEPARATOR in token:
+                raise ValueError(f"Callback value {token!r} contains separator")
+        # Trailing empty (None) values are implied
+        while tokens and tokens[-1] == "":
+            tokens.pop()
+
+        data = CALLBACK_DATA_SEPARATOR.join([spec.tag, *tokens])
+        if len(data.encode()) > MAX_CALLBACK_DATA_BYTES:
+            raise ValueError(f"Callback data {data!r} exceeds {MAX_CALLBACK_DATA_BYTES} bytes")
+        return data
+
+    def _unpack(self, data: str) -> Optional[Any]:
+        """Decode callback data, None when it is not recognised."""
+        tag, separator, rest = data.partition(CALLBACK_DATA_SEPARATOR)
+        spec = self._specs_by_tag.get(tag)
+        if spec is None:
+            return self._unpack_fallback(data)
+
+        tokens = rest.split(CALLBACK_DATA_SEPARATOR) if separator else []
+        if len(tokens) > len(spec.decoders):
+            return None
+        tokens.extend([""] * (len(spec.decoders) - len(tokens)))
+        try:
+            return spec.payload_type(*(decode(token) for decode, token in zip(spec.decoders, tokens)))
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _unpack_fallback(self, data: str) -> Optional[Any]:
+        for parser in self._fallbacks:
+            payload = parser(data)
+            if payload is not None:
+                return payload
+        return None
+
+
+class CallbackFilter(Filter):
+    """Matches callback queries carrying one of the given payload types.
+
+    The decoded payload is passed to the handler as `payload`.
+    """
+
+    def __init__(self, *payload_types: type, registry: Optional[CallbackRegistry] = None):
+        self.payload_types = payload_types
+        self.registry = registry or callback_registry
+
+    async def __call__(self, callback: CallbackQuery) -> Union[bool, Dict[str, Any]]:
+        payload = self.registry.unpack(callback.data or "")
+        if payload is None or not isinstance(payload, self.payload_types):
+            return False
+        return {"payload": payload}
+
+
+callback_registry = CallbackRegistry()
+
+
+def pack_callback(payload: Any) -> str:
+    """Encode payload with the default registry."""
+    return callback_registry.pack(payload)
+
+
+def unpack_callback(data: str) -> Optional[Any]:
+    """Decode callback data with the default registry."""
+    return callback_registry.unpack(data)
@@ -0,0 +1,125 @@
+"""Callback query routing table."""
+
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from aiogram.dispatcher.event.handler import CallableObject
+from aiogram.filters import Filter
+from aiogram.types import CallbackQuery
+
+from infrastructure.telegram.utils.callback_codec import CallbackRegistry, callback_registry
+
+Route = Tuple[CallableObject, Dict[str, Any]]
+
+
+class _TrieNode:
+    """Node of callback data prefix trie."""
+
+    __slots__ = ("children", "exact", "prefix")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.exact: Optional[CallableObject] = None
+        self.prefix: Optional[CallableObject] = None
+
+
+class CallbackRouter:
+    """Resolves callback data to one handler without trying filters in turn.
+
+    Codec payloads are routed by payload type; raw strings by an exact match
+    or the longest registered prefix, walked in a trie. Resolution costs
+    O(len(data)) however many routes there are, and registration order does
+    not matter: `payment_success:` reaches its own handler even when
+    `payment` is registered too.
+    """
+
+    def __init__(self, registry: Optional[CallbackRegistry] = None):
+        self.registry = registry or callback_registry
+        self._root = _TrieNode()
+        self._payload_routes: Dict[type, CallableObject] = {}
+
+    def exact(self, data: str, handler: Callable[..., Any]) -> None:
+        """Route callback data equal to `data`."""
+        node = self._node(data)
+        if node.exact is not None:
+            raise ValueError(f"Callback data {data!r} is already routed")
+        node.exact = CallableObject(handler)
+
+    def prefix(self, prefix: str, handler: Callable[..., Any]) -> None:
+        """Route callback data starting with `prefix` unless a longer route matches."""
+        node = self._node(prefix)
+        if node.prefix is not None:
+            raise ValueError(f"Callback prefix {prefix!r} is already routed")
+        node.prefix = CallableObject(handler)
+
+    def payload(self, handler: Callable[..., Any], *payload_types: type) -> None:
+        """Route codec payloads of given types; handler gets the payload as `payload`."""
+        for payload_type in payload_types:
+            if payload_type in self._payload_routes:
+                raise ValueError(f"Callback payload {payload_type.__name__} is already routed")
+            self._payload_routes[payload_type] = CallableObject(handler)
+
+    def include(self, other: "CallbackRouter") -> None:
+        """Merge routes of another table, refusing duplicates."""
+        for payload_type, handler in other._payload_routes.items():
+            self.payload(handler.callback, payload_type)
+        stack = [("", other._root)]
+        while stack:
+            key, node = stack.pop()
+            if node.exact is not None:
+                self.exact(key, node.exact.callback)
+            if node.prefix is not None:
+                self.prefix(key, node.prefix.callback)
+            stack.extend((key + char, child) for char, child in node.children.items())
+
+    def resolve(self, data: str) -> Optional[Route]:
+        """Find handler for callback data and the kwargs it should receive."""
+        payload = self.registry.unpack(data)
+        if payload is not None:
+            handler = self._payload_routes.get(type(payload))
+            if handler is not None:
+                return handler, {"payload": payload}
+
+        node = self._root
+        best = node.prefix
+        for char in data:
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.prefix is not None:
+                best = node.prefix
+        else:
+            if node.exact is not None:
+                return node.exact, {}
+        return (best, {}) if best is not None else None
+
+    def as_filter(self) -> "CallbackRouteFilter":
+        """Get filter to register `dispatch` with."""
+        return CallbackRouteFilter(self)
+
+    async def dispatch(self, callback: CallbackQuery, callback_route: CallableObject, **kwargs) -> Any:
+        """Call resolved handler with the kwargs it accepts."""
+        return await callback_route.call(callback, **kwargs)
+
+    def _node(self, key: str) -> _TrieNode:
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        return node
+
+
+class CallbackRouteFilter(Filter):
+    """Matches callback queries routed by a `CallbackRouter`.
+
+    Registered together with `CallbackRouter.dispatch` as one aiogram
+    handler, so inner middlewares still wrap the routed handler.
+    """
+
+    def __init__(self, router: CallbackRouter):
+        self.router = router
+
+    async def __call__(self, callback: CallbackQuery) -> Union[bool, Dict[str, Any]]:
+        route = self.router.resolve(callback.data or "")
+        if route is None:
+            return False
+        handler, extra = route
+        return {"callback_route": handler, **extra}
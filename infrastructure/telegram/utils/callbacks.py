@@ -0,0 +1,149 @@
+"""Callback payloads of menu, cart and order buttons."""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+from infrastructure.telegram.utils.callback_codec import callback_registry
+from shared.constants.order_constants import OrderType, PaymentMethod
+from shared.utils.helpers import extract_callback_data
+
+
+# Menu
+@callback_registry.register("menu")
+@dataclass(frozen=True)
+class MenuCallback:
+    """Show menu categories."""
+
+
+@callback_registry.register("c")
+@dataclass(frozen=True)
+class CategoryCallback:
+    """Show items of category."""
+
+    category_id: str
+
+
+@callback_registry.register("i")
+@dataclass(frozen=True)
+class ItemCallback:
+    """Show menu item."""
+
+    item_id: str
+
+
+# Cart
+class CartAction(str, Enum):
+    """Cart button actions."""
+
+    ADD = "add"
+    ADD_CONFIRM = "add_confirm"
+    ADD_FINAL = "add_final"
+    ADD_COMMENT = "add_comment"
+    EDIT = "edit"
+    INC = "inc"
+    DEC = "dec"
+    NAVIGATE = "navigate"
+    REMOVE = "remove"
+    CLEAR = "clear"
+    ORDER = "order"
+
+
+@callback_registry.register("cart")
+@dataclass(frozen=True)
+class OpenCartCallback:
+    """Show cart."""
+
+
+@callback_registry.register("k")
+@dataclass(frozen=True)
+class CartCallback:
+    """Cart action, optionally on an item."""
+
+    action: CartAction
+    item_id: Optional[str] = None
+    quantity: Optional[int] = None
+
+
+@callback_registry.register("q")
+@dataclass(frozen=True)
+class QuantityCallback:
+    """Pick quantity of item before adding it to cart."""
+
+    item_id: str
+    quantity: int
+
+
+# Order
+@callback_registry.register("order")
+@dataclass(frozen=True)
+class OrderCallback:
+    """Start checkout."""
+
+
+@callback_registry.register("ot")
+@dataclass(frozen=True)
+class OrderTypeCallback:
+    """Choose delivery or pickup."""
+
+    order_type: OrderType
+
+
+@callback_registry.register("op")
+@dataclass(frozen=True)
+class OrderPaymentCallback:
+    """Choose payment method."""
+
+    payment_method: PaymentMethod
+
+
+@callback_registry.register("order:confirm")
+@dataclass(frozen=True)
+class OrderConfirmCallback:
+    """Confirm order."""
+
+
+@callback_registry.register("order:back")
+@dataclass(frozen=True)
+class OrderBackCallback:
+    """Return from checkout to cart."""
+
+
+@callback_registry.register("order:cancel")
+@dataclass(frozen=True)
+class OrderCancelCallback:
+    """Cancel checkout."""
+
+
+def _parse_legacy(data: str) -> Optional[Any]:
+    """Parse colon-separated callback data of buttons sent before the codec."""
+    prefix, _, rest = data.partition(":")
+    parts = rest.split(":")
+    try:
+        if prefix == "category" and parts[0] == "id":
+            return CategoryCallback(parts[1])
+        if prefix == "item":
+            return ItemCallback(parts[-1])
+        if prefix == "quantity" and len(parts) == 2:
+            return QuantityCallback(parts[0], int(parts[1]))
+        if prefix == "order" and parts[0] == "type":
+            return OrderTypeCallback(OrderType(parts[1]))
+        if prefix == "order" and parts[0] == "payment":
+            return OrderPaymentCallback(PaymentMethod(parts[1]))
+        if prefix == "cart":
+            values = extract_callback_data(data, "cart")
+            action = values.get("action")
+            if action == "update":
+                action = values.get("op")
+            quantity = values.get("quantity")
+            return CartCallback(
+                CartAction(action),
+                values.get("item_id"),
+                int(quantity) if quantity else None,
+            )
+    except (IndexError, ValueError):
+        return None
+    return None
+
+
+callback_registry.add_fallback(_parse_legacy)
@@ -1,12 +1,29 @@
 """Message formatting utilities for Telegram."""
 
+import html
+import re
 from typing import List, Optional
 
-from domain.entities.cart import Cart
+from domain.entities.broadcast_campaign import BroadcastCampaign
+from domain.entities.cart import Cart, CartItem
 from domain.entities.menu_item import MenuItem
 from domain.entities.order import Order
+from shared.constants.broadcast_constants import BroadcastStatus
+from shared.types.cart_types import CartValidationResult
+from infrastructure.cache.ttl_lru_cache import TTLLRUCache
 from shared.utils.formatters import format_price, format_datetime, format_order_status, format_payment_method, format_order_type
 
+# Rendered fragments never expire; they are keyed by everything they show
+_item_cards = TTLLRUCache(max_entries=1024, ttl=float("inf"))
+_cart_lines = TTLLRUCache(max_entries=4096, ttl=float("inf"))
+
+_BROADCAST_STATUS_LABELS = {
+    BroadcastStatus.PENDING: "⏳ В очереди",
+    BroadcastStatus.RUNNING: "📤 Отправляется",
+    BroadcastStatus.COMPLETED: "✅ Завершена",
+    BroadcastStatus.CANCELLED: "⛔ Остановлена",
+}
+
 
 class MessageFormatter:
     """Message formatter for Telegram messages."""
@@ -24,7 +41,20 @@ class MessageFormatter:
     
     @staticmethod
     def format_menu_item(item: MenuItem) -> str:
-        """Format menu item message."""
+        """Format menu item message.
+        
+        Cards are memoized by (item_id, updated_at): every change of an item
+        bumps `updated_at`, so a stale card is never served.
+        """
+        key = (item.item_id, item.updated_at)
+        message = _item_cards.get(key)
+        if message is None:
+            message = MessageFormatter._render_menu_item(item)
+            _item_cards.set(key, message)
+        return message
+    
+    @staticmethod
+    def _render_menu_item(item: MenuItem) -> str:
         message = f"<b>{item.name}</b>\n"
         
         if item.description:
@@ -51,23 +81,55 @@ class MessageFormatter:
     
     @staticmethod
     def format_cart_message(cart: Cart) -> str:
-        """Format cart message."""
+        """Format cart message.
+        
+        Each line is cached by its content, so after a quantity change only
+        the changed line and the total are rendered again.
+        """
         if cart.is_empty():
             return "🛒 <b>Корзина пуста</b>\n\nДобавьте товары из меню!"
         
-        message = "🛒 <b>Ваша корзина:</b>\n\n"
-        
+        lines = []
         for item in cart.get_items_list():
-            message += f"• <b>{item.name}</b>\n"
-            message += f"  Количество: {item.quantity}\n"
-            message += f"  Цена: {format_price(item.total_price)}\n"
-            
-            if item.comment:
-                message += f"  Комментарий: {item.comment}\n"
-            
-            message += "\n"
+            key = (item.name, item.quantity, item.total_price, item.comment)
+            line = _cart_lines.get(key)
+            if line is None:
+                line = MessageFormatter._render_cart_line(item)
+                _cart_lines.set(key, line)
+            lines.append(line)
+        
+        return f"🛒 <b>Ваша корзина:</b>\n\n{''.join(lines)}💰 <b>Итого:</b> {format_price(cart.total_price)}"
+    
+    @staticmethod
+    def _render_cart_line(item: CartItem) -> str:
+        line = f"• <b>{item.name}</b>\n"
+        line += f"  Количество: {item.quantity}\n"
+        line += f"  Цена: {format_price(item.total_price)}\n"
         
-        message += f"💰 <b>Итого:</b> {format_price(cart.total_price)}"
+        if item.comment:
+            line += f"  Комментарий: {item.comment}\n"
+        
+        return line + "\n"
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget memoized item cards and cart lines."""
+        _item_cards.clear()
+        _cart_lines.clear()
+    
+    @staticmethod
+    def format_cart_changes(validation: CartValidationResult) -> str:
+        """Format cart items changed since they were added."""
+        message = "⚠️ <b>Меню изменилось, корзина обновлена</b>\n\n"
+        
+        for change in validation.price_changes:
+            message += (
+                f"• <b>{change.name}</b>: {format_price(change.old_price)} → "
+                f"{format_price(change.new_price)}\n"
+            )
+        
+        for change in validation.unavailable:
+            message += f"• <b>{change.name}</b>: больше недоступно, удалено из корзины\n"
         
         return message
     
@@ -168,6 +230,31 @@ class MessageFormatter:
 Попробуйте еще раз или выберите другой способ оплаты.
         """.strip()
     
+    @staticmethod
+    def format_broadcast_preview(text: str, recipients: int) -> str:
+        """Format broadcast preview shown before sending."""
+        return f"📢 <b>Предпросмотр рассылки</b>\n\n{text}\n\n👥 <b>Получателей:</b> {recipients}"
+    
+    @staticmethod
+    def format_broadcast_history(campaigns: List[BroadcastCampaign]) -> str:
+        """Format latest broadcasts with their delivery counts."""
+        message = "📋 <b>История рассылок</b>"
+        if not campaigns:
+            return message + "\n\nРассылок пока не было"
+        
+        for campaign in campaigns:
+            # Texts are stored as HTML; show a short plain-text preview
+            plain = html.unescape(re.sub(r"<[^>]+>", "", campaign.text))
+            preview = html.escape(plain[:40]) + ("…" if len(plain) > 40 else "")
+            message += f"\n\n{_BROADCAST_STATUS_LABELS[campaign.status]} · {format_datetime(campaign.created_at)}\n"
+            message += f"{preview}\n"
+            message += (
+                f"📨 {campaign.processed}/{campaign.total_recipients} · ✅ {campaign.delivered} · "
+                f"🚫 {campaign.blocked} · ❌ {campaign.failed}"
+            )
+        
+        return message
+    
     @staticmethod
     def format_delivery_info(address: str, phone: str, comment: Optional[str] = None) -> str:
         """Format delivery information."""
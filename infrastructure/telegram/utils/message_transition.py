@@ -0,0 +1,120 @@
+"""Screen transitions with the fewest Bot API calls."""
+
+from enum import Enum
+from typing import Optional, Union
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import InputMediaPhoto, Message
+
+from infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MessageKind(str, Enum):
+    """What a bot message currently displays."""
+
+    TEXT = "text"
+    PHOTO = "photo"
+    OTHER = "other"
+
+
+def message_kind(message: Message) -> MessageKind:
+    """Get kind of displayed message."""
+    if message.photo:
+        return MessageKind.PHOTO
+    if message.text is not None:
+        return MessageKind.TEXT
+    return MessageKind.OTHER
+
+
+def _is_not_modified(error: TelegramBadRequest) -> bool:
+    return "message is not modified" in str(error)
+
+
+class MessageTransition:
+    """Turns the message a callback came from into the next screen.
+
+    The kind of the current screen is read from the message itself, so it
+    is always what the user sees. Each transition costs one edit call when
+    Telegram allows editing between the two kinds:
+
+    - text -> text: edit_text
+    - photo -> photo: edit_media
+    - photo -> text: edit_caption when the photo may stay, else delete + send
+    - text -> photo: delete + send (a text message cannot get media)
+
+    Edits that fail (message too old, deleted, ...) fall back to delete + send.
+    """
+
+    @staticmethod
+    async def show_text(
+        message: Message,
+        text: str,
+        reply_markup=None,
+        keep_media: bool = True,
+    ) -> Union[Message, bool]:
+        """Show text screen; with keep_media a photo stays and gets text as caption."""
+        kind = message_kind(message)
+        if kind == MessageKind.TEXT:
+            operation = message.edit_text(text=text, reply_markup=reply_markup)
+        elif kind == MessageKind.PHOTO and keep_media:
+            operation = message.edit_caption(caption=text, reply_markup=reply_markup)
+        else:
+            return await MessageTransition._replace(message, kind, MessageKind.TEXT, text, reply_markup)
+        return await MessageTransition._edit(message, operation, kind, MessageKind.TEXT, text, reply_markup)
+
+    @staticmethod
+    async def show_photo(
+        message: Message,
+        photo: str,
+        caption: str,
+        reply_markup=None,
+    ) -> Union[Message, bool]:
+        """Show photo screen."""
+        kind = message_kind(message)
+        if kind != MessageKind.PHOTO:
+            return await MessageTransition._replace(message, kind, MessageKind.PHOTO, caption, reply_markup, photo)
+        operation = message.edit_media(
+            media=InputMediaPhoto(media=photo, caption=caption),
+            reply_markup=reply_markup,
+        )
+        return await MessageTransition._edit(message, operation, kind, MessageKind.PHOTO, caption, reply_markup, photo)
+
+    @staticmethod
+    async def _edit(
+        message: Message,
+        operation,
+        kind: MessageKind,
+        target: MessageKind,
+        text: str,
+        reply_markup,
+        photo: Optional[str] = None,
+    ) -> Union[Message, bool]:
+        try:
+            result = await operation
+        except TelegramBadRequest as e:
+            if _is_not_modified(e):
+                return message
+            logger.debug("Message edit failed, resending", error=str(e), from_kind=kind.value, to_kind=target.value)
+            return await MessageTransition._replace(message, kind, target, text, reply_markup, photo)
+        logger.debug("Message edited", from_kind=kind.value, to_kind=target.value)
+        return result
+
+    @staticmethod
+    async def _replace(
+        message: Message,
+        kind: MessageKind,
+        target: MessageKind,
+        text: str,
+        reply_markup,
+        photo: Optional[str] = None,
+    ) -> Message:
+        try:
+            await message.delete()
+        except Exception:
+            pass
+        logger.debug("Message replaced", from_kind=kind.value, to_kind=target.value)
+        if target == MessageKind.PHOTO:
+            return await message.answer_photo(photo=photo, caption=text, reply_markup=reply_markup)
+        return await message.answer(text=text, reply_markup=reply_markup)
@@ -0,0 +1,136 @@
+"""Move order line items from orders.items JSON to order_items table
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+import json
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+orders = sa.table(
+    "orders",
+    sa.column("id", sa.String),
+    sa.column("items", sa.JSON),
+    sa.column("created_at", sa.DateTime),
+)
+
+order_items = sa.table(
+    "order_items",
+    sa.column("id", sa.String),
+    sa.column("order_id", sa.String),
+    sa.column("item_id", sa.String),
+    sa.column("name", sa.String),
+    sa.column("price", sa.Integer),
+    sa.column("quantity", sa.Integer),
+    sa.column("comment", sa.Text),
+    sa.column("position", sa.Integer),
+    sa.column("created_at", sa.DateTime),
+)
+
+
+def _load_items(value):
+    if value is None:
+        return []
+    if isinstance(value, (str, bytes)):
+        value = json.loads(value)
+    return value or []
+
+
+def _backfill(connection) -> None:
+    last_id = ""
+    while True:
+        batch = connection.execute(
+            sa.select(orders.c.id, orders.c["items"], orders.c.created_at)
+            .where(orders.c.id > last_id)
+            .order_by(orders.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not batch:
+            return
+
+        rows = []
+        for order_id, items, created_at in batch:
+            for position, item in enumerate(_load_items(items)):
+                rows.append({
+                    "id": str(uuid.uuid4()),
+                    "order_id": order_id,
+                    "item_id": item.get("item_id"),
+                    "name": item.get("name") or "",
+                    "price": int(item.get("price") or 0),
+                    "quantity": int(item.get("quantity") or 0),
+                    "comment": item.get("comment"),
+                    "position": position,
+                    "created_at": created_at,
+                })
+        if rows:
+            connection.execute(order_items.insert(), rows)
+        last_id = batch[-1][0]
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    inspector = sa.inspect(connection)
+    tables = inspector.get_table_names()
+
+    if "order_items" not in tables:
+        op.create_table(
+            "order_items",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("order_id", sa.String(36), sa.ForeignKey("orders.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("item_id", sa.String(36), nullable=True),
+            sa.Column("name", sa.String(200), nullable=False),
+            sa.Column("price", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("quantity", sa.Integer(), nullable=False, server_default="1"),
+            sa.Column("comment", sa.Text(), nullable=True),
+            sa.Column("position", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_order_items_order_id", "order_items", ["order_id"])
+        op.create_index("ix_order_items_item_id_order_id", "order_items", ["item_id", "order_id"])
+
+    # Fresh databases created from the models have no JSON column to migrate
+    if "orders" in tables and "items" in {c["name"] for c in inspector.get_columns("orders")}:
+        _backfill(connection)
+        with op.batch_alter_table("orders") as batch_op:
+            batch_op.drop_column("items")
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    with op.batch_alter_table("orders") as batch_op:
+        batch_op.add_column(sa.Column("items", sa.JSON(), nullable=True))
+
+    grouped = {}
+    for row in connection.execute(
+        sa.select(order_items).order_by(order_items.c.order_id, order_items.c.position)
+    ).mappings():
+        grouped.setdefault(row["order_id"], []).append({
+            "item_id": row["item_id"],
+            "name": row["name"],
+            "price": row["price"],
+            "quantity": row["quantity"],
+            "comment": row["comment"],
+        })
+    for order_id, items in grouped.items():
+        connection.execute(orders.update().where(orders.c.id == order_id).values(items=items))
+    connection.execute(orders.update().where(orders.c["items"].is_(None)).values(items=[]))
+
+    with op.batch_alter_table("orders") as batch_op:
+        batch_op.alter_column("items", existing_type=sa.JSON(), nullable=False)
+
+    op.drop_index("ix_order_items_item_id_order_id", table_name="order_items")
+    op.drop_index("ix_order_items_order_id", table_name="order_items")
+    op.drop_table("order_items")
@@ -0,0 +1,64 @@
+"""Add composite and partial indexes for order list/filter queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+ACTIVE_ORDER_STATUSES = ("pending", "confirmed", "preparing", "ready")
+
+INDEXES = [
+    ("ix_orders_created_at_id", ["created_at", "id"], None),
+    ("ix_orders_user_id_created_at", ["user_id", "created_at"], None),
+    ("ix_orders_status_created_at", ["status", "created_at"], None),
+    ("ix_orders_order_type_created_at", ["order_type", "created_at"], None),
+    ("ix_orders_payment_status_created_at", ["payment_status", "created_at"], None),
+    ("ix_orders_active_created_at", ["created_at"], sa.column("status").in_(ACTIVE_ORDER_STATUSES)),
+]
+
+
+def _existing_indexes() -> set:
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("orders")}
+
+
+def upgrade() -> None:
+    existing = _existing_indexes()
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+
+    def create_indexes() -> None:
+        for name, columns, where in INDEXES:
+            if name in existing:
+                continue
+            op.create_index(
+                name,
+                "orders",
+                columns,
+                postgresql_where=where,
+                sqlite_where=where,
+                # Do not block order writes while building on a live table
+                postgresql_concurrently=is_postgresql,
+            )
+
+    if is_postgresql:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            create_indexes()
+    else:
+        create_indexes()
+
+
+def downgrade() -> None:
+    existing = _existing_indexes()
+    for name, _columns, _where in reversed(INDEXES):
+        if name in existing:
+            op.drop_index(name, table_name="orders")
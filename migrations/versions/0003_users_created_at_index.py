@@ -0,0 +1,36 @@
+"""Add (created_at, id) index for keyset pagination of users
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def _has_index() -> bool:
+    indexes = sa.inspect(op.get_bind()).get_indexes("users")
+    return any(index["name"] == "ix_users_created_at_id" for index in indexes)
+
+
+def upgrade() -> None:
+    if _has_index():
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index("ix_users_created_at_id", "users", ["created_at", "id"], postgresql_concurrently=True)
+    else:
+        op.create_index("ix_users_created_at_id", "users", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    if _has_index():
+        op.drop_index("ix_users_created_at_id", table_name="users")
@@ -0,0 +1,50 @@
+"""Add sales_rollup table and fill it from existing orders
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if sa.inspect(bind).has_table("sales_rollup"):
+        return
+
+    op.create_table(
+        "sales_rollup",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("hour", sa.SmallInteger(), primary_key=True),
+        sa.Column("order_type", sa.String(length=20), primary_key=True),
+        sa.Column("status", sa.String(length=20), primary_key=True),
+        sa.Column("order_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("revenue", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+    if bind.dialect.name == "postgresql":
+        day, hour = "created_at::date", "EXTRACT(HOUR FROM created_at)::int"
+    else:
+        day, hour = "date(created_at)", "CAST(strftime('%H', created_at) AS INTEGER)"
+    op.execute(
+        f"""
+        INSERT INTO sales_rollup (day, hour, order_type, status, order_count, revenue)
+        SELECT {day}, {hour}, order_type, status, COUNT(*), COALESCE(SUM(total), 0)
+        FROM orders
+        GROUP BY {day}, {hour}, order_type, status
+        """
+    )
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("sales_rollup"):
+        op.drop_table("sales_rollup")
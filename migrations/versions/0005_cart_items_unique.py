@@ -0,0 +1,67 @@
+"""Make (cart_id, menu_item_id) unique in cart_items
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+NAME = "uq_cart_items_cart_id_menu_item_id"
+
+
+def _exists() -> bool:
+    inspector = sa.inspect(op.get_bind())
+    names = {c["name"] for c in inspector.get_unique_constraints("cart_items")}
+    names |= {i["name"] for i in inspector.get_indexes("cart_items")}
+    return NAME in names
+
+
+def upgrade() -> None:
+    if _exists():
+        return
+
+    # Merge duplicate rows into the oldest id of each pair before enforcing uniqueness
+    op.execute(
+        """
+        UPDATE cart_items SET quantity = (
+            SELECT CASE WHEN SUM(d.quantity) > 99 THEN 99 ELSE SUM(d.quantity) END
+            FROM cart_items d
+            WHERE d.cart_id = cart_items.cart_id AND d.menu_item_id = cart_items.menu_item_id
+        )
+        WHERE id IN (
+            SELECT MIN(id) FROM cart_items GROUP BY cart_id, menu_item_id HAVING COUNT(*) > 1
+        )
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM cart_items
+        WHERE id NOT IN (SELECT MIN(id) FROM cart_items GROUP BY cart_id, menu_item_id)
+        """
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(NAME, "cart_items", ["cart_id", "menu_item_id"], unique=True, postgresql_concurrently=True)
+        op.execute(f"ALTER TABLE cart_items ADD CONSTRAINT {NAME} UNIQUE USING INDEX {NAME}")
+    else:
+        # SQLite cannot add constraints to existing tables; a unique index serves ON CONFLICT the same way
+        op.create_index(NAME, "cart_items", ["cart_id", "menu_item_id"], unique=True)
+
+
+def downgrade() -> None:
+    if not _exists():
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_constraint(NAME, "cart_items", type_="unique")
+    else:
+        op.drop_index(NAME, table_name="cart_items")
@@ -0,0 +1,35 @@
+"""Add Telegram image file_id to categories and menu_items
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+TABLES = ("categories", "menu_items")
+
+
+def _has_column(table: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    return any(column["name"] == "image_file_id" for column in columns)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        if not _has_column(table):
+            op.add_column(table, sa.Column("image_file_id", sa.String(length=200), nullable=True))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        if _has_column(table):
+            op.drop_column(table, "image_file_id")
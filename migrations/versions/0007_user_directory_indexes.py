@@ -0,0 +1,76 @@
+"""Add role/status keyset indexes and trigram name search indexes for users
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_users_role_created_at_id", ["role", "created_at", "id"]),
+    ("ix_users_status_created_at_id", ["status", "created_at", "id"]),
+]
+
+# PostgreSQL only: GIN pg_trgm indexes answering ILIKE '%query%'
+TRIGRAM_INDEXES = [
+    ("ix_users_username_trgm", "username"),
+    ("ix_users_first_name_trgm", "first_name"),
+    ("ix_users_last_name_trgm", "last_name"),
+]
+
+
+def _existing_indexes() -> set:
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("users")}
+
+
+def upgrade() -> None:
+    existing = _existing_indexes()
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+
+    def create_indexes() -> None:
+        for name, columns in INDEXES:
+            if name in existing:
+                continue
+            # Do not block user writes while building on a live table
+            op.create_index(name, "users", columns, postgresql_concurrently=is_postgresql)
+
+        if not is_postgresql:
+            return
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, column in TRIGRAM_INDEXES:
+            if name in existing:
+                continue
+            op.create_index(
+                name,
+                "users",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+    if is_postgresql:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            create_indexes()
+    else:
+        create_indexes()
+
+
+def downgrade() -> None:
+    existing = _existing_indexes()
+    for name, _column in reversed(TRIGRAM_INDEXES):
+        if name in existing:
+            op.drop_index(name, table_name="users")
+    for name, _columns in reversed(INDEXES):
+        if name in existing:
+            op.drop_index(name, table_name="users")
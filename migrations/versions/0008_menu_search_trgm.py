@@ -0,0 +1,42 @@
+"""Add trigram indexes for ranked menu item search
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+# PostgreSQL only: the expression must match the one search queries use
+INDEXES = [
+    ("ix_menu_items_name_trgm", "name"),
+    ("ix_menu_items_description_trgm", "description"),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        # Other databases search the menu in process
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON menu_items "
+                f"USING gin (translate({column}, 'Ёё', 'Ее') gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for name, _column in reversed(INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,46 @@
+"""Add broadcast_campaigns table
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("broadcast_campaigns"):
+        return
+
+    op.create_table(
+        "broadcast_campaigns",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("created_by", sa.BigInteger(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("total_recipients", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("delivered", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("blocked", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_user_id", sa.String(length=36), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_broadcast_campaigns_status_created_at", "broadcast_campaigns", ["status", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("broadcast_campaigns"):
+        op.drop_table("broadcast_campaigns")
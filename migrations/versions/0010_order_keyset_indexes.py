@@ -0,0 +1,64 @@
+"""Add id to order status and user_id indexes for keyset pagination
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+# (new index, columns, index it replaces, its columns)
+INDEXES = [
+    ("ix_orders_status_created_at_id", ["status", "created_at", "id"],
+     "ix_orders_status_created_at", ["status", "created_at"]),
+    ("ix_orders_user_id_created_at_id", ["user_id", "created_at", "id"],
+     "ix_orders_user_id_created_at", ["user_id", "created_at"]),
+]
+
+
+def _existing_indexes() -> set:
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("orders")}
+
+
+def _run(step) -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            step(True)
+    else:
+        step(False)
+
+
+def upgrade() -> None:
+    existing = _existing_indexes()
+
+    def replace_indexes(concurrently: bool) -> None:
+        for name, columns, old_name, _old_columns in INDEXES:
+            # Build the replacement first so the queries always have an index
+            if name not in existing:
+                op.create_index(name, "orders", columns, postgresql_concurrently=concurrently)
+            if old_name in existing:
+                op.drop_index(old_name, table_name="orders", postgresql_concurrently=concurrently)
+
+    _run(replace_indexes)
+
+
+def downgrade() -> None:
+    existing = _existing_indexes()
+
+    def restore_indexes(concurrently: bool) -> None:
+        for name, _columns, old_name, old_columns in reversed(INDEXES):
+            if old_name not in existing:
+                op.create_index(old_name, "orders", old_columns, postgresql_concurrently=concurrently)
+            if name in existing:
+                op.drop_index(name, table_name="orders", postgresql_concurrently=concurrently)
+
+    _run(restore_indexes)
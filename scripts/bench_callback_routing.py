@@ -0,0 +1,79 @@
+"""Measure callback query dispatch time as the number of handlers grows.
+
+Usage (from repo root):
+  python -m scripts.bench_callback_routing [--updates N] [--handlers 10 50 200]
+
+Compares aiogram routers with one `F.data.startswith(...)` filter per
+handler against a single CallbackRouter, dispatching data that matches the
+last registered handler (the worst case for a filter chain).
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from aiogram import F, Router
+from aiogram.types import CallbackQuery, User
+
+from infrastructure.telegram.utils.callback_router import CallbackRouter
+
+
+async def noop(callback: CallbackQuery) -> None:
+    pass
+
+
+def make_callback(data: str) -> CallbackQuery:
+    return CallbackQuery(
+        id="1",
+        from_user=User(id=1, is_bot=False, first_name="Bench"),
+        chat_instance="1",
+        data=data,
+    )
+
+
+def filter_chain(handlers: int) -> Router:
+    router = Router()
+    for index in range(handlers):
+        router.callback_query.register(noop, F.data.startswith(f"route{index}:"))
+    return router
+
+
+def routing_table(handlers: int) -> Router:
+    routes = CallbackRouter()
+    for index in range(handlers):
+        routes.prefix(f"route{index}:", noop)
+    router = Router()
+    router.callback_query.register(routes.dispatch, routes.as_filter())
+    return router
+
+
+async def measure(router: Router, callback: CallbackQuery, updates: int) -> float:
+    """Get mean dispatch time in microseconds."""
+    for _ in range(min(updates, 100)):
+        await router.propagate_event("callback_query", callback)
+    started = time.perf_counter()
+    for _ in range(updates):
+        await router.propagate_event("callback_query", callback)
+    return (time.perf_counter() - started) / updates * 1e6
+
+
+async def run(handler_counts: List[int], updates: int) -> None:
+    print(f"{'handlers':>8}  {'filters, us':>12}  {'trie, us':>9}")
+    for handlers in handler_counts:
+        callback = make_callback(f"route{handlers - 1}:42")
+        chain = await measure(filter_chain(handlers), callback, updates)
+        trie = await measure(routing_table(handlers), callback, updates)
+        print(f"{handlers:>8}  {chain:>12.1f}  {trie:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=2000, help="updates dispatched per measurement")
+    parser.add_argument("--handlers", type=int, nargs="+", default=[10, 50, 200, 1000], help="handler counts")
+    args = parser.parse_args()
+    asyncio.run(run(args.handlers, args.updates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Measure in-process menu search latency as the menu grows.
+
+Usage (from repo root):
+  python -m scripts.bench_menu_search [--sizes 100 1000 5000] [--searches N]
+
+Compares a substring scan over every item (what ILIKE '%q%' does without
+an index) with MenuSearchIndex, which reads only the posting lists of the
+query's trigrams.
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from domain.entities.menu_item import MenuItem
+from domain.value_objects.menu_search_index import MenuSearchIndex
+
+# Every menu size has the same 10 dishes per searched word; the rest of the
+# menu gets its own vocabulary, as a real menu that grows adds new dishes
+DISHES = ["рёбра", "бургер", "цезарь", "шашлык", "солянка", "чизкейк"]
+QUERIES = ["рёбра", "ребра", "бургр", "цезарь", "шашлык", "чизкейк"]
+SYLLABLES = ["ка", "ро", "ми", "ту", "ле", "ба", "зо", "ри", "ню", "шо", "фа", "ги", "да", "пу", "вэ", "хе"]
+
+
+def make_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def make_menu(size: int) -> List[MenuItem]:
+    rng = random.Random(size)
+    items = []
+    for index in range(size):
+        dish = DISHES[index % len(DISHES)] if index < 10 * len(DISHES) else make_word(rng)
+        items.append(MenuItem(
+            item_id=f"m{index}",
+            category_id=f"c{index % 12}",
+            name=f"{dish.capitalize()} {make_word(rng)}",
+            description=" ".join(make_word(rng) for _ in range(8)),
+            price=25000,
+            sort_order=index,
+        ))
+    return items
+
+
+def scan(items: List[MenuItem], query: str) -> List[MenuItem]:
+    query = query.lower()
+    return [
+        item for item in items
+        if query in item.name.lower() or query in (item.description or "").lower()
+    ]
+
+
+def measure(search: Callable[[str], object], searches: int) -> float:
+    """Get mean search time in microseconds."""
+    started = time.perf_counter()
+    for step in range(searches):
+        search(QUERIES[step % len(QUERIES)])
+    return (time.perf_counter() - started) / searches * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000], help="menu sizes")
+    parser.add_argument("--searches", type=int, default=600, help="searches per measurement")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        items = make_menu(size)
+        started = time.perf_counter()
+        index = MenuSearchIndex(items)
+        build = (time.perf_counter() - started) * 1e3
+        # Each search returns one page of results, like the bot shows
+        indexed = measure(lambda query: index.search(query, limit=20), args.searches)
+        scanned = measure(lambda query: scan(items, query)[:20], args.searches)
+        print(
+            f"{size:>6} items: scan {scanned:9.1f} us   index {indexed:9.1f} us"
+            f"   (index build {build:.0f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measure cart and menu item rendering cost.
+
+Usage (from repo root):
+  python -m scripts.bench_message_rendering [--items 20] [--renders N]
+
+Compares rendering a cart from scratch with re-rendering it after one
+quantity change, and rendering an item card with reading it from cache.
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Callable
+
+from domain.entities.cart import Cart
+from domain.entities.menu_item import MenuItem
+from infrastructure.telegram.utils.message_formatter import MessageFormatter
+
+
+def make_item(index: int) -> MenuItem:
+    return MenuItem(
+        item_id=f"m{index}",
+        category_id="c1",
+        name=f"Блюдо {index}",
+        description="Томлёные свиные рёбра в соусе барбекю",
+        price=25000 + index * 150,
+        ingredients="свинина, соус, специи",
+        weight="350 г",
+        calories=640,
+        updated_at=datetime(2024, 1, 1),
+    )
+
+
+def measure(render: Callable[[int], object], renders: int) -> float:
+    """Get mean render time in microseconds."""
+    started = time.perf_counter()
+    for step in range(renders):
+        render(step)
+    return (time.perf_counter() - started) / renders * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20, help="cart size")
+    parser.add_argument("--renders", type=int, default=20000, help="renders per measurement")
+    args = parser.parse_args()
+
+    items = [make_item(index) for index in range(args.items)]
+    cart = Cart(cart_id="bench", user_id="bench")
+    for item in items:
+        cart.add_item(item, 1)
+
+    def full_cart(step: int) -> None:
+        MessageFormatter.clear_cache()
+        MessageFormatter.format_cart_message(cart)
+
+    def incremental_cart(step: int) -> None:
+        # Typical +/- tap: one line changes between renders
+        cart.update_item_quantity(items[step % len(items)].item_id, step % 5 + 1)
+        MessageFormatter.format_cart_message(cart)
+
+    def full_card(step: int) -> None:
+        MessageFormatter.clear_cache()
+        MessageFormatter.format_menu_item(items[step % len(items)])
+
+    def cached_card(step: int) -> None:
+        MessageFormatter.format_menu_item(items[step % len(items)])
+
+    results = [
+        (f"{args.items}-item cart, full render", full_cart),
+        (f"{args.items}-item cart, one line changed", incremental_cart),
+        ("menu item card, rendered", full_card),
+        ("menu item card, cached", cached_card),
+    ]
+    for label, render in results:
+        print(f"{label + ':':<36} {measure(render, args.renders):8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
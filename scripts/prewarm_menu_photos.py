@@ -0,0 +1,88 @@
+"""Upload menu images to Telegram once and store their file_id.
+
+Usage (from repo root):
+  python -m scripts.prewarm_menu_photos [--chat-id ID] [--force]
+
+Run at deploy time. Every category and menu item whose image is a URL
+without a stored file_id is sent to the admin chat (settings.admin_chat_id
+unless --chat-id is given); the message is deleted right away and the
+file_id Telegram returned is saved, so users are never the first to make
+Telegram download an image. --force re-uploads images that already have one.
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+
+from app.config import get_settings
+from infrastructure.cache.photo_cache import PhotoCache
+from infrastructure.database.connection import close_database, get_sessionmaker, init_database
+from infrastructure.database.repositories.menu_repository_impl import MenuRepositoryImpl
+
+
+async def upload(bot: Bot, chat_id: int, image_url: str) -> Optional[str]:
+    """Send image to chat and get its file_id."""
+    try:
+        message = await bot.send_photo(chat_id=chat_id, photo=image_url, disable_notification=True)
+    except TelegramAPIError as e:
+        print(f"  failed: {image_url}: {e}")
+        return None
+    try:
+        await bot.delete_message(chat_id=chat_id, message_id=message.message_id)
+    except TelegramAPIError:
+        pass
+    return message.photo[-1].file_id if message.photo else None
+
+
+async def prewarm(chat_id: int, force: bool) -> None:
+    settings = get_settings()
+    await init_database(settings.database_url)
+    bot = Bot(token=settings.bot_token)
+    uploaded = 0
+    try:
+        async with get_sessionmaker()() as session:
+            repository = MenuRepositoryImpl(session)
+            categories = await repository.list_categories(active_only=False)
+            items = await repository.list_menu_items(active_only=False, limit=100000)
+
+            targets = [
+                (repository.set_category_image_file_id, category.category_id, category)
+                for category in categories
+            ] + [
+                (repository.set_menu_item_image_file_id, item.item_id, item)
+                for item in items
+            ]
+            for store, entity_id, entity in targets:
+                if not entity.image_url or not PhotoCache.is_url(entity.image_url):
+                    continue
+                if entity.image_file_id and not force:
+                    continue
+                file_id = await upload(bot, chat_id, entity.image_url)
+                if file_id:
+                    await store(entity_id, entity.image_url, file_id)
+                    # Keep progress if the run is interrupted
+                    await session.commit()
+                    uploaded += 1
+        print(f"menu photos uploaded: {uploaded}")
+    finally:
+        await bot.session.close()
+        await close_database()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chat-id", type=int, help="chat to upload to (default: settings.admin_chat_id)")
+    parser.add_argument("--force", action="store_true", help="re-upload images that already have a file_id")
+    args = parser.parse_args()
+
+    chat_id = args.chat_id or get_settings().admin_chat_id
+    if chat_id is None:
+        parser.error("--chat-id is required when ADMIN_CHAT_ID is not set")
+    asyncio.run(prewarm(chat_id, args.force))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Recompute sales_rollup from the orders table.
+
+Usage (from repo root):
+  python -m scripts.rebuild_sales_rollup [--since YYYY-MM-DD]
+
+The rollup is kept up to date by OrderService; run this after bulk edits
+of orders made outside the bot or to repair drift. With --since only
+buckets from that day on are recomputed.
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from app.config import get_settings
+from infrastructure.database.connection import close_database, get_sessionmaker, init_database
+from infrastructure.database.repositories.sales_rollup_repository_impl import SalesRollupRepositoryImpl
+
+
+async def rebuild(since: Optional[datetime]) -> None:
+    await init_database(get_settings().database_url)
+    try:
+        async with get_sessionmaker()() as session:
+            buckets = await SalesRollupRepositoryImpl(session).rebuild(since)
+            await session.commit()
+        print(f"sales_rollup rebuilt: {buckets} buckets")
+    finally:
+        await close_database()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--since", type=datetime.fromisoformat, help="first day to recompute (YYYY-MM-DD)")
+    args = parser.parse_args()
+    asyncio.run(rebuild(args.since))
+
+
+if __name__ == "__main__":
+    main()
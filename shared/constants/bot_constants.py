@@ -24,6 +24,7 @@ CALLBACK_DATA_SEPARATOR = "|"
 # Pagination
 ITEMS_PER_PAGE = 5
 MAX_CART_ITEMS = 20
+MAX_CART_ITEM_QUANTITY = 99
 
 # Message limits
 MAX_MESSAGE_LENGTH = 4096
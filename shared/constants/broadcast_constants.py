@@ -0,0 +1,15 @@
+"""Broadcast-related constants."""
+
+from enum import Enum
+
+
+class BroadcastStatus(str, Enum):
+    """Broadcast campaign status enumeration."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+ACTIVE_BROADCAST_STATUSES = (BroadcastStatus.PENDING, BroadcastStatus.RUNNING)
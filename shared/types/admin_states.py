@@ -35,6 +35,9 @@ class AdminState(str, Enum):
     EDITING_ITEM_IMAGE = "editing_item_image"
     EDITING_ITEM_CATEGORY = "editing_item_category"
     
+    # Broadcast states
+    SENDING_BROADCAST_TEXT = "sending_broadcast_text"
+    
     # Default state
     IDLE = "idle"
 
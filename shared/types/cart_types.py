@@ -0,0 +1,29 @@
+"""Cart-related types."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class CartItemChange:
+    """Cart item that no longer matches the menu."""
+
+    item_id: str
+    name: str
+    quantity: int
+    old_price: int  # Price in kopecks the item was added at
+    new_price: Optional[int] = None  # None when the item is unavailable
+
+
+@dataclass
+class CartValidationResult:
+    """Differences between cart and current menu."""
+
+    price_changes: List[CartItemChange] = field(default_factory=list)
+    unavailable: List[CartItemChange] = field(default_factory=list)
+    total: int = 0  # Total in kopecks of available items at current prices
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether cart can be ordered as it is."""
+        return not self.price_changes and not self.unavailable
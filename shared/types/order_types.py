@@ -91,4 +91,29 @@ class OrderAnalytics:
     orders_by_payment_method: dict[PaymentMethod, int]
     top_items: list[tuple[str, int]]  # (item_name, quantity)
     orders_by_hour: dict[int, int]  # Hour -> count
-    orders_by_day: dict[str, int]  # Day -> count
\ No newline at end of file
+    orders_by_day: dict[str, int]  # Day -> count
+
+
+@dataclass
+class OrderPeriodStats:
+    """Aggregated order figures for a period."""
+    
+    total_orders: int = 0
+    completed_orders: int = 0
+    revenue: int = 0  # Revenue from completed orders in kopecks
+    active_users: int = 0  # Distinct users who placed an order
+    
+    @property
+    def average_order_value(self) -> int:
+        """Average completed order value in kopecks."""
+        return self.revenue // self.completed_orders if self.completed_orders else 0
+
+
+@dataclass
+class SalesRollupEntry:
+    """Rollup totals for one (status, order type) pair over a period."""
+    
+    status: str
+    order_type: str
+    order_count: int = 0
+    revenue: int = 0  # Sum of order totals in kopecks
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""Keyset pagination types."""
+
+import base64
+import binascii
+import struct
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_EPOCH = datetime(1970, 1, 1)
+_UUID_ID = 0
+_TEXT_ID = 1
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Position in a listing ordered by (created_at, id).
+
+    Encoded as a short URL-safe token, so it fits into Telegram callback_data
+    (64 bytes) next to the action prefix.
+    """
+
+    created_at: datetime
+    id: str
+
+    def encode(self) -> str:
+        """Encode cursor to opaque token."""
+        micros = (self.created_at.replace(tzinfo=None) - _EPOCH) // timedelta(microseconds=1)
+        try:
+            parsed = uuid.UUID(self.id)
+        except ValueError:
+            parsed = None
+        # Canonical UUIDs pack into 16 bytes; anything else is kept verbatim
+        if parsed is not None and str(parsed) == self.id:
+            id_bytes = bytes([_UUID_ID]) + parsed.bytes
+        else:
+            id_bytes = bytes([_TEXT_ID]) + self.id.encode("utf-8")
+        raw = struct.pack(">q", micros) + id_bytes
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """Decode token produced by encode; raises ValueError if it is malformed."""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            (micros,) = struct.unpack(">q", raw[:8])
+            kind, id_bytes = raw[8], raw[9:]
+            if kind == _UUID_ID:
+                id_ = str(uuid.UUID(bytes=id_bytes))
+            elif kind == _TEXT_ID:
+                id_ = id_bytes.decode("utf-8")
+            else:
+                raise ValueError(f"Unknown cursor id kind: {kind}")
+            return cls(created_at=_EPOCH + timedelta(microseconds=micros), id=id_)
+        except (binascii.Error, struct.error, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid page cursor: {token!r}") from e
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing.
+
+    `next_cursor` points to older items, `prev_cursor` to newer ones;
+    either is None at the corresponding end of the listing.
+    """
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+    def map(self, func: Callable[[T], R]) -> "Page[R]":
+        """Convert page items keeping cursors."""
+        return Page([func(item) for item in self.items], self.next_cursor, self.prev_cursor)
@@ -0,0 +1,94 @@
+"""Trigram text search compatible with PostgreSQL pg_trgm."""
+
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Generic, Hashable, Iterable, List, Set, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_search_text(text: str) -> str:
+    """Lowercase text, fold ё into е and collapse everything but letters and digits into single spaces."""
+    return _NON_WORD.sub(" ", text.lower().replace("ё", "е")).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Get trigrams of text the way pg_trgm does.
+
+    Every word is padded with two spaces in front and one behind, so
+    "суп" gives {"  с", " су", "суп", "уп "}.
+    """
+    result = set()
+    for word in normalize_search_text(text).split():
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+class TrigramIndex(Generic[K]):
+    """Inverted index from trigrams to the documents containing them.
+
+    A document matches when it contains at least `threshold` of the query
+    trigrams, so a query found in a long description is not penalised for
+    the rest of the text and a typo only costs the few trigrams it touches.
+    Matches are ranked by the same share with every trigram counted at the
+    highest weight of a document field containing it.
+
+    Only documents in the posting lists of the query's rarest trigrams are
+    scored: a match must contain enough query trigrams to include at least
+    one of them. Search cost thus follows how selective the query is, not
+    how many documents are indexed.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[K, float]] = defaultdict(dict)
+        self._order: Dict[K, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def add(self, key: K, fields: Iterable[Tuple[str, float]]) -> None:
+        """Index document under key from (text, weight) fields.
+
+        Ties in search results keep the order documents were added in.
+        """
+        self._order.setdefault(key, len(self._order))
+        for text, weight in fields:
+            if not text:
+                continue
+            for trigram in trigrams(text):
+                posting = self._postings[trigram]
+                if posting.get(key, 0.0) < weight:
+                    posting[key] = weight
+
+    def search(self, query: str, threshold: float = 0.5) -> List[Tuple[K, float]]:
+        """Get (key, score) of documents containing at least threshold of the query, best first."""
+        query_trigrams = trigrams(query)
+        if not query_trigrams:
+            return []
+        total = len(query_trigrams)
+        required = max(1, math.ceil(threshold * total - 1e-9))
+        postings = sorted(
+            (self._postings[trigram] for trigram in query_trigrams if trigram in self._postings),
+            key=len,
+        )
+        if len(postings) < required:
+            return []
+
+        candidates = set().union(*postings[:len(postings) - required + 1])
+        ranked = []
+        for key in candidates:
+            hits = 0
+            score = 0.0
+            for posting in postings:
+                weight = posting.get(key)
+                if weight is not None:
+                    hits += 1
+                    score += weight
+            if hits >= required:
+                ranked.append((key, score / total))
+        ranked.sort(key=lambda result: (-result[1], self._order[result[0]]))
+        return ranked
@@ -0,0 +1,8 @@
+"""Shared pytest configuration."""
+
+import os
+
+# Required settings so modules that read configuration can be imported in tests
+os.environ.setdefault("BOT_TOKEN", "123456:test-token")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
@@ -0,0 +1,101 @@
+"""Integration tests for SQL-side statistics aggregation."""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sqlalchemy import event
+
+from domain.services.statistics_service import StatisticsService
+from infrastructure.database import connection
+from infrastructure.database.models import OrderModel, UserModel
+from infrastructure.database.repositories.analytics_repository_impl import AnalyticsRepositoryImpl
+
+DAY = datetime(2026, 2, 10)
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Provide session with three users and their orders over two days."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'analytics.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        for i, created_at in enumerate([DAY - timedelta(days=40), DAY, DAY + timedelta(hours=1)]):
+            await conn.execute(UserModel.__table__.insert().values(
+                id=f"u{i}", telegram_id=i, created_at=created_at, updated_at=created_at
+            ))
+        orders = [
+            ("o1", "u0", "delivered", "delivery", 1000, DAY + timedelta(hours=12)),
+            ("o2", "u0", "picked_up", "pickup", 3000, DAY + timedelta(hours=12, minutes=30)),
+            ("o3", "u1", "cancelled", "pickup", 5000, DAY + timedelta(hours=18)),
+            ("o4", "u1", "delivered", "delivery", 2000, DAY + timedelta(days=1, hours=9)),
+            ("o5", "u2", "pending", "delivery", 7000, DAY + timedelta(days=5)),
+        ]
+        for order_id, user_id, status, order_type, total, created_at in orders:
+            await conn.execute(OrderModel.__table__.insert().values(
+                id=order_id, user_id=user_id, status=status, order_type=order_type,
+                total=total, created_at=created_at, updated_at=created_at
+            ))
+    async with connection.get_sessionmaker()() as session:
+        yield session
+    await connection.close_database()
+
+
+def create_statistics_service(session) -> StatisticsService:
+    """Create service whose only real dependency is the analytics repository."""
+    menu_repository = Mock()
+    menu_repository.list_categories = AsyncMock(return_value=[])
+    menu_repository.list_menu_items = AsyncMock(return_value=[])
+    return StatisticsService(Mock(), Mock(), menu_repository, AnalyticsRepositoryImpl(session))
+
+
+class TestAnalyticsRepository:
+    """Test AnalyticsRepositoryImpl."""
+
+    @pytest.mark.asyncio
+    async def test_order_statistics(self, session):
+        """Test counts, revenue and buckets for a two-day period."""
+        service = create_statistics_service(session)
+        start, end = DAY, DAY + timedelta(days=2)
+
+        order_stats = await service.get_order_statistics(start, end)
+        sales_stats = await service.get_sales_statistics(start, end)
+
+        assert order_stats["total_orders"] == 4
+        assert order_stats["total_revenue"] == 6000
+        assert order_stats["average_order_value"] == 2000
+        assert order_stats["orders_by_status"] == {"delivered": 2, "picked_up": 1, "cancelled": 1}
+        assert order_stats["orders_by_type"] == {"delivery": 2, "pickup": 2}
+        assert sales_stats["sales_by_day"] == [("2026-02-10", 4000), ("2026-02-11", 2000)]
+        assert sales_stats["sales_by_hour"] == [(12, 4000), (9, 2000)]
+
+    @pytest.mark.asyncio
+    async def test_period_stats_and_user_counts(self, session):
+        """Test distinct active users and registration counts."""
+        repository = AnalyticsRepositoryImpl(session)
+
+        stats = await repository.get_order_period_stats(DAY, DAY + timedelta(days=1))
+
+        assert stats.active_users == 2
+        assert stats.completed_orders == 2
+        assert await repository.count_users() == 3
+        assert await repository.count_users(created_from=DAY) == 2
+
+    @pytest.mark.asyncio
+    async def test_dashboard_query_count_is_constant(self, session):
+        """Test dashboard issues a fixed number of aggregate queries."""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sync_engine = connection._engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", capture)
+        try:
+            await create_statistics_service(session).get_dashboard_summary()
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", capture)
+
+        assert len(statements) == 4
+        assert all("count(" in s.lower() for s in statements)
@@ -0,0 +1,199 @@
+"""Integration tests for resumable broadcasts."""
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.exceptions import TelegramForbiddenError
+
+from domain.services.broadcast_service import BroadcastService
+from infrastructure.database import connection
+from infrastructure.database.models import BroadcastCampaignModel, UserModel
+from infrastructure.database.repositories.broadcast_repository_impl import BroadcastRepositoryImpl
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.telegram.broadcaster import Broadcaster
+from infrastructure.telegram.send_queue import SendQueue
+from shared.constants.broadcast_constants import BroadcastStatus
+
+# Telegram IDs 1..30; every fifth user turned notifications off
+RECIPIENTS = [telegram_id for telegram_id in range(1, 31) if telegram_id % 5]
+BLOCKED_BY = {7, 13}
+
+
+def user_id(telegram_id: int) -> str:
+    return str(uuid.UUID(int=telegram_id))
+
+
+class BroadcastSession(BaseSession):
+    """Bot session recording recipients; some users blocked the bot."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent: List[int] = []
+        self.on_send = None
+
+    async def make_request(self, bot, method, timeout=None):
+        if self.on_send is not None:
+            await self.on_send(len(self.sent))
+        if method.chat_id in BLOCKED_BY:
+            raise TelegramForbiddenError(method=method, message="Forbidden: bot was blocked by the user")
+        self.sent.append(method.chat_id)
+        return True
+
+    async def close(self):
+        pass
+
+    async def stream_content(self, *args, **kwargs):
+        yield b""
+
+
+@pytest.fixture
+async def database(tmp_path):
+    """Provide database with 30 users."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'broadcast.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        for telegram_id in range(1, 31):
+            await conn.execute(UserModel.__table__.insert().values(
+                id=user_id(telegram_id), telegram_id=telegram_id, is_notifications_enabled=bool(telegram_id % 5)
+            ))
+    yield connection.get_sessionmaker()
+    await connection.close_database()
+
+
+async def create_campaign(session_maker, text: str = "Скидка 20% на рёбра") -> str:
+    async with session_maker() as session:
+        service = BroadcastService(BroadcastRepositoryImpl(session), UserRepositoryImpl(session))
+        campaign = await service.create_campaign(text, created_by=1)
+        await session.commit()
+    return campaign.campaign_id
+
+
+async def get_campaign(session_maker, campaign_id: str):
+    async with session_maker() as session:
+        return await BroadcastRepositoryImpl(session).get_by_id(campaign_id)
+
+
+def make_broadcaster(session: BroadcastSession, **options) -> Broadcaster:
+    queue = SendQueue(Bot("42:TEST", session=session), global_rate=1000.0, chat_rate=1000.0)
+    queue.start()
+    options.setdefault("batch_size", 4)
+    return Broadcaster(queue, **options)
+
+
+class TestBroadcast:
+    """Test broadcasts reach every recipient once and survive restarts."""
+
+    @pytest.mark.asyncio
+    async def test_campaign_sent_to_recipients(self, database):
+        """Test users with notifications off are skipped and outcomes are counted."""
+        campaign_id = await create_campaign(database)
+        session = BroadcastSession()
+        broadcaster = make_broadcaster(session, checkpoint_interval=0)
+
+        assert await broadcaster.run_pending() == 1
+        await broadcaster.send_queue.stop()
+
+        assert sorted(session.sent) == sorted(set(RECIPIENTS) - BLOCKED_BY)
+        campaign = await get_campaign(database, campaign_id)
+        assert campaign.status == BroadcastStatus.COMPLETED
+        assert campaign.total_recipients == len(RECIPIENTS)
+        assert (campaign.delivered, campaign.blocked, campaign.failed) == (len(RECIPIENTS) - 2, 2, 0)
+        assert campaign.last_user_id == user_id(RECIPIENTS[-1])
+        assert campaign.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_resume_after_last_finished_recipient(self, database):
+        """Test a paused campaign continues after the saved position."""
+        campaign_id = await create_campaign(database)
+        async with database() as db_session:
+            await db_session.execute(
+                BroadcastCampaignModel.__table__.update().values(last_user_id=user_id(20), delivered=15)
+            )
+            await db_session.commit()
+        session = BroadcastSession()
+        broadcaster = make_broadcaster(session)
+
+        await broadcaster.run_pending()
+        await broadcaster.send_queue.stop()
+
+        assert session.sent == [21, 22, 23, 24, 26, 27, 28, 29]
+        assert (await get_campaign(database, campaign_id)).delivered == 23
+
+    @pytest.mark.asyncio
+    async def test_only_stale_running_campaign_is_taken_over(self, database):
+        """Test a running campaign is left to its worker until its lease expires."""
+        campaign_id = await create_campaign(database)
+        async with database() as db_session:
+            await db_session.execute(BroadcastCampaignModel.__table__.update().values(
+                status=BroadcastStatus.RUNNING.value, updated_at=datetime.utcnow()
+            ))
+            await db_session.commit()
+        session = BroadcastSession()
+        broadcaster = make_broadcaster(session, lease_timeout=60)
+
+        assert await broadcaster.run_pending() == 0
+        broadcaster.lease_timeout = 0
+        assert await broadcaster.run_pending() == 1
+        await broadcaster.send_queue.stop()
+        assert (await get_campaign(database, campaign_id)).status == BroadcastStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_cancelled_campaign_stops(self, database):
+        """Test cancelling stops the campaign at its next checkpoint."""
+        campaign_id = await create_campaign(database)
+        session = BroadcastSession()
+
+        async def cancel_after_three(sent_count):
+            if sent_count == 3:
+                async with database() as db_session:
+                    await BroadcastRepositoryImpl(db_session).cancel(campaign_id)
+                    await db_session.commit()
+
+        session.on_send = cancel_after_three
+        broadcaster = make_broadcaster(session, checkpoint_interval=0)
+
+        assert await broadcaster.run_pending() == 0
+        await broadcaster.send_queue.stop()
+
+        assert len(session.sent) < len(RECIPIENTS) - 2
+        assert (await get_campaign(database, campaign_id)).status == BroadcastStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_shutdown_saves_progress_and_restart_resumes(self, database):
+        """Test stopping mid-campaign hands it back and the next start finishes it."""
+        campaign_id = await create_campaign(database)
+        session = BroadcastSession()
+        gate = asyncio.Event()
+
+        async def hold_after_five(sent_count):
+            if sent_count >= 5:
+                await gate.wait()
+
+        session.on_send = hold_after_five
+        broadcaster = make_broadcaster(session)
+        broadcaster.start()
+        while len(session.sent) < 5:
+            await asyncio.sleep(0.01)
+        await broadcaster.stop()
+        gate.set()
+        await broadcaster.send_queue.stop()
+
+        paused = await get_campaign(database, campaign_id)
+        assert paused.status == BroadcastStatus.PENDING
+        assert paused.last_user_id == user_id(6)
+
+        restarted = make_broadcaster(session)
+        assert await restarted.run_pending() == 1
+        await restarted.send_queue.stop()
+
+        # Sends in flight at shutdown may be repeated; nobody is skipped
+        assert set(session.sent) == set(RECIPIENTS) - BLOCKED_BY
+        finished = await get_campaign(database, campaign_id)
+        assert finished.status == BroadcastStatus.COMPLETED
+        assert finished.delivered + finished.blocked >= len(RECIPIENTS)
@@ -0,0 +1,134 @@
+"""Integration tests for upsert-based cart mutations."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+
+from domain.services.cart_service import CartService
+from infrastructure.database import connection
+from infrastructure.database.models import CartModel, CategoryModel, MenuItemModel, UserModel
+from infrastructure.database.repositories.cart_repository_impl import CartRepositoryImpl
+from infrastructure.database.repositories.menu_repository_impl import MenuRepositoryImpl
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Provide session with a user, two menu items and a cart for user u1."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'cart.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        await conn.execute(UserModel.__table__.insert().values(
+            id="u1", telegram_id=1, created_at=NOW, updated_at=NOW
+        ))
+        await conn.execute(UserModel.__table__.insert().values(
+            id="u2", telegram_id=2, created_at=NOW, updated_at=NOW
+        ))
+        await conn.execute(CategoryModel.__table__.insert().values(
+            id="c1", name="Супы", created_at=NOW, updated_at=NOW
+        ))
+        for item_id, name, price in [("m1", "Борщ", 35000), ("m2", "Солянка", 42000)]:
+            await conn.execute(MenuItemModel.__table__.insert().values(
+                id=item_id, category_id="c1", name=name, price=price, created_at=NOW, updated_at=NOW
+            ))
+        await conn.execute(CartModel.__table__.insert().values(
+            id="cart1", user_id="u1", created_at=NOW, updated_at=NOW
+        ))
+    async with connection.get_sessionmaker()() as session:
+        yield session
+    await connection.close_database()
+
+
+def capture_statements(session):
+    """Collect SQL statements executed on session's engine."""
+    statements = []
+    event.listen(
+        session.bind.sync_engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+    return statements
+
+
+class TestCartUpsert:
+    """Test CartRepositoryImpl.add_item_returning."""
+
+    @pytest.mark.asyncio
+    async def test_add_and_increment(self, session):
+        """Test repeated add increments one row and returns whole cart."""
+        repository = CartRepositoryImpl(session)
+
+        await repository.add_item_returning("u1", "m2", 1)
+        await repository.add_item_returning("u1", "m1", 2, "без сметаны")
+        cart = await repository.add_item_returning("u1", "m1", 1)
+
+        assert cart.cart_id == "cart1"
+        assert [(i.item_id, i.quantity, i.price) for i in cart.get_items_list()] == [
+            ("m2", 1, 42000), ("m1", 3, 35000)
+        ]
+        assert cart.items["m1"].comment == "без сметаны"
+        assert await repository.count_items("cart1") == 2
+
+    @pytest.mark.asyncio
+    async def test_quantity_is_capped(self, session):
+        """Test upsert never exceeds the maximum quantity."""
+        repository = CartRepositoryImpl(session)
+
+        await repository.add_item_returning("u1", "m1", 98)
+        cart = await repository.add_item_returning("u1", "m1", 5)
+
+        assert cart.items["m1"].quantity == 99
+
+    @pytest.mark.asyncio
+    async def test_missing_cart_or_item(self, session):
+        """Test nothing is written without cart or menu item."""
+        repository = CartRepositoryImpl(session)
+
+        assert await repository.add_item_returning("u2", "m1", 1) is None
+        assert await repository.add_item_returning("u1", "missing", 1) is None
+        assert await repository.count_items("cart1") == 0
+
+    @pytest.mark.asyncio
+    async def test_service_round_trips(self, session):
+        """Test adding to an existing cart takes user lookup plus upsert and read."""
+        service = CartService(CartRepositoryImpl(session), MenuRepositoryImpl(session), UserRepositoryImpl(session))
+        statements = capture_statements(session)
+
+        cart = await service.add_item_to_cart("1", "m1", 1)
+
+        assert cart.items["m1"].quantity == 1
+        # SQLite needs a separate read; PostgreSQL folds it into the upsert
+        assert len(statements) == 3
+        assert "ON CONFLICT" in statements[1]
+
+    @pytest.mark.asyncio
+    async def test_service_creates_cart(self, session):
+        """Test first add creates cart through the slow path."""
+        service = CartService(CartRepositoryImpl(session), MenuRepositoryImpl(session), UserRepositoryImpl(session))
+
+        cart = await service.add_item_to_cart("2", "m2", 2)
+
+        assert cart.user_id == "u2"
+        assert cart.items["m2"].quantity == 2
+        with pytest.raises(ValueError):
+            await service.add_item_to_cart("2", "missing", 1)
+
+    @pytest.mark.asyncio
+    async def test_postgresql_single_statement(self):
+        """Test PostgreSQL statement embeds the upsert in a CTE."""
+        session = Mock()
+        session.get_bind.return_value = Mock(dialect=postgresql.dialect())
+        session.execute = AsyncMock(return_value=Mock(all=Mock(return_value=[])))
+
+        assert await CartRepositoryImpl(session).add_item_returning("u1", "m1", 1) is None
+
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("WITH upserted AS")
+        assert "ON CONFLICT (cart_id, menu_item_id) DO UPDATE" in sql
+        assert "RETURNING" in sql
@@ -0,0 +1,117 @@
+"""Integration tests for batch cart validation at checkout."""
+
+from datetime import datetime
+
+import pytest
+
+from sqlalchemy import event, update
+
+from domain.exceptions.order_exception import CartChangedException
+from domain.services.cart_service import CartService, check_cart
+from domain.services.order_service import OrderService
+from infrastructure.cache.menu_cache import MenuCache
+from infrastructure.database import connection
+from infrastructure.database.models import CartModel, CategoryModel, MenuItemModel, UserModel
+from infrastructure.database.repositories.cached_menu_repository import CachedMenuRepository
+from infrastructure.database.repositories.cart_repository_impl import CartRepositoryImpl
+from infrastructure.database.repositories.menu_repository_impl import MenuRepositoryImpl
+from infrastructure.database.repositories.order_repository_impl import OrderRepositoryImpl
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from shared.constants.order_constants import OrderType, PaymentMethod
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Provide session for database with a cart of three menu items."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'validation.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        await conn.execute(UserModel.__table__.insert().values(
+            id="u1", telegram_id=1, created_at=NOW, updated_at=NOW
+        ))
+        await conn.execute(CategoryModel.__table__.insert().values(
+            id="c1", name="Супы", created_at=NOW, updated_at=NOW
+        ))
+        for item_id, name, price in [("m1", "Борщ", 35000), ("m2", "Солянка", 42000), ("m3", "Уха", 39000)]:
+            await conn.execute(MenuItemModel.__table__.insert().values(
+                id=item_id, category_id="c1", name=name, price=price, created_at=NOW, updated_at=NOW
+            ))
+        await conn.execute(CartModel.__table__.insert().values(
+            id="cart1", user_id="u1", created_at=NOW, updated_at=NOW
+        ))
+    async with connection.get_sessionmaker()() as session:
+        repository = CartRepositoryImpl(session)
+        for item_id in ("m1", "m2", "m3"):
+            await repository.add_item("cart1", item_id, 2)
+        await session.commit()
+        yield session
+    await connection.close_database()
+
+
+def count_queries(session) -> list:
+    """Collect statements executed on session's engine."""
+    statements = []
+    event.listen(
+        session.bind.sync_engine, "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+    return statements
+
+
+class TestCartValidation:
+    """Test cart validation against the current menu."""
+
+    @pytest.mark.asyncio
+    async def test_diff_in_one_query(self, session):
+        """Test changed and unavailable items are found with a single IN query."""
+        cart = await CartRepositoryImpl(session).get_by_id("cart1")
+        await session.execute(update(MenuItemModel).where(MenuItemModel.id == "m1").values(price=37000))
+        await session.execute(update(MenuItemModel).where(MenuItemModel.id == "m2").values(is_available=False))
+
+        statements = count_queries(session)
+        validation = await check_cart(cart, MenuRepositoryImpl(session))
+
+        assert len(statements) == 1
+        assert not validation.is_valid
+        assert [(c.item_id, c.old_price, c.new_price) for c in validation.price_changes] == [("m1", 35000, 37000)]
+        assert [c.item_id for c in validation.unavailable] == ["m2"]
+        assert validation.total == 2 * 37000 + 2 * 39000
+
+    @pytest.mark.asyncio
+    async def test_cached_lookup_loads_misses_only(self, session):
+        """Test cached items are served without a query and misses share one."""
+        repository = CachedMenuRepository(MenuRepositoryImpl(session), MenuCache())
+        await repository.get_menu_item_by_id("m1")
+
+        statements = count_queries(session)
+        items = await repository.get_menu_items_by_ids(["m3", "m1", "missing", "m2"])
+        assert [item.item_id for item in items] == ["m3", "m1", "m2"]
+        assert len(statements) == 1
+
+        await repository.get_menu_items_by_ids(["m1", "m2", "m3"])
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_checkout_refuses_changed_cart(self, session):
+        """Test order is only created once the user saw the updated cart."""
+        menu_repository = MenuRepositoryImpl(session)
+        cart_service = CartService(CartRepositoryImpl(session), menu_repository, UserRepositoryImpl(session))
+        order_service = OrderService(
+            OrderRepositoryImpl(session), CartRepositoryImpl(session), UserRepositoryImpl(session),
+            menu_repository=menu_repository
+        )
+        await session.execute(update(MenuItemModel).where(MenuItemModel.id == "m3").values(is_available=False))
+
+        with pytest.raises(CartChangedException) as error:
+            await order_service.create_order_from_cart("1", OrderType.DELIVERY, PaymentMethod.CASH)
+        assert [c.item_id for c in error.value.validation.unavailable] == ["m3"]
+
+        cart = await cart_service.get_or_create_cart(1)
+        cart = await cart_service.apply_cart_changes(cart, error.value.validation)
+        assert set(cart.items) == {"m1", "m2"}
+        assert (await cart_service.validate_cart(1)).is_valid
+
+        order = await order_service.create_order_from_cart("1", OrderType.DELIVERY, PaymentMethod.CASH)
+        assert order.total == 2 * 35000 + 2 * 42000
@@ -0,0 +1,158 @@
+"""Integration tests for DbSessionMiddleware."""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+
+from sqlalchemy import text
+
+from infrastructure.database import connection
+from infrastructure.database.pool_metrics import pool_metrics
+from infrastructure.telegram.middlewares.db_session_middleware import DbSessionMiddleware
+
+
+@pytest.fixture
+async def database(tmp_path):
+    """Initialize file-backed SQLite database."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'bot.db'}")
+    async with connection.get_sessionmaker()() as session:
+        await session.execute(text("CREATE TABLE notes (body TEXT)"))
+        await session.commit()
+    pool_metrics.reset()
+    yield
+    await connection.close_database()
+
+
+class TestDbSessionMiddleware:
+    """Test DbSessionMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_handler_without_queries_does_not_touch_pool(self, database):
+        """Test updates that never use the session do not check out a connection."""
+        data = {}
+
+        async def handler(event, data):
+            return "ok"
+
+        result = await DbSessionMiddleware()(handler, Mock(), data)
+
+        assert result == "ok"
+        assert data["session"].acquired is False
+        assert pool_metrics.peak_in_use == 0
+        assert connection.get_current_session() is None
+
+    @pytest.mark.asyncio
+    async def test_handler_writes_are_committed(self, database):
+        """Test session is opened on first use and committed on success."""
+        async def handler(event, data):
+            await data["session"].execute(text("INSERT INTO notes VALUES ('hello')"))
+
+        await DbSessionMiddleware()(handler, Mock(), {})
+
+        async with connection.get_sessionmaker()() as session:
+            rows = (await session.execute(text("SELECT body FROM notes"))).scalars().all()
+        assert rows == ["hello"]
+        assert pool_metrics.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_handler_error_rolls_back(self, database):
+        """Test writes are rolled back when handler fails."""
+        async def handler(event, data):
+            await connection.get_current_session().execute(text("INSERT INTO notes VALUES ('lost')"))
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await DbSessionMiddleware()(handler, Mock(), {})
+
+        async with connection.get_sessionmaker()() as session:
+            rows = (await session.execute(text("SELECT body FROM notes"))).scalars().all()
+        assert rows == []
+
+    @pytest.mark.asyncio
+    async def test_after_commit_step_runs_only_on_commit(self, database):
+        """Test steps queued with run_after_commit start after commit and are dropped on rollback."""
+        sent = []
+
+        async def notify(body):
+            sent.append(body)
+
+        async def handler(event, data):
+            body = data["body"]
+            await data["session"].execute(text(f"INSERT INTO notes VALUES ('{body}')"))
+            connection.run_after_commit(data["session"], lambda: notify(body))
+            assert body not in sent
+            if body == "lost":
+                raise RuntimeError("boom")
+
+        await DbSessionMiddleware()(handler, Mock(), {"body": "saved"})
+        with pytest.raises(RuntimeError):
+            await DbSessionMiddleware()(handler, Mock(), {"body": "lost"})
+        await asyncio.sleep(0)
+
+        assert sent == ["saved"]
+
+
+class TestOnCommit:
+    """Test on_commit callbacks."""
+
+    @pytest.mark.asyncio
+    async def test_callbacks_run_once_per_key_after_commit(self, database):
+        """Test callbacks wait for commit and a repeated key replaces the pending callback."""
+        calls = []
+        async with connection.get_sessionmaker()() as session:
+            await session.execute(text("INSERT INTO notes VALUES ('a')"))
+            connection.on_commit(session, lambda: calls.append("first"), key="same")
+            connection.on_commit(session, lambda: calls.append("second"), key="same")
+            connection.on_commit(session, lambda: calls.append("unkeyed"))
+            assert calls == []
+            await session.commit()
+
+        assert calls == ["second", "unkeyed"]
+
+    @pytest.mark.asyncio
+    async def test_rollback_drops_callbacks(self, database):
+        """Test callbacks of a rolled back transaction never run, later ones do."""
+        calls = []
+        async with connection.get_sessionmaker()() as session:
+            await session.execute(text("INSERT INTO notes VALUES ('a')"))
+            connection.on_commit(session, lambda: calls.append("lost"))
+            await session.rollback()
+            await session.execute(text("INSERT INTO notes VALUES ('b')"))
+            connection.on_commit(session, lambda: calls.append("saved"))
+            await session.commit()
+
+        assert calls == ["saved"]
+
+    @pytest.mark.asyncio
+    async def test_without_session(self, database):
+        """Test None means the current update's session, and no session at all runs now."""
+        calls = []
+
+        async def handler(event, data):
+            await data["session"].execute(text("INSERT INTO notes VALUES ('a')"))
+            connection.on_commit(None, lambda: calls.append("update"))
+            assert calls == []
+
+        await DbSessionMiddleware()(handler, Mock(), {})
+        connection.on_commit(None, lambda: calls.append("now"))
+
+        assert calls == ["update", "now"]
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_fail_commit(self, database):
+        """Test a failing callback is logged while the commit and other callbacks go on."""
+        calls = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        async with connection.get_sessionmaker()() as session:
+            await session.execute(text("INSERT INTO notes VALUES ('a')"))
+            connection.on_commit(session, fail)
+            connection.on_commit(session, lambda: calls.append("after"))
+            await session.commit()
+            rows = (await session.execute(text("SELECT body FROM notes"))).scalars().all()
+
+        assert calls == ["after"]
+        assert rows == ["a"]
@@ -0,0 +1,101 @@
+"""Integration tests for keyset pagination."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from infrastructure.database import connection
+from infrastructure.database.models import OrderModel, UserModel
+from infrastructure.database.repositories.order_repository_impl import OrderRepositoryImpl
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from shared.constants.order_constants import OrderStatus
+from shared.types.order_types import OrderFilters
+from shared.types.pagination import PageCursor
+
+CREATED_AT = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Provide session with 25 users and 25 pending orders.
+
+    Pairs of rows share created_at so paging has to break ties by id.
+    """
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'pages.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        for i in range(25):
+            created_at = CREATED_AT + timedelta(minutes=i // 2)
+            await conn.execute(UserModel.__table__.insert().values(
+                id=str(uuid.UUID(int=i + 1)), telegram_id=i + 1, created_at=created_at, updated_at=created_at
+            ))
+            await conn.execute(OrderModel.__table__.insert().values(
+                id=str(uuid.UUID(int=1000 + i)), user_id=str(uuid.UUID(int=1)), order_type="delivery",
+                status="pending", created_at=created_at, updated_at=created_at
+            ))
+    async with connection.get_sessionmaker()() as session:
+        yield session
+    await connection.close_database()
+
+
+class TestPageCursor:
+    """Test PageCursor encoding."""
+
+    def test_round_trip_fits_callback_data(self):
+        """Test cursor survives encoding and stays short."""
+        cursor = PageCursor(datetime(2026, 3, 4, 5, 6, 7, 890123), str(uuid.uuid4()))
+
+        token = cursor.encode()
+
+        assert PageCursor.decode(token) == cursor
+        assert len(f"orders:preparing:n:{token}") <= 64
+
+    def test_non_uuid_id(self):
+        """Test ids that are not UUIDs are kept verbatim."""
+        cursor = PageCursor(datetime(2026, 1, 1), "o1")
+
+        assert PageCursor.decode(cursor.encode()) == cursor
+
+    def test_invalid_token(self):
+        """Test malformed cursor raises ValueError."""
+        with pytest.raises(ValueError):
+            PageCursor.decode("not-a-cursor")
+
+
+class TestKeysetPagination:
+    """Test repository page listings."""
+
+    @pytest.mark.asyncio
+    async def test_orders_walk_forward_and_back(self, session):
+        """Test pages cover every order once and going back returns the same page."""
+        repo = OrderRepositoryImpl(session)
+        filters = OrderFilters(status=OrderStatus.PENDING)
+
+        pages = [await repo.list_orders_page(filters, limit=10)]
+        while pages[-1].next_cursor:
+            pages.append(await repo.list_orders_page(filters, pages[-1].next_cursor, limit=10))
+        back = await repo.list_orders_page(filters, pages[2].prev_cursor, limit=10, backward=True)
+
+        seen = [o.order_id for page in pages for o in page.items]
+        expected = await repo.list_orders(OrderFilters(status=OrderStatus.PENDING, limit=100))
+        assert [len(page.items) for page in pages] == [10, 10, 5]
+        assert len(set(seen)) == 25
+        assert [o.created_at for o in expected] == [
+            o.created_at for page in pages for o in page.items
+        ]
+        assert pages[0].prev_cursor is None
+        assert [o.order_id for o in back.items] == [o.order_id for o in pages[1].items]
+
+    @pytest.mark.asyncio
+    async def test_backward_to_start_returns_full_first_page(self, session):
+        """Test paging back past the newest rows yields the first page."""
+        repo = UserRepositoryImpl(session)
+        first = await repo.list_page(limit=10)
+        second = await repo.list_page(first.next_cursor, limit=10)
+
+        back = await repo.list_page(second.prev_cursor, limit=10, backward=True)
+
+        assert [u.user_id for u in back.items] == [u.user_id for u in first.items]
+        assert back.prev_cursor is None
+        assert back.next_cursor == first.next_cursor
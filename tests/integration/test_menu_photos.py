@@ -0,0 +1,102 @@
+"""Integration tests for Telegram file_id caching of menu images."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import SendPhoto
+
+from domain.services.menu_service import MenuService
+from infrastructure.cache.photo_cache import get_photo_cache
+from infrastructure.database import connection
+from infrastructure.database.models import CategoryModel, MenuItemModel
+from infrastructure.database.repositories.menu_repository_impl import MenuRepositoryImpl
+from infrastructure.telegram.handlers.start_handler import StartHandler
+
+NOW = datetime(2026, 1, 1, 12, 0)
+IMAGE_URL = "https://cdn.example.com/ribs.jpg"
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Provide session for database with one menu item that has a URL image."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'photos.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        await conn.execute(CategoryModel.__table__.insert().values(
+            id="c1", name="Горячее", created_at=NOW, updated_at=NOW
+        ))
+        await conn.execute(MenuItemModel.__table__.insert().values(
+            id="m1", category_id="c1", name="Ребра", price=59000, image_url=IMAGE_URL,
+            created_at=NOW, updated_at=NOW
+        ))
+    get_photo_cache().clear()
+    async with connection.get_sessionmaker()() as session:
+        yield session
+    get_photo_cache().clear()
+    await connection.close_database()
+
+
+def text_message(**kwargs) -> Mock:
+    """Create text message a callback came from."""
+    return Mock(photo=None, text="Меню", delete=AsyncMock(), **kwargs)
+
+
+def sent_photo(file_id: str) -> Mock:
+    """Create message Telegram returns for a sent photo."""
+    return Mock(photo=[Mock(file_id=f"{file_id}-thumb"), Mock(file_id=file_id)])
+
+
+class TestMenuPhotos:
+    """Test sending menu photos by file_id."""
+
+    @pytest.mark.asyncio
+    async def test_file_id_stored_after_first_upload(self, session):
+        """Test URL is uploaded once and later views send the stored file_id."""
+        repository = MenuRepositoryImpl(session)
+        menu_service = MenuService(repository)
+        handler = StartHandler()
+        message = text_message(answer_photo=AsyncMock(return_value=sent_photo("F1")))
+
+        item = await repository.get_menu_item_by_id("m1")
+        await handler.show_menu_photo(message, item, menu_service, caption="Ребра")
+        assert message.answer_photo.await_args.kwargs["photo"] == IMAGE_URL
+
+        stored = await repository.get_menu_item_by_id("m1")
+        assert stored.image_file_id == "F1"
+        assert stored.updated_at == NOW
+
+        get_photo_cache().clear()
+        await handler.show_menu_photo(message, stored, menu_service, caption="Ребра")
+        assert message.answer_photo.await_args.kwargs["photo"] == "F1"
+        assert message.answer_photo.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_file_id_is_replaced(self, session):
+        """Test file_id Telegram refuses is dropped and the URL uploaded again."""
+        repository = MenuRepositoryImpl(session)
+        await repository.set_menu_item_image_file_id("m1", IMAGE_URL, "STALE")
+        item = await repository.get_menu_item_by_id("m1")
+        error = TelegramBadRequest(method=SendPhoto(chat_id=1, photo="STALE"), message="wrong file identifier")
+        message = text_message(answer_photo=AsyncMock(side_effect=[error, sent_photo("F2")]))
+
+        await StartHandler().show_menu_photo(message, item, MenuService(repository), caption="Ребра")
+
+        assert message.answer_photo.await_args.kwargs["photo"] == IMAGE_URL
+        assert (await repository.get_menu_item_by_id("m1")).image_file_id == "F2"
+
+    @pytest.mark.asyncio
+    async def test_new_image_drops_file_id(self, session):
+        """Test file_id of a replaced image is neither kept nor stored late."""
+        repository = MenuRepositoryImpl(session)
+        await repository.set_menu_item_image_file_id("m1", IMAGE_URL, "F1")
+
+        item = await repository.get_menu_item_by_id("m1")
+        item.image_url = "https://cdn.example.com/ribs-v2.jpg"
+        await repository.update_menu_item(item)
+        assert (await repository.get_menu_item_by_id("m1")).image_file_id is None
+
+        assert await repository.set_menu_item_image_file_id("m1", IMAGE_URL, "F1") is False
+        assert (await repository.get_menu_item_by_id("m1")).image_file_id is None
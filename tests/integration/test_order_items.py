@@ -0,0 +1,76 @@
+"""Integration tests for normalized order line items."""
+
+from datetime import datetime
+
+import pytest
+
+from domain.entities.order import Order
+from domain.entities.order_item import OrderItem
+from infrastructure.database import connection
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories.order_repository_impl import OrderRepositoryImpl
+from shared.constants.order_constants import OrderStatus, OrderType
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Provide session bound to a fresh SQLite database with one user."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'orders.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        await conn.execute(UserModel.__table__.insert().values(id="user-1", telegram_id=1))
+    async with connection.get_sessionmaker()() as session:
+        yield session
+    await connection.close_database()
+
+
+def create_order(order_id: str, lines, status: OrderStatus = OrderStatus.DELIVERED) -> Order:
+    """Create delivery order with (item_id, name, price, quantity) lines."""
+    return Order(
+        order_id=order_id,
+        user_id="user-1",
+        items=[
+            OrderItem(
+                order_item_id=f"{order_id}-{position}",
+                order_id=order_id,
+                item_id=item_id,
+                name=name,
+                price=price,
+                quantity=quantity,
+            )
+            for position, (item_id, name, price, quantity) in enumerate(lines)
+        ],
+        order_type=OrderType.DELIVERY,
+        status=status,
+        created_at=datetime(2026, 1, 1, 12, 0),
+    )
+
+
+class TestOrderItems:
+    """Test order_items persistence and aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_items_round_trip(self, session):
+        """Test line items are stored as rows and read back in order."""
+        repo = OrderRepositoryImpl(session)
+
+        await repo.create(create_order("o1", [("i1", "Борщ", 35000, 2), ("i2", "Чай", 5000, 1)]))
+        session.expunge_all()
+        order = await repo.get_by_id("o1")
+
+        assert [(i.order_item_id, i.name, i.quantity) for i in order.items] == [
+            ("o1-0", "Борщ", 2),
+            ("o1-1", "Чай", 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_top_items_aggregated_in_sql(self, session):
+        """Test top items sum quantities across orders and skip cancelled ones."""
+        repo = OrderRepositoryImpl(session)
+        await repo.create(create_order("o1", [("i1", "Борщ", 35000, 2), ("i2", "Чай", 5000, 1)]))
+        await repo.create(create_order("o2", [("i2", "Чай", 5000, 4)]))
+        await repo.create(create_order("o3", [("i1", "Борщ", 35000, 10)], OrderStatus.CANCELLED))
+
+        top_items = await repo.get_top_items(limit=5)
+
+        assert top_items == [("Чай", 5, 25000), ("Борщ", 2, 70000)]
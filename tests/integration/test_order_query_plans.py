@@ -0,0 +1,172 @@
+"""Query-plan regression tests for order repository queries."""
+
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+from sqlalchemy import event
+
+from infrastructure.database import connection
+from infrastructure.database.repositories.order_repository_impl import OrderRepositoryImpl
+from shared.constants.order_constants import OrderStatus, OrderType, PaymentStatus
+from shared.types.order_types import OrderFilters
+from shared.types.pagination import PageCursor
+
+
+@pytest.fixture
+async def captured(tmp_path):
+    """Provide repository plus list of (sql, params) it sent to the database."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        await seed_statistics(conn)
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM orders" in statement:
+            statements.append((statement, parameters))
+
+    sync_engine = connection._engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    async with connection.get_sessionmaker()() as session:
+        yield OrderRepositoryImpl(session), statements
+    event.remove(sync_engine, "before_cursor_execute", capture)
+    await connection.close_database()
+
+
+# Shape of a production orders table: 100k orders, 2% still active
+ORDER_STATISTICS = {
+    None: "100000",
+    "ix_orders_created_at_id": "100000 1 1",
+    "ix_orders_user_id_created_at_id": "100000 20 1 1",
+    "ix_orders_status_created_at_id": "100000 14000 1 1",
+    "ix_orders_order_type_created_at": "100000 50000 1",
+    "ix_orders_payment_status_created_at": "100000 25000 1",
+    "ix_orders_active_created_at": "2000 1",
+}
+
+
+async def seed_statistics(conn) -> None:
+    """Give the SQLite planner table statistics instead of an empty table's defaults."""
+    await conn.exec_driver_sql("ANALYZE")
+    await conn.exec_driver_sql("DELETE FROM sqlite_stat1")
+    for index, stat in ORDER_STATISTICS.items():
+        await conn.exec_driver_sql(
+            "INSERT INTO sqlite_stat1 (tbl, idx, stat) VALUES ('orders', ?, ?)", (index, stat)
+        )
+    # Reload statistics into the planner
+    await conn.exec_driver_sql("ANALYZE sqlite_schema")
+
+
+async def explain(statement: str, parameters) -> str:
+    """Get SQLite query plan as one string."""
+    async with connection._engine.connect() as conn:
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", tuple(parameters))
+        return "\n".join(row[-1] for row in result.all())
+
+
+# Query -> (access, index) of its plan; SCAN is expected only where the
+# index is read in order up to a LIMIT or holds just the matching rows
+QUERIES = {
+    "list_orders": (
+        lambda r: r.list_orders(OrderFilters(limit=20)),
+        ("SCAN", "ix_orders_created_at_id"),
+    ),
+    "list_orders_by_status": (
+        lambda r: r.list_orders(OrderFilters(status=OrderStatus.PENDING, limit=20)),
+        ("SEARCH", "ix_orders_status_created_at_id"),
+    ),
+    "list_orders_by_user": (
+        lambda r: r.list_orders(OrderFilters(user_id="user-1")),
+        ("SEARCH", "ix_orders_user_id_created_at_id"),
+    ),
+    "list_orders_by_date": (
+        lambda r: r.list_orders(
+            OrderFilters(date_from=datetime.now() - timedelta(days=1), date_to=datetime.now())
+        ),
+        ("SEARCH", "ix_orders_created_at_id"),
+    ),
+    "get_by_user_id": (
+        lambda r: r.get_by_user_id("user-1"),
+        ("SEARCH", "ix_orders_user_id_created_at_id"),
+    ),
+    "get_orders_by_status": (
+        lambda r: r.get_orders_by_status(OrderStatus.READY),
+        ("SEARCH", "ix_orders_status_created_at_id"),
+    ),
+    "get_orders_by_type": (
+        lambda r: r.get_orders_by_type(OrderType.DELIVERY),
+        ("SEARCH", "ix_orders_order_type_created_at"),
+    ),
+    "get_orders_by_payment_status": (
+        lambda r: r.get_orders_by_payment_status(PaymentStatus.PENDING),
+        ("SEARCH", "ix_orders_payment_status_created_at"),
+    ),
+    "get_orders_by_date_range": (
+        lambda r: r.get_orders_by_date_range(datetime.now() - timedelta(days=7), datetime.now()),
+        ("SEARCH", "ix_orders_created_at_id"),
+    ),
+    "get_orders_requiring_attention": (
+        lambda r: r.get_orders_requiring_attention(),
+        ("SCAN", "ix_orders_active_created_at"),
+    ),
+    "list_orders_page_by_status": (
+        lambda r: r.list_orders_page(
+            OrderFilters(status=OrderStatus.PENDING),
+            PageCursor(datetime.now(), "00000000-0000-0000-0000-000000000001").encode(),
+        ),
+        ("SEARCH", "ix_orders_status_created_at_id"),
+    ),
+    "list_orders_page_by_user": (
+        lambda r: r.list_orders_page(
+            OrderFilters(user_id="user-1"),
+            PageCursor(datetime.now(), "00000000-0000-0000-0000-000000000001").encode(),
+            backward=True,
+        ),
+        ("SEARCH", "ix_orders_user_id_created_at_id"),
+    ),
+    "count_orders_by_status": (
+        lambda r: r.count_orders(OrderFilters(status=OrderStatus.PENDING)),
+        ("SEARCH", "ix_orders_status_created_at_id"),
+    ),
+}
+
+PLAN_ACCESS = re.compile(r"^(SEARCH|SCAN) orders USING (?:COVERING )?INDEX (\w+)")
+
+
+class TestOrderQueryPlans:
+    """Test order queries are served by indexes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", sorted(QUERIES))
+    async def test_query_uses_index(self, captured, name):
+        """Test query reads orders through its expected index."""
+        repository, statements = captured
+        query, expected = QUERIES[name]
+
+        await query(repository)
+
+        assert statements, "query did not reach the orders table"
+        for statement, parameters in statements:
+            plan = await explain(statement, parameters)
+            access = PLAN_ACCESS.match(plan)
+            assert access is not None, plan
+            assert access.groups() == expected, plan
+            if name.startswith(("list_orders_page", "get_by_user_id")):
+                # Keyset pages are read in index order, without sorting
+                assert "TEMP B-TREE" not in plan, plan
+
+    @pytest.mark.asyncio
+    async def test_attention_query_matches_partial_index(self, captured):
+        """Test active-status filter is inlined so the partial index stays usable."""
+        repository, statements = captured
+
+        await repository.get_orders_requiring_attention()
+
+        statement, parameters = statements[0]
+        forced = statement.replace("FROM orders", "FROM orders INDEXED BY ix_orders_active_created_at", 1)
+        # SQLite refuses INDEXED BY when the query does not imply the index predicate
+        plan = await explain(forced, parameters)
+        assert "ix_orders_active_created_at" in plan
@@ -0,0 +1,80 @@
+"""Integration tests for primary/replica session routing."""
+
+import pytest
+
+from sqlalchemy import text
+
+from infrastructure.database import connection
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.database.routing import primary_only, use_primary
+from tests.fixtures.test_data import create_test_user
+
+
+@pytest.fixture
+async def databases(tmp_path):
+    """Initialize primary and replica as two SQLite files with different users."""
+    primary_url = f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"
+    replica_url = f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"
+
+    for url, telegram_id in ((primary_url, 1), (replica_url, 2)):
+        await connection.init_database(url)
+        async with connection._engine.begin() as conn:
+            await conn.run_sync(connection.Base.metadata.create_all)
+            await conn.execute(
+                UserModel.__table__.insert().values(
+                    id=f"user-{telegram_id}", telegram_id=telegram_id, username=url[-10:]
+                )
+            )
+        await connection.close_database()
+
+    await connection.init_database(primary_url, replica_url)
+    yield
+    await connection.close_database()
+
+
+class TestReadReplicaRouting:
+    """Test RoutingSession."""
+
+    @pytest.mark.asyncio
+    async def test_read_only_methods_use_replica(self, databases):
+        """Test list_all reads replica while point lookups read primary."""
+        async with connection.get_sessionmaker()() as session:
+            repo = UserRepositoryImpl(session)
+
+            users = await repo.list_all()
+            primary_user = await repo.get_by_telegram_id(1)
+
+        assert [u.telegram_id for u in users] == [2]
+        assert primary_user is not None
+
+    @pytest.mark.asyncio
+    async def test_reads_after_write_use_primary(self, databases):
+        """Test a session that has written keeps reading from the primary."""
+        async with connection.get_sessionmaker()() as session:
+            repo = UserRepositoryImpl(session)
+            await repo.create(create_test_user(user_id="user-3", telegram_id=3))
+
+            users = await repo.list_all()
+
+        assert sorted(u.telegram_id for u in users) == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_explicit_primary_override(self, databases):
+        """Test use_primary and primary_only force primary reads."""
+        async with connection.get_sessionmaker()() as session:
+            repo = UserRepositoryImpl(session)
+            with primary_only():
+                assert [u.telegram_id for u in await repo.list_all()] == [1]
+
+            assert [u.telegram_id for u in await repo.list_all()] == [2]
+            use_primary(session)
+            assert [u.telegram_id for u in await repo.list_all()] == [1]
+
+    @pytest.mark.asyncio
+    async def test_raw_sql_goes_to_primary(self, databases):
+        """Test statements outside read-only methods are not routed."""
+        async with connection.get_sessionmaker()() as session:
+            rows = (await session.execute(text("SELECT telegram_id FROM users"))).scalars().all()
+
+        assert rows == [1]
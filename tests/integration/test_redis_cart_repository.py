@@ -0,0 +1,309 @@
+"""Integration tests for the Redis cart store with write-behind persistence."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sqlalchemy import func, select
+
+from domain.entities.menu_item import MenuItem
+from domain.services.cart_service import CartService, check_cart
+from domain.services.order_service import OrderService
+from infrastructure.cache.cart_store import RedisCartStore
+from infrastructure.cache.cart_write_behind import CartWriteBehind
+from infrastructure.database import connection
+from infrastructure.database.models import CartItemModel, CartModel, CategoryModel, MenuItemModel, UserModel
+from infrastructure.database.repositories.cart_repository_impl import CartRepositoryImpl
+from infrastructure.database.repositories.order_repository_impl import OrderRepositoryImpl
+from infrastructure.database.repositories.redis_cart_repository import RedisCartRepository
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from shared.constants.order_constants import OrderType, PaymentMethod
+
+NOW = datetime(2026, 1, 1, 12, 0)
+MENU = {
+    "m1": MenuItem(item_id="m1", category_id="c1", name="Борщ", price=35000),
+    "m2": MenuItem(item_id="m2", category_id="c1", name="Солянка", price=42000),
+}
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.asyncio.Redis with decode_responses."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = str(value)
+        self.ttls[key] = ex
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return key in self.data
+
+    async def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        fields = self.data.setdefault(key, {})
+        for name, item in (mapping or {field: value}).items():
+            fields[name] = str(item)
+
+    async def hsetnx(self, key, field, value):
+        fields = self.data.setdefault(key, {})
+        if field in fields:
+            return 0
+        fields[field] = str(value)
+        return 1
+
+    async def hincrby(self, key, field, amount):
+        fields = self.data.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+
+    async def eval(self, script, numkeys, *keys_and_args):
+        # Only the store's capped HINCRBY script is run
+        assert "HINCRBY" in script
+        key, field, amount, cap = keys_and_args
+        quantity = min(await self.hincrby(key, field, int(amount)), int(cap))
+        self.data[key][field] = str(quantity)
+        return quantity
+
+    async def hdel(self, key, *fields):
+        values = self.data.get(key, {})
+        return sum(values.pop(field, None) is not None for field in fields)
+
+    async def sadd(self, key, *members):
+        values = self.data.setdefault(key, set())
+        before = len(values)
+        values.update(members)
+        return len(values) - before
+
+    async def spop(self, key, count):
+        values = self.data.get(key, set())
+        return [values.pop() for _ in range(min(count, len(values)))]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them back to back on execute."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((getattr(self.redis, name), args, kwargs))
+        return queue
+
+    async def execute(self):
+        return [await command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+@pytest.fixture
+async def sessionmaker(tmp_path):
+    """Provide sessionmaker for database with user u1 (telegram_id 1) and two menu items."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'carts.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        await conn.execute(UserModel.__table__.insert().values(
+            id="u1", telegram_id=1, created_at=NOW, updated_at=NOW
+        ))
+        await conn.execute(CategoryModel.__table__.insert().values(
+            id="c1", name="Супы", created_at=NOW, updated_at=NOW
+        ))
+        for item in MENU.values():
+            await conn.execute(MenuItemModel.__table__.insert().values(
+                id=item.item_id, category_id="c1", name=item.name, price=item.price,
+                created_at=NOW, updated_at=NOW
+            ))
+    yield connection.get_sessionmaker()
+    await connection.close_database()
+
+
+@pytest.fixture
+def store():
+    """Provide Redis cart store on a fake Redis."""
+    return RedisCartStore(FakeRedis())
+
+
+def create_repository(session, store) -> RedisCartRepository:
+    """Create Redis cart repository with an in-memory menu."""
+    menu_repository = Mock()
+    menu_repository.get_menu_item_by_id = AsyncMock(side_effect=MENU.get)
+    menu_repository.get_menu_items_by_ids = AsyncMock(
+        side_effect=lambda item_ids: [MENU[item_id] for item_id in item_ids if item_id in MENU]
+    )
+    return RedisCartRepository(store, CartRepositoryImpl(session), menu_repository)
+
+
+async def count_rows(session, model) -> int:
+    """Count rows of model's table."""
+    return (await session.execute(select(func.count()).select_from(model))).scalar()
+
+
+class TestRedisCartRepository:
+    """Test RedisCartRepository and CartWriteBehind."""
+
+    @pytest.mark.asyncio
+    async def test_edits_reach_database_on_flush(self, sessionmaker, store):
+        """Test cart edits stay in Redis until the write-behind flush."""
+        async with sessionmaker() as session:
+            repository = create_repository(session, store)
+            service = CartService(repository, repository.menu_repository, UserRepositoryImpl(session))
+
+            await service.add_item_to_cart("1", "m2", 1)
+            await service.add_item_to_cart("1", "m1", 2, "без сметаны")
+            cart = await service.add_item_to_cart("1", "m1", 1)
+            await session.commit()
+
+            assert [(i.item_id, i.quantity) for i in cart.get_items_list()] == [("m2", 1), ("m1", 3)]
+            assert await count_rows(session, CartItemModel) == 0
+
+        assert await CartWriteBehind(store, lambda: sessionmaker).flush() == 1
+
+        async with sessionmaker() as session:
+            persisted = await CartRepositoryImpl(session).get_by_user_id("u1")
+            assert {i.item_id: (i.quantity, i.comment) for i in persisted.get_items_list()} == {
+                "m1": (3, "без сметаны"), "m2": (1, None)
+            }
+            assert persisted.cart_id == cart.cart_id
+
+    @pytest.mark.asyncio
+    async def test_cart_loaded_from_database_on_miss(self, sessionmaker, store):
+        """Test cart persisted earlier is served after Redis lost it."""
+        async with sessionmaker() as session:
+            await session.execute(CartModel.__table__.insert().values(
+                id="cart1", user_id="u1", created_at=NOW, updated_at=NOW
+            ))
+            await CartRepositoryImpl(session).add_item("cart1", "m1", 2)
+            await session.commit()
+
+            repository = create_repository(session, store)
+            cart = await repository.add_item_returning("u1", "m2", 1)
+
+            assert {i.item_id: i.quantity for i in cart.get_items_list()} == {"m1": 2, "m2": 1}
+            assert await store.load("cart1") is not None
+
+    @pytest.mark.asyncio
+    async def test_quantity_is_capped(self, sessionmaker, store):
+        """Test quantity never exceeds the maximum."""
+        async with sessionmaker() as session:
+            repository = create_repository(session, store)
+            service = CartService(repository, repository.menu_repository, UserRepositoryImpl(session))
+
+            await service.add_item_to_cart("1", "m1", 98)
+            cart = await service.add_item_to_cart("1", "m1", 5)
+
+            assert cart.items["m1"].quantity == 99
+            assert (await repository.get_by_id(cart.cart_id)).items["m1"].quantity == 99
+
+    @pytest.mark.asyncio
+    async def test_checkout_snapshot_and_clear(self, sessionmaker, store):
+        """Test order is built from the Redis cart and clearing it wins over a racing flush."""
+        async with sessionmaker() as session:
+            repository = create_repository(session, store)
+            service = CartService(repository, repository.menu_repository, UserRepositoryImpl(session))
+            cart = await service.add_item_to_cart("1", "m1", 2)
+            await session.commit()
+        stale = await store.load(cart.cart_id)
+
+        async with sessionmaker() as session:
+            repository = create_repository(session, store)
+            order_service = OrderService(OrderRepositoryImpl(session), repository, UserRepositoryImpl(session))
+            order = await order_service.create_order_from_cart("1", OrderType.DELIVERY, PaymentMethod.CASH)
+            assert order.total == 70000
+            assert await repository.clear_user_cart("u1") is True
+            await session.commit()
+        await store.join()
+
+        # A flush that read the cart before checkout writes it back afterwards
+        async with sessionmaker() as session:
+            await CartRepositoryImpl(session).replace(stale)
+            await session.commit()
+
+            assert await create_repository(session, store).get_by_user_id("u1") is None
+
+        await CartWriteBehind(store, lambda: sessionmaker).flush()
+        async with sessionmaker() as session:
+            assert await count_rows(session, CartModel) == 0
+
+    @pytest.mark.asyncio
+    async def test_evicted_cart_keeps_database_copy(self, sessionmaker, store):
+        """Test a cart lost from Redis without being deleted is not deleted from the database."""
+        async with sessionmaker() as session:
+            repository = create_repository(session, store)
+            service = CartService(repository, repository.menu_repository, UserRepositoryImpl(session))
+            cart = await service.add_item_to_cart("1", "m1", 2)
+            await session.commit()
+        write_behind = CartWriteBehind(store, lambda: sessionmaker)
+        await write_behind.flush()
+
+        # Edited, then evicted by Redis before the next flush
+        async with sessionmaker() as session:
+            await create_repository(session, store).add_item(cart.cart_id, "m2", 1)
+        del store.redis.data[store.cart_key(cart.cart_id)]
+
+        assert await write_behind.flush() == 0
+        async with sessionmaker() as session:
+            persisted = await CartRepositoryImpl(session).get_by_id(cart.cart_id)
+            assert persisted.items["m1"].quantity == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_checkout_keeps_cart(self, sessionmaker, store):
+        """Test the Redis cart is only dropped once clearing it commits."""
+        async with sessionmaker() as session:
+            repository = create_repository(session, store)
+            service = CartService(repository, repository.menu_repository, UserRepositoryImpl(session))
+            cart = await service.add_item_to_cart("1", "m1", 2)
+
+            assert await repository.clear_user_cart("u1") is True
+            assert await store.load(cart.cart_id) is not None
+            await session.rollback()
+        await store.join()
+
+        async with sessionmaker() as session:
+            kept = await create_repository(session, store).get_by_user_id("u1")
+            assert kept.items["m1"].quantity == 2
+
+    @pytest.mark.asyncio
+    async def test_stored_prices_follow_menu(self, sessionmaker, store, monkeypatch):
+        """Test price snapshot kept in Redis is moved to the current menu price."""
+        async with sessionmaker() as session:
+            repository = create_repository(session, store)
+            service = CartService(repository, repository.menu_repository, UserRepositoryImpl(session))
+            cart = await service.add_item_to_cart("1", "m1", 2)
+            await service.add_item_to_cart("1", "m2", 1)
+
+            monkeypatch.setitem(MENU, "m1", MenuItem(item_id="m1", category_id="c1", name="Борщ", price=36000))
+            validation = await service.validate_cart(1)
+            assert [(c.item_id, c.old_price, c.new_price) for c in validation.price_changes] == [
+                ("m1", 35000, 36000)
+            ]
+
+            cart = await service.apply_cart_changes(cart, validation)
+            assert cart.total_price == 2 * 36000 + 42000
+            assert [i.item_id for i in cart.get_items_list()] == ["m1", "m2"]
+            assert (await check_cart(cart, repository.menu_repository)).is_valid
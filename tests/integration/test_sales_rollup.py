@@ -0,0 +1,128 @@
+"""Integration tests for the incrementally maintained sales rollup."""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from domain.entities.order import Order
+from domain.services.statistics_service import StatisticsService
+from infrastructure.database import connection
+from infrastructure.database.models import OrderModel, SalesRollupModel, UserModel
+from infrastructure.database.repositories.analytics_repository_impl import AnalyticsRepositoryImpl
+from infrastructure.database.repositories.sales_rollup_repository_impl import SalesRollupRepositoryImpl
+from shared.constants.order_constants import OrderStatus, OrderType
+from shared.types.order_types import SalesRollupEntry
+from sqlalchemy import select
+
+DAY = datetime(2026, 2, 10)
+
+
+@pytest.fixture
+async def session(tmp_path):
+    """Provide session with orders over two days and an empty rollup."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'rollup.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        await conn.execute(UserModel.__table__.insert().values(
+            id="u1", telegram_id=1, created_at=DAY, updated_at=DAY
+        ))
+        orders = [
+            ("o1", "delivered", "delivery", 1000, DAY + timedelta(hours=12)),
+            ("o2", "picked_up", "pickup", 3000, DAY + timedelta(hours=12, minutes=30)),
+            ("o3", "cancelled", "pickup", 5000, DAY + timedelta(hours=18)),
+            ("o4", "delivered", "delivery", 2000, DAY + timedelta(days=1, hours=9)),
+            ("o5", "pending", "delivery", 7000, DAY + timedelta(days=5)),
+        ]
+        for order_id, status, order_type, total, created_at in orders:
+            await conn.execute(OrderModel.__table__.insert().values(
+                id=order_id, user_id="u1", status=status, order_type=order_type,
+                total=total, created_at=created_at, updated_at=created_at
+            ))
+    async with connection.get_sessionmaker()() as session:
+        yield session
+    await connection.close_database()
+
+
+def create_statistics_service(session, with_rollup: bool) -> StatisticsService:
+    """Create service reading period statistics from rollup or from orders."""
+    rollup_repository = SalesRollupRepositoryImpl(session) if with_rollup else None
+    return StatisticsService(
+        Mock(), Mock(), Mock(), AnalyticsRepositoryImpl(session), rollup_repository
+    )
+
+
+def create_order(status: OrderStatus, total: int, created_at: datetime) -> Order:
+    """Create delivery order entity."""
+    return Order(
+        order_id="new", user_id="u1", items=[], order_type=OrderType.DELIVERY,
+        status=status, total=total, created_at=created_at
+    )
+
+
+async def get_buckets(session):
+    """Get rollup rows as {(day, hour, order_type, status): (count, revenue)}."""
+    result = await session.execute(select(SalesRollupModel))
+    return {
+        (row.day.isoformat(), row.hour, row.order_type, row.status): (row.order_count, row.revenue)
+        for row in result.scalars().all()
+    }
+
+
+class TestSalesRollup:
+    """Test SalesRollupRepositoryImpl."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_order_statistics(self, session):
+        """Test rollup statistics equal ones aggregated from orders."""
+        buckets = await SalesRollupRepositoryImpl(session).rebuild()
+        start, end = DAY, DAY + timedelta(days=2)
+
+        from_rollup = create_statistics_service(session, with_rollup=True)
+        from_orders = create_statistics_service(session, with_rollup=False)
+
+        assert buckets == 5
+        assert await from_rollup.get_order_statistics(start, end) == await from_orders.get_order_statistics(start, end)
+        assert await from_rollup.get_sales_statistics(start, end) == await from_orders.get_sales_statistics(start, end)
+
+    @pytest.mark.asyncio
+    async def test_record_and_move_order(self, session):
+        """Test new order and its status changes move it between buckets."""
+        repository = SalesRollupRepositoryImpl(session)
+        order = create_order(OrderStatus.PENDING, 1500, DAY + timedelta(hours=12, minutes=10))
+
+        await repository.record_order(order)
+        order.status = OrderStatus.DELIVERED
+        await repository.move_order(order, OrderStatus.PENDING)
+
+        buckets = await get_buckets(session)
+        assert buckets[("2026-02-10", 12, "delivery", "pending")] == (0, 0)
+        assert buckets[("2026-02-10", 12, "delivery", "delivered")] == (1, 1500)
+
+        summary = await repository.summarize(DAY, DAY + timedelta(hours=23))
+        assert summary == [SalesRollupEntry("delivered", "delivery", 1, 1500)]
+        assert await repository.get_revenue_by_hour(DAY, DAY + timedelta(hours=23)) == [(12, 1500)]
+
+    @pytest.mark.asyncio
+    async def test_incremental_updates_match_rebuild(self, session):
+        """Test rebuild after incremental changes yields the same buckets."""
+        repository = SalesRollupRepositoryImpl(session)
+        await repository.rebuild()
+
+        created_at = DAY + timedelta(days=1, hours=9, minutes=5)
+        await session.execute(OrderModel.__table__.insert().values(
+            id="o6", user_id="u1", status="pending", order_type="delivery",
+            total=4000, created_at=created_at, updated_at=created_at
+        ))
+        order = create_order(OrderStatus.PENDING, 4000, created_at)
+        await repository.record_order(order)
+        await session.execute(
+            OrderModel.__table__.update().where(OrderModel.id == "o6").values(status="delivered")
+        )
+        order.status = OrderStatus.DELIVERED
+        await repository.move_order(order, OrderStatus.PENDING)
+        incremental = {key: value for key, value in (await get_buckets(session)).items() if value[0]}
+
+        await repository.rebuild(DAY + timedelta(days=1, hours=15))
+
+        assert await get_buckets(session) == incremental
@@ -1,10 +1,29 @@
 """Integration tests for Telegram handlers."""
 
+import asyncio
+from datetime import datetime
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 
-from aiogram.types import Message, CallbackQuery, User, Chat
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.types import Message, CallbackQuery, User, Chat, Update
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from domain.entities.order import Order
+from infrastructure.database import connection
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories.order_repository_impl import OrderRepositoryImpl
+from infrastructure.telegram import send_queue
+from infrastructure.telegram.bot import create_dispatcher
 from infrastructure.telegram.handlers.start_handler import StartHandler
+from shared.constants.order_constants import OrderStatus, OrderType
+
+ADMIN_TELEGRAM_ID = 900
+CUSTOMER_TELEGRAM_ID = 901
 
 
 class TestStartHandler:
@@ -98,4 +117,103 @@ class TestStartHandler:
     async def test_handle_start_command_customer(self, start_handler, mock_message):
         """Test handle start command for customer user."""
         # TODO: Implement test
-        pass
\ No newline at end of file
+        pass
+
+
+class AnsweringSession(BaseSession):
+    """Bot session answering every request locally."""
+
+    async def make_request(self, bot, method, timeout=None):
+        return True
+
+    async def close(self):
+        pass
+
+    async def stream_content(self, *args, **kwargs):
+        yield b""
+
+
+class RecordingSendQueue:
+    """Send queue recording chats messages were queued to."""
+
+    def __init__(self):
+        self.chat_ids = []
+
+    async def submit_message(self, chat_id, text, priority=None):
+        self.chat_ids.append(chat_id)
+
+
+@pytest.fixture
+async def orders(tmp_path, monkeypatch):
+    """Provide database with one confirmed order and a recording send queue."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'bot.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        await conn.execute(UserModel.__table__.insert().values(id="customer", telegram_id=CUSTOMER_TELEGRAM_ID))
+    async with connection.get_sessionmaker()() as session:
+        await OrderRepositoryImpl(session).create(Order(
+            order_id="o1",
+            user_id="customer",
+            items=[],
+            order_type=OrderType.DELIVERY,
+            status=OrderStatus.CONFIRMED,
+            created_at=datetime(2026, 1, 1, 12, 0),
+        ))
+        await session.commit()
+    queue = RecordingSendQueue()
+    monkeypatch.setattr(send_queue, "_send_queue", queue)
+    monkeypatch.setattr(get_settings(), "admin_user_ids", [ADMIN_TELEGRAM_ID])
+    yield queue
+    await connection.close_database()
+
+
+async def order_status(order_id: str) -> OrderStatus:
+    async with connection.get_sessionmaker()() as session:
+        return (await OrderRepositoryImpl(session).get_by_id(order_id)).status
+
+
+def status_callback(data: str) -> Update:
+    """Create update for admin pressing an order management button."""
+    admin = User(id=ADMIN_TELEGRAM_ID, is_bot=False, first_name="Admin")
+    return Update(update_id=1, callback_query=CallbackQuery(
+        id="1",
+        from_user=admin,
+        chat_instance="admin",
+        data=data,
+        message=Message(
+            message_id=1,
+            date=datetime(2026, 1, 1),
+            chat=Chat(id=ADMIN_TELEGRAM_ID, type="private"),
+            text="Заказ",
+        ),
+    ))
+
+
+class TestOrderStatusNotification:
+    """Test customer notifications sent for order status changes."""
+
+    @pytest.mark.asyncio
+    async def test_customer_notified_only_after_commit(self, orders):
+        """Test nothing is queued when the status change fails to commit."""
+        dispatcher = create_dispatcher()
+        bot = Bot("42:TEST", session=AnsweringSession())
+
+        def fail_commit(session):
+            raise RuntimeError("commit failed")
+
+        event.listen(Session, "before_commit", fail_commit)
+        try:
+            with pytest.raises(RuntimeError):
+                await dispatcher.feed_update(bot, status_callback("order_accept:o1"))
+        finally:
+            event.remove(Session, "before_commit", fail_commit)
+        await asyncio.sleep(0)
+
+        assert orders.chat_ids == []
+        assert await order_status("o1") == OrderStatus.CONFIRMED
+
+        await dispatcher.feed_update(bot, status_callback("order_accept:o1"))
+        await asyncio.sleep(0)
+
+        assert orders.chat_ids == [CUSTOMER_TELEGRAM_ID]
+        assert await order_status("o1") == OrderStatus.PREPARING
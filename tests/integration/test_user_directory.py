@@ -0,0 +1,114 @@
+"""Integration tests for paginated user directory queries."""
+
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from sqlalchemy import event
+
+from domain.services.user_service import UserService
+from infrastructure.database import connection
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from shared.types.user_types import UserRole, UserStatus
+
+TODAY = date(2026, 1, 2)
+NOW = datetime(2026, 1, 2, 12, 0)
+
+USERS = [
+    # telegram_id, username, first_name, last_name, role, status, created_at
+    (1, "ivan_petrov", "Иван", "Петров", "admin", "active", NOW - timedelta(days=1)),
+    (2, "anna", "Анна", "Иванова", "customer", "active", NOW - timedelta(hours=11, minutes=59)),
+    (3, None, "Пётр", None, "customer", "blocked", NOW),
+    (4, "boss", "Олег", None, "admin", "active", NOW + timedelta(hours=1)),
+    (5, "courier_5", "Семён", "Ivanov", "courier", "active", NOW + timedelta(hours=12)),
+    (6, "100%_real", None, None, "customer", "deleted", NOW - timedelta(days=3)),
+]
+
+
+@pytest.fixture
+async def service(tmp_path):
+    """Provide user service over a database with a few users on different days."""
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        for telegram_id, username, first_name, last_name, role, status, created_at in USERS:
+            await conn.execute(UserModel.__table__.insert().values(
+                id=str(uuid.UUID(int=telegram_id)), telegram_id=telegram_id, username=username,
+                first_name=first_name, last_name=last_name, role=role, status=status,
+                created_at=created_at, updated_at=created_at
+            ))
+    async with connection.get_sessionmaker()() as session:
+        yield UserService(UserRepositoryImpl(session))
+    await connection.close_database()
+
+
+def telegram_ids(page) -> list:
+    return [user.telegram_id for user in page.items]
+
+
+class TestUserDirectory:
+    """Test user directory queries filter in the database and page results."""
+
+    @pytest.mark.asyncio
+    async def test_users_by_date(self, service):
+        """Test day covers [00:00, next 00:00) and pages newest first."""
+        first = await service.get_users_by_date(TODAY, limit=2)
+        assert telegram_ids(first) == [4, 3]
+        assert first.next_cursor is not None
+
+        second = await service.get_users_by_date(TODAY, first.next_cursor, limit=2)
+        assert telegram_ids(second) == [2]
+        assert second.next_cursor is None
+        assert await service.count_users_by_date(TODAY) == 3
+
+    @pytest.mark.asyncio
+    async def test_active_and_admin_users(self, service):
+        """Test status and role filters."""
+        assert telegram_ids(await service.get_active_users()) == [5, 4, 2, 1]
+        assert telegram_ids(await service.get_admin_users()) == [4, 1]
+
+        admins = await service.user_repository.get_admins()
+        assert {user.role for user in admins} == {UserRole.ADMIN}
+
+    @pytest.mark.asyncio
+    async def test_search_users(self, service):
+        """Test case-insensitive substring search over username and names."""
+        assert telegram_ids(await service.search_users("Иван")) == [2, 1]
+        assert telegram_ids(await service.search_users("IVAN")) == [5, 1]
+        assert telegram_ids(await service.search_users("@boss")) == [4]
+        assert telegram_ids(await service.search_users("  ")) == []
+
+    @pytest.mark.asyncio
+    async def test_search_escapes_wildcards(self, service):
+        """Test % and _ in query match literally."""
+        assert telegram_ids(await service.search_users("%")) == [6]
+        assert telegram_ids(await service.search_users("0%_")) == [6]
+        assert telegram_ids(await service.search_users("r_5")) == [5]
+
+    @pytest.mark.asyncio
+    async def test_filtered_queries_use_index(self, service):
+        """Test date, role and status pages read users through an index."""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if "FROM users" in statement:
+                statements.append((statement, parameters))
+
+        sync_engine = connection._engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", capture)
+        try:
+            await service.get_users_by_date(TODAY)
+            await service.get_admin_users()
+            await service.get_active_users()
+            await service.user_repository.list_page_by_status(UserStatus.BLOCKED)
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", capture)
+
+        assert len(statements) == 4
+        async with connection._engine.connect() as conn:
+            for statement, parameters in statements:
+                result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", tuple(parameters))
+                plan = "\n".join(row[-1] for row in result.all())
+                assert "USING INDEX" in plan or "USING COVERING INDEX" in plan, plan
@@ -0,0 +1,123 @@
+"""Integration tests for telegram_id -> user resolution caches."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from sqlalchemy import event
+
+from domain.entities.user import User
+from domain.services.cart_service import CartService
+from infrastructure.cache.user_identity_cache import get_user_id_cache, user_identity_scope
+from infrastructure.database import connection
+from infrastructure.database.models import UserModel
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.telegram.middlewares.user_identity_middleware import UserIdentityMiddleware
+from shared.types.user_types import UserRole, UserStatus
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest.fixture
+async def sessionmaker(tmp_path):
+    """Provide sessionmaker for database with user u1 (telegram_id 1)."""
+    get_user_id_cache().clear()
+    await connection.init_database(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    async with connection._engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+        await conn.execute(UserModel.__table__.insert().values(
+            id="u1", telegram_id=1, created_at=NOW, updated_at=NOW
+        ))
+    yield connection.get_sessionmaker()
+    await connection.close_database()
+    get_user_id_cache().clear()
+
+
+def count_user_queries(session):
+    """Collect SELECTs on users executed on session's engine."""
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        if statement.startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", capture)
+    return statements
+
+
+class TestUserIdentityCache:
+    """Test user identity map and process-wide user ID cache."""
+
+    @pytest.mark.asyncio
+    async def test_identity_map_loads_user_once_per_update(self, sessionmaker):
+        """Test repeated lookups within one update hit the database once."""
+        async with sessionmaker() as session:
+            repository = UserRepositoryImpl(session)
+            queries = count_user_queries(session)
+
+            with user_identity_scope():
+                first = await repository.get_by_telegram_id(1)
+                second = await repository.get_by_telegram_id(1)
+                user_id = await repository.get_id_by_telegram_id(1)
+
+            assert first is second
+            assert user_id == "u1"
+            assert len(queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_user_id_cached_after_commit(self, sessionmaker):
+        """Test mapping reaches the process cache only after commit."""
+        async with sessionmaker() as session:
+            assert await UserRepositoryImpl(session).get_id_by_telegram_id(1) == "u1"
+            assert get_user_id_cache().get(1) is None
+            await session.commit()
+
+        assert get_user_id_cache().get(1) == "u1"
+
+        async with sessionmaker() as session:
+            queries = count_user_queries(session)
+            assert await UserRepositoryImpl(session).get_id_by_telegram_id(1) == "u1"
+            assert queries == []
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_user_is_not_cached(self, sessionmaker):
+        """Test user created by a rolled back transaction never enters the cache."""
+        async with sessionmaker() as session:
+            await UserRepositoryImpl(session).create(User(
+                user_id="u2", telegram_id=2, role=UserRole.CUSTOMER, status=UserStatus.ACTIVE
+            ))
+            await session.rollback()
+
+        assert get_user_id_cache().get(2) is None
+
+    @pytest.mark.asyncio
+    async def test_cart_service_resolves_user_once(self, sessionmaker):
+        """Test several cart calls in one update resolve the user once."""
+        async with sessionmaker() as session:
+            from infrastructure.database.repositories.cart_repository_impl import CartRepositoryImpl
+            service = CartService(CartRepositoryImpl(session), Mock(), UserRepositoryImpl(session))
+            queries = count_user_queries(session)
+
+            with user_identity_scope():
+                await service.get_or_create_cart(1)
+                await service.get_cart_total(1)
+                await service.clear_cart(1)
+
+            assert len(queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_middleware_exposes_known_user_id(self, sessionmaker):
+        """Test middleware fills internal_user_id from the process cache."""
+        get_user_id_cache().set(1, "u1")
+        seen = {}
+
+        async def handler(event, data):
+            seen.update(data)
+
+        await UserIdentityMiddleware()(handler, Mock(), {"user_id": 1})
+        await UserIdentityMiddleware()(handler, Mock(), {"user_id": 5})
+
+        assert seen["internal_user_id"] is None
+        await UserIdentityMiddleware()(handler, Mock(), {"user_id": 1})
+        assert seen["internal_user_id"] == "u1"
@@ -0,0 +1,98 @@
+"""Unit tests for the callback data codec."""
+
+import pytest
+from unittest.mock import Mock
+
+from infrastructure.telegram.utils.callback_codec import (
+    CallbackFilter,
+    decode_id,
+    encode_id,
+    pack_callback,
+    unpack_callback,
+)
+from infrastructure.telegram.utils.callbacks import (
+    CartAction,
+    CartCallback,
+    CategoryCallback,
+    ItemCallback,
+    MenuCallback,
+    OrderConfirmCallback,
+    OrderPaymentCallback,
+    OrderTypeCallback,
+    QuantityCallback,
+)
+from shared.constants.order_constants import OrderType, PaymentMethod
+
+ITEM_ID = "0f8fad5b-d9cb-469f-a165-70867728950e"
+
+
+class TestCallbackCodec:
+    """Test packing and unpacking callback payloads."""
+
+    @pytest.mark.parametrize("value", [ITEM_ID, "Ab3dE9xQ", "0" * 22, "~x", "00000000-0000-0000-0000-000000000000"])
+    def test_id_round_trip(self, value):
+        """Test any ID survives encoding."""
+        assert decode_id(encode_id(value)) == value
+
+    def test_uuid_is_compacted(self):
+        """Test canonical UUID takes 22 characters instead of 36."""
+        assert len(encode_id(ITEM_ID)) == 22
+        assert encode_id(ITEM_ID.upper()) == ITEM_ID.upper()
+
+    @pytest.mark.parametrize("payload", [
+        MenuCallback(),
+        CategoryCallback(ITEM_ID),
+        ItemCallback("m1"),
+        CartCallback(CartAction.EDIT),
+        CartCallback(CartAction.INC, ITEM_ID),
+        CartCallback(CartAction.ADD_CONFIRM, ITEM_ID, 99),
+        QuantityCallback(ITEM_ID, 12),
+        OrderTypeCallback(OrderType.PICKUP),
+        OrderPaymentCallback(PaymentMethod.CARD),
+        OrderConfirmCallback(),
+    ])
+    def test_payload_round_trip(self, payload):
+        """Test payloads decode to equal payloads and fit Telegram's limit."""
+        data = pack_callback(payload)
+        assert unpack_callback(data) == payload
+        assert len(data.encode()) <= 64
+
+    def test_packed_form_is_short(self):
+        """Test packed data drops field names and trailing empty values."""
+        assert pack_callback(MenuCallback()) == "menu"
+        assert pack_callback(CartCallback(CartAction.EDIT)) == "k|edit"
+        assert pack_callback(QuantityCallback("m1", 61)) == "q|m1|Z"
+
+    @pytest.mark.parametrize("data", ["", "nope", "q|m1", "q|m1|!", "k|fly", "menu|x", "q|a|1|2"])
+    def test_malformed_data_is_rejected(self, data):
+        """Test unknown or malformed data decodes to None."""
+        assert unpack_callback(data) is None
+
+    def test_value_with_separator_is_refused(self):
+        """Test encoding fails instead of producing ambiguous data."""
+        with pytest.raises(ValueError):
+            pack_callback(ItemCallback("a|b"))
+
+    @pytest.mark.parametrize("data, payload", [
+        ("category:id:c1", CategoryCallback("c1")),
+        ("item:id:m1", ItemCallback("m1")),
+        ("item:m1", ItemCallback("m1")),
+        ("quantity:m1:3", QuantityCallback("m1", 3)),
+        ("cart:action:update:item_id:m1:op:dec:ctx:cart", CartCallback(CartAction.DEC, "m1")),
+        ("cart:action:add_final:item_id:m1:quantity:2", CartCallback(CartAction.ADD_FINAL, "m1", 2)),
+        ("order:type:delivery", OrderTypeCallback(OrderType.DELIVERY)),
+        ("order:payment:cash", OrderPaymentCallback(PaymentMethod.CASH)),
+        ("order:confirm", OrderConfirmCallback()),
+    ])
+    def test_legacy_data_is_understood(self, data, payload):
+        """Test buttons sent in the old colon-separated format keep working."""
+        assert unpack_callback(data) == payload
+
+    @pytest.mark.asyncio
+    async def test_filter_passes_payload(self):
+        """Test filter matches only its payload types and hands over the payload."""
+        callback = Mock(data=pack_callback(CategoryCallback("c1")))
+
+        assert await CallbackFilter(CategoryCallback)(callback) == {"payload": CategoryCallback("c1")}
+        assert await CallbackFilter(ItemCallback, MenuCallback)(callback) is False
+        assert await CallbackFilter(CategoryCallback)(Mock(data="category_edit:c1")) is False
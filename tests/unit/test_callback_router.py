@@ -0,0 +1,116 @@
+"""Unit tests for callback routing table."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from aiogram import Router
+from aiogram.types import CallbackQuery, User
+
+from infrastructure.telegram.utils.callback_codec import pack_callback
+from infrastructure.telegram.utils.callback_router import CallbackRouter
+from infrastructure.telegram.utils.callbacks import CategoryCallback, ItemCallback
+
+
+def make_callback(data: str) -> CallbackQuery:
+    """Create callback query with given data."""
+    return CallbackQuery(
+        id="1",
+        from_user=User(id=1, is_bot=False, first_name="Test"),
+        chat_instance="1",
+        data=data,
+    )
+
+
+async def payment(callback, **kwargs):
+    pass
+
+
+async def payment_success(callback, **kwargs):
+    pass
+
+
+async def admin_open(callback, **kwargs):
+    pass
+
+
+async def admin(callback, **kwargs):
+    pass
+
+
+async def category(callback, **kwargs):
+    pass
+
+
+class TestCallbackRouter:
+    """Test CallbackRouter."""
+
+    @pytest.fixture
+    def routes(self):
+        """Create routing table registered in the order that used to shadow handlers."""
+        routes = CallbackRouter()
+        routes.prefix("payment", payment)
+        routes.prefix("payment_success", payment_success)
+        routes.exact("admin", admin_open)
+        routes.prefix("admin", admin)
+        routes.payload(category, CategoryCallback)
+        return routes
+
+    @pytest.mark.parametrize("data, handler", [
+        ("payment:create:o1", payment),
+        ("payment_success:o1", payment_success),
+        ("payment_succ", payment),
+        ("admin", admin_open),
+        ("admin:menu", admin),
+        ("category:id:c1", category),
+    ])
+    def test_most_specific_route_wins(self, routes, data, handler):
+        """Test exact match beats prefix and longer prefix beats shorter one."""
+        route, _ = routes.resolve(data)
+        assert route.callback is handler
+
+    def test_payload_route_gets_payload(self, routes):
+        """Test codec payloads are routed by type and handed over."""
+        route, extra = routes.resolve(pack_callback(CategoryCallback("c1")))
+        assert route.callback is category
+        assert extra == {"payload": CategoryCallback("c1")}
+
+    @pytest.mark.parametrize("data", ["", "pay", "cart", pack_callback(ItemCallback("m1"))])
+    def test_unrouted_data(self, routes, data):
+        """Test data without route resolves to None."""
+        assert routes.resolve(data) is None
+
+    def test_include_refuses_duplicates(self, routes):
+        """Test merging two handlers claiming the same data fails at startup."""
+        other = CallbackRouter()
+        other.prefix("payment", admin)
+        with pytest.raises(ValueError):
+            routes.include(other)
+
+    def test_include_merges_routes(self, routes):
+        """Test merged table resolves like the source tables."""
+        merged = CallbackRouter()
+        merged.include(routes)
+        for data in ["payment_success:o1", "admin", "admin:x", "category:id:c1"]:
+            assert merged.resolve(data)[0].callback is routes.resolve(data)[0].callback
+
+    @pytest.mark.asyncio
+    async def test_dispatch_through_aiogram(self):
+        """Test routed handler receives payload and middleware data."""
+        handler = AsyncMock()
+
+        async def show_category(callback, payload, session):
+            await handler(payload, session)
+
+        routes = CallbackRouter()
+        routes.payload(show_category, CategoryCallback)
+        router = Router()
+        router.callback_query.register(routes.dispatch, routes.as_filter())
+
+        async def inject_session(next_handler, event, data):
+            data["session"] = "db"
+            return await next_handler(event, data)
+
+        router.callback_query.middleware(inject_session)
+
+        await router.propagate_event("callback_query", make_callback(pack_callback(CategoryCallback("c1"))))
+        handler.assert_awaited_once_with(CategoryCallback("c1"), "db")
@@ -0,0 +1,100 @@
+"""Unit tests for database pool configuration and metrics."""
+
+import pytest
+from unittest.mock import patch
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infrastructure.database import connection
+from infrastructure.database.pool_metrics import InstrumentedAsyncQueuePool, PoolMetrics, pool_metrics
+
+
+class FakeSettings:
+    """Settings stand-in with pool options."""
+
+    database_pool_size = 5
+    database_max_overflow = 2
+    database_pool_timeout = 3.0
+    database_statement_timeout = 15000
+    database_statement_cache_size = 50
+
+
+class TestEngineOptions:
+    """Test engine option building."""
+
+    def test_postgres_options(self):
+        """Test pool sizing, statement timeout and statement cache for asyncpg."""
+        with patch.object(connection, "get_settings", return_value=FakeSettings()):
+            options = connection._engine_options("postgresql+asyncpg://u:p@localhost/db")
+
+        assert options["poolclass"] is InstrumentedAsyncQueuePool
+        assert options["pool_size"] == 5
+        assert options["max_overflow"] == 2
+        assert options["pool_timeout"] == 3.0
+        assert options["connect_args"]["prepared_statement_cache_size"] == 50
+        assert options["connect_args"]["server_settings"] == {"statement_timeout": "15000"}
+
+    def test_sqlite_has_no_pool_options(self):
+        """Test SQLite keeps its default pool."""
+        with patch.object(connection, "get_settings", return_value=FakeSettings()):
+            assert connection._engine_options("sqlite+aiosqlite:///cafe.db") == {}
+
+
+class TestPoolMetrics:
+    """Test PoolMetrics."""
+
+    def test_wait_statistics(self):
+        """Test checkout wait aggregation."""
+        metrics = PoolMetrics(slow_checkout_threshold=0.5)
+        metrics.observe_wait(0.1)
+        metrics.observe_wait(0.7)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["checkouts"] == 2
+        assert snapshot["slow_checkouts"] == 1
+        assert snapshot["wait_max_ms"] == 700.0
+        assert snapshot["wait_avg_ms"] == 400.0
+
+    @pytest.mark.asyncio
+    async def test_in_use_tracking(self, tmp_path):
+        """Test connections in use are counted through pool events."""
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=2,
+        )
+        pool_metrics.reset()
+        pool_metrics.bind(engine.sync_engine.pool)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                assert pool_metrics.in_use == 1
+            assert pool_metrics.in_use == 0
+            assert pool_metrics.peak_in_use == 1
+            assert pool_metrics.checkouts == 1
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_engines_measured_separately(self, tmp_path):
+        """Test waits and connections in use are recorded for the engine's own metrics."""
+        engines = [
+            create_async_engine(
+                f"sqlite+aiosqlite:///{tmp_path / name}",
+                poolclass=InstrumentedAsyncQueuePool,
+                pool_size=2,
+            )
+            for name in ("primary.db", "replica.db")
+        ]
+        primary, replica = PoolMetrics(), PoolMetrics()
+        primary.bind(engines[0].sync_engine.pool)
+        replica.bind(engines[1].sync_engine.pool)
+        try:
+            async with engines[1].connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                assert (primary.in_use, replica.in_use) == (0, 1)
+            assert (primary.checkouts, replica.checkouts) == (0, 1)
+        finally:
+            for engine in engines:
+                await engine.dispose()
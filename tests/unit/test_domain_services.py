@@ -370,10 +370,4 @@ class TestNotificationService:
     async def test_send_courier_notification(self, notification_service):
         """Test send courier notification."""
         # TODO: Implement test
-        pass
-    
-    @pytest.mark.asyncio
-    async def test_send_promotion_notification(self, notification_service):
-        """Test send promotion notification."""
-        # TODO: Implement test
         pass
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""Unit tests for inline mode menu search."""
+
+from typing import List
+
+import pytest
+
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import AnswerInlineQuery
+from aiogram.types import InlineQuery, User
+
+from domain.entities.menu_item import MenuItem
+from domain.services.menu_service import MenuService
+from domain.value_objects.menu_snapshot import MenuSnapshot
+from infrastructure.cache.inline_result_cache import InlineResultCache
+from infrastructure.cache.menu_cache import MenuCache
+from infrastructure.telegram.handlers import inline_search_handler
+from infrastructure.telegram.handlers.inline_search_handler import InlineSearchHandler
+from infrastructure.telegram.utils.message_formatter import MessageFormatter
+
+ITEMS = [
+    MenuItem(item_id="i1", category_id="c1", name="Рёбра BBQ", price=59000, sort_order=1,
+             image_url="https://cdn.example.com/ribs.jpg"),
+    MenuItem(item_id="i2", category_id="c1", name="Борщ", price=35000, description="Со сметаной", sort_order=2),
+]
+
+
+class AnswerSession(BaseSession):
+    """Bot session recording inline query answers."""
+
+    def __init__(self):
+        super().__init__()
+        self.answers: List[AnswerInlineQuery] = []
+
+    async def make_request(self, bot, method, timeout=None):
+        self.answers.append(method)
+        return True
+
+    async def close(self):
+        pass
+
+    async def stream_content(self, *args, **kwargs):
+        yield b""
+
+
+@pytest.fixture
+def inline(monkeypatch):
+    """Provide function running an inline query against a menu snapshot."""
+    session = AnswerSession()
+    bot = Bot("42:TEST", session=session)
+    menu_cache = MenuCache(max_entries=100, ttl=60)
+    state = {"items": ITEMS, "loads": 0}
+
+    async def fake_menu_service(data=None):
+        state["loads"] += 1
+        return MenuService(None, MenuSnapshot(menu_cache.version, [], state["items"]))
+
+    monkeypatch.setattr(inline_search_handler, "get_menu_service", fake_menu_service)
+    monkeypatch.setattr(
+        inline_search_handler, "get_inline_result_cache", lambda: InlineResultCache(menu_cache)
+    )
+    handler = InlineSearchHandler()
+
+    async def run(query: str, offset: str = "") -> AnswerInlineQuery:
+        inline_query = InlineQuery(
+            id="q1", from_user=User(id=1, is_bot=False, first_name="Анна"), query=query, offset=offset
+        ).as_(bot)
+        await handler.handle_inline_query(inline_query)
+        return session.answers[-1]
+
+    run.menu_cache = menu_cache
+    run.state = state
+    return run
+
+
+class TestInlineSearch:
+    """Test inline query answers."""
+
+    @pytest.mark.asyncio
+    async def test_answer_is_cacheable_item_card(self, inline):
+        """Test matching item is answered with its card and a shared cache_time."""
+        answer = await inline("борш")
+
+        assert [result.id for result in answer.results] == ["i2"]
+        result = answer.results[0]
+        assert result.title == "Борщ"
+        assert result.input_message_content.message_text == MessageFormatter.format_menu_item(ITEMS[1])
+        assert answer.cache_time == 300
+        assert answer.is_personal is False
+        assert answer.next_offset == ""
+
+    @pytest.mark.asyncio
+    async def test_results_built_once_per_menu_version(self, inline, monkeypatch):
+        """Test results are reused until the menu changes."""
+        built = []
+        original = InlineSearchHandler.build_menu_item_result
+        monkeypatch.setattr(
+            InlineSearchHandler, "build_menu_item_result",
+            staticmethod(lambda item: built.append(item.item_id) or original(item)),
+        )
+
+        first = await inline("ребра")
+        await inline("борщ")
+        assert sorted(built) == ["i1", "i2"]
+        assert first.results[0].thumbnail_url == "https://cdn.example.com/ribs.jpg"
+
+        inline.menu_cache.bump_version()
+        await inline("борщ")
+        assert len(built) == 4
+
+    @pytest.mark.asyncio
+    async def test_empty_query_pages_through_menu(self, inline):
+        """Test empty query lists the menu 50 results at a time."""
+        inline.state["items"] = [
+            MenuItem(item_id=f"m{i}", category_id="c1", name=f"Блюдо {i}", price=10000, sort_order=i)
+            for i in range(60)
+        ]
+
+        first = await inline("")
+        second = await inline("", first.next_offset)
+
+        assert len(first.results) == 50 and first.next_offset == "50"
+        assert [result.id for result in second.results] == [f"m{i}" for i in range(50, 60)]
+        assert second.next_offset == ""
@@ -0,0 +1,83 @@
+"""Unit tests for cached menu keyboards."""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+
+from aiogram import Bot
+from aiogram.methods import SendMessage
+
+from domain.entities.category import Category
+from infrastructure.cache.keyboard_cache import KeyboardCache
+from infrastructure.cache.menu_cache import MenuCache
+from infrastructure.telegram.keyboards.cached_markup import CachedInlineKeyboardMarkup
+from infrastructure.telegram.keyboards.menu_keyboard import MenuKeyboard
+from infrastructure.telegram.session import CachedMarkupSession
+
+CATEGORIES = [Category(category_id="c1", name="Супы"), Category(category_id="c2", name="Салаты")]
+
+
+class TestKeyboardCache:
+    """Test KeyboardCache."""
+
+    @pytest.fixture
+    def build(self):
+        """Create keyboard builder counting its calls."""
+        return AsyncMock(side_effect=lambda: MenuKeyboard.get_categories_keyboard(CATEGORIES))
+
+    @pytest.mark.asyncio
+    async def test_keyboard_built_once_per_menu_version(self, build):
+        """Test keyboard is reused until the menu version changes."""
+        menu_cache = MenuCache(max_entries=100, ttl=60)
+        cache = KeyboardCache(menu_cache)
+
+        first = await cache.get_or_build(("categories",), build)
+        assert await cache.get_or_build(("categories",), build) is first
+        assert isinstance(first, CachedInlineKeyboardMarkup)
+        assert build.await_count == 1
+
+        menu_cache.bump_version()
+        assert await cache.get_or_build(("categories",), build) is not first
+        assert build.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_keyboard_not_cached(self):
+        """Test empty screens are rebuilt on every call."""
+        cache = KeyboardCache(MenuCache(max_entries=100, ttl=60))
+        build = AsyncMock(return_value=None)
+
+        assert await cache.get_or_build(("categories",), build) is None
+        assert await cache.get_or_build(("categories",), build) is None
+        assert build.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_builds_every_time(self, build):
+        """Test nothing is memoized when menu caching is off."""
+        cache = KeyboardCache(MenuCache(max_entries=100, ttl=60), enabled=False)
+
+        await cache.get_or_build(("categories",), build)
+        await cache.get_or_build(("categories",), build)
+        assert build.await_count == 2
+
+
+class TestCachedMarkupSession:
+    """Test CachedMarkupSession."""
+
+    def test_sends_stored_json(self):
+        """Test cached keyboard is sent as the JSON aiogram would produce, serialized once."""
+        session = CachedMarkupSession()
+        bot = Bot("42:TEST", session=session)
+        markup = MenuKeyboard.get_categories_keyboard(CATEGORIES)
+        cached = CachedInlineKeyboardMarkup.from_markup(markup)
+
+        expected = session.prepare_value(markup, bot=bot, files={})
+        fields = {}
+        for _ in range(2):
+            form = session.build_form_data(bot, SendMessage(chat_id=1, text="Меню", reply_markup=cached))
+            fields = {options["name"]: value for options, _, value in form._fields}
+
+        assert fields["reply_markup"] == expected
+        assert json.loads(fields["reply_markup"])["inline_keyboard"][0][0]["callback_data"] == "c|c1"
+        assert fields["text"] == "Меню"
+        assert cached.serialized(session, bot) is fields["reply_markup"]
@@ -0,0 +1,106 @@
+"""Unit tests for menu caching."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from domain.entities.category import Category
+from domain.entities.menu_item import MenuItem
+from infrastructure.cache.menu_cache import MenuCache
+from infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from infrastructure.database.repositories.cached_menu_repository import CachedMenuRepository
+
+
+class TestTTLLRUCache:
+    """Test TTLLRUCache."""
+
+    def test_entry_expires_after_ttl(self):
+        """Test entries are dropped once TTL passes."""
+        now = [100.0]
+        cache = TTLLRUCache(max_entries=10, ttl=5, clock=lambda: now[0])
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        now[0] += 5
+        assert cache.get("key") is None
+
+    def test_least_recently_used_is_evicted(self):
+        """Test LRU eviction when cache is full."""
+        cache = TTLLRUCache(max_entries=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+class TestCachedMenuRepository:
+    """Test CachedMenuRepository."""
+
+    @pytest.fixture
+    def inner_repo(self):
+        """Create mocked menu repository."""
+        repo = Mock()
+        repo.session = None
+        repo.list_categories = AsyncMock(return_value=[Category(category_id="c1", name="Супы")])
+        repo.get_menu_items_by_category = AsyncMock(return_value=[
+            MenuItem(item_id="i1", category_id="c1", name="Борщ", price=35000)
+        ])
+        repo.get_menu_item_by_id = AsyncMock(return_value=None)
+        repo.update_menu_item = AsyncMock(side_effect=lambda item: item)
+        return repo
+
+    @pytest.fixture
+    def repo(self, inner_repo):
+        """Create cached repository."""
+        return CachedMenuRepository(inner_repo, MenuCache(max_entries=100, ttl=60))
+
+    @pytest.mark.asyncio
+    async def test_reads_are_served_from_cache(self, repo, inner_repo):
+        """Test repeated reads hit the wrapped repository once."""
+        await repo.list_categories()
+        categories = await repo.list_categories()
+
+        assert categories[0].name == "Супы"
+        assert inner_repo.list_categories.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_category_listing_warms_item_lookup(self, repo, inner_repo):
+        """Test items loaded by category are reused for item lookup."""
+        await repo.get_menu_items_by_category("c1")
+        item = await repo.get_menu_item_by_id("i1")
+
+        assert item.name == "Борщ"
+        inner_repo.get_menu_item_by_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_write_bumps_version(self, repo, inner_repo):
+        """Test menu writes invalidate cached reads."""
+        items = await repo.get_menu_items_by_category("c1")
+        version = repo.cache.version
+
+        await repo.update_menu_item(items[0])
+        await repo.get_menu_items_by_category("c1")
+
+        assert repo.cache.version > version
+        assert inner_repo.get_menu_items_by_category.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_returned_entities_are_copies(self, repo):
+        """Test mutating a returned entity does not change cached state."""
+        items = await repo.get_menu_items_by_category("c1")
+        items[0].is_available = False
+
+        items = await repo.get_menu_items_by_category("c1")
+        assert items[0].is_available is True
+
+    def test_value_loaded_under_old_version_is_discarded(self):
+        """Test a read racing with a write is not cached."""
+        cache = MenuCache()
+        version = cache.version
+        cache.bump_version()
+        cache.set("categories", ["stale"], version)
+
+        assert cache.get("categories") is None
@@ -0,0 +1,116 @@
+"""Unit tests for menu search."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from sqlalchemy.dialects import postgresql
+
+from domain.entities.menu_item import MenuItem
+from domain.value_objects.menu_search_index import MenuSearchIndex
+from domain.value_objects.menu_snapshot import MenuSnapshot
+from infrastructure.cache.menu_cache import MenuCache
+from infrastructure.database.repositories.cached_menu_repository import CachedMenuRepository
+from infrastructure.database.repositories.menu_repository_impl import MenuRepositoryImpl
+from shared.utils.text_search import TrigramIndex, normalize_search_text, trigrams
+
+ITEMS = [
+    MenuItem(item_id="i1", category_id="c1", name="Рёбра BBQ", price=59000, sort_order=1),
+    MenuItem(item_id="i2", category_id="c1", name="Крылышки", price=39000, description="С соусом из рёбрышек",
+             sort_order=2),
+    MenuItem(item_id="i3", category_id="c2", name="Борщ", price=35000, sort_order=3),
+    MenuItem(item_id="i4", category_id="c2", name="Щи", price=30000, sort_order=4, is_available=False),
+]
+
+
+def names(items) -> list:
+    return [item.name for item in items]
+
+
+class TestTextSearch:
+    """Test trigram text search helpers."""
+
+    def test_normalize(self):
+        """Test case, ё and punctuation are folded."""
+        assert normalize_search_text("  Рёбра-BBQ!  ") == "ребра bbq"
+
+    def test_trigrams_match_pg_trgm(self):
+        """Test words are padded like pg_trgm pads them."""
+        assert trigrams("Суп") == {"  с", " су", "суп", "уп "}
+
+    def test_typo_scores_below_exact_match(self):
+        """Test a typo costs only the trigrams it touches."""
+        index = TrigramIndex()
+        index.add("ribs", [("ребра", 1.0)])
+        index.add("soup", [("суп", 1.0)])
+
+        assert index.search("ребра") == [("ribs", 1.0)]
+        [(key, score)] = index.search("рбра")
+        assert key == "ribs" and 0.5 <= score < 1.0
+
+
+class TestMenuSearchIndex:
+    """Test in-process menu search."""
+
+    def test_ranked_name_before_description(self):
+        """Test name matches rank above description matches; ё and case are ignored."""
+        index = MenuSearchIndex(ITEMS)
+
+        assert names(index.search("ребра")) == ["Рёбра BBQ", "Крылышки"]
+        assert names(index.search("РЕБРА")) == ["Рёбра BBQ", "Крылышки"]
+
+    def test_typo_tolerated(self):
+        """Test misspelled query still finds the item."""
+        assert names(MenuSearchIndex(ITEMS).search("боршь")) == ["Борщ"]
+
+    def test_active_only_and_limit(self):
+        """Test unavailable items are skipped unless asked for, and results are limited."""
+        index = MenuSearchIndex(ITEMS)
+
+        assert index.search("щи") == []
+        assert names(index.search("щи", active_only=False)) == ["Щи"]
+        assert names(index.search("ребра", limit=1)) == ["Рёбра BBQ"]
+
+    def test_snapshot_search(self):
+        """Test snapshot answers searches from its own index."""
+        snapshot = MenuSnapshot(1, [], ITEMS)
+
+        results = snapshot.search_menu_items("крылышки")
+        results[0].name = "changed"
+
+        assert names(snapshot.search_menu_items("крылышки")) == ["Крылышки"]
+
+
+class TestRepositorySearch:
+    """Test repository search paths."""
+
+    @pytest.mark.asyncio
+    async def test_cached_index_built_once_per_version(self):
+        """Test cached menu is indexed once and rebuilt after a menu write."""
+        inner_repo = Mock(session=None)
+        inner_repo.list_menu_items = AsyncMock(return_value=ITEMS)
+        repo = CachedMenuRepository(inner_repo, MenuCache(max_entries=100, ttl=60))
+
+        assert names(await repo.search_menu_items("борщ")) == ["Борщ"]
+        assert names(await repo.search_menu_items("ребра")) == ["Рёбра BBQ", "Крылышки"]
+        assert inner_repo.list_menu_items.await_count == 1
+
+        repo.cache.bump_version()
+        await repo.search_menu_items("борщ")
+        assert inner_repo.list_menu_items.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_postgresql_query_uses_trigram_indexes(self):
+        """Test PostgreSQL search uses the indexed expression and word similarity."""
+        session = Mock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        session.execute = AsyncMock(return_value=Mock(scalars=Mock(return_value=Mock(all=Mock(return_value=[])))))
+
+        await MenuRepositoryImpl(session).search_menu_items("Рёбра", limit=10)
+
+        statement = session.execute.await_args.args[0]
+        compiled = statement.compile(dialect=postgresql.dialect())
+        # Inlined translate() arguments match the index expression; %% is the escaped %> operator
+        assert "translate(menu_items.name, 'Ёё', 'Ее') %%> %(translate_1)s" in str(compiled)
+        assert "ORDER BY greatest(word_similarity(" in str(compiled)
+        assert compiled.params["translate_1"] == "ребра"
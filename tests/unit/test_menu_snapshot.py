@@ -0,0 +1,142 @@
+"""Unit tests for shared menu snapshots."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from domain.entities.category import Category
+from domain.entities.menu_item import MenuItem
+from domain.services.menu_service import MenuService
+from domain.value_objects.menu_snapshot import MenuSnapshot
+from infrastructure.cache.menu_cache import MenuCache
+from infrastructure.cache.menu_snapshot_store import RedisMenuSnapshotStore
+from infrastructure.cache.menu_snapshot_sync import MenuSnapshotSync
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.data = {}
+        self.published = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    async def expire(self, key, seconds):
+        return key in self.data
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+def create_snapshot(version: int = 1) -> MenuSnapshot:
+    """Create snapshot with one active and one hidden item."""
+    return MenuSnapshot(
+        version=version,
+        categories=[
+            Category(category_id="c2", name="Напитки", sort_order=2),
+            Category(category_id="c1", name="Супы", sort_order=1),
+        ],
+        menu_items=[
+            MenuItem(item_id="i1", category_id="c1", name="Борщ", price=35000),
+            MenuItem(item_id="i2", category_id="c1", name="Солянка", price=40000, is_available=False),
+        ],
+    )
+
+
+class TestMenuSnapshot:
+    """Test MenuSnapshot."""
+
+    def test_lookups(self):
+        """Test snapshot ordering and filters."""
+        snapshot = create_snapshot()
+
+        assert [c.category_id for c in snapshot.list_categories()] == ["c1", "c2"]
+        assert [i.item_id for i in snapshot.list_menu_items("c1")] == ["i1"]
+        assert len(snapshot.list_menu_items("c1", active_only=False)) == 2
+        assert snapshot.get_menu_item("i2").name == "Солянка"
+        assert snapshot.get_menu_item("missing") is None
+
+    def test_serialization_round_trip(self):
+        """Test snapshot survives JSON serialization."""
+        snapshot = RedisMenuSnapshotStore.loads(RedisMenuSnapshotStore.dumps(create_snapshot(7)))
+
+        assert snapshot.version == 7
+        assert snapshot.get_category("c1").name == "Супы"
+        assert snapshot.get_menu_item("i1").price == 35000
+
+
+class TestMenuSnapshotSync:
+    """Test MenuSnapshotSync."""
+
+    @pytest.mark.asyncio
+    async def test_replica_loads_published_snapshot(self):
+        """Test a snapshot published by one replica is loaded by another."""
+        redis = FakeRedis()
+        store = RedisMenuSnapshotStore(redis)
+        version = await store.next_version()
+        await store.publish(create_snapshot(version))
+
+        replica = MenuSnapshotSync(RedisMenuSnapshotStore(redis), MenuCache())
+        await replica.refresh()
+
+        assert replica.snapshot.version == version
+        assert redis.published == [(store.channel, str(version))]
+
+    @pytest.mark.asyncio
+    async def test_latest_lookup_skips_unfinished_version(self):
+        """Test a reserved but unpublished version falls back to the previous one."""
+        store = RedisMenuSnapshotStore(FakeRedis())
+        await store.publish(create_snapshot(await store.next_version()))
+        await store.next_version()
+
+        snapshot = await store.load_latest()
+
+        assert snapshot.version == 1
+
+    def test_older_snapshot_is_ignored(self):
+        """Test snapshots never go back in version."""
+        sync = MenuSnapshotSync(RedisMenuSnapshotStore(FakeRedis()), MenuCache())
+
+        assert sync.apply(create_snapshot(2)) is True
+        assert sync.apply(create_snapshot(1)) is False
+        assert sync.snapshot.version == 2
+
+    def test_local_write_drops_snapshot(self):
+        """Test a local menu write makes reads fall back to the repository."""
+        cache = MenuCache()
+        sync = MenuSnapshotSync(RedisMenuSnapshotStore(FakeRedis()), cache)
+        sync.apply(create_snapshot(1))
+
+        cache.bump_version()
+
+        assert sync.snapshot is None
+
+
+class TestMenuServiceWithSnapshot:
+    """Test MenuService reads from snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_touch_repository(self):
+        """Test MenuService answers reads from snapshot."""
+        repo = Mock()
+        repo.list_categories = AsyncMock()
+        repo.get_menu_item_by_id = AsyncMock()
+        service = MenuService(repo, create_snapshot())
+
+        categories = await service.get_categories()
+        item = await service.get_menu_item("i1")
+        items = await service.get_menu_items("c1")
+
+        assert len(categories) == 2
+        assert item.name == "Борщ"
+        assert [i.item_id for i in items] == ["i1"]
+        repo.list_categories.assert_not_awaited()
+        repo.get_menu_item_by_id.assert_not_awaited()
@@ -0,0 +1,73 @@
+"""Unit tests for rendered message caching."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from domain.entities.cart import Cart
+from domain.entities.menu_item import MenuItem
+from infrastructure.telegram.utils.message_formatter import MessageFormatter
+
+
+def make_item(item_id: str, price: int = 25000, updated_at: datetime = datetime(2024, 1, 1)) -> MenuItem:
+    """Create menu item."""
+    return MenuItem(
+        item_id=item_id,
+        category_id="c1",
+        name=f"Ребра {item_id}",
+        price=price,
+        weight="350 г",
+        updated_at=updated_at,
+    )
+
+
+class TestMessageFormatterCache:
+    """Test memoized MessageFormatter rendering."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with empty caches."""
+        MessageFormatter.clear_cache()
+        yield
+        MessageFormatter.clear_cache()
+
+    def test_menu_item_card_keyed_by_updated_at(self):
+        """Test card is reused until the item changes."""
+        item = make_item("m1")
+        card = MessageFormatter.format_menu_item(item)
+
+        assert MessageFormatter.format_menu_item(make_item("m1")) is card
+        assert card == "<b>Ребра m1</b>\n\n💰 <b>Цена:</b> 250 ₽\n⚖️ <b>Вес:</b> 350 г"
+
+        item.name = "Ребра BBQ"
+        item.updated_at = datetime(2024, 1, 2)
+        assert MessageFormatter.format_menu_item(item).startswith("<b>Ребра BBQ</b>")
+
+    def test_cart_message(self):
+        """Test cart text is unchanged by line caching."""
+        cart = Cart(cart_id="k1", user_id="u1")
+        cart.add_item(make_item("m1"), 2)
+        cart.add_item(make_item("m2", price=9950), 1, comment="без лука")
+
+        assert MessageFormatter.format_cart_message(cart) == (
+            "🛒 <b>Ваша корзина:</b>\n\n"
+            "• <b>Ребра m1</b>\n  Количество: 2\n  Цена: 500 ₽\n\n"
+            "• <b>Ребра m2</b>\n  Количество: 1\n  Цена: 99.50 ₽\n  Комментарий: без лука\n\n"
+            "💰 <b>Итого:</b> 599.50 ₽"
+        )
+
+    def test_quantity_change_renders_one_line(self):
+        """Test only the changed line is rendered again."""
+        cart = Cart(cart_id="k1", user_id="u1")
+        for index in range(20):
+            cart.add_item(make_item(f"m{index}"), 1)
+        MessageFormatter.format_cart_message(cart)
+
+        cart.update_item_quantity("m7", 3)
+        with patch.object(MessageFormatter, "_render_cart_line", wraps=MessageFormatter._render_cart_line) as render:
+            text = MessageFormatter.format_cart_message(cart)
+
+        assert render.call_count == 1
+        assert "Количество: 3\n  Цена: 750 ₽" in text
+        assert text.endswith("💰 <b>Итого:</b> 5 500 ₽")
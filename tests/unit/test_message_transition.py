@@ -0,0 +1,112 @@
+"""Unit tests for message transitions and Bot API call accounting."""
+
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import Chat, Message, PhotoSize
+
+from infrastructure.telegram.api_metrics import ApiCallCounter, api_call_metrics, api_call_scope
+from infrastructure.telegram.utils.message_transition import MessageTransition
+
+PHOTO = [PhotoSize(file_id="F1", file_unique_id="U1", width=800, height=600)]
+
+
+class RecordingSession(BaseSession):
+    """Bot session answering every request locally."""
+
+    def __init__(self, errors: List[str] = ()):
+        super().__init__()
+        self.errors = list(errors)
+        self.middleware(ApiCallCounter())
+
+    async def make_request(self, bot, method, timeout=None):
+        if self.errors:
+            raise TelegramBadRequest(method=method, message=self.errors.pop(0))
+        if method.__returning__ is not Message:
+            return True
+        photo = PHOTO if getattr(method, "photo", None) or getattr(method, "media", None) else None
+        return Message(
+            message_id=2,
+            date=datetime(2026, 1, 1),
+            chat=Chat(id=1, type="private"),
+            text=None if photo else getattr(method, "text", None),
+            photo=photo,
+        )
+
+    async def close(self):
+        pass
+
+    async def stream_content(self, *args, **kwargs):
+        yield b""
+
+
+def make_message(bot: Bot, photo: bool) -> Message:
+    """Create bot message the user pressed a button on."""
+    return Message(
+        message_id=1,
+        date=datetime(2026, 1, 1),
+        chat=Chat(id=1, type="private"),
+        text=None if photo else "Меню",
+        photo=PHOTO if photo else None,
+        caption="Ребра" if photo else None,
+    ).as_(bot)
+
+
+async def transition(current_photo: bool, target: str, errors: List[str] = (), **kwargs) -> List[str]:
+    """Run one screen transition and get Bot API methods it called."""
+    bot = Bot("42:TEST", session=RecordingSession(errors))
+    message = make_message(bot, current_photo)
+    with api_call_scope() as calls:
+        if target == "photo":
+            await MessageTransition.show_photo(message, "F2", "Ребра", **kwargs)
+        else:
+            await MessageTransition.show_text(message, "Корзина", **kwargs)
+    return calls
+
+
+class TestMessageTransition:
+    """Test the Bot API calls each screen transition costs."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("current_photo, target, kwargs, expected", [
+        (False, "text", {}, ["editMessageText"]),
+        (False, "text", {"keep_media": False}, ["editMessageText"]),
+        (True, "photo", {}, ["editMessageMedia"]),
+        (True, "text", {}, ["editMessageCaption"]),
+        (True, "text", {"keep_media": False}, ["deleteMessage", "sendMessage"]),
+        (False, "photo", {}, ["deleteMessage", "sendPhoto"]),
+    ])
+    async def test_minimal_calls(self, current_photo, target, kwargs, expected):
+        """Test every transition uses one edit where Telegram allows it."""
+        assert await transition(current_photo, target, **kwargs) == expected
+
+    @pytest.mark.asyncio
+    async def test_not_modified_is_done(self):
+        """Test pressing a button that shows the same screen costs nothing more."""
+        calls = await transition(False, "text", errors=["Bad Request: message is not modified"])
+        assert calls == ["editMessageText"]
+
+    @pytest.mark.asyncio
+    async def test_failed_edit_resends(self):
+        """Test message that can no longer be edited is replaced."""
+        calls = await transition(True, "photo", errors=["Bad Request: message can't be edited"])
+        assert calls == ["editMessageMedia", "deleteMessage", "sendPhoto"]
+
+    def test_metrics_per_update(self):
+        """Test calls are aggregated per update."""
+        api_call_metrics.reset()
+        for calls in (["editMessageText", "answerCallbackQuery"], ["editMessageMedia"]):
+            for method in calls:
+                api_call_metrics.observe_call(method)
+            api_call_metrics.observe_update(len(calls))
+
+        snapshot = api_call_metrics.snapshot()
+        assert snapshot["calls_per_update_avg"] == 1.5
+        assert snapshot["calls_per_update"] == {"1": 1, "2": 1}
+        assert snapshot["by_method"]["editMessageMedia"] == 1
+        api_call_metrics.reset()
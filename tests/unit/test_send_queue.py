@@ -0,0 +1,218 @@
+"""Unit tests for the outbound send queue."""
+
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+from aiogram.methods import SendMessage
+
+from domain.services.notification_service import NotificationService
+from infrastructure.telegram.send_queue import Priority, SendQueue, TokenBucket
+from infrastructure.telegram.utils.message_formatter import MessageFormatter
+
+
+class SendSession(BaseSession):
+    """Bot session recording sent texts; errors are raised per chat in order."""
+
+    def __init__(self, errors: Dict[int, List[str]] = None):
+        super().__init__()
+        self.sent: List[tuple] = []
+        self.errors = {chat_id: list(kinds) for chat_id, kinds in (errors or {}).items()}
+
+    async def make_request(self, bot, method, timeout=None):
+        kinds = self.errors.get(method.chat_id)
+        if kinds:
+            kind = kinds.pop(0)
+            if kind == "retry_after":
+                raise TelegramRetryAfter(method=method, message="Too Many Requests", retry_after=0)
+            raise TelegramForbiddenError(method=method, message="Forbidden: bot was blocked by the user")
+        self.sent.append((method.chat_id, method.text))
+        return True
+
+    async def close(self):
+        pass
+
+    async def stream_content(self, *args, **kwargs):
+        yield b""
+
+
+def make_queue(session: SendSession, **options) -> SendQueue:
+    options.setdefault("global_rate", 1000.0)
+    options.setdefault("chat_rate", 1000.0)
+    return SendQueue(Bot("42:TEST", session=session), **options)
+
+
+async def drain(queue: SendQueue) -> None:
+    queue.start()
+    await queue.stop(timeout=5)
+
+
+class TestTokenBucket:
+    """Test token bucket timing."""
+
+    def test_rate_and_pause(self):
+        """Test tokens refill at the rate and a pause withholds them."""
+        now = [0.0]
+        bucket = TokenBucket(rate=2.0, clock=lambda: now[0])
+
+        assert bucket.delay() == 0
+        bucket.consume()
+        assert bucket.delay() == pytest.approx(0.5)
+
+        now[0] = 0.5
+        assert bucket.delay() == 0
+
+        bucket.pause(3.0)
+        assert bucket.delay() == pytest.approx(3.0)
+
+
+class TestSendQueue:
+    """Test scheduling, retries and failures."""
+
+    @pytest.mark.asyncio
+    async def test_transactional_before_bulk(self):
+        """Test ready transactional messages are sent before queued bulk ones."""
+        session = SendSession()
+        queue = make_queue(session, max_in_flight=1)
+        for chat_id in (1, 2, 3):
+            await queue.submit(SendMessage(chat_id=chat_id, text="promo"), Priority.BULK)
+        await queue.submit(SendMessage(chat_id=4, text="status"))
+
+        await drain(queue)
+
+        assert session.sent[0] == (4, "status")
+        assert len(session.sent) == 4
+        assert queue.snapshot()["sent"] == {"transactional": 1, "bulk": 3}
+
+    @pytest.mark.asyncio
+    async def test_chat_order_kept(self):
+        """Test messages to one chat keep their order."""
+        session = SendSession()
+        queue = make_queue(session)
+        for n in range(5):
+            await queue.submit(SendMessage(chat_id=1, text=str(n)))
+
+        await drain(queue)
+
+        assert [text for _, text in session.sent] == ["0", "1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_chat_rate_does_not_block_other_chats(self):
+        """Test a chat waiting for its bucket does not hold up other chats."""
+        session = SendSession()
+        queue = make_queue(session, chat_rate=2.0)
+        queue.start()
+        first = await queue.submit(SendMessage(chat_id=1, text="a"))
+        second = await queue.submit(SendMessage(chat_id=1, text="b"))
+        other = await queue.submit(SendMessage(chat_id=2, text="c"))
+
+        await asyncio.wait_for(asyncio.gather(first, other), timeout=0.3)
+        assert not second.done()
+        await second
+        await queue.stop()
+
+        assert session.sent == [(1, "a"), (2, "c"), (1, "b")]
+
+    @pytest.mark.asyncio
+    async def test_chat_rate_kept_between_sequential_sends(self):
+        """Test a chat whose queue drained still waits for its bucket."""
+        session = SendSession()
+        queue = make_queue(session, chat_rate=10.0)
+        queue.start()
+        loop = asyncio.get_running_loop()
+        sent_at = []
+        for n in range(3):
+            await queue.send(SendMessage(chat_id=42, text=str(n)))
+            sent_at.append(loop.time())
+
+        assert sent_at[1] - sent_at[0] >= 0.09
+        assert sent_at[2] - sent_at[1] >= 0.09
+        await asyncio.sleep(0.15)
+        await queue.send(SendMessage(chat_id=7, text="other"))
+        assert 42 not in queue._chats
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_retried(self):
+        """Test a 429 pauses sending and the message is sent on retry."""
+        session = SendSession(errors={1: ["retry_after"]})
+        queue = make_queue(session)
+        queue.start()
+
+        assert await queue.send(SendMessage(chat_id=1, text="paid")) is True
+        await queue.stop()
+
+        snapshot = queue.snapshot()
+        assert snapshot["rate_limited"] == 1 and snapshot["retried"] == 1
+        assert session.sent == [(1, "paid")]
+
+    @pytest.mark.asyncio
+    async def test_blocked_chat_fails_without_retry(self):
+        """Test a chat that blocked the bot fails at once and is counted."""
+        session = SendSession(errors={1: ["forbidden"]})
+        queue = make_queue(session)
+        queue.start()
+
+        with pytest.raises(TelegramForbiddenError):
+            await queue.send(SendMessage(chat_id=1, text="promo"), Priority.BULK)
+        await queue.stop()
+
+        assert queue.snapshot()["blocked"] == 1
+        assert queue.snapshot()["pending"] == {"transactional": 0, "bulk": 0}
+
+    @pytest.mark.asyncio
+    async def test_bulk_backpressure(self):
+        """Test bulk producers wait while the bulk backlog is full."""
+        session = SendSession()
+        queue = make_queue(session, max_pending_bulk=2)
+        await queue.submit(SendMessage(chat_id=1, text="a"), Priority.BULK)
+        await queue.submit(SendMessage(chat_id=2, text="b"), Priority.BULK)
+
+        blocked = asyncio.create_task(queue.submit(SendMessage(chat_id=3, text="c"), Priority.BULK))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        queue.start()
+        await asyncio.wait_for(blocked, timeout=1)
+        await queue.stop()
+        assert len(session.sent) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_send_is_dropped(self):
+        """Test a queued message whose future was cancelled is never sent."""
+        session = SendSession()
+        queue = make_queue(session)
+        dropped = await queue.submit(SendMessage(chat_id=1, text="promo"), Priority.BULK)
+        await queue.submit(SendMessage(chat_id=2, text="promo"), Priority.BULK)
+        dropped.cancel()
+
+        await drain(queue)
+
+        assert session.sent == [(2, "promo")]
+        assert queue.snapshot()["pending"] == {"transactional": 0, "bulk": 0}
+
+
+class TestNotificationService:
+    """Test notifications go through the queue."""
+
+    @pytest.mark.asyncio
+    async def test_admin_notification_queued(self):
+        """Test admin notification is queued to the admin chat."""
+        session = SendSession()
+        queue = make_queue(session)
+        service = NotificationService(queue, MessageFormatter, admin_chat_id=-100)
+
+        assert await service.send_admin_notification("Новый заказ") is True
+        await drain(queue)
+
+        assert session.sent == [(-100, "Новый заказ")]
+
+    @pytest.mark.asyncio
+    async def test_no_queue_is_reported(self):
+        """Test notifications report failure before the queue is started."""
+        service = NotificationService(formatter=MessageFormatter, admin_chat_id=-100)
+        assert await service.send_admin_notification("x") is False